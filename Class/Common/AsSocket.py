@@ -17,7 +17,7 @@ from Event.fr_socket_sensor import FrSocketSensor   # ← 실제 구현체 사
 from Common.CommType import (
     NOT_ASSIGN, SESSION_REPORTING, CMD_ALIVE_ACK,
     CMD_ALIVE_RECEIVE, CMD_ALIVE_SEND,
-    CMD_LOG_STATUS_CHANGE, AS_PARSED_DATA,
+    CMD_LOG_STATUS_CHANGE, AS_PARSED_DATA, AS_PARSED_DATA_BATCH,
     AS_LOG_INFO, PORT_STATUS_INFO, PROCESS_INFO, PROCESS_INFO_LIST,
     ROUTER_PORT_INFO, CONNECTOR_DATA, ASCII_ERROR_MSG,
     CMD_PARSING_RULE_CHANGE, PROC_CONTROL, SESSION_CONTROL,
@@ -54,6 +54,7 @@ from Common.CommType import (
     AsConnectionInfoList, AsCommandAuthorityInfo, AsDataHandlerInit,
     AsDataRoutingInit, AsSystemInfoData, AsSessionCfg, AsSubProcInfo,
 )
+from Common.ParsedDataBatch import ParsedDataBatch
 from Common.AsciiMmcType import (
     MAX_MSG, MAX_PACKET,
     AS_MMC_IDENT_RES, AS_MMC_FLOW_CONTROL,
@@ -80,6 +81,11 @@ logger = logging.getLogger(__name__)
 # ──────────────────────────────────────────────
 _HDR_FMT  = "!II"          # network byte order: uint32 MsgId, uint32 Length
 _HDR_SIZE = struct.calcsize(_HDR_FMT)   # == 8
+_HDR      = struct.Struct(_HDR_FMT)
+
+# 수신 링 버퍼: recv_into 1회로 여러 패킷 수신, 미완성 패킷은 다음 수신까지 보관
+_RECV_BUF_SIZE = 65536
+_RECV_MIN_FREE = MAX_PACKET        # 남은 공간이 이보다 작으면 미완성 패킷을 앞으로 이동
 
 
 def _pack_packet(packet: PacketT) -> bytes:
@@ -120,6 +126,12 @@ class AsSocket(FrSocketSensor):
         self._fail_count_max: int = 0
         self._re_read_check_flag: bool = False
 
+        # 수신 링 버퍼 ([_recv_start, _recv_end) 가 아직 처리하지 않은 데이터)
+        self._recv_buf   = bytearray(_RECV_BUF_SIZE)
+        self._recv_view  = memoryview(self._recv_buf)
+        self._recv_start = 0
+        self._recv_end   = 0
+
     def __del__(self) -> None:
         if self._alive_check_timer:
             self._alive_check_timer.cancel_timer()
@@ -146,53 +158,98 @@ class AsSocket(FrSocketSensor):
     # ── 패킷 수신 ─────────────────────────────
     def packet_recv(self) -> PacketT | None:
         """
-        C++ PacketRecv 대응.
+        C++ PacketRecv 대응 (패킷 1개를 받을 때까지 대기).
         성공 시 PacketT 반환, 오류 시 None 반환.
+        수신 링에 이미 완성된 패킷이 있으면 소켓을 읽지 않는다.
         """
-        # 헤더 수신
-        hdr_data = self._recv_exact(_HDR_SIZE)
-        if hdr_data is None:
+        re_read_cnt = 0
+        while True:
+            packet = self._next_frame()
+            if packet is False:             # 길이 오류
+                return None
+            if packet is not None:
+                # 같은 세그먼트로 뒤따라온 패킷은 읽기 이벤트 없이 처리되도록 재등록
+                self._notify_buffered_frame()
+                return packet
+
+            ret = self._fill_recv_buf()
+            if ret is None and self._re_read_check_flag and re_read_cnt < 4:
+                time.sleep(0.07)            # EAGAIN : 재시도
+                re_read_cnt += 1
+                continue
+            if ret is None or ret <= 0:
+                return None
+
+    def _fill_recv_buf(self) -> int | None:
+        """
+        recv_into 1회로 수신 링을 채운다.
+        반환: 수신 바이트 수, 0 연결 종료, -1 오류, None 읽을 데이터 없음 (EAGAIN)
+        """
+        start, end = self._recv_start, self._recv_end
+        if start == end:
+            start = end = 0
+        elif len(self._recv_buf) - end < _RECV_MIN_FREE:
+            # 미완성 패킷(최대 MAX_PACKET)만 앞으로 이동
+            self._recv_buf[:end - start] = self._recv_view[start:end]
+            start, end = 0, end - start
+        self._recv_start, self._recv_end = start, end
+
+        try:
+            n = self._sock.recv_into(self._recv_view[end:])
+        except (BlockingIOError, InterruptedError):
             return None
+        except (OSError, AttributeError) as e:
+            logger.debug("recv error: %s", e)
+            return -1
 
-        msg_id, length = struct.unpack(_HDR_FMT, hdr_data)
-        msg_id  = socket.ntohl(msg_id)
-        length  = socket.ntohl(length)
+        self._recv_end = end + n
+        return n
 
-        if length == 0:
-            return PacketT(msg_id=msg_id, length=0, msg="")
+    def _has_buffered_frame(self) -> bool:
+        """수신 링에 완성된 패킷(또는 길이 오류 헤더)이 남아 있는지."""
+        avail = self._recv_end - self._recv_start
+        if avail < _HDR_SIZE:
+            return False
+        _, length = _HDR.unpack_from(self._recv_buf, self._recv_start)
+        length = socket.ntohl(length)
+        return length > MAX_MSG or avail >= _HDR_SIZE + length
 
-        if length > MAX_MSG:
-            logger.error("length(%d) is over than MAX_MSG(4K)", length)
-            return None
+    def _notify_buffered_frame(self) -> None:
+        """
+        수신 링에 완성된 패킷이 남아 있으면 센서를 디스패치 대기열에 다시 넣는다.
+        이미 커널 버퍼에서 읽어 온 데이터라 읽기 이벤트가 다시 오지 않을 수 있다.
+        """
+        if not self._has_buffered_frame():
+            return
+        if self.m_WorldPtr and self.m_WorldPtr.m_InputEventSrc:
+            self.m_WorldPtr.m_InputEventSrc.insert_notify_sensor(self)
 
-        # 페이로드 수신
-        payload = self._recv_exact(length)
-        if payload is None:
+    def _next_frame(self) -> PacketT | bool | None:
+        """
+        수신 링에서 완성된 패킷 1개를 꺼낸다 (헤더는 링에서 직접 해석).
+        반환: PacketT, 미완성이면 None, 길이 오류면 False
+        """
+        start = self._recv_start
+        avail = self._recv_end - start
+        if avail < _HDR_SIZE:
             return None
 
-        return PacketT(msg_id=msg_id, length=length, msg=payload)
+        msg_id, length = _HDR.unpack_from(self._recv_buf, start)
+        msg_id  = socket.ntohl(msg_id)
+        length  = socket.ntohl(length)
 
-    def _recv_exact(self, size: int) -> bytes | None:
-        """정확히 size 바이트를 수신. 실패 시 None 반환."""
-        buf = b""
-        re_read_cnt = 0
-        while len(buf) < size:
-            try:
-                chunk = self.read(size - len(buf))
-            except OSError as e:
-                if e.errno == errno.EINTR:
-                    continue
-                logger.debug("recv error: %s", e)
-                return None
+        if length > MAX_MSG:
+            logger.error("length(%d) is over than MAX_MSG(4K)", length)
+            return False
+        if avail < _HDR_SIZE + length:
+            return None
 
-            if not chunk:
-                if self._re_read_check_flag and re_read_cnt < 4:
-                    time.sleep(0.07)
-                    re_read_cnt += 1
-                    continue
-                return None
-            buf += chunk
-        return buf
+        self._recv_start = start + _HDR_SIZE + length
+        if length == 0:
+            return PacketT(msg_id=msg_id, length=0, msg="")
+        # 수신 링은 다음 recv 에서 재사용되므로 payload 는 1회 복사해 보관
+        payload = self._recv_buf[start + _HDR_SIZE:self._recv_start]
+        return PacketT(msg_id=msg_id, length=length, msg=bytes(payload))
 
     # ── 세션 식별 ─────────────────────────────
     def _session_identify_packet(self, packet: PacketT) -> None:
@@ -259,12 +316,27 @@ class AsSocket(FrSocketSensor):
 
     # ── 수신 메시지 처리 ─────────────────────
     def receive_message(self) -> None:
-        """C++ ReceiveMessage 대응 — 이벤트 루프에서 호출."""
-        packet = self.packet_recv()
-        if packet is None:
+        """
+        C++ ReceiveMessage 대응 — 이벤트 루프에서 호출.
+        읽기 이벤트 1회에 recv 1회, 수신 링의 완성 패킷을 모두 처리한다.
+        recv 결과(EAGAIN / 종료 포함)와 무관하게 링에 남은 패킷부터 처리하고,
+        미완성 패킷은 수신 링에 남겨 다음 이벤트에서 이어 받는다.
+        """
+        ret = self._fill_recv_buf()
+
+        while self._sock is not None:
+            packet = self._next_frame()
+            if packet is None:
+                break
+            if packet is False:
+                self.socket_broken(self._get_errno())
+                return
+            self._dispatch_packet(packet)
+
+        if ret is not None and ret <= 0 and self._sock is not None:
             self.socket_broken(self._get_errno())
-            return
 
+    def _dispatch_packet(self, packet: PacketT) -> None:
         mid = packet.msg_id
         if mid == SESSION_REPORTING:
             if self._session_identify != NOT_ASSIGN:
@@ -278,9 +350,30 @@ class AsSocket(FrSocketSensor):
             logger.debug("Alive Ack Receive: %s", self.get_session_name())
             self._fail_count = 0
 
+        elif mid == AS_PARSED_DATA_BATCH:
+            self._dispatch_parsed_data_batch(packet)
+
         else:
             self.receive_packet(packet, self._session_identify)
 
+    def _dispatch_parsed_data_batch(self, packet: PacketT) -> None:
+        """
+        (C++ 원본 없음)
+        AS_PARSED_DATA_BATCH 를 AS_PARSED_DATA 패킷으로 풀어 순서대로 receive_packet 에 전달.
+        수신 측(DataRouter)은 배치 여부와 무관하게 레코드 1건씩 처리한다.
+        """
+        raw = packet.msg if isinstance(packet.msg, bytes) else packet.msg.encode()
+        bodies = ParsedDataBatch.unpack(raw)
+        if bodies is None:
+            logger.error("Invalid AS_PARSED_DATA_BATCH(%d bytes): %s",
+                         len(raw), self.get_session_name())
+            return
+        for body in bodies:
+            if self._sock is None:
+                break
+            self.receive_packet(PacketT(msg_id=AS_PARSED_DATA, length=len(body),
+                                        msg=bytes(body)), self._session_identify)
+
     # ── 패킷 전송 퍼블릭 API ──────────────────
     def send_packet(self, msg_id: int,
                     result: bytes | None = None, length: int = 0) -> bool:
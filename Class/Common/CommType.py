@@ -541,6 +541,7 @@ PARSER_INTI_END         = 1006
 ROUTER_PORT_INFO        = 1007
 
 AS_PARSED_DATA          = 5001
+AS_PARSED_DATA_BATCH    = 5002  # Several AS_PARSED_DATA bodies (ParsedDataBatch)
 PARSED_DATA_KEY_SIZE    = 60
 MAX_RAW_MSG             = MAX_MSG - 4 - EQUIP_ID_LEN - EQUIP_ID_LEN - 4 - 4 - 2
 PARSED_DATA_SIZE        = MAX_MSG - EQUIP_ID_LEN - EVENT_ID_LEN - EVENT_ID_LEN - MMC_CMD_LEN - (4 + 2 * 5)
@@ -58,9 +58,18 @@ QUERY_TYPE_INSERT = 2
 
 QUERY_REQ_TYPE_BULK = 0
 QUERY_REQ_TYPE_RS = 1
+QUERY_REQ_TYPE_STREAM = 2   # pipelined bulk select (needs BULK_CODEC_STREAM)
 
 DEF_BUF_SIZE = 2048000 # 2M
 
+# DB_BULK_QUERY_DATA encoding, negotiated at DB_CONN_REQ (m_BulkCodec)
+BULK_CODEC_LEGACY = 0   # [Len][Data] per cell, NULL == ""
+BULK_CODEC_COLLEN = 1   # DBGwRowCodec column-length blocks, NULL distinct
+BULK_CODEC_STREAM = 2   # COLLEN + QUERY_REQ_TYPE_STREAM (blocks sent while fetching)
+
+STREAM_FETCH_ROWS = 512 # rows fetched from the DB and encoded per block in stream mode
+RS_FETCH_ROWS = 100     # default DBGwRecordSet fetch size (rows per DB_RS_MOVE_NEXT_REQ)
+
 # MFC_ERROR Macro is ignored in Python logic
 
 # -------------------------------------------------------
@@ -79,6 +88,7 @@ class DbConnReqT:
         self.HostName = ""    # char[40]
         self.HostIp = ""      # char[40]
         self.ProcPid = 0      # int
+        self.m_BulkCodec = BULK_CODEC_LEGACY # int (highest codec the client supports, old clients: 0)
 
 class DbConnResT:
     """
@@ -87,6 +97,7 @@ class DbConnResT:
     def __init__(self):
         self.m_Result = 0     # short int
         self.m_Error = ""     # char[MAX_ERROR_SIZE]
+        self.m_BulkCodec = BULK_CODEC_LEGACY # int (codec the server will use, old servers: 0)
 
 class DbCloseReqT:
     """
@@ -145,7 +156,7 @@ class DbRsMoveNextReqT:
     """
     def __init__(self):
         self.m_QueryId = 0    # int
-        self.m_Reserved = 0   # int
+        self.m_Reserved = 0   # int (fetch rows : 0 = one legacy row, N = up to N rows in one DBGwRowCodec block)
 
 class DbRsCloseReqT:
     """
@@ -0,0 +1,104 @@
+import os
+import sys
+import struct
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Common.AsciiMmcType import MAX_MSG
+
+class ParsedDataBatch:
+    """
+    AS_PARSED_DATA_BATCH payload (no C++ original).
+    Packs several AS_PARSED_DATA bodies into one PACKET_T so a list response
+    costs one socket write per batch instead of one per record.
+
+    Layout (network byte order):
+        RecordCnt(4) + { Length(4) + AS_PARSED_DATA body } * RecordCnt
+    """
+    COUNT_FMT = "!I"
+    LENGTH_FMT = "!I"
+    COUNT_SIZE = struct.calcsize(COUNT_FMT)
+    LENGTH_SIZE = struct.calcsize(LENGTH_FMT)
+
+    def __init__(self, max_size=MAX_MSG):
+        """
+        max_size : payload limit (peer packet_recv rejects payloads over MAX_MSG)
+        """
+        self.m_MaxSize = max_size
+        self.m_Buf = bytearray(max_size)
+        self.m_View = memoryview(self.m_Buf)
+        self.m_Len = self.COUNT_SIZE
+        self.m_RecordCnt = 0
+
+    def clear(self):
+        self.m_Len = self.COUNT_SIZE
+        self.m_RecordCnt = 0
+
+    def is_empty(self):
+        return self.m_RecordCnt == 0
+
+    def get_record_cnt(self):
+        return self.m_RecordCnt
+
+    def can_hold(self, body_len):
+        """
+        True if a body of body_len fits in an empty batch (else send it as AS_PARSED_DATA).
+        """
+        return self.COUNT_SIZE + self.LENGTH_SIZE + body_len <= self.m_MaxSize
+
+    def append(self, body):
+        """
+        Appends one AS_PARSED_DATA body. Returns False (batch unchanged) if it does not fit.
+        """
+        body_len = len(body)
+        start = self.m_Len + self.LENGTH_SIZE
+        end = start + body_len
+        if end > self.m_MaxSize:
+            return False
+
+        struct.pack_into(self.LENGTH_FMT, self.m_Buf, self.m_Len, body_len)
+        self.m_Buf[start:end] = body
+        self.m_Len = end
+        self.m_RecordCnt += 1
+        return True
+
+    def get_payload(self):
+        """
+        Batch payload as a view of the internal buffer (valid until clear/append).
+        """
+        struct.pack_into(self.COUNT_FMT, self.m_Buf, 0, self.m_RecordCnt)
+        return self.m_View[:self.m_Len]
+
+    @staticmethod
+    def unpack(payload):
+        """
+        Receiver side: splits an AS_PARSED_DATA_BATCH payload into AS_PARSED_DATA bodies
+        (memoryview slices of payload). Returns None if the payload is malformed.
+        """
+        view = memoryview(payload)
+        if len(view) < ParsedDataBatch.COUNT_SIZE:
+            return None
+
+        record_cnt = struct.unpack_from(ParsedDataBatch.COUNT_FMT, view, 0)[0]
+        offset = ParsedDataBatch.COUNT_SIZE
+        body_list = []
+
+        for _ in range(record_cnt):
+            if offset + ParsedDataBatch.LENGTH_SIZE > len(view):
+                return None
+            body_len = struct.unpack_from(ParsedDataBatch.LENGTH_FMT, view, offset)[0]
+            offset += ParsedDataBatch.LENGTH_SIZE
+            if offset + body_len > len(view):
+                return None
+            body_list.append(view[offset:offset + body_len])
+            offset += body_len
+
+        if offset != len(view):
+            return None
+        return body_list
@@ -19,8 +19,11 @@ class FrEventSrc:
         """
         C++: frEventSrc()
         """
-        self.m_SensorList = []          # 등록된 모든 센서 리스트
-        self.m_NotifySensorList = deque() # 알림 대기 중인 센서 큐 (Efficient Pop)
+        # 등록된 모든 센서 (삽입 순서 유지 dict : sensor -> 등록 세대)
+        self.m_SensorList = {}
+        self.m_RegisterSeq = 0
+        # 알림 대기 중인 (센서, 등록 세대) 큐. 해제된 센서는 제거하지 않고 세대 불일치로 건너뜀
+        self.m_NotifySensorList = deque()
 
     def __del__(self):
         """
@@ -38,19 +41,16 @@ class FrEventSrc:
         C++: int RegisterSensor(frSensor* Sensor)
         """
         if sensor not in self.m_SensorList:
-            self.m_SensorList.append(sensor)
+            self.m_RegisterSeq += 1
+            self.m_SensorList[sensor] = self.m_RegisterSeq
         return 1
 
     def unregister_sensor(self, sensor):
         """
         C++: int UnRegisterSensor(frSensor* Sensor)
         """
-        if sensor in self.m_SensorList:
-            self.m_SensorList.remove(sensor)
-        
-        # 알림 대기열에서도 제거
-        if sensor in self.m_NotifySensorList:
-            self.m_NotifySensorList.remove(sensor)
+        # 알림 대기열의 항목은 dispatch_sensor 에서 세대 비교로 무효 처리 (tombstone)
+        self.m_SensorList.pop(sensor, None)
         return 1
 
     def is_exist_instance(self, sensor):
@@ -67,7 +67,7 @@ class FrEventSrc:
         C++: void InsertNotifySensor(frSensor* Sensor)
         이벤트가 발생하여 처리가 필요한 센서를 대기열에 추가
         """
-        self.m_NotifySensorList.append(sensor)
+        self.m_NotifySensorList.append((sensor, self.m_SensorList.get(sensor)))
 
     def dispatch_sensor(self):
         """
@@ -76,7 +76,11 @@ class FrEventSrc:
         """
         while self.m_NotifySensorList:
             # FIFO (First-In-First-Out) 처리
-            sensor = self.m_NotifySensorList.popleft()
+            sensor, seq = self.m_NotifySensorList.popleft()
+
+            # 대기 중 해제(또는 해제 후 재등록)된 센서는 건너뜀
+            if self.m_SensorList.get(sensor) != seq:
+                continue
             
             # 센서가 활성화 상태인지 확인 후 실행
             # (Python에서는 FrSensor 구현에 따라 메서드 이름 확인 필요)
@@ -91,11 +95,12 @@ class FrEventSrc:
         C++: void ReleaseSensor(frWorld* WorldPtr)
         종료 시 센서들에게 자원 해제 알림
         """
-        for sensor in self.m_SensorList:
+        for sensor in list(self.m_SensorList):
             if hasattr(sensor, 'release_world'):
                 sensor.release_world(world_ptr)
         
         self.m_SensorList.clear()
+        self.m_NotifySensorList.clear()
 
     # ---------------------------------------------------
     # Virtual Methods for Select Loop (From FrWorld interface)
@@ -103,12 +108,20 @@ class FrEventSrc:
     # ---------------------------------------------------
     def make_select_request(self, rd_list, wr_list, ex_list, world_ptr):
         """
-        자식 클래스(InputSrc, TimerSrc 등)에서 구현
+        C++: frInputEventSrc::MakeSelectRequest
+        활성화된 센서들에게 위임 (자식 클래스 TimerSrc 등에서 재정의)
         """
-        pass
+        for sensor in self.m_SensorList:
+            if sensor.is_enabled():
+                sensor.make_select_request(rd_list, wr_list, ex_list, world_ptr)
+        return 1
 
     def get_events(self, rd_list, wr_list, ex_list, world_ptr):
         """
-        자식 클래스에서 구현
+        C++: frInputEventSrc::GetEvents
+        활성화된 센서들에게 위임 (자식 클래스에서 재정의)
         """
-        pass
\ No newline at end of file
+        for sensor in self.m_SensorList:
+            if sensor.is_enabled():
+                sensor.get_events(rd_list, wr_list, ex_list, world_ptr)
+        return 1
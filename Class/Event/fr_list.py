@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from typing import Any
 
 
@@ -66,10 +66,19 @@ SOCK_INFO_WRITERABLE_STATUS_UNKNOWN_STR = "UNKNOWN"
 
 @dataclass
 class FrMessageInfo:
-    """C++ frMessageInfo struct 대응."""
+    """
+    C++ frMessageInfo struct 대응.
+    센서 포인터 대신 FrSensorRegistry 의 sensor_id 를 보관 (pickle 시 센서 객체 복사 방지).
+    """
     message:        int
-    sensor:         Any  # frSensor (순환참조 방지를 위해 Any 사용)
+    sensor:         InitVar[Any]  # frSensor (순환참조 방지를 위해 Any 사용)
     addition_info:  Any = None
+    sensor_id:      int = field(init=False, default=0)
+
+    def __post_init__(self, sensor: Any) -> None:
+        if sensor is not None:
+            from fr_sensor_registry import FrSensorRegistry
+            self.sensor_id = FrSensorRegistry.register(sensor)
 
 
 @dataclass
@@ -24,7 +24,8 @@ C++ → Python 주요 변환 포인트:
 import logging
 from typing import Optional, TYPE_CHECKING
 
-from fr_sensor import FrSensor, SensorType
+from fr_sensor          import FrSensor, SensorType
+from fr_sensor_registry import FrSensorRegistry
 
 if TYPE_CHECKING:
     from fr_object import FrObject
@@ -56,8 +57,10 @@ class FrMsgSensor(FrSensor):
         self._sensor_type = SensorType.INPUT
         self._object: 'FrObject' = obj
         self.register_sensor()
+        FrSensorRegistry.register(self)     # FrWorldPipe 메시지 수신 대상 (sensor_id 색인)
 
     def __del__(self) -> None:
+        FrSensorRegistry.unregister(self)
         self.unregister_sensor()
 
     # ------------------------------------------------------------------ #
@@ -2,6 +2,7 @@ import sys
 import os
 import fcntl
 import errno
+import selectors
 
 # 프로젝트 경로 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -24,9 +25,13 @@ class FrRdFdSensor(FrSensor):
         2. frRdFdSensor(int FileDes)
         3. frRdFdSensor(FR_SENSOR_MODE SensorMode)
         """
+        # FrSensor 초기화 중 enable()/disable() 호출 대비, FD 관련 멤버 먼저 설정
+        self.m_FD = fd
+        self.m_RegisteredFd = -1    # selector 에 등록된 FD (-1 = 미등록)
+        self.m_WriteWait = False    # 쓰기 가능 이벤트 대기 여부
+
         super().__init__(sensor_mode=sensor_mode)
         
-        self.m_FD = fd
         self.m_SensorType = SENSOR_TYPE.INPUT_SENSOR
         self.m_frRdFdSensorTimer = None # 타이머 헬퍼 (Lazy Init)
         self.m_BlockMode = True
@@ -36,6 +41,7 @@ class FrRdFdSensor(FrSensor):
             if self.m_FD != -1:
                 self.set_close_on_exec(True)
             self.register_sensor()
+            self.register_fd()
 
     def __del__(self):
         """
@@ -48,6 +54,7 @@ class FrRdFdSensor(FrSensor):
         if self.m_frRdFdSensorTimer:
             self.m_frRdFdSensorTimer = None
             
+        self.unregister_fd()
         self.unregister_sensor()
 
     # ---------------------------------------------------
@@ -56,10 +63,14 @@ class FrRdFdSensor(FrSensor):
     def make_select_request(self, rd_list, wr_list, ex_list, world_ptr):
         """
         C++: FD_SET(m_FD, Rd)
-        감시할 FD를 읽기 리스트(rd_list)에 추가
+        감시할 FD를 읽기 리스트(rd_list)에 추가 (쓰기 대기 중이면 wr_list 에도 추가)
+        selector 에 등록된 FD 는 수집하지 않음
         """
-        if self.m_FD != -1:
-            rd_list.append(self.m_FD)
+        fd = self.get_fd()
+        if fd != -1 and self.m_RegisteredFd == -1:
+            rd_list.append(fd)
+            if self.m_WriteWait:
+                wr_list.append(fd)
         return 1
 
     def get_events(self, rd_list, wr_list, ex_list, world_ptr):
@@ -67,11 +78,79 @@ class FrRdFdSensor(FrSensor):
         C++: if(FD_ISSET(m_FD, Rd)) ...
         FD가 준비되었으면 Notify 대기열에 추가
         """
-        if self.m_FD != -1 and (self.m_FD in rd_list):
-            if self.m_WorldPtr and self.m_WorldPtr.m_InputEventSrc:
-                self.m_WorldPtr.m_InputEventSrc.insert_notify_sensor(self)
+        fd = self.get_fd()
+        if fd == -1 or not self.m_WorldPtr:
+            return 1
+        if fd in rd_list and self.m_WorldPtr.m_InputEventSrc:
+            self.m_WorldPtr.m_InputEventSrc.insert_notify_sensor(self)
+        if self.m_WriteWait and fd in wr_list:
+            self.m_WorldPtr.insert_writable_sensor(self)
         return 1
 
+    # ---------------------------------------------------
+    # Selector Registration (C++ 원본 없음)
+    # ---------------------------------------------------
+    def register_fd(self):
+        """
+        (C++ 원본 없음)
+        selector 모드 World 에 FD 를 한 번 등록. 이후 루프마다 재수집하지 않고
+        쓰기 대기 / enable / disable / close 등 상태 변경 시에만 갱신한다.
+        select 모드 World 이면 False (make_select_request 로 매 루프 수집).
+        """
+        fd = self.get_fd()
+        if fd == -1 or not self.m_WorldPtr:
+            return False
+        if self.m_RegisteredFd == fd:
+            return True
+        if self.m_RegisteredFd != -1:
+            self.unregister_fd()
+        if not self.m_WorldPtr.register_fd(fd, self, self.get_interest()):
+            return False
+        self.m_RegisteredFd = fd
+        return True
+
+    def unregister_fd(self):
+        if self.m_RegisteredFd == -1:
+            return
+        if self.m_WorldPtr:
+            self.m_WorldPtr.unregister_fd(self.m_RegisteredFd)
+        self.m_RegisteredFd = -1
+
+    def get_interest(self):
+        if self.m_WriteWait:
+            return selectors.EVENT_READ | selectors.EVENT_WRITE
+        return selectors.EVENT_READ
+
+    def set_write_wait(self, flag):
+        """
+        (C++ 원본 없음)
+        쓰기 가능 이벤트 대기 설정. 통지는 receive_writable() 로 전달된다.
+        """
+        if self.m_WriteWait == flag:
+            return
+        self.m_WriteWait = flag
+        if self.m_RegisteredFd != -1:
+            self.m_WorldPtr.modify_fd(self.m_RegisteredFd, self, self.get_interest())
+
+    def is_write_wait(self):
+        return self.m_WriteWait
+
+    def receive_writable(self):
+        """
+        (C++ 원본 없음)
+        쓰기 가능 통지 (가상 함수). 기본 동작은 대기 해제.
+        """
+        self.set_write_wait(False)
+
+    def enable(self):
+        super().enable()
+        self.register_fd()
+
+    def disable(self):
+        # 비활성 센서의 FD 가 남아 있으면 레벨 트리거로 매 루프 깨어나므로 해제
+        self.unregister_fd()
+        super().disable()
+
     # ---------------------------------------------------
     # I/O Operations
     # ---------------------------------------------------
@@ -152,6 +231,8 @@ class FrRdFdSensor(FrSensor):
         """
         if self.m_FD == -1: return True
         
+        # FD 번호 재사용 전에 selector 에서 먼저 해제
+        self.unregister_fd()
         try:
             os.close(self.m_FD)
         except OSError as e:
@@ -163,7 +244,10 @@ class FrRdFdSensor(FrSensor):
         return True
 
     def set_fd(self, new_fd):
+        self.unregister_fd()
         self.m_FD = new_fd
+        if self.is_enabled():
+            self.register_fd()
 
     def get_fd(self):
         return self.m_FD
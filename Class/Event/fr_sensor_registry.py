@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+fr_sensor_registry.py  (C++ 원본 없음)
+Python 3.11.10 버전
+
+설계:
+  FrSensorRegistry → 프로세스 전역 센서 ID 색인
+
+C++ frSensor::m_SensorMgrLock / GetGlobalSensorList() 의 선형 탐색을 대체:
+  센서 검색 (list 순회)          → sensor_id → sensor 조회 O(1)
+  FrWorldPipe 메시지의 센서 포인터 → sensor_id (pickle 직렬화 시 객체 복사 문제 해소)
+  등록/해제                      → WeakValueDictionary (삽입 순서 유지, 소멸 시 자동 해제)
+
+변경 이력:
+  v1 - 초기 작성
+"""
+
+import itertools
+import threading
+import weakref
+from typing import Any, Optional
+
+
+class FrSensorRegistry:
+    """
+    전역 센서 색인 (클래스 정적 멤버만 사용).
+
+    register() 는 센서에 _registry_id 를 부여하며 같은 센서는 같은 ID 를 돌려준다.
+    센서가 GC 되면 항목이 자동으로 사라지므로 unregister() 는 명시적 정리용.
+    """
+
+    lock:        threading.RLock = threading.RLock()
+    _sensors:    'weakref.WeakValueDictionary[int, Any]' = weakref.WeakValueDictionary()
+    _id_counter: itertools.count = itertools.count(1)
+
+    @classmethod
+    def register(cls, sensor: Any) -> int:
+        """센서 등록 후 sensor_id 반환. 이미 등록된 센서는 기존 ID."""
+        with cls.lock:
+            sensor_id = getattr(sensor, '_registry_id', 0)
+            if sensor_id and cls._sensors.get(sensor_id) is sensor:
+                return sensor_id
+            sensor_id = next(cls._id_counter)
+            sensor._registry_id = sensor_id
+            cls._sensors[sensor_id] = sensor
+            return sensor_id
+
+    @classmethod
+    def unregister(cls, sensor: Any) -> None:
+        with cls.lock:
+            sensor_id = getattr(sensor, '_registry_id', 0)
+            if sensor_id and cls._sensors.get(sensor_id) is sensor:
+                del cls._sensors[sensor_id]
+
+    @classmethod
+    def find(cls, sensor_id: int) -> Optional[Any]:
+        """sensor_id 로 센서 조회. 없거나 이미 해제됐으면 None."""
+        with cls.lock:
+            return cls._sensors.get(sensor_id)
+
+    @classmethod
+    def sensor_list(cls) -> list:
+        """등록 순서대로 센서 목록 (스냅샷)."""
+        with cls.lock:
+            return list(cls._sensors.values())
+
+    @classmethod
+    def count(cls) -> int:
+        with cls.lock:
+            return len(cls._sensors)
@@ -15,7 +15,9 @@ C++ → Python 주요 변환 포인트:
                                → sock.setsockopt()
   select() FD_SET/FD_ISSET     → select.select()  (IsWriterable/IsReaderable)
   ioctl FIONREAD                → socket.ioctl(FIONREAD) 또는 fcntl.ioctl()
-  WriteDataList (list<WriteData*>) → deque[_WriteData]
+  WriteDataList (list<WriteData*>) → deque[_WriteData]  (memoryview, 부분 전송은 슬라이스)
+  IsWriterable() 후 Write         → MSG_DONTWAIT send, 남은 데이터는 쓰기 가능 이벤트에서
+                                    sendmsg 로 여러 버퍼를 한 번에 전송
   frMutex m_WriteDataLock / m_WriteLock → threading.Lock
   frSocketSensorTimer*         → FrSocketSensorTimer (지연 임포트)
   memset(m_SessionTime)        → str
@@ -28,9 +30,11 @@ C++ → Python 주요 변환 포인트:
 
 변경 이력:
   v1 - 초기 변환
+  v2 - 쓰기 가능 이벤트 기반 송신 큐 (sendmsg 묶음 전송, 큐 크기/최대치 조회)
 """
 
 import datetime
+import itertools
 import os
 import select as _select
 import signal
@@ -56,6 +60,7 @@ _DEFAULT_SOCK_BUF_SIZE        = 32768
 _DEFAULT_SOCK_CHECK_TIME_OUT  = 100          # microsec
 _MAX_SOCK_BUF_SIZE            = 1024*1024*200
 _MAX_DATADUMP_SIZE            = 51
+_SENDMSG_MAX_BUFS             = 64           # sendmsg 1회 최대 버퍼 수 (IOV_MAX 이하)
 
 # SOCK_INFO 상수 (frSockFdManager.h 대응)
 SOCK_INFO_USE_TYPE_UNKNOWN   = 0
@@ -72,12 +77,16 @@ SOCK_INFO_MODE_AF_UNIX       = 2
 # ─────────────────────────────────────────────────────────────────────────────
 @dataclass
 class _WriteData:
-    data:   bytes
+    data:   memoryview              # 부분 전송 시 남은 부분 슬라이스 (복사 없음)
     length: int = field(init=False)
 
     def __post_init__(self) -> None:
         self.length = len(self.data)
 
+    def consume(self, sent: int) -> None:
+        self.data    = self.data[sent:]
+        self.length -= sent
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # FrSocketSensor
@@ -119,7 +128,8 @@ class FrSocketSensor(FrRdFdSensor):
         self._writerable_check:  bool = False
         self._writerable_check_timeout: int = _DEFAULT_SOCK_CHECK_TIME_OUT
         self._max_data_buf_size: int  = -1
-        self._cur_data_buf_size: int  = 0
+        self._cur_data_buf_size: int  = 0    # 송신 큐 바이트
+        self._write_queue_high_water: int = 0
         self._write_data_list:   deque[_WriteData] = deque()
         self._write_data_lock:   threading.Lock    = threading.Lock()
         self._write_lock:        threading.Lock    = threading.Lock()
@@ -335,7 +345,12 @@ class FrSocketSensor(FrRdFdSensor):
         prev_sock_path  = self._socket_path
         self._use_type  = SOCK_INFO_USE_TYPE_UNKNOWN
 
-        # 부모 close() — selector 해제 + os.close()
+        # selector 해제 (FD 번호 재사용 전) 후 소켓 close
+        self.unregister_fd()
+        self.set_write_wait(False)
+        with self._write_data_lock:
+            self._write_data_list.clear()
+            self._cur_data_buf_size = 0
         if self._sock:
             try:
                 self._sock.close()
@@ -399,22 +414,31 @@ class FrSocketSensor(FrRdFdSensor):
     # Write
     # ------------------------------------------------------------------ #
     def write(self, packet: bytes) -> int:
-        """C++ Write(char* Packet, int Length) 대응."""
+        """
+        C++ Write(char* Packet, int Length) 대응.
+        쓰기 확인 모드에서는 블로킹하지 않는다 : 보낼 수 있는 만큼 바로 보내고
+        나머지는 송신 큐에 넣어 쓰기 가능 이벤트(receive_writable) 에서 전송.
+        """
         if not self._writerable_check:
             return self._write_socket(packet)
 
         with self._write_lock:
-            while True:
-                if self.is_writerable():
-                    data = self._get_write_data()
-                    if data:
-                        ret = self._write_socket(data.data)
-                        if ret < 1:
-                            return ret
-                    else:
-                        return self._write_socket(packet)
-                else:
-                    return self._put_write_data(packet)
+            # 큐가 남아 있으면 순서 유지를 위해 뒤에 붙임 (쓰기 이벤트 대기 중)
+            if self._is_write_data():
+                return self._put_write_data(packet)
+
+            try:
+                sent = self._sock.send(packet, socket.MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except OSError as e:
+                self.set_obj_err_msg('write error: %s', e)
+                return -1
+
+            if sent < len(packet):
+                if self._put_write_data(memoryview(packet)[sent:]) < 0:
+                    return -1
+            return len(packet)
 
     def _write_socket(self, packet: bytes) -> int:
         """C++ WriteSocket() 대응 — 부모 os.write() 직접 호출."""
@@ -444,13 +468,15 @@ class FrSocketSensor(FrRdFdSensor):
     # ------------------------------------------------------------------ #
     # 쓰기 버퍼 관리
     # ------------------------------------------------------------------ #
-    def _put_write_data(self, data: bytes) -> int:
-        """C++ PutWriteData() 대응."""
-        entry = _WriteData(data)
+    def _put_write_data(self, data) -> int:
+        """C++ PutWriteData() 대응. 큐에 넣고 쓰기 가능 이벤트 대기."""
+        entry = _WriteData(memoryview(data))
         with self._write_data_lock:
             self._write_data_list.append(entry)
-            if self._max_data_buf_size > 0:
-                self._cur_data_buf_size += entry.length
+            self._cur_data_buf_size += entry.length
+            if self._cur_data_buf_size > self._write_queue_high_water:
+                self._write_queue_high_water = self._cur_data_buf_size
+        self.set_write_wait(True)
 
         if self._max_data_buf_size > 0 and self._cur_data_buf_size > self._max_data_buf_size:
             self.recv_overflow_data_buf_info(self._max_data_buf_size,
@@ -458,42 +484,83 @@ class FrSocketSensor(FrRdFdSensor):
             return -1
         return entry.length
 
-    def _get_write_data(self) -> Optional[_WriteData]:
-        """C++ GetWriteData() (포인터 반환형) 대응."""
-        with self._write_data_lock:
-            if self._write_data_list:
-                entry = self._write_data_list.popleft()
-                if self._max_data_buf_size > 0:
-                    self._cur_data_buf_size -= entry.length
-                return entry
-        return None
-
     def _is_write_data(self) -> bool:
         """C++ IsWriteData() 대응."""
         with self._write_data_lock:
             return bool(self._write_data_list)
 
+    def _flush_write_data(self) -> int:
+        """
+        송신 큐를 sendmsg 로 묶어 전송 (MSG_DONTWAIT).
+        소켓 버퍼가 차면 중단하고 쓰기 대기 유지, 큐가 비면 쓰기 대기 해제.
+        반환: 전송 바이트 수, 오류 시 -1
+        """
+        total = 0
+        with self._write_data_lock:
+            queue = self._write_data_list
+            while queue:
+                bufs = [entry.data for entry in itertools.islice(queue, _SENDMSG_MAX_BUFS)]
+                want = sum(len(buf) for buf in bufs)
+                try:
+                    sent = self._sock.sendmsg(bufs, [], socket.MSG_DONTWAIT)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError as e:
+                    self.set_obj_err_msg('sendmsg error: %s', e)
+                    return -1
+
+                total += sent
+                self._cur_data_buf_size -= sent
+                left = sent
+                while left:
+                    head = queue[0]
+                    if left < head.length:
+                        head.consume(left)
+                        break
+                    left -= head.length
+                    queue.popleft()
+
+                if sent < want:
+                    break       # 소켓 버퍼 가득 참
+            empty = not queue
+
+        self.set_write_wait(not empty)
+        return total
+
+    def receive_writable(self) -> None:
+        """FrRdFdSensor 쓰기 가능 통지 오버라이드 — 송신 큐 전송."""
+        with self._write_lock:
+            self._flush_write_data()
+
     def data_send_time(self) -> None:
-        """C++ DataSendTime() 대응."""
+        """
+        C++ DataSendTime() 대응.
+        송신 큐는 쓰기 가능 이벤트로 전송되며, 타이머는 보조 재시도로만 사용.
+        """
         if self._is_write_data():
             with self._write_lock:
-                while True:
-                    if self.is_writerable():
-                        data = self._get_write_data()
-                        if data:
-                            ret = self._write_socket(data.data)
-                            if ret < 1:
-                                break
-                        else:
-                            break
-                    else:
-                        break
+                self._flush_write_data()
         if self._write_timer_sensor:
             self._write_timer_sensor.set_timer2(350, 1)
 
+    def get_write_queue_bytes(self) -> int:
+        """송신 큐에 남은 바이트 수."""
+        return self._cur_data_buf_size
+
+    def get_write_queue_high_water(self) -> int:
+        """송신 큐 최대 적재 바이트 수 (reset_write_queue_high_water 이후)."""
+        return self._write_queue_high_water
+
+    def reset_write_queue_high_water(self) -> None:
+        self._write_queue_high_water = self._cur_data_buf_size
+
     # ------------------------------------------------------------------ #
     # 소켓 상태 확인
     # ------------------------------------------------------------------ #
+    def get_fd(self) -> int:
+        """C++ GetFD() 대응. selector 등록/select 수집 시 부모가 참조."""
+        return self._fd
+
     def is_connect(self) -> bool:
         """C++ IsConnect() 대응."""
         return self._fd != -1
@@ -8,6 +8,7 @@ Python 3.11.10 버전
 
 C++ → Python 주요 변환 포인트:
   timeb / ftime()              → time.time()  (초+밀리초 동시 제공, float)
+  타이머 만료 시각             → time.monotonic() 기준, 월드 타이머 힙(FrTimerQueue) 에서 관리
   time_t m_CurrentTimeSec      → current_time_sec  : float  (정수 초)
   int    m_CurrentTimeMiliSec  → current_time_msec : int    (밀리초)
   timeval* Time (in/out 파라미터)
@@ -16,15 +17,18 @@ C++ → Python 주요 변환 포인트:
   fd_set 파라미터              → 제거 (fr_event_src 설계 동일)
   센서 없을 때 tv_sec=99999    → _next_timeout = 99999.0
   Time->tv_sec/tv_usec 계산    → float 초 단위로 통합
+  센서별 MakeSelectRequest 순회 → timer_queue.next_deadline()  (센서 수와 무관)
 
 변경 이력:
   v1 - 초기 변환
+  v2 - 타이머 힙 (FrTimerQueue) 기반, 루프마다 센서 순회 제거
 """
 
 import logging
 import time
 
 from fr_event_src import FrEventSrc
+from fr_timer_queue import FrTimerQueue
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +45,8 @@ class FrTimerEventSrc(FrEventSrc):
       current_time_sec  : float — 마지막 갱신 시각 (Unix 초, 정수부)
       current_time_msec : int   — 마지막 갱신 시각 (밀리초 부분, 0~999)
 
+      timer_queue       : FrTimerQueue — 월드의 모든 타이머 센서가 공유하는 만료 힙
+
     내부 멤버:
       _next_timeout     : float — 다음 select() 까지의 대기 시간(초)
                                   FrWorld._read_event() 가 참조.
@@ -51,6 +57,7 @@ class FrTimerEventSrc(FrEventSrc):
         self.current_time_sec:  float = 0.0
         self.current_time_msec: int   = 0
         self._next_timeout:     float = _NO_SENSOR_TIMEOUT
+        self.timer_queue:       FrTimerQueue = FrTimerQueue()
 
     # ------------------------------------------------------------------ #
     # 현재 시각 갱신 헬퍼  (C++ ftime(&curTime) 대응)
@@ -67,7 +74,8 @@ class FrTimerEventSrc(FrEventSrc):
     # ------------------------------------------------------------------ #
     # FrEventSrc 추상 메서드 구현
     # ------------------------------------------------------------------ #
-    def make_select_request(self) -> dict:
+    def make_select_request(self, rd_list=None, wr_list=None, ex_list=None,
+                            world_ptr=None) -> dict:
         """
         C++ MakeSelectRequest(fd_set*, timeval*) 대응.
 
@@ -77,55 +85,33 @@ class FrTimerEventSrc(FrEventSrc):
           3. 현재 시각을 빼서 상대 대기시간(timeval) 계산
 
         Python 변환:
-          센서의 make_select_request() 가 {'deadline': float(Unix초)} 를 반환하면
-          그 중 최솟값에서 현재 시각을 뺀 값을 _next_timeout 으로 저장.
-          FrWorld._read_event() 가 selector.select(timeout=_next_timeout) 에 사용.
+          2 를 타이머 힙 top 조회로 대체 (센서 순회 없음).
+          world_ptr 가 주어지면 (FrWorld 호출) world_ptr.timeout 도 더 짧은 쪽으로 갱신.
         """
-        if not self._sensor_list:
-            self._next_timeout = _NO_SENSOR_TIMEOUT
-            return {}
-
-        self._update_current_time()
-        now = self.current_time_sec + self.current_time_msec / 1000.0
-
-        earliest_deadline = -1.0   # C++ Time->tv_sec = -1 초기값 대응
-
-        for sensor in self._sensor_list:
-            if sensor.is_enabled():
-                req = {}
-                try:
-                    req = sensor.make_select_request()
-                except Exception as e:
-                    logger.error('make_select_request sensor error: %s', e)
-
-                deadline = req.get('deadline', -1.0)
-                if deadline > 0:
-                    if earliest_deadline < 0 or deadline < earliest_deadline:
-                        earliest_deadline = deadline
-
-        # 상대 대기시간 계산 (C++ tv_sec/tv_usec 보정 로직 대응)
-        if earliest_deadline < 0:
+        deadline = self.timer_queue.next_deadline()
+        if deadline is None:
             self._next_timeout = _NO_SENSOR_TIMEOUT
         else:
-            timeout = earliest_deadline - now
-            if timeout < 0:
-                timeout = 0.0
-            self._next_timeout = timeout
+            self._next_timeout = max(0.0, deadline - time.monotonic())
+
+        if world_ptr is not None:
+            if world_ptr.timeout is None or self._next_timeout < world_ptr.timeout:
+                world_ptr.timeout = self._next_timeout
 
         return {'timeout': self._next_timeout}
 
-    def get_events(self) -> None:
+    def get_events(self, rd_list=None, wr_list=None, ex_list=None,
+                   world_ptr=None) -> None:
         """
         C++ GetEvents(fd_set*, timeval*) 대응.
-        현재 시각을 갱신한 뒤 활성 센서의 get_events() 를 순서대로 호출.
-        각 타이머 센서는 내부에서 만료 여부를 판단하고
-        insert_notify_sensor() 를 통해 디스패치 큐에 삽입한다.
+        만료된 타이머를 힙에서 꺼내 해당 센서에 전달하고,
+        센서별 1회 insert_notify_sensor() 로 디스패치 큐에 삽입한다.
         """
         self._update_current_time()
 
-        for sensor in self._sensor_list:
-            if sensor.is_enabled():
-                try:
-                    sensor.get_events()
-                except Exception as e:
-                    logger.error('get_events sensor error: %s', e)
\ No newline at end of file
+        notified = set()
+        for sensor, entry in self.timer_queue.pop_expired(time.monotonic()):
+            sensor.add_expired_timer(entry)
+            if sensor not in notified:
+                notified.add(sensor)
+                self.insert_notify_sensor(sensor)
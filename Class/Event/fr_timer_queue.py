@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+fr_timer_queue.py  (C++ 원본 없음)
+Python 3.11.10 버전
+
+설계:
+  FrTimerQueue     → 월드 단위 타이머 힙 (FrTimerEventSrc 가 1개 소유)
+
+C++ frTimerSensor 의 센서별 정렬 TimerList 를 대체:
+  정렬 삽입 O(n)                 → heapq.heappush O(log n)
+  CancelTimer 키 탐색 O(n)       → 항목 cancelled 표시 O(1) (lazy delete)
+  매 루프 전 센서 최소값 탐색    → 힙 top 조회 (취소 항목만 걷어냄)
+  deadline                       → time.monotonic() 기준 (시스템 시각 변경 무관)
+
+변경 이력:
+  v1 - 초기 작성
+"""
+
+import heapq
+from typing import Any, Optional
+
+# 취소 항목이 이 수 이상이고 힙의 절반을 넘으면 재구성
+_COMPACT_MIN = 1024
+
+
+class FrTimerQueue:
+    """
+    만료 시각 오름차순 타이머 힙.
+
+    항목은 (deadline, seq, entry, owner) 이며 entry 는 deadline / cancelled / queued
+    속성을 가진 타이머 객체(_TimeOut), owner 는 만료 통지를 받을 센서.
+    seq 는 같은 deadline 의 등록 순서를 보장한다.
+    """
+
+    def __init__(self) -> None:
+        self._heap:      list[tuple[float, int, Any, Any]] = []
+        self._seq:       int = 0
+        self._cancelled: int = 0
+
+    def __len__(self) -> int:
+        """취소되지 않은 타이머 수."""
+        return len(self._heap) - self._cancelled
+
+    def push(self, entry: Any, owner: Any) -> None:
+        """타이머 등록. O(log n)"""
+        self._seq += 1
+        entry.queued = True
+        heapq.heappush(self._heap, (entry.deadline, self._seq, entry, owner))
+
+    def cancel(self, entry: Any) -> None:
+        """
+        타이머 취소. 힙에서 바로 빼지 않고 표시만 한다 (top 에 오거나 재구성 시 제거).
+        """
+        if entry.cancelled:
+            return
+        entry.cancelled = True
+        if not entry.queued:
+            return      # 이미 만료되어 힙에서 빠진 항목 (통지 대기 중)
+        self._cancelled += 1
+        if self._cancelled >= _COMPACT_MIN and self._cancelled * 2 > len(self._heap):
+            self._compact()
+
+    def next_deadline(self) -> Optional[float]:
+        """가장 이른 만료 시각 (monotonic 초). 타이머가 없으면 None."""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)[2].queued = False
+            self._cancelled -= 1
+        return heap[0][0] if heap else None
+
+    def pop_expired(self, now: float) -> list[tuple[Any, Any]]:
+        """
+        now(monotonic) 까지 만료된 타이머를 deadline 순으로 꺼내 [(owner, entry), ...] 반환.
+        """
+        heap = self._heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            _, _, entry, owner = heapq.heappop(heap)
+            entry.queued = False
+            if entry.cancelled:
+                self._cancelled -= 1
+                continue
+            expired.append((owner, entry))
+        return expired
+
+    def _compact(self) -> None:
+        for item in self._heap:
+            if item[2].cancelled:
+                item[2].queued = False
+        self._heap = [item for item in self._heap if not item[2].cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
@@ -7,13 +7,13 @@ Python 3.11.10 버전
   frTimerSensor    → FrTimerSensor  (FrSensor 상속, 추상 클래스)
 
 C++ → Python 주요 변환 포인트:
-  TimerList* m_TimerList           → list[_TimeOut]  (정렬 삽입 유지)
+  TimerList* m_TimerList           → dict[key, _TimeOut] + 월드 타이머 힙 (FrTimerQueue)
   TimeOut 구조체                   → _TimeOut dataclass
-  timeb / ftime()                  → time.time()
-  time_t m_MinTimeOutSec           → _min_deadline : float  (Unix 절대 시각, 초+밀리초 통합)
-  int    m_MinTimeOutMiliSec       → (통합, 별도 필드 불필요)
+  timeb / ftime()                  → time.monotonic()
+  time_t m_MinTimeOutSec           → (제거, FrTimerEventSrc 타이머 힙 top 으로 대체)
+  int    m_MinTimeOutMiliSec       → (제거)
   timer_key (int typedef)          → int
-  LONG_TIME (31536000 = 1년)       → _LONG_TIME
+  LONG_TIME (31536000 = 1년)       → (제거, 더미 타이머 불필요)
   MakeSelectRequest(fd_set*, tv*)  → make_select_request() → dict{'deadline': float}
   GetEvents(fd_set*, tv*)          → get_events()
   SubjectChanged()                 → subject_changed()
@@ -25,6 +25,7 @@ C++ → Python 주요 변환 포인트:
 
 변경 이력:
   v1 - 초기 변환
+  v2 - 월드 단위 타이머 힙 (등록 O(log n), 취소 O(1) lazy delete), monotonic 시각
 """
 
 import logging
@@ -37,8 +38,6 @@ from fr_sensor import FrSensor, SensorType
 
 logger = logging.getLogger(__name__)
 
-_LONG_TIME: int = 31536000   # 1년(초) — 더미 타이머용 C++ LONG_TIME 대응
-
 
 # ─────────────────────────────────────────────────────────────────────────────
 # _TimeOut  (C++ TimeOut 구조체 대응)
@@ -47,13 +46,15 @@ _LONG_TIME: int = 31536000   # 1년(초) — 더미 타이머용 C++ LONG_TIME 
 class _TimeOut:
     """
     C++ TimeOut 구조체 대응.
-    deadline 을 float(Unix 초, 밀리초 포함) 으로 통합 저장.
+    deadline 을 float(monotonic 초, 밀리초 포함) 으로 통합 저장.
       C++ m_TimeOutSec + m_TimeOutMiliSec  →  deadline : float
     """
-    deadline:     float          # 절대 만료 시각 (Unix 초, 소수점 = 밀리초)
+    deadline:     float          # 절대 만료 시각 (time.monotonic 기준)
     reason:       int
     key:          int
     extra_reason: object = field(default=None, repr=False)
+    cancelled:    bool   = False # FrTimerQueue lazy delete 표시
+    queued:       bool   = False # FrTimerQueue 힙에 들어 있는지
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -64,30 +65,28 @@ class FrTimerSensor(FrSensor):
     C++ frTimerSensor 대응 추상 클래스.
     타이머 만료 시 ReceiveTimeOut() 을 호출하는 TIMER_SENSOR.
 
-    TimerList 는 deadline 오름차순 정렬을 유지하며,
-    항상 더미 타이머(1년 후)가 1개 이상 존재한다.
+    만료 시각 정렬은 월드의 FrTimerEventSrc.timer_queue(힙) 가 담당하고,
+    센서는 key → _TimeOut 만 보관한다. 만료된 항목은 FrTimerEventSrc.get_events()
+    가 add_expired_timer() 로 넘겨주며 subject_changed() 에서 순서대로 처리한다.
 
     멤버 매핑:
-      m_TimerList          → _timer_list    : list[_TimeOut]
+      m_TimerList          → _timers        : dict[int, _TimeOut]  (미만료 타이머)
       m_KeySequence        → _key_sequence  : int
-      m_MinTimeOutSec/Msec → _min_deadline  : float  (통합)
+      m_MinTimeOutSec/Msec → (제거, 힙 top)
     """
 
     def __init__(self) -> None:
         super().__init__()
         self._sensor_type  = SensorType.TIMER
-        self._timer_list:  list[_TimeOut] = []
-        self._key_sequence: int           = 0
-        self._min_deadline: float         = 0.0
+        self._timers:       dict[int, _TimeOut] = {}
+        self._expired:      list[_TimeOut]      = []
+        self._key_sequence: int                 = 0
 
         self.register_sensor()
         self._object_type = 3
 
-        # 더미 타이머 (C++ SetTimer(LONG_TIME, 10000) 대응)
-        self.set_timer(_LONG_TIME, 10000)
-
     def __del__(self) -> None:
-        self._timer_list.clear()
+        self.cancel_all_timer()
         self.unregister_sensor()
 
     # ------------------------------------------------------------------ #
@@ -96,31 +95,23 @@ class FrTimerSensor(FrSensor):
     def make_select_request(self) -> dict:
         """
         C++ MakeSelectRequest(fd_set*, timeval*) 대응.
-
-        C++ 동작:
-          Time 이 -1/-1 이면 (첫 센서) 자신의 m_MinTimeout 으로 초기화.
-          이미 값이 있으면 더 작은 쪽으로 갱신.
-
-        Python 변환:
-          FrTimerEventSrc 가 모든 센서의 deadline 최솟값을 직접 비교하므로
-          여기서는 자신의 _min_deadline 을 {'deadline': float} 으로 반환.
+        최소 만료 시각은 FrTimerEventSrc 가 타이머 힙에서 직접 구하므로
+        이벤트 루프에서는 호출되지 않는다. 조회용으로 자신의 최소값을 반환.
         """
-        if not self._timer_list:
+        if not self._timers:
             return {}
-        return {'deadline': self._min_deadline}
+        return {'deadline': min(t.deadline for t in self._timers.values())}
 
     def get_events(self) -> None:
         """
         C++ GetEvents(fd_set*, timeval*) 대응.
-        타이머 큐의 맨 앞 항목이 만료됐으면 InsertNotifySensor() 로 등록.
+        만료 판정은 FrTimerEventSrc.get_events() 가 타이머 힙에서 수행한다.
         """
-        if not self._timer_list:
-            return
+        pass
 
-        now = time.time()
-        if now >= self._timer_list[0].deadline:
-            if self.world_ptr and self.world_ptr.timer_event_src:
-                self.world_ptr.timer_event_src.insert_notify_sensor(self)
+    def add_expired_timer(self, entry: _TimeOut) -> None:
+        """FrTimerEventSrc 가 힙에서 꺼낸 만료 타이머를 전달 (subject_changed 에서 처리)."""
+        self._expired.append(entry)
 
     # ------------------------------------------------------------------ #
     # SubjectChanged  (C++ SubjectChanged() 대응)
@@ -128,24 +119,23 @@ class FrTimerSensor(FrSensor):
     def subject_changed(self) -> int:
         """
         C++ SubjectChanged() 대응.
-        만료된 타이머를 큐에서 꺼내 receive_time_out() 을 호출한다.
+        만료된 타이머마다 receive_time_out() 을 호출한다.
         """
-        if not self._timer_list:
-            return 1
-
-        now = time.time()
-        entry = self._timer_list[0]
-
-        if now >= entry.deadline:
-            self._timer_list.pop(0)
+        expired, self._expired = self._expired, []
+        for idx, entry in enumerate(expired):
+            # 앞선 receive_time_out() 안에서 취소됐을 수 있음
+            if entry.cancelled:
+                continue
+            self._timers.pop(entry.key, None)
             self.receive_time_out(entry.reason, entry.extra_reason)
 
             # receive_time_out() 안에서 unregister 됐을 수 있음
-            if self.world_ptr and self.world_ptr.timer_event_src:
-                if not self.world_ptr.timer_event_src.is_exist_instance(self):
-                    return 1
-
-        self._update_min_deadline()
+            # → 남은 만료 타이머는 통지하지 않고 목록에서도 제거 (힙에서는 이미 빠짐)
+            src = self._timer_event_src()
+            if src and not src.is_exist_instance(self):
+                for rest in expired[idx + 1:]:
+                    self._timers.pop(rest.key, None)
+                return 1
         return 1
 
     # ------------------------------------------------------------------ #
@@ -171,22 +161,21 @@ class FrTimerSensor(FrSensor):
 
     def cancel_timer(self, key: int) -> bool:
         """C++ CancelTimer(timer_key) 대응."""
-        for i, t in enumerate(self._timer_list):
-            if t.key == key:
-                self._timer_list.pop(i)
-                self._restore_after_cancel()
-                return True
-        return False
+        entry = self._timers.pop(key, None)
+        if entry is None:
+            return False
+        self._cancel_entry(entry)
+        return True
 
     def cancel_all_timer(self) -> None:
         """C++ CancelAllTimer() 대응."""
-        self._timer_list.clear()
-        self._min_deadline = 0.0
-        self.set_timer(_LONG_TIME, 10000)   # 더미 타이머 재등록
+        for entry in self._timers.values():
+            self._cancel_entry(entry)
+        self._timers.clear()
 
     def get_timer_count(self) -> int:
-        """C++ GetTimerCount() 대응. 더미 타이머 1개 제외한 실제 타이머 수."""
-        return max(0, len(self._timer_list) - 1)
+        """C++ GetTimerCount() 대응. 미만료 타이머 수."""
+        return len(self._timers)
 
     # ------------------------------------------------------------------ #
     # 순수 가상 함수
@@ -203,10 +192,16 @@ class FrTimerSensor(FrSensor):
                      reason: int, extra_reason: object = None) -> int:
         """
         C++ SetTimeOut(int Sec, int MiliSec, ...) 대응.
-        deadline = 현재시각 + 지연시간 으로 계산 후 정렬 삽입.
+        deadline = monotonic 현재시각 + 지연시간 으로 계산 후 월드 타이머 힙에 등록.
+        타이머 이벤트 소스가 없으면 -1 (set_timer 의 잘못된 값과 동일).
         """
-        now      = time.time()
-        deadline = now + sec + milli_sec / 1000.0
+        # 월드(타이머 힙)가 없으면 만료 통지를 받을 수 없으므로 등록 실패
+        src = self._timer_event_src()
+        if not src:
+            logger.error('_set_timeout: no timer event source (reason %d)', reason)
+            return -1
+
+        deadline = time.monotonic() + sec + milli_sec / 1000.0
 
         self._key_sequence += 1
         entry = _TimeOut(
@@ -215,34 +210,18 @@ class FrTimerSensor(FrSensor):
             key          = self._key_sequence,
             extra_reason = extra_reason,
         )
-
-        # 정렬 삽입 (deadline 오름차순)
-        inserted = False
-        for i, t in enumerate(self._timer_list):
-            if t.deadline > deadline:
-                self._timer_list.insert(i, entry)
-                inserted = True
-                break
-        if not inserted:
-            self._timer_list.append(entry)
-
-        self._update_min_deadline()
+        self._timers[entry.key] = entry
+        src.timer_queue.push(entry, self)
         return self._key_sequence
 
-    def _update_min_deadline(self) -> None:
-        """_min_deadline 을 큐 맨 앞 항목으로 갱신."""
-        if self._timer_list:
-            self._min_deadline = self._timer_list[0].deadline
+    def _cancel_entry(self, entry: _TimeOut) -> None:
+        src = self._timer_event_src()
+        if src:
+            src.timer_queue.cancel(entry)
         else:
-            self._min_deadline = 0.0
+            entry.cancelled = True
 
-    def _restore_after_cancel(self) -> None:
-        """
-        cancel_timer() 후 처리.
-        C++ : 빈 리스트면 더미 타이머 재등록, 아니면 _min 갱신.
-        """
-        if self._timer_list:
-            self._update_min_deadline()
-        else:
-            self._min_deadline = 0.0
-            self.set_timer(_LONG_TIME, 10000)
\ No newline at end of file
+    def _timer_event_src(self):
+        if self.world_ptr:
+            return self.world_ptr.timer_event_src
+        return None
@@ -1,9 +1,11 @@
 import sys
 import os
 import select
+import selectors
 import threading
 import errno
 import time
+from collections import deque
 
 # -------------------------------------------------------
 # 1. 프로젝트 경로 설정
@@ -54,6 +56,10 @@ class EVENT_MSG:
     SENSOR_ADD = 1
     WORLD_THREAD_CLEAR = 2
 
+class FR_REACTOR:
+    SELECT = "select"       # 매 루프 FD 리스트 재구성 + select.select (기본, FD_SETSIZE 제한)
+    SELECTOR = "selector"   # selectors.DefaultSelector (epoll) 에 FD 상주 등록
+
 # -------------------------------------------------------
 # FrWorld Class
 # 이벤트 루프 및 스레드/월드 관리자 (The Core Engine)
@@ -67,10 +73,12 @@ class FrWorld:
     m_ExitCode = 0
     m_Argc = 0
     m_Argv = []
+    m_DefaultReactor = os.environ.get("FR_REACTOR", FR_REACTOR.SELECT)
 
-    def __init__(self, mode=FR_MODE.FR_SUB):
+    def __init__(self, mode=FR_MODE.FR_SUB, reactor=None):
         """
         C++: FrWorld Constructor
+        reactor : FR_REACTOR.SELECT / FR_REACTOR.SELECTOR (None 이면 FR_REACTOR 환경변수, 기본 select)
         """
         # [수정] 메서드 호출 전에 멤버 변수들을 가장 먼저 초기화합니다.
         self.m_WorldId = FrWorld.m_GlobalWorldId
@@ -81,6 +89,11 @@ class FrWorld:
         self.m_RunStatus = False
         
         self.m_EventSrcList = [] # List of FrEventSrc
+
+        # Reactor (selector 모드 : FD 는 센서가 상태 변경 시에만 register/modify/unregister)
+        self.m_Reactor = reactor if reactor else FrWorld.m_DefaultReactor
+        self.m_Selector = selectors.DefaultSelector() if self.m_Reactor == FR_REACTOR.SELECTOR else None
+        self.m_WritableSensorList = deque() # 쓰기 가능 통지 대기 센서
         
         # ---------------------------------------------------
         # Event Sources Initialization
@@ -143,6 +156,10 @@ class FrWorld:
                 src.release_sensor(self)
         self.m_EventSrcList.clear()
 
+        if self.m_Selector:
+            self.m_Selector.close()
+            self.m_Selector = None
+
     # -------------------------------------------------------
     # Initialization & Main Loop
     # -------------------------------------------------------
@@ -237,6 +254,9 @@ class FrWorld:
 
         # 각 EventSrc에게 요청 위임
         for src in self.m_EventSrcList:
+            # selector 모드 : 입력 센서 FD 는 selector 에 상주 -> 수집 생략
+            if self.m_Selector and src is self.m_InputEventSrc:
+                continue
             # 1. FrInputEventSrc: 소켓 FD 수집
             # 2. FrTimerEventSrc: 최소 타임아웃 계산 후 self.timeout 갱신
             # 3. FrSignalEventSrc: (Select와 무관, Pass)
@@ -244,6 +264,9 @@ class FrWorld:
         return 1
 
     def read_event(self):
+        if self.m_Selector:
+            return self.read_event_selector()
+
         self.make_select_request()
         
         # 타임아웃 보정
@@ -254,8 +277,8 @@ class FrWorld:
             # Python select
             r_in, w_in, x_in = select.select(self.rd_fds, self.wr_fds, self.ex_fds, self.timeout)
             
-            # 결과 전달 -> 각 Src는 자신의 센서들에게 통지
-            self.get_events(r_in, w_in, x_in)
+            # 결과 전달 -> 각 Src는 자신의 센서들에게 통지 (센서별 FD_ISSET 은 set 조회)
+            self.get_events(set(r_in), set(w_in), set(x_in))
             return 1
 
         except select.error as e:
@@ -271,16 +294,99 @@ class FrWorld:
              print(f"[Error] Select ValueError: {e}")
              return -1
 
+    def read_event_selector(self):
+        """
+        (C++ 원본 없음)
+        selector 모드 이벤트 대기.
+        입력 센서 FD 는 등록된 상태로 유지되므로 루프 비용은 센서 수가 아닌 발생 이벤트 수에 비례.
+        타이머/시그널 Src 는 기존과 같이 make_select_request / get_events 로 처리.
+        """
+        self.make_select_request()
+
+        if self.timeout is not None and self.timeout < 0:
+            self.timeout = 0
+
+        try:
+            ready = self.m_Selector.select(self.timeout)
+        except InterruptedError:
+            return 1 # Signal interrupt (정상)
+        except (OSError, ValueError) as e:
+            print(f"[Error] Selector error: {e}")
+            return -1
+
+        for key, mask in ready:
+            sensor = key.data
+            if mask & selectors.EVENT_READ:
+                self.m_InputEventSrc.insert_notify_sensor(sensor)
+            if mask & selectors.EVENT_WRITE:
+                self.insert_writable_sensor(sensor)
+
+        self.get_events(self.rd_fds, self.wr_fds, self.ex_fds)
+        return 1
+
     def get_events(self, r_in, w_in, x_in):
         for src in self.m_EventSrcList:
+            if self.m_Selector and src is self.m_InputEventSrc:
+                continue
             src.get_events(r_in, w_in, x_in, None)
         return 1
 
     def dispatch_src(self):
+        # 쓰기 가능 통지 먼저 (대기 중인 송신 데이터 처리)
+        while self.m_WritableSensorList:
+            sensor = self.m_WritableSensorList.popleft()
+            if sensor.is_enabled():
+                sensor.receive_writable()
+
         for src in self.m_EventSrcList:
             src.dispatch_sensor()
         return 1
 
+    # -------------------------------------------------------
+    # FD Registration (selector 모드)
+    # -------------------------------------------------------
+    def is_selector_mode(self):
+        return self.m_Selector is not None
+
+    def register_fd(self, fd, sensor, events=selectors.EVENT_READ):
+        """
+        (C++ 원본 없음)
+        selector 에 FD 등록 (data = 센서). select 모드에서는 False (매 루프 수집 방식 유지).
+        """
+        if not self.m_Selector:
+            return False
+        try:
+            self.m_Selector.register(fd, events, sensor)
+        except KeyError:
+            # 같은 FD 번호가 남아 있음 (close 후 재사용) -> 새 센서로 교체
+            self.m_Selector.modify(fd, events, sensor)
+        except (OSError, ValueError) as e:
+            print(f"[FrWorld] register_fd({fd}) error: {e}")
+            return False
+        return True
+
+    def modify_fd(self, fd, sensor, events):
+        if not self.m_Selector:
+            return False
+        try:
+            self.m_Selector.modify(fd, events, sensor)
+        except (KeyError, OSError, ValueError) as e:
+            print(f"[FrWorld] modify_fd({fd}) error: {e}")
+            return False
+        return True
+
+    def unregister_fd(self, fd):
+        if not self.m_Selector:
+            return False
+        try:
+            self.m_Selector.unregister(fd)
+        except (KeyError, OSError, ValueError):
+            return False
+        return True
+
+    def insert_writable_sensor(self, sensor):
+        self.m_WritableSensorList.append(sensor)
+
     # -------------------------------------------------------
     # Inter-World Communication (Pipe)
     # -------------------------------------------------------
@@ -16,13 +16,15 @@ C++ → Python 주요 변환 포인트:
   SENSOR_ADD                   → MessageType.SENSOR_ADD
   frThreadWorld* ptr           → FrThreadWorld (지연 임포트)
   ptr->WaitFinish() / delete   → thread_world.wait_finish()
-  frSensor::m_SensorMgrLock    → FrSensor._sensor_mgr_lock
-  frSensor::GetGlobalSensorList() → FrSensor.get_global_sensor_list()
+  frSensor::m_SensorMgrLock    → FrSensorRegistry.lock
+  frSensor::GetGlobalSensorList() 순회 → FrSensorRegistry.find(sensor_id)  (O(1))
+  frMessageInfo.m_Sensor (포인터) → FrMessageInfo.sensor_id
   ((frMsgSensor*)sensor)->RecvEvent() → msg_sensor.recv_event()
   info.m_Sensor->m_WorldPtr    → sensor.world_ptr
 
 변경 이력:
   v1 - 초기 변환
+  v2 - 메시지에 센서 대신 sensor_id 전달, 전역 센서 목록 순회 제거
 """
 
 import logging
@@ -30,8 +32,10 @@ import pickle
 import struct
 from typing import TYPE_CHECKING
 
-from fr_pipe_sensor import FrPipeSensor
-from fr_world       import MessageType
+from fr_list            import FrMessageInfo
+from fr_pipe_sensor     import FrPipeSensor
+from fr_sensor_registry import FrSensorRegistry
+from fr_world           import MessageType
 
 if TYPE_CHECKING:
     pass
@@ -141,32 +145,28 @@ class FrWorldPipe(FrPipeSensor):
             return 1
 
         # ── 일반 센서 메시지 ─────────────────────────────────────────── #
-        from fr_sensor    import FrSensor
         from fr_msg_sensor import FrMsgSensor
 
-        with FrSensor._sensor_mgr_lock:
-            sensor_list = FrSensor.get_global_sensor_list()
+        with FrSensorRegistry.lock:
+            sensor = FrSensorRegistry.find(info.sensor_id)
 
-            for sensor in sensor_list:
-                if sensor is not info.sensor:
-                    continue
+            # 센서를 찾지 못한 경우 (C++ 주석 처리된 에러와 동일하게 조용히 통과)
+            if sensor is None:
+                return 1
 
-                # 월드 일치 확인
-                if sensor.world_ptr is not self.get_world():
-                    logger.error('_dispatch: different event world')
-                    return -1
+            # 월드 일치 확인
+            if sensor.world_ptr is not self.get_world():
+                logger.error('_dispatch: different event world')
+                return -1
 
-                if info.message == MessageType.SENSOR_ADD:
-                    sensor.register_sensor()
+            if info.message == MessageType.SENSOR_ADD:
+                sensor.register_sensor()
 
+            else:
+                # frMsgSensor 로 캐스팅 후 RecvEvent 호출
+                if isinstance(sensor, FrMsgSensor):
+                    sensor.recv_event(info.message, info.addition_info)
                 else:
-                    # frMsgSensor 로 캐스팅 후 RecvEvent 호출
-                    if isinstance(sensor, FrMsgSensor):
-                        sensor.recv_event(info.message, info.addition_info)
-                    else:
-                        logger.error('_dispatch: sensor is not FrMsgSensor')
-
-                return 1
+                    logger.error('_dispatch: sensor is not FrMsgSensor')
 
-        # 센서를 찾지 못한 경우 (C++ 주석 처리된 에러와 동일하게 조용히 통과)
-        return 1
\ No newline at end of file
+        return 1
@@ -19,12 +19,18 @@ except ImportError:
     class DBGwServerMgr:
         def __init__(self, k, u, p, n): pass
 
+from Class.libDBGw.libDBGwSvr.DBGwWorkerPool import DBGwWorkerPool
+
 class DBGwMgr(DBGwServerMgr):
     """
     C++: DBGwMgr
     Manages the Gateway Process.
-    Uses Fork-Exec model to handle sessions in separate processes.
+    Uses Fork-Exec model to handle sessions in separate processes,
+    or a DBGwWorkerPool (one thread per session) once enable_worker_pool() is called.
     """
+    # Logged-on DB sessions shared by threaded sessions (DB_CONN_REQ beyond it waits for a release)
+    MAX_WORKER_DB_SESSION = 256
+
     def __init__(self, db_kind, default_db_user, default_db_passwd, default_db_name):
         """
         C++: DBGwMgr(...) : DBGwServerMgr(...)
@@ -36,15 +42,39 @@ class DBGwMgr(DBGwServerMgr):
         if sys.platform != 'win32':
             signal.signal(signal.SIGCHLD, signal.SIG_IGN)
 
+        self.m_WorkerPool = None
+
     def __del__(self):
         pass
 
+    def enable_worker_pool(self, warm_cnt, session_handler):
+        """
+        (No C++ original)
+        Serves each session on its own thread with warm_cnt DB sessions logged on in advance,
+        instead of fork-per-accept. session_handler(session) runs the session until it is closed.
+        """
+        from Class.libDBGw.libDBGwSvr.DBGwServer import DBGwServer
+
+        session_pool = DBGwServer.get_session_pool(self.m_DbKind, self.m_DbUser, self.m_DbPasswd, self.m_DbName,
+                                                   min_size=warm_cnt, max_size=DBGwMgr.MAX_WORKER_DB_SESSION)
+        self.m_WorkerPool = DBGwWorkerPool(warm_cnt, session_handler)
+        self.m_WorkerPool.start(session_pool)
+
+    def stop_worker_pool(self):
+        if self.m_WorkerPool:
+            self.m_WorkerPool.stop()
+            self.m_WorkerPool = None
+
     def accept_session(self, session):
         """
         C++: bool AcceptSession(DBGwServerSession* Session)
         Forks a new process to handle the session.
         The child process re-executes the script with '-alone' and '-sessionid' arguments.
+        With a worker pool, the session is served on a worker thread instead (kept alive : returns False).
         """
+        if self.m_WorkerPool and self.m_WorkerPool.submit(session):
+            return False
+
         # Windows does not support fork().
         if sys.platform == 'win32':
             print("Windows does not support fork(). Single process mode suggested.")
@@ -41,6 +41,8 @@ class DBGwWorld:
         parser.add_argument("-dbgwport", type=int, help="Listen Port for Parent Process")
         parser.add_argument("-alone", action="store_true", help="Run in detached/child mode")
         parser.add_argument("-log", help="Logging option (off to disable)")
+        parser.add_argument("-workers", type=int, default=0,
+                            help="Thread per session with N warm DB sessions (0: fork per session)")
 
         # Parse known args to avoid erroring on unknown flags passed by framework
         args, unknown = parser.parse_known_args()
@@ -105,8 +107,10 @@ class DBGwWorld:
 
         if gw.run(db_gw_port):
             gw.set_log_dir(self.log_dir)
+            if args.workers > 0:
+                gw.enable_worker_pool(args.workers, self.run_session_loop)
             pid = FrUtilMisc.get_pid()
-            print(f"DBGwMgr Run Success (pid:{pid})(port:{db_gw_port})")
+            print(f"DBGwMgr Run Success (pid:{pid})(port:{db_gw_port})(workers:{args.workers})")
             
             # Run Main Loop
             # This keeps the parent process alive to accept new connections
@@ -149,6 +153,7 @@ class DBGwWorld:
                 time.sleep(0.01)
         except KeyboardInterrupt:
             print("Server Stopping...")
+            gw.stop_worker_pool()
 
 # -------------------------------------------------------
 # Execution Entry Point (Equivalent to main.C usually linking this)
@@ -30,6 +30,8 @@ from Class.Common.AsciiServerType import *
 # Managers (Lazy Import 및 순환 참조 방지)
 try:
     from Class.ProcNaServer.DbManager import DbManager
+    from Class.ProcNaServer.DbWorkerPool import DbWorkerPool
+    from Class.ProcNaServer.PortStatusWriter import PortStatusWriter
     from Class.ProcNaServer.ManagerConnMgr import ManagerConnMgr
     from Class.ProcNaServer.GuiConnMgr import GuiConnMgr
     from Class.ProcNaServer.ServerConnMgr import ServerConnMgr
@@ -76,6 +78,7 @@ class AsciiServerWorld(AsWorld):
         self.m_DbUserId = ""; self.m_DbPassword = ""; self.m_DbTns = ""
         self.m_DbIp = ""; self.m_DbPort = "1521"
         self.m_DbManager = None
+        self.m_DbWorkerPool = None
         self.m_MMCResultDbManager = None
         self.m_MmcStoredFunctionStatus = False
         
@@ -296,6 +299,17 @@ class AsciiServerWorld(AsWorld):
             print(f"[AsciiServerWorld] Db Connection Error : {self.m_DbManager.get_error_msg()}")
             return False
 
+        # 포트 상태(DC_STATUS_CMD_PORT) 갱신은 모아서 Array DML 로 반영 (매니저 재접속 시 수천 건)
+        self.m_DbManager.enable_port_status_writer()
+
+        # 운용 중 상태 테이블 갱신은 DbWorkerPool 작업 스레드에서 수행 (World 스레드 비블로킹)
+        worker_cnt = int(os.environ.get("ASCII_DB_WORKER_CNT", "0") or 0)
+        self.m_DbWorkerPool = DbWorkerPool(self, (self.m_DbUserId, self.m_DbPassword, self.m_DbTns,
+                                                  self.m_DbIp, self.m_DbPort), worker_cnt)
+        self.m_DbWorkerPool.start()
+        if self.m_DbManager.m_PortStatusWriter:
+            self.m_DbManager.m_PortStatusWriter.set_worker_pool(self.m_DbWorkerPool)
+
         # 13. Execute Processes & Load Data
         self.m_DbManager.get_command_authority_info(self.m_CommandAuthorityInfoMap)
         dbm_msg_id = self.m_DbManager.get_current_msg_id()
@@ -417,6 +431,39 @@ class AsciiServerWorld(AsWorld):
     def error_file_changed(self):
         pass # Log rotation logic
         
+    def submit_db_job(self, key, func, *args, callback=None):
+        """
+        func(db_manager, *args) 를 DbWorkerPool 에서 수행 (같은 key 는 순서 보장).
+        Pool 이 없으면 m_DbManager 로 즉시 수행.
+        결과는 callback(result, error) 로 전달 (result False = 실패, error 는 해당 작업의 오류).
+        callback 이 없으면 실패만 보고. 반환값은 작업 접수 여부.
+        """
+        if self.m_DbWorkerPool and self.m_DbWorkerPool.submit(key, func, *args, callback=callback):
+            return True
+
+        result = func(self.m_DbManager, *args)
+        error = self.m_DbManager.get_error_msg() if result is False else ""
+        if callback:
+            callback(result, error)
+        elif result is False:
+            print(f"[AsciiServerWorld] DB Job Error (key={key}) : {error}")
+            self.send_ascii_error(1, f"DB Query Error - {error}")
+        return True
+
+    def submit_cmd_port_job(self, func, *args, callback=None):
+        """
+        DC_STATUS_CMD_PORT 를 변경하는 작업 : 대기 중인 포트 상태를 먼저 제출하여
+        PortStatusWriter flush 와 같은 작업 스레드에서 순서대로 수행.
+        """
+        if self.m_DbManager:
+            self.m_DbManager.flush_port_status()
+        return self.submit_db_job(PortStatusWriter.DB_JOB_KEY, func, *args, callback=callback)
+
     def clean_up(self):
         self.m_ThreadStatus = False
+        if self.m_DbManager:
+            self.m_DbManager.flush_port_status()
+        if self.m_DbWorkerPool:
+            self.m_DbWorkerPool.stop()
+            self.m_DbWorkerPool = None
         if self.m_ErrorLogFp: self.m_ErrorLogFp.close()
\ No newline at end of file
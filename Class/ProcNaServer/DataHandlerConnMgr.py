@@ -121,6 +121,8 @@ class DataHandlerConnMgr(SockMgrConnMgr):
             from AsciiServerWorld import AsciiServerWorld
             world = AsciiServerWorld._instance
             
+            # World 스레드 동기 조회 유지 : 기동 시 적재한 정보에 SSH 계정이 없을 때만 1회 수행되며,
+            # 이어지는 ssh 실행도 이 스레드에서 동기로 수행됨
             if not info.SshID: # Empty string check
                 if world.m_DbManager and not world.m_DbManager.get_data_handler_info_find_id(info):
                      print(f"[DataHandlerConnMgr] [CORE_ERROR] Get DataHandler Info Error : {world.m_DbManager.get_error_msg()}")
@@ -291,27 +293,13 @@ class DataHandlerConnMgr(SockMgrConnMgr):
                 world.send_ascii_error(1, msg)
                 return False
 
-            if world.m_DbManager and not world.m_DbManager.update_data_handler_status(proc_ctl.ProcessId, proc_ctl.Status):
-                 print(f"[DataHandlerConnMgr] [CORE_ERROR] Update DataHandler Status Error : {world.m_DbManager.get_error_msg()}")
-                 return False
-
-            info.SettingStatus = START if proc_ctl.Status == START else STOP
-
-            if info.RunMode == 0:
-                # Normal Mode logic
-                # SendDataHandlerInfoChange -> likely meant for DataRouter sync?
-                # Assuming not implemented or stub needed
-                pass
-
-            if proc_ctl.Status == START:
-                if self.execute_data_handler(info):
-                    world.send_ascii_error(1, f"The DataHandler({proc_ctl.ProcessId}) start successfull")
-                else:
-                    # GetGErrMsg equivalent
-                    world.send_ascii_error(1, "Execute Fail")
-                    
-            elif proc_ctl.Status == STOP:
-                self.stop_data_handler(info)
+            # DB Update (DbWorkerPool) -> 완료 통지에서 상태 변경 및 실행/중지
+            dh_id, status = proc_ctl.ProcessId, proc_ctl.Status
+            if world.m_DbManager:
+                world.submit_db_job(dh_id, lambda db: db.update_data_handler_status(dh_id, status),
+                                    callback=lambda result, error: self.data_handler_status_done(dh_id, status, result, error))
+            else:
+                self.data_handler_status_done(dh_id, status, True, "")
 
         else:
             status_str = "Start" if info.RequestStatus == WAIT_START else "Stop"
@@ -322,6 +310,41 @@ class DataHandlerConnMgr(SockMgrConnMgr):
             
         return False
 
+    def data_handler_status_done(self, dh_id, status, result, error):
+        """
+        recv_process_control 의 DB 갱신 완료 (World 스레드, DB_JOB_DONE)
+        """
+        from AsciiServerWorld import AsciiServerWorld
+        world = AsciiServerWorld._instance
+
+        if result is False:
+            msg = f"Update DataHandler Status Error({dh_id}) : {error}"
+            print(f"[DataHandlerConnMgr] [CORE_ERROR] {msg}")
+            world.send_ascii_error(1, msg)
+            return
+
+        info = self.find_data_handler_info(dh_id)
+        if info is None:
+            return
+
+        info.SettingStatus = START if status == START else STOP
+
+        if info.RunMode == 0:
+            # Normal Mode logic
+            # SendDataHandlerInfoChange -> likely meant for DataRouter sync?
+            # Assuming not implemented or stub needed
+            pass
+
+        if status == START:
+            if self.execute_data_handler(info):
+                world.send_ascii_error(1, f"The DataHandler({dh_id}) start successfull")
+            else:
+                # GetGErrMsg equivalent
+                world.send_ascii_error(1, "Execute Fail")
+
+        elif status == STOP:
+            self.stop_data_handler(info)
+
     def find_data_handler_info(self, data_handler_id):
         """
         C++: AS_DATA_HANDLER_INFO_T* FindDataHandlerInfo(string DataHandlerId)
@@ -353,16 +376,22 @@ class DataHandlerConnMgr(SockMgrConnMgr):
 
             print(f"[DataHandlerConnMgr] DataHandler {dh_id} Status is setting STOP")
 
-            if world.m_DbManager and not world.m_DbManager.update_data_handler_status(dh_id, STOP):
-                print(f"[DataHandlerConnMgr] [CORE_ERROR] Update Datahandler Status Error : {world.m_DbManager.get_error_msg()}")
-                return
+            def stop_done(result, error):
+                if result is False:
+                    print(f"[DataHandlerConnMgr] [CORE_ERROR] Update Datahandler Status Error({dh_id}) : {error}")
+                    return
 
-            info.SettingStatus = STOP
-            info.CurStatus = STOP
-            info.RequestStatus = WAIT_NO
+                info.SettingStatus = STOP
+                info.CurStatus = STOP
+                info.RequestStatus = WAIT_NO
 
-            # Send Info Changes
-            world.send_info_change(info)
+                # Send Info Changes
+                world.send_info_change(info)
+
+            if world.m_DbManager:
+                world.submit_db_job(dh_id, lambda db: db.update_data_handler_status(dh_id, STOP), callback=stop_done)
+            else:
+                stop_done(True, "")
 
     def kill_data_handler(self, data_handler_id):
         """
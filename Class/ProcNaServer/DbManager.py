@@ -8,49 +8,232 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 # 모듈 Import
-from Class.Sql.fr_db_session import FrDbSession
 from Class.Sql.FrBaseType import EDB_TYPE, E_QUERY_DATA_TYPE
-from Class.SqlType.fr_db_param import FrDbParam
+from Class.SqlType.fr_db_param import FrDbParam, DbParam
+from Class.SqlType.fr_db_base_type import DbType
+from Class.Sql.fr_db_statement import DbStatementRegistry
+from Class.Sql.fr_db_session_pool import DbSessionPool
 from Class.Common.CommType import *
 from Class.Common.AsciiServerType import *
 from Class.Common.AsUtil import AsUtil
 from Class.Common.CommDbType import * # DB 테이블 상수
 
+# -------------------------------------------------------
+# SQL Statements
+# 논리 쿼리별 1회 선언 (:NAME 바인드 변수, {DATE(:NAME)} / {SYSDATE} 매크로)
+# 값은 실행 시 바인드 -> DB 에 전달되는 SQL 텍스트가 id/sequence 와 무관하게 고정
+# -------------------------------------------------------
+DB_MANAGER_STATEMENTS = {
+    # Status
+    "DELETE_CMD_PORT_BY_MANAGER":   f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE MANAGERID = :MANAGERID",
+    "DELETE_CMD_PORT_BY_CONNECTOR": f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE CONNECTORID = :CONNECTORID",
+    "DELETE_CMD_PORT_BY_SEQUENCE":  f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE SEQUENCE = :SEQUENCE",
+    "DELETE_CMD_PORT_ALL":          f"DELETE FROM {DC_STATUS_CMD_PORT}",
+    "INSERT_CMD_PORT":
+        f"INSERT INTO {DC_STATUS_CMD_PORT} (SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS) "
+        f"VALUES (:SEQUENCE, :MANAGERID, :CONNECTORID, :EQUIPID, :STATUS)",
+    "UPDATE_CONNECTOR_STATUS":
+        f"UPDATE {DC_CNF_CONNECTOR} SET STATUS = :STATUS, LAST_ACTION_DATE = {{DATE(:LAST_ACTION_DATE)}}, "
+        f"LAST_ACTION = :LAST_ACTION, LAST_ACTION_DESC = :LAST_ACTION_DESC "
+        f"WHERE GATEWAYID = :GATEWAYID AND ID = :ID",
+    "UPDATE_CONNECTION_STATUS":
+        f"UPDATE {DC_CNF_CONNECTION} SET STATUS = :STATUS, DESCRIPTION = :DESCRIPTION WHERE SEQUENCE = :SEQUENCE",
+    "UPDATE_MANAGER_STATUS":
+        f"UPDATE {DC_CNF_MANAGER} SET STATUS = :STATUS, DESCRIPTION = :DESCRIPTION WHERE ID = :ID",
+    "UPDATE_DATA_HANDLER_STATUS":
+        f"UPDATE {DC_EVENT_CONSUMER} SET STATUS = :STATUS, MODIFY_DATE = {{SYSDATE}} WHERE ID = :ID",
+    "UPDATE_SUB_PROC_STATUS":
+        f"UPDATE {DC_CNF_SUB_PROC} SET STATUS = :STATUS WHERE ID_STR = :ID_STR",
+    "DISABLE_MANAGER_FROM_IP":
+        f"UPDATE {DC_CNF_MANAGER} SET STATUS = :STATUS WHERE IP = :IP",
+
+    # Select (id 조건)
+    "SELECT_DATA_HANDLER_SSH":
+        f"SELECT ID, SSHID, SSHPW FROM {DC_EVENT_CONSUMER} WHERE ID = :ID",
+    "SELECT_MANAGER_BY_ID":
+        f"SELECT ID, IP, STATUS, SSHID, SSHPW FROM {DC_CNF_MANAGER} WHERE ID = :ID",
+    "SELECT_CONNECTION_IP":
+        f"SELECT DISTINCT CC.SEQUENCE, HW.IP FROM {DC_CNF_CONNECTION} CC, {TBD_EQP_HOSTHW} HW "
+        f"WHERE CC.AGENTEQUIPID = HW.AGENTEQUIPID AND CC.CONNECTORID = :CONNECTORID",
+    "SELECT_CONNECTION_IP_BY_SEQUENCE":
+        f"SELECT DISTINCT CC.SEQUENCE, HW.IP FROM {DC_CNF_CONNECTION} CC, {TBD_EQP_HOSTHW} HW "
+        f"WHERE CC.AGENTEQUIPID = HW.AGENTEQUIPID AND CC.CONNECTORID = :CONNECTORID "
+        f"AND CC.SEQUENCE = :SEQUENCE",
+
+    # MMC Result
+    "INSERT_MMC_RESULT":
+        f"INSERT INTO {DC_MMC_RESULT} (EQUIPID, GID, EXTID, RESULTMODE, USERID, COMMAND) "
+        f"VALUES (:EQUIPID, :GID, :EXTID, :RESULTMODE, :USERID, :COMMAND)",
+
+    # Connector Info Change
+    "INSERT_CONNECTOR":
+        f"INSERT INTO {DC_CNF_CONNECTOR} "
+        f"(ID, GATEWAYID, RULEID, STATUS, JUNCTIONTYPE, CMDRESPONSETYPE, LOGCYCLE, "
+        f"CREATE_DATE, MODIFY_DATE, LAST_ACTION_DATE, LAST_ACTION ) "
+        f"VALUES (:ID, :GATEWAYID, :RULEID, :STATUS, :JUNCTIONTYPE, :CMDRESPONSETYPE, :LOGCYCLE, "
+        f"{{DATE(:CREATE_DATE)}}, {{DATE(:MODIFY_DATE)}}, {{DATE(:LAST_ACTION_DATE)}}, :LAST_ACTION )",
+    "UPDATE_CONNECTOR":
+        f"UPDATE {DC_CNF_CONNECTOR} SET "
+        f"GATEWAYID = :GATEWAYID, RULEID = :RULEID, STATUS = :STATUS, CMDRESPONSETYPE = :CMDRESPONSETYPE, "
+        f"LOGCYCLE = :LOGCYCLE, MODIFY_DATE = {{DATE(:MODIFY_DATE)}}, "
+        f"LAST_ACTION_DATE = {{DATE(:LAST_ACTION_DATE)}}, LAST_ACTION = :LAST_ACTION, "
+        f"DESCRIPTION = :DESCRIPTION, LAST_ACTION_DESC = :LAST_ACTION_DESC "
+        f"WHERE ID = :ID",
+    "DELETE_CONNECTION_BY_CONNECTOR": f"DELETE FROM {DC_CNF_CONNECTION} WHERE CONNECTORID = :CONNECTORID",
+    "DELETE_CONNECTOR":               f"DELETE FROM {DC_CNF_CONNECTOR} WHERE ID = :ID",
+    "INSERT_CONNECTOR_DELETED":
+        f"INSERT INTO {DC_CNF_CONNECTOR_DELETED} "
+        f"(ID, GATEWAYID, RULEID, DESCRIPTION, CREATE_DATE, MODIFY_DATE, DELETE_DATE) "
+        f"VALUES (:ID, :GATEWAYID, :RULEID, :DESCRIPTION, "
+        f"{{DATE(:CREATE_DATE)}}, {{DATE(:MODIFY_DATE)}}, {{SYSDATE}})",
+    "UPDATE_CONNECTOR_RULE":
+        f"UPDATE {DC_CNF_CONNECTOR} SET RULEID = :RULEID WHERE GATEWAYID = :GATEWAYID AND ID = :ID",
+    "UPDATE_CONNECTOR_DESC":
+        f"UPDATE {DC_CNF_CONNECTOR} SET DESCRIPTION = :DESCRIPTION WHERE GATEWAYID = :GATEWAYID AND ID = :ID",
+
+    # Manager Info Change
+    "INSERT_MANAGER":
+        f"INSERT INTO {DC_CNF_MANAGER} (ID, IP, STATUS, SSHID, SSHPW) "
+        f"VALUES (:ID, :IP, :STATUS, :SSHID, :SSHPW)",
+    "UPDATE_CONNECTOR_GATEWAY":
+        f"UPDATE {DC_CNF_CONNECTOR} SET GATEWAYID = :GATEWAYID WHERE GATEWAYID = :OLD_GATEWAYID",
+    "UPDATE_MANAGER":
+        f"UPDATE {DC_CNF_MANAGER} SET ID = :ID, IP = :IP, STATUS = :STATUS, SSHID = :SSHID, SSHPW = :SSHPW "
+        f"WHERE ID = :OLD_ID",
+    "DELETE_CONNECTION_BY_MANAGER":
+        f"DELETE FROM {DC_CNF_CONNECTION} "
+        f"WHERE CONNECTORID IN (SELECT ID FROM {DC_CNF_CONNECTOR} WHERE GATEWAYID = :GATEWAYID)",
+    "DELETE_CONNECTOR_BY_MANAGER":    f"DELETE FROM {DC_CNF_CONNECTOR} WHERE GATEWAYID = :GATEWAYID",
+    "DELETE_MANAGER":                 f"DELETE FROM {DC_CNF_MANAGER} WHERE ID = :ID",
+
+    # Connection Info Change
+    "INSERT_CONNECTION":
+        f"INSERT INTO {DC_CNF_CONNECTION} "
+        f"(SEQUENCE, CONNECTORID, AGENTEQUIPID, PROTOCOLTYPE, PORTTYPE, "
+        f"AGENTPORTNO, USERID, PASSWORD, GATFLAG, STATUS, COMMANDFLAG ) "
+        f"VALUES (:SEQUENCE, :CONNECTORID, :AGENTEQUIPID, :PROTOCOLTYPE, :PORTTYPE, "
+        f":AGENTPORTNO, :USERID, :PASSWORD, :GATFLAG, :STATUS, :COMMANDFLAG)",
+    "UPDATE_CONNECTION":
+        f"UPDATE {DC_CNF_CONNECTION} SET "
+        f"CONNECTORID = :CONNECTORID, AGENTEQUIPID = :AGENTEQUIPID, PROTOCOLTYPE = :PROTOCOLTYPE, "
+        f"PORTTYPE = :PORTTYPE, AGENTPORTNO = :AGENTPORTNO, USERID = :USERID, PASSWORD = :PASSWORD, "
+        f"GATFLAG = :GATFLAG, STATUS = :STATUS, COMMANDFLAG = :COMMANDFLAG "
+        f"WHERE SEQUENCE = :SEQUENCE",
+    "DELETE_CONNECTION":              f"DELETE FROM {DC_CNF_CONNECTION} WHERE SEQUENCE = :SEQUENCE",
+
+    # Data Handler Info Change
+    "INSERT_DATA_HANDLER":
+        f"INSERT INTO {DC_EVENT_CONSUMER} "
+        f"(ID, DBUSERID, DBPASSWORD, DBTNS, HOSTNAME, TIMEMODE, LISTENPORT, "
+        f"STATUS, LOGMODE, IPADDRESS, BYPASSLISTENPORT, LOADINGINTERVAL, "
+        f"HANDLERMODE, TARGETINFO, RUNMODE, LOGCYCLE, SSHID, SSHPW, MODIFY_DATE) "
+        f"VALUES (:ID, :DBUSERID, :DBPASSWORD, :DBTNS, :HOSTNAME, :TIMEMODE, :LISTENPORT, "
+        f":STATUS, :LOGMODE, :IPADDRESS, :BYPASSLISTENPORT, :LOADINGINTERVAL, "
+        f":HANDLERMODE, :TARGETINFO, :RUNMODE, :LOGCYCLE, :SSHID, :SSHPW, {{SYSDATE}})",
+    "UPDATE_DATA_HANDLER":
+        f"UPDATE {DC_EVENT_CONSUMER} SET "
+        f"ID = :ID, DBUSERID = :DBUSERID, DBPASSWORD = :DBPASSWORD, DBTNS = :DBTNS, HOSTNAME = :HOSTNAME, "
+        f"TIMEMODE = :TIMEMODE, LISTENPORT = :LISTENPORT, STATUS = :STATUS, LOGMODE = :LOGMODE, "
+        f"IPADDRESS = :IPADDRESS, BYPASSLISTENPORT = :BYPASSLISTENPORT, LOADINGINTERVAL = :LOADINGINTERVAL, "
+        f"HANDLERMODE = :HANDLERMODE, TARGETINFO = :TARGETINFO, RUNMODE = :RUNMODE, LOGCYCLE = :LOGCYCLE, "
+        f"SSHID = :SSHID, SSHPW = :SSHPW, MODIFY_DATE = {{SYSDATE}} "
+        f"WHERE ID = :OLD_ID",
+    "DELETE_DATA_HANDLER":            f"DELETE FROM {DC_EVENT_CONSUMER} WHERE ID = :ID",
+
+    # Sub Proc Info Change
+    "INSERT_SUB_PROC":
+        f"INSERT INTO {DC_CNF_SUB_PROC} "
+        f"(ID, ID_STR, PARENT, PARENTID, IPADDRESS, HOSTNAME, "
+        f"STATUS, LOGCYCLE, DESCRIPTION, BIN_NAME, ARGS) "
+        f"VALUES (0, :ID_STR, :PARENT, :PARENTID, :IPADDRESS, :HOSTNAME, "
+        f":STATUS, :LOGCYCLE, :DESCRIPTION, :BIN_NAME, :ARGS)",
+    "UPDATE_SUB_PROC":
+        f"UPDATE {DC_CNF_SUB_PROC} SET "
+        f"ID_STR = :ID_STR, PARENT = :PARENT, PARENTID = :PARENTID, IPADDRESS = :IPADDRESS, "
+        f"HOSTNAME = :HOSTNAME, STATUS = :STATUS, LOGCYCLE = :LOGCYCLE, DESCRIPTION = :DESCRIPTION, "
+        f"BIN_NAME = :BIN_NAME, ARGS = :ARGS "
+        f"WHERE ID_STR = :OLD_ID_STR",
+    "DELETE_SUB_PROC":                f"DELETE FROM {DC_CNF_SUB_PROC} WHERE ID_STR = :ID_STR",
+
+    # Command Authority Info Change
+    "INSERT_CMD_SESSION_IDENT":
+        f"INSERT INTO {DC_CMD_SESSION_IDENT} "
+        f"(ID, MAXCMDQUEUE, PRIORITY, LOGMODE, ACKMODE, DESCRIPTION, MAX_SESSION_CNT ) "
+        f"VALUES (:ID, :MAXCMDQUEUE, :PRIORITY, :LOGMODE, :ACKMODE, :DESCRIPTION, :MAX_SESSION_CNT)",
+    "UPDATE_CMD_SESSION_IDENT":
+        f"UPDATE {DC_CMD_SESSION_IDENT} SET "
+        f"ID = :ID, MAXCMDQUEUE = :MAXCMDQUEUE, PRIORITY = :PRIORITY, DESCRIPTION = :DESCRIPTION, "
+        f"LOGMODE = :LOGMODE, ACKMODE = :ACKMODE, MAX_SESSION_CNT = :MAX_SESSION_CNT "
+        f"WHERE ID = :OLD_ID",
+    "DELETE_CMD_SESSION_IDENT":       f"DELETE FROM {DC_CMD_SESSION_IDENT} WHERE ID = :ID",
+}
+
 # -------------------------------------------------------
 # DbManager Class
 # DB 연결 및 비즈니스 쿼리 수행
 # -------------------------------------------------------
 class DbManager:
+    # 모든 DbManager 인스턴스가 공유 (DB 타입별 렌더링 결과도 캐시됨)
+    m_StatementRegistry = DbStatementRegistry()
+    m_StatementRegistry.register_all(DB_MANAGER_STATEMENTS)
+
     def __init__(self):
         self.m_DbSession = None
+        self.m_SessionPool = None # DbSessionPool (같은 접속 정보의 DbManager 끼리 공유)
+        self.m_ErrorMsg = ""      # 폐기된 세션의 마지막 에러
         self.m_DbId = ""
         self.m_DbPass = ""
         self.m_DbTns = ""
         self.m_DbIp = ""
         self.m_DbPort = 0
+        self.m_PortStatusWriter = None
+        self.m_ReportErrorToMain = True # False : DbWorkerPool 작업 스레드 (에러는 완료 통지로 전달)
 
     def __del__(self):
-        if self.m_DbSession:
-            self.m_DbSession.disconnect()
+        self.release_session()
+
+    def enable_port_status_writer(self, flush_size=0, flush_msec=0):
+        """
+        update_connection_status 의 개별 포트 갱신을 PortStatusWriter 로 모아서 반영.
+        flush_size / flush_msec : 0 이면 PortStatusWriter 기본값
+        """
+        from Class.ProcNaServer.PortStatusWriter import PortStatusWriter
+        from Class.ProcNaServer.PortStatusWriterTimer import PortStatusWriterTimer
+        if self.m_PortStatusWriter is None:
+            self.m_PortStatusWriter = PortStatusWriter(self, flush_size, flush_msec)
+            self.m_PortStatusWriter.set_timer(PortStatusWriterTimer(self.m_PortStatusWriter))
+        return self.m_PortStatusWriter
+
+    def flush_port_status(self):
+        """
+        대기 중인 포트 상태 갱신 반영 (DbWorkerPool 사용 시 작업 제출)
+        """
+        if self.m_PortStatusWriter:
+            return self.m_PortStatusWriter.flush()
+        return True
 
     # ---------------------------------------------------
     # Connection Management
     # ---------------------------------------------------
-    def init_db_manager(self, user, passwd, tns, ip, port):
+    def init_db_manager(self, user, passwd, tns, ip, port, session_pool=None):
         """
         C++: bool InitDbManager(...)
+        세션은 DbSessionPool 에서 대여 (session_pool 이 없으면 접속 정보별 공유 풀 사용)
         """
-        # DB 세션 생성 (Oracle/MySQL 선택 - 여기서는 Oracle 가정)
-        self.m_DbSession = FrDbSession.get_instance(EDB_TYPE.ORACLE)
-        
         self.m_DbId = user
         self.m_DbPass = passwd
         self.m_DbTns = tns
         self.m_DbIp = ip
         self.m_DbPort = int(port) if port else 1521
 
-        if not self.m_DbSession.connect(user, passwd, tns, ip, self.m_DbPort):
-            print(f"[DbManager] Connect Fail: {self.m_DbSession.get_error()}")
+        # DB 세션 (Oracle/MySQL 선택 - 여기서는 Oracle 가정)
+        self.m_SessionPool = session_pool or DbSessionPool.get_shared(
+            DbType.ORACLE_OCI2, user, passwd, tns, ip, self.m_DbPort)
+
+        self.m_DbSession = self.m_SessionPool.borrow()
+        if self.m_DbSession is None:
+            self.m_ErrorMsg = self.m_SessionPool.get_error()
+            print(f"[DbManager] Connect Fail: {self.m_ErrorMsg}")
             return False
             
         return True
@@ -58,25 +241,46 @@ class DbManager:
     def get_db_instance(self):
         """
         C++: bool GetDBInstance() -> Reconnect
+        현재 세션을 풀에 반납(끊긴 세션은 폐기)하고 다시 대여.
+        연속 접속 실패 시 풀의 back-off 동안은 접속하지 않고 즉시 실패.
         """
         print("[DbManager] Try auto reconnect to db")
-        if self.m_DbSession:
-            self.m_DbSession.disconnect()
-            
-        self.m_DbSession = FrDbSession.get_instance(EDB_TYPE.ORACLE)
-        if not self.m_DbSession.connect(self.m_DbId, self.m_DbPass, self.m_DbTns, self.m_DbIp, self.m_DbPort):
-            print("[DbManager] Reconnect Fail")
+        self.release_session()
+        if self.m_SessionPool is None:
+            return False
+
+        self.m_DbSession = self.m_SessionPool.borrow(timeout=0)
+        if self.m_DbSession is None:
+            self.m_ErrorMsg = self.m_SessionPool.get_error()
+            print(f"[DbManager] Reconnect Fail : {self.m_ErrorMsg}")
             return False
         
         print("[DbManager] Reconnect Success")
         return True
 
-    def execute_query(self, query_or_param, auto_commit=True):
+    def release_session(self):
+        """
+        대여 중인 세션 반납 (풀이 없으면 접속 해제)
+        """
+        session = self.m_DbSession
+        self.m_DbSession = None
+        if session is None:
+            return
+        if session.get_error():
+            self.m_ErrorMsg = session.get_error()
+        if self.m_SessionPool:
+            self.m_SessionPool.give_back(session)
+        else:
+            session.disconnect()
+
+    def execute_query(self, query_or_param, auto_commit=True, bind_param=None, bind_list=None):
         """
         C++: bool ExecuteQuery(char* Query, bool AutoCommit)
         C++: bool ExecuteQuery(frDbParam* DbParam)
         
         통합 메서드: 입력 타입에 따라 처리
+        bind_param : BindParamByPos / BindParamByName (execute_statement 에서 전달)
+        bind_list  : 행별 bind_param 목록 -> Array DML (execute_statement_array 에서 전달)
         """
         # 1. 쿼리 문자열 추출 (로깅용)
         query_str = ""
@@ -84,13 +288,17 @@ class DbManager:
             query_str = query_or_param
         elif hasattr(query_or_param, 'GetQuery'):
             query_str = query_or_param.GetQuery()
+        elif hasattr(query_or_param, 'get_query'):
+            query_str = query_or_param.get_query()
 
         # print(f"[DbManager] Execute: {query_str}")
 
         # 2. 메인 서버 인스턴스 가져오기 (MAINPTR 대응)
         # 순환 참조 방지를 위해 내부 Import
-        from AsciiServerWorld import AsciiServerWorld
-        main_ptr = AsciiServerWorld._instance
+        main_ptr = None
+        if self.m_ReportErrorToMain:
+            from AsciiServerWorld import AsciiServerWorld
+            main_ptr = AsciiServerWorld._instance
 
         # 3. 세션 확인
         if self.m_DbSession is None:
@@ -106,23 +314,61 @@ class DbManager:
 
         # 4. 실행 (FrDbSession::execute 호출)
         # FrDbSession은 내부적으로 query_or_param 타입을 확인하여 처리함
-        if self.m_DbSession.execute(query_or_param, auto_commit=auto_commit):
+        if bind_list is not None:
+            result = self.m_DbSession.execute_array(query_or_param, bind_list, auto_commit)
+        elif bind_param is not None:
+            if isinstance(query_or_param, str):
+                result = self.m_DbSession.execute_query(query_or_param, bind_param, auto_commit)
+            else:
+                result = self.m_DbSession.execute(query_or_param, bind_param)
+        elif isinstance(query_or_param, str):
+            result = self.m_DbSession.execute_query(query_or_param, auto_commit=auto_commit)
+        else:
+            result = self.m_DbSession.execute(query_or_param)
+
+        if result:
             return True
         else:
             # 5. 실패 시 처리 로직 (C++ 원본 로직 반영)
             print(f"[DbManager] DB Query Error - {query_str}")
             
-            # 재연결 시도
-            self.get_db_instance()
+            # 접속 끊김일 때만 세션 교체 (SQL 에러는 같은 세션 유지, 재접속 back-off 는 풀에서 처리)
+            if self.m_DbSession.is_db_disconnect_err():
+                self.get_db_instance()
             
             # 에러 보고
             if main_ptr and hasattr(main_ptr, 'send_ascii_error'):
                 main_ptr.send_ascii_error(1, f"DB Query Error - {query_str}")
             
-            # 세션 초기화 (재연결 실패 시 다음 시도에서 다시 접속하도록)
-            self.m_DbSession = None
             return False
         
+    def execute_statement(self, name, values, auto_commit=True, param=None):
+        """
+        등록된 문장(DB_MANAGER_STATEMENTS) 을 바인드 변수로 실행.
+        param 이 주어지면 SELECT 로 보고 param 에 쿼리를 설정하여 결과를 적재.
+        """
+        db_type = self.m_DbSession.get_db_type() if self.m_DbSession else DbType.ORACLE_OCI2
+        query, bind = self.m_StatementRegistry.get(name).make_bind_param(db_type, values)
+
+        if param is not None:
+            param.SetQuery(query)
+            return self.execute_query(param, bind_param=bind)
+        return self.execute_query(query, auto_commit, bind_param=bind)
+
+    def execute_statement_array(self, name, values_list, auto_commit=True):
+        """
+        등록된 DML 문장을 values_list 의 행 수만큼 Array DML 로 실행 (1회 왕복).
+        """
+        if not values_list:
+            return True
+
+        db_type = self.m_DbSession.get_db_type() if self.m_DbSession else DbType.ORACLE_OCI2
+        query, bind_list = self.m_StatementRegistry.get(name).make_bind_param_list(db_type, values_list)
+        return self.execute_query(query, auto_commit, bind_list=bind_list)
+
+    def get_exec_row_count(self):
+        return self.m_DbSession.get_exec_row_count() if self.m_DbSession else -1
+
     def commit(self):
         if self.m_DbSession: self.m_DbSession.commit()
 
@@ -134,35 +380,28 @@ class DbManager:
         C++: void DisConnection()
         DB 연결 해제
         """
-        if self.m_DbSession:
-            self.m_DbSession.disconnect()
+        if self.m_PortStatusWriter:
+            self.m_PortStatusWriter.flush()
+        self.release_session()
 
     def get_error_msg(self):
         """
         C++: string GetErrorMsg()
         DB 세션의 에러 메시지 반환. 세션이 없으면 기본 에러 문자열 반환.
         """
-        if self.m_DbSession:
+        if self.m_DbSession and self.m_DbSession.get_error():
             return self.m_DbSession.get_error()
         else:
-            return "ERROR DB"
+            return self.m_ErrorMsg or "ERROR DB"
 
     def get_data_handler_info_find_id(self, info):
         """
         C++: bool GetDataHandlerInfoFindId(AS_DATA_HANDLER_INFO_T* Info)
         ID로 특정 DataHandler의 SSH 접속 정보를 조회하여 Info 객체에 업데이트
         """
-        # 쿼리 생성 (DC_EVENT_CONSUMER는 CommDbType.py에 정의됨)
-        query = (
-            f"SELECT ID, SSHID, SSHPW "
-            f"FROM {DC_EVENT_CONSUMER} "
-            f"WHERE ID = '{info.DataHandlerId}'"
-        )
-
-        self.m_DbParam.SetQuery(query)
-
-        # 쿼리 실행
-        if not self.execute_query(self.m_DbParam):
+        # 쿼리 실행 (DC_EVENT_CONSUMER는 CommDbType.py에 정의됨)
+        if not self.execute_statement("SELECT_DATA_HANDLER_SSH", {"ID": info.DataHandlerId},
+                                      param=self.m_DbParam):
             return False
 
         # 결과 Fetch
@@ -191,39 +430,33 @@ class DbManager:
         # 1. 매니저 정보 조회 (DC_CNF_MANAGER)
         # -------------------------------------------------------
         query = f"SELECT ID, IP, STATUS, SSHID, SSHPW FROM {DC_CNF_MANAGER}"
-        self.m_DbParam.SetQuery(query)
 
-        if not self.execute_query(self.m_DbParam):
-            return False
+        # 컬럼 모드 : STATUS 는 DB 의 숫자 타입 그대로 (str 변환 후 int() 재변환 없음)
+        param = DbParam(columnar=True)
+        param.set_query(query)
 
-        # Python에서는 Bind 대신 Next 루프 내에서 get_value(index) 사용
-        # 0:ID, 1:IP, 2:STATUS, 3:SSHID, 4:SSHPW
-        self.m_DbParam.Rewind()
-        while self.m_DbParam.Next():
-            rec = self.m_DbParam.get_current_record()
-            if not rec: continue
+        if not self.execute_query(param):
+            return False
 
-            mgr_id = rec.get_value(0)
-            
+        for mgr_id, ip, status, ssh_id, ssh_pw in zip(*(param.get_column(i) for i in range(5))):
             manager_info = ManagerInfo()
             # AsManagerInfoT 객체 (m_ManagerInfo는 멤버 변수)
             manager_info.m_ManagerInfo = AsManagerInfoT()
-            manager_info.m_ManagerInfo.ManagerId = mgr_id
-            manager_info.m_ManagerInfo.IP = rec.get_value(1)
-            
-            try: manager_info.m_ManagerInfo.SettingStatus = int(rec.get_value(2))
-            except: manager_info.m_ManagerInfo.SettingStatus = 0
-                
-            manager_info.m_ManagerInfo.SshID = rec.get_value(3)
-            manager_info.m_ManagerInfo.SshPass = rec.get_value(4)
+            manager_info.m_ManagerInfo.ManagerId = mgr_id or ""
+            manager_info.m_ManagerInfo.IP = ip or ""
+
+            # 숫자 타입이 아닌 컬럼 (문자열 STATUS, NULL 등) 은 기존과 같이 0
+            try: manager_info.m_ManagerInfo.SettingStatus = int(status)
+            except (TypeError, ValueError): manager_info.m_ManagerInfo.SettingStatus = 0
+
+            manager_info.m_ManagerInfo.SshID = ssh_id or ""
+            manager_info.m_ManagerInfo.SshPass = ssh_pw or ""
             
             manager_info.m_ManagerInfo.CurStatus = STOP
             manager_info.m_ManagerInfo.RequestStatus = WAIT_NO
 
             # 맵에 등록
-            info_map[mgr_id] = manager_info
-
-        self.m_DbParam.Clear()
+            info_map[manager_info.m_ManagerInfo.ManagerId] = manager_info
 
         # -------------------------------------------------------
         # 2. 커넥터 및 연결 정보 조회 (JOIN Query)
@@ -517,26 +750,20 @@ class DbManager:
         # Enum -> Int
         st_val = START if status == START else STOP
         
-        query = (f"UPDATE {DC_CNF_MANAGER} SET STATUS = {st_val}, DESCRIPTION = '{desc}' "
-                 f"WHERE ID = '{manager_id}'")
-        return self.execute_query(query)
+        return self.execute_statement("UPDATE_MANAGER_STATUS",
+                                      {"STATUS": st_val, "DESCRIPTION": desc, "ID": manager_id})
 
     def get_connection_ip_info(self, ip_info_map, connector_id, sequence=-1):
         """
         C++: bool GetConnectionIpInfo(...)
         """
+        param = FrDbParam("")
         if sequence == -1:
-            query = (f"SELECT DISTINCT CC.SEQUENCE, HW.IP "
-                     f"FROM {DC_CNF_CONNECTION} CC, {TBD_EQP_HOSTHW} HW "
-                     f"WHERE CC.AGENTEQUIPID = HW.AGENTEQUIPID AND CC.CONNECTORID = '{connector_id}'")
+            ok = self.execute_statement("SELECT_CONNECTION_IP", {"CONNECTORID": connector_id}, param=param)
         else:
-            query = (f"SELECT DISTINCT CC.SEQUENCE, HW.IP "
-                     f"FROM {DC_CNF_CONNECTION} CC, {TBD_EQP_HOSTHW} HW "
-                     f"WHERE CC.AGENTEQUIPID = HW.AGENTEQUIPID AND CC.CONNECTORID = '{connector_id}' "
-                     f"AND CC.SEQUENCE = {sequence}")
-                     
-        param = FrDbParam(query)
-        if not self.execute_query(param): return False
+            ok = self.execute_statement("SELECT_CONNECTION_IP_BY_SEQUENCE",
+                                        {"CONNECTORID": connector_id, "SEQUENCE": sequence}, param=param)
+        if not ok: return False
         
         param.Rewind()
         while param.Next():
@@ -551,15 +778,20 @@ class DbManager:
         C++: bool InsertMMCResult(MMCResultStored* Result)
         MMC 결과 저장 (BLOB 처리 포함)
         """
-        # String Escape (' -> '')
+        # String Escape (' -> '') : update_long 은 리터럴 SQL 사용
         msg = result_stored.ResultMsg.replace("'", "''")
+        mmc_info = result_stored.MmcInfo
+
+        values = {
+            "EQUIPID": getattr(mmc_info, 'ne', ""),
+            "GID": result_stored.Gid,
+            "EXTID": result_stored.ExtId,
+            "RESULTMODE": result_stored.ResultMode,
+            "USERID": getattr(mmc_info, 'userid', ""),
+            "COMMAND": getattr(mmc_info, 'mmc', ""),
+        }
         
-        query = (
-            f"INSERT INTO {DC_MMC_RESULT} (EQUIPID, GID, EXTID, RESULTMODE, USERID, ... COMMAND) "
-            f"VALUES ('{result_stored.MmcInfo.ne}', {result_stored.Gid}, {result_stored.ExtId}, ... )"
-        )
-        
-        if self.execute_query(query, False): # AutoCommit=False
+        if self.execute_statement("INSERT_MMC_RESULT", values, False): # AutoCommit=False
             # CLOB 업데이트 (UpdateLong)
             where_clause = f"GID = {result_stored.Gid}"
             if self.m_DbSession.update_long(DC_MMC_RESULT, "RESULTMSG", msg, where_clause):
@@ -584,10 +816,12 @@ class DbManager:
         C++: bool DeleteConnectionStatus()
         DC_STATUS_CMD_PORT 테이블 전체 삭제 (초기화)
         """
-        # DC_STATUS_CMD_PORT는 CommDbType.py에 정의됨
-        query = f"DELETE FROM {DC_STATUS_CMD_PORT}"
+        # 전체 삭제이므로 대기 중인 개별 포트 갱신은 반영할 필요 없음
+        if self.m_PortStatusWriter:
+            self.m_PortStatusWriter.discard()
 
-        if not self.execute_query(query):
+        # DC_STATUS_CMD_PORT는 CommDbType.py에 정의됨
+        if not self.execute_statement("DELETE_CMD_PORT_ALL", {}):
             print("[DbManager] DeleteConnectionStatus error")
             return False
             
@@ -622,28 +856,22 @@ class DbManager:
             self.get_db_instance()
             return False
 
-        # 날짜 포맷팅 (C++ MakeInsertQuery 대응)
-        # E_QUERY_DATA_TYPE.DATE는 FrBaseType.py에 정의되어 있어야 함
-        cur_time_query = self.m_DbSession.make_insert_query(E_QUERY_DATA_TYPE.DATE, info.LastActionDate)
-        create_date_q = self.m_DbSession.make_insert_query(E_QUERY_DATA_TYPE.DATE, info.CreateDate)
-        modify_date_q = self.m_DbSession.make_insert_query(E_QUERY_DATA_TYPE.DATE, info.ModifyDate)
+        # 날짜 컬럼은 문자열 바인드 + {DATE(:NAME)} 매크로 (C++ MakeInsertQuery 대응)
 
         # ---------------------------------------------------
         # 1. CREATE (INSERT)
         # ---------------------------------------------------
         if info.RequestStatus == ACT_CREATE:
             action_str = AsUtil.get_action_type_string(ACT_CREATE)
-            query = (
-                f"INSERT INTO {DC_CNF_CONNECTOR} "
-                f"(ID, GATEWAYID, RULEID, STATUS, JUNCTIONTYPE, CMDRESPONSETYPE, LOGCYCLE, "
-                f"CREATE_DATE, MODIFY_DATE, LAST_ACTION_DATE, LAST_ACTION ) "
-                f"VALUES "
-                f"('{info.ConnectorId}', '{info.ManagerId}', '{info.RuleId}', "
-                f"{info.SettingStatus}, {info.JunctionType}, {info.CmdResponseType}, {info.LogCycle}, "
-                f"{create_date_q}, {modify_date_q}, {cur_time_query}, '{action_str}' )"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "ID": info.ConnectorId, "GATEWAYID": info.ManagerId, "RULEID": info.RuleId,
+                "STATUS": info.SettingStatus, "JUNCTIONTYPE": info.JunctionType,
+                "CMDRESPONSETYPE": info.CmdResponseType, "LOGCYCLE": info.LogCycle,
+                "CREATE_DATE": info.CreateDate, "MODIFY_DATE": info.ModifyDate,
+                "LAST_ACTION_DATE": info.LastActionDate, "LAST_ACTION": action_str,
+            }
+
+            if not self.execute_statement("INSERT_CONNECTOR", values):
                 print(f"[DbManager] Connector Create({info.ConnectorId}) Error")
                 return False
             return True
@@ -653,18 +881,15 @@ class DbManager:
         # ---------------------------------------------------
         elif info.RequestStatus == ACT_MODIFY:
             action_str = AsUtil.get_action_type_string(ACT_MODIFY)
-            query = (
-                f"UPDATE {DC_CNF_CONNECTOR} SET "
-                f"GATEWAYID = '{info.ManagerId}', RULEID = '{info.RuleId}', "
-                f"STATUS = {info.SettingStatus}, CMDRESPONSETYPE = {info.CmdResponseType}, "
-                f"LOGCYCLE = {info.LogCycle}, "
-                f"MODIFY_DATE = {modify_date_q}, LAST_ACTION_DATE = {cur_time_query}, "
-                f"LAST_ACTION = '{action_str}', DESCRIPTION = '{info.Desc}', "
-                f"LAST_ACTION_DESC = '{info.LastActionDesc}' "
-                f"WHERE ID = '{info.ConnectorId}'"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "GATEWAYID": info.ManagerId, "RULEID": info.RuleId, "STATUS": info.SettingStatus,
+                "CMDRESPONSETYPE": info.CmdResponseType, "LOGCYCLE": info.LogCycle,
+                "MODIFY_DATE": info.ModifyDate, "LAST_ACTION_DATE": info.LastActionDate,
+                "LAST_ACTION": action_str, "DESCRIPTION": info.Desc,
+                "LAST_ACTION_DESC": info.LastActionDesc, "ID": info.ConnectorId,
+            }
+
+            if not self.execute_statement("UPDATE_CONNECTOR", values):
                 print(f"[DbManager] Connector Update({info.ConnectorId}) Error")
                 return False
             return True
@@ -674,14 +899,13 @@ class DbManager:
         # ---------------------------------------------------
         elif info.RequestStatus == ACT_DELETE:
             # 3-1. 하위 연결(Connection) 삭제 (AutoCommit=False)
-            q1 = f"DELETE FROM {DC_CNF_CONNECTION} WHERE CONNECTORID = '{info.ConnectorId}'"
-            if not self.execute_query(q1, False):
+            if not self.execute_statement("DELETE_CONNECTION_BY_CONNECTOR",
+                                          {"CONNECTORID": info.ConnectorId}, False):
                 print(f"[DbManager] Connection Delete({info.ConnectorId}) Error")
                 return False
 
             # 3-2. 커넥터 삭제
-            q2 = f"DELETE FROM {DC_CNF_CONNECTOR} WHERE ID = '{info.ConnectorId}'"
-            if not self.execute_query(q2, False):
+            if not self.execute_statement("DELETE_CONNECTOR", {"ID": info.ConnectorId}, False):
                 self.rollback()
                 print(f"[DbManager] Connector Delete({info.ConnectorId}) Error")
                 return False
@@ -698,23 +922,15 @@ class DbManager:
             con_info = world.get_connector_info(info.ConnectorId)
 
             if con_info:
-                # 기존 정보의 날짜 쿼리 생성
-                old_create_q = self.m_DbSession.make_insert_query(E_QUERY_DATA_TYPE.DATE, con_info.m_ConnectorInfo.CreateDate)
-                old_mod_q = self.m_DbSession.make_insert_query(E_QUERY_DATA_TYPE.DATE, con_info.m_ConnectorInfo.ModifyDate)
-                
-                # 현재 시간 함수 (DB 종속성 처리)
-                sysdate_q = "SYSDATE" if self.m_DbSession.get_db_type() == EDB_TYPE.ORACLE else "NOW()"
-
-                history_query = (
-                    f"INSERT INTO {DC_CNF_CONNECTOR_DELETED} "
-                    f"(ID, GATEWAYID, RULEID, DESCRIPTION, CREATE_DATE, MODIFY_DATE, DELETE_DATE) "
-                    f"VALUES "
-                    f"('{con_info.m_ConnectorInfo.ConnectorId}', '{con_info.m_ConnectorInfo.ManagerId}', "
-                    f"'{con_info.m_ConnectorInfo.RuleId}', '{info.Desc}', "
-                    f"{old_create_q}, {old_mod_q}, {sysdate_q})"
-                )
-
-                if not self.execute_query(history_query):
+                # 기존 정보의 날짜 + 삭제 시각(SYSDATE, DB 종속성은 매크로에서 처리)
+                old_info = con_info.m_ConnectorInfo
+                values = {
+                    "ID": old_info.ConnectorId, "GATEWAYID": old_info.ManagerId,
+                    "RULEID": old_info.RuleId, "DESCRIPTION": info.Desc,
+                    "CREATE_DATE": old_info.CreateDate, "MODIFY_DATE": old_info.ModifyDate,
+                }
+
+                if not self.execute_statement("INSERT_CONNECTOR_DELETED", values):
                     print(f"[DbManager] ERROR Insert {DC_CNF_CONNECTOR_DELETED} : {info.ConnectorId}")
                     return False
             else:
@@ -736,13 +952,12 @@ class DbManager:
 
         # 1. CREATE (INSERT)
         if info.RequestStatus == CREATE_DATA:
-            query = (
-                f"INSERT INTO {DC_CNF_MANAGER} (ID, IP, STATUS, SSHID, SSHPW) "
-                f"VALUES "
-                f"('{info.ManagerId}', '{info.IP}', {info.SettingStatus}, '{info.SshID}', '{info.SshPass}')"
-            )
+            values = {
+                "ID": info.ManagerId, "IP": info.IP, "STATUS": info.SettingStatus,
+                "SSHID": info.SshID, "SSHPW": info.SshPass,
+            }
 
-            if not self.execute_query(query):
+            if not self.execute_statement("INSERT_MANAGER", values):
                 print(f"[DbManager] Manager Create({info.ManagerId}) Error")
                 return False
             return True
@@ -752,24 +967,19 @@ class DbManager:
             # 트랜잭션 시작 (AutoCommit=False)
             
             # 2-1. Connector 테이블의 GATEWAYID(ManagerId) 업데이트 (FK 관계 유지)
-            q1 = (
-                f"UPDATE {DC_CNF_CONNECTOR} SET GATEWAYID = '{info.ManagerId}' "
-                f"WHERE GATEWAYID = '{info.OldManagerId}'"
-            )
-
-            if not self.execute_query(q1, False):
+            if not self.execute_statement("UPDATE_CONNECTOR_GATEWAY",
+                                          {"GATEWAYID": info.ManagerId, "OLD_GATEWAYID": info.OldManagerId},
+                                          False):
                 print(f"[DbManager] Manager Update({info.OldManagerId}) Error - Connector Update Fail")
                 return False
 
             # 2-2. Manager 테이블 본체 업데이트
-            q2 = (
-                f"UPDATE {DC_CNF_MANAGER} SET "
-                f"ID = '{info.ManagerId}', IP = '{info.IP}', STATUS = {info.SettingStatus}, "
-                f"SSHID = '{info.SshID}', SSHPW = '{info.SshPass}' "
-                f"WHERE ID = '{info.OldManagerId}'"
-            )
-
-            if not self.execute_query(q2, False):
+            values = {
+                "ID": info.ManagerId, "IP": info.IP, "STATUS": info.SettingStatus,
+                "SSHID": info.SshID, "SSHPW": info.SshPass, "OLD_ID": info.OldManagerId,
+            }
+
+            if not self.execute_statement("UPDATE_MANAGER", values, False):
                 self.rollback()
                 print(f"[DbManager] Manager Update({info.OldManagerId}) Error - Manager Update Fail")
                 return False
@@ -783,27 +993,18 @@ class DbManager:
 
             # 3-1. 해당 매니저 하위의 모든 Connection 삭제 (Cascade)
             # (Subquery 사용: Connector가 해당 Manager에 속한 경우)
-            q1 = (
-                f"DELETE FROM {DC_CNF_CONNECTION} "
-                f"WHERE CONNECTORID IN (SELECT ID FROM {DC_CNF_CONNECTOR} WHERE GATEWAYID = '{info.ManagerId}')"
-            )
-
-            if not self.execute_query(q1, False):
+            if not self.execute_statement("DELETE_CONNECTION_BY_MANAGER", {"GATEWAYID": info.ManagerId}, False):
                 print(f"[DbManager] Connection Delete({info.ManagerId}) Error")
                 return False
 
             # 3-2. 해당 매니저 하위의 모든 Connector 삭제
-            q2 = f"DELETE FROM {DC_CNF_CONNECTOR} WHERE GATEWAYID = '{info.ManagerId}'"
-            
-            if not self.execute_query(q2, False):
+            if not self.execute_statement("DELETE_CONNECTOR_BY_MANAGER", {"GATEWAYID": info.ManagerId}, False):
                 self.rollback()
                 print(f"[DbManager] Connector Delete({info.ManagerId}) Error")
                 return False
 
             # 3-3. Manager 삭제
-            q3 = f"DELETE FROM {DC_CNF_MANAGER} WHERE ID = '{info.ManagerId}'"
-
-            if not self.execute_query(q3, False):
+            if not self.execute_statement("DELETE_MANAGER", {"ID": info.ManagerId}, False):
                 self.rollback()
                 print(f"[DbManager] Manager Delete({info.ManagerId}) Error")
                 return False
@@ -848,21 +1049,18 @@ class DbManager:
             info.Sequence = max_sequence + 1
 
             # 1-2. Insert 쿼리
-            # C++의 IF('%s'='','','%s') 로직은 Python f-string에서 직접 처리
+            # C++의 IF('%s'='','','%s') 로직은 바인드 값에서 직접 처리
             pwd_val = info.UserPassword if info.UserPassword else ""
 
-            query = (
-                f"INSERT INTO {DC_CNF_CONNECTION} "
-                f"(SEQUENCE, CONNECTORID, AGENTEQUIPID, PROTOCOLTYPE, PORTTYPE, "
-                f"AGENTPORTNO, USERID, PASSWORD, GATFLAG, STATUS, COMMANDFLAG ) "
-                f"VALUES "
-                f"({info.Sequence}, '{info.ConnectorId}', '{info.AgentEquipId}', "
-                f"{info.ProtocolType}, {info.PortType}, {info.PortNo}, "
-                f"'{info.UserId}', '{pwd_val}', {info.GatFlag}, "
-                f"{info.SettingStatus}, {info.CommandPortFlag})"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "SEQUENCE": info.Sequence, "CONNECTORID": info.ConnectorId,
+                "AGENTEQUIPID": info.AgentEquipId, "PROTOCOLTYPE": info.ProtocolType,
+                "PORTTYPE": info.PortType, "AGENTPORTNO": info.PortNo, "USERID": info.UserId,
+                "PASSWORD": pwd_val, "GATFLAG": info.GatFlag, "STATUS": info.SettingStatus,
+                "COMMANDFLAG": info.CommandPortFlag,
+            }
+
+            if not self.execute_statement("INSERT_CONNECTION", values):
                 print(f"[DbManager] Connection Create({info.Sequence}) Error")
                 return False
             
@@ -872,22 +1070,15 @@ class DbManager:
         # 2. UPDATE
         # ---------------------------------------------------
         elif info.RequestStatus == UPDATE_DATA:
-            query = (
-                f"UPDATE {DC_CNF_CONNECTION} SET "
-                f"CONNECTORID = '{info.ConnectorId}', "
-                f"AGENTEQUIPID = '{info.AgentEquipId}', "
-                f"PROTOCOLTYPE = {info.ProtocolType}, "
-                f"PORTTYPE = {info.PortType}, "
-                f"AGENTPORTNO = {info.PortNo}, "
-                f"USERID = '{info.UserId}', "
-                f"PASSWORD = '{info.UserPassword}', "
-                f"GATFLAG = {info.GatFlag}, "
-                f"STATUS = {info.SettingStatus}, "
-                f"COMMANDFLAG = {info.CommandPortFlag} "
-                f"WHERE SEQUENCE = {info.Sequence}"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "CONNECTORID": info.ConnectorId, "AGENTEQUIPID": info.AgentEquipId,
+                "PROTOCOLTYPE": info.ProtocolType, "PORTTYPE": info.PortType,
+                "AGENTPORTNO": info.PortNo, "USERID": info.UserId, "PASSWORD": info.UserPassword,
+                "GATFLAG": info.GatFlag, "STATUS": info.SettingStatus,
+                "COMMANDFLAG": info.CommandPortFlag, "SEQUENCE": info.Sequence,
+            }
+
+            if not self.execute_statement("UPDATE_CONNECTION", values):
                 print(f"[DbManager] Connection Update({info.Sequence}) Error")
                 return False
             return True
@@ -896,9 +1087,7 @@ class DbManager:
         # 3. DELETE
         # ---------------------------------------------------
         elif info.RequestStatus == DELETE_DATA:
-            query = f"DELETE FROM {DC_CNF_CONNECTION} WHERE SEQUENCE = {info.Sequence}"
-
-            if not self.execute_query(query):
+            if not self.execute_statement("DELETE_CONNECTION", {"SEQUENCE": info.Sequence}):
                 print(f"[DbManager] Connection Delete({info.Sequence}) Error")
                 return False
             return True
@@ -919,28 +1108,22 @@ class DbManager:
         # (이미 구현된 get_ip_info_to_string 헬퍼 메서드 사용)
         target_info = self.get_ip_info_to_string(info.TargetIpInfoList)
 
-        # 2. 현재 시간 함수 결정 (DB 타입에 따라 NOW() 또는 SYSDATE)
-        time_func = "SYSDATE" if self.m_DbSession.get_db_type() == EDB_TYPE.ORACLE else "NOW()"
+        # 2. 현재 시간(MODIFY_DATE)은 {SYSDATE} 매크로가 DB 타입에 맞게 처리
+        values = {
+            "ID": info.DataHandlerId, "DBUSERID": info.DbUserId, "DBPASSWORD": info.DbPassword,
+            "DBTNS": info.DbName, "HOSTNAME": info.HostName, "TIMEMODE": info.TimeMode,
+            "LISTENPORT": info.ListenPort, "STATUS": info.SettingStatus, "LOGMODE": info.LogMode,
+            "IPADDRESS": info.IpAddress, "BYPASSLISTENPORT": info.BypassListenPort,
+            "LOADINGINTERVAL": info.LoadingInterval, "HANDLERMODE": info.OperMode,
+            "TARGETINFO": target_info, "RUNMODE": info.RunMode, "LOGCYCLE": info.LogCycle,
+            "SSHID": info.SshID, "SSHPW": info.SshPass,
+        }
 
         # ---------------------------------------------------
         # 1. CREATE (INSERT)
         # ---------------------------------------------------
         if info.RequestStatus == CREATE_DATA:
-            query = (
-                f"INSERT INTO {DC_EVENT_CONSUMER} "
-                f"(ID, DBUSERID, DBPASSWORD, DBTNS, HOSTNAME, TIMEMODE, LISTENPORT, "
-                f"STATUS, LOGMODE, IPADDRESS, BYPASSLISTENPORT, LOADINGINTERVAL, "
-                f"HANDLERMODE, TARGETINFO, RUNMODE, LOGCYCLE, SSHID, SSHPW, MODIFY_DATE) "
-                f"VALUES "
-                f"('{info.DataHandlerId}', '{info.DbUserId}', '{info.DbPassword}', '{info.DbName}', "
-                f"'{info.HostName}', {info.TimeMode}, {info.ListenPort}, "
-                f"{info.SettingStatus}, {info.LogMode}, '{info.IpAddress}', "
-                f"{info.BypassListenPort}, {info.LoadingInterval}, {info.OperMode}, "
-                f"'{target_info}', {info.RunMode}, {info.LogCycle}, "
-                f"'{info.SshID}', '{info.SshPass}', {time_func})"
-            )
-
-            if not self.execute_query(query):
+            if not self.execute_statement("INSERT_DATA_HANDLER", values):
                 print(f"[DbManager] Data Handler Create({info.DataHandlerId}) Error")
                 return False
             return True
@@ -949,31 +1132,9 @@ class DbManager:
         # 2. UPDATE
         # ---------------------------------------------------
         elif info.RequestStatus == UPDATE_DATA:
-            query = (
-                f"UPDATE {DC_EVENT_CONSUMER} SET "
-                f"ID = '{info.DataHandlerId}', "
-                f"DBUSERID = '{info.DbUserId}', "
-                f"DBPASSWORD = '{info.DbPassword}', "
-                f"DBTNS = '{info.DbName}', "
-                f"HOSTNAME = '{info.HostName}', "
-                f"TIMEMODE = {info.TimeMode}, "
-                f"LISTENPORT = {info.ListenPort}, "
-                f"STATUS = {info.SettingStatus}, "
-                f"LOGMODE = {info.LogMode}, "
-                f"IPADDRESS = '{info.IpAddress}', "
-                f"BYPASSLISTENPORT = {info.BypassListenPort}, "
-                f"LOADINGINTERVAL = {info.LoadingInterval}, "
-                f"HANDLERMODE = {info.OperMode}, "
-                f"TARGETINFO = '{target_info}', "
-                f"RUNMODE = {info.RunMode}, "
-                f"LOGCYCLE = {info.LogCycle}, "
-                f"SSHID = '{info.SshID}', "
-                f"SSHPW = '{info.SshPass}', "
-                f"MODIFY_DATE = {time_func} "
-                f"WHERE ID = '{info.OldDataHandlerId}'"
-            )
-
-            if not self.execute_query(query):
+            values["OLD_ID"] = info.OldDataHandlerId
+
+            if not self.execute_statement("UPDATE_DATA_HANDLER", values):
                 print(f"[DbManager] Data Handler Update({info.OldDataHandlerId}) Error")
                 return False
             return True
@@ -982,9 +1143,7 @@ class DbManager:
         # 3. DELETE
         # ---------------------------------------------------
         elif info.RequestStatus == DELETE_DATA:
-            query = f"DELETE FROM {DC_EVENT_CONSUMER} WHERE ID = '{info.DataHandlerId}'"
-            
-            if not self.execute_query(query):
+            if not self.execute_statement("DELETE_DATA_HANDLER", {"ID": info.DataHandlerId}):
                 print(f"[DbManager] Data Handler Delete({info.DataHandlerId}) Error")
                 return False
             return True
@@ -1006,17 +1165,14 @@ class DbManager:
         # ---------------------------------------------------
         if info.RequestStatus == CREATE_DATA:
             # ID 컬럼에는 0을 입력 (C++ 원본 로직: Auto Increment 혹은 Trigger 사용 추정)
-            query = (
-                f"INSERT INTO {DC_CNF_SUB_PROC} "
-                f"(ID, ID_STR, PARENT, PARENTID, IPADDRESS, HOSTNAME, "
-                f"STATUS, LOGCYCLE, DESCRIPTION, BIN_NAME, ARGS) "
-                f"VALUES "
-                f"(0, '{info.ProcIdStr}', {info.ParentProc}, '{info.ParentId}', "
-                f"'{info.IpAddress}', '{info.HostName}', {info.SettingStatus}, "
-                f"{info.LogCycle}, '{info.Description}', '{info.BinaryName}', '{info.Args}')"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "ID_STR": info.ProcIdStr, "PARENT": info.ParentProc, "PARENTID": info.ParentId,
+                "IPADDRESS": info.IpAddress, "HOSTNAME": info.HostName, "STATUS": info.SettingStatus,
+                "LOGCYCLE": info.LogCycle, "DESCRIPTION": info.Description,
+                "BIN_NAME": info.BinaryName, "ARGS": info.Args,
+            }
+
+            if not self.execute_statement("INSERT_SUB_PROC", values):
                 print(f"[DbManager] Sub Proc Create({info.ProcIdStr}) Error")
                 return False
             return True
@@ -1026,17 +1182,14 @@ class DbManager:
         # ---------------------------------------------------
         elif info.RequestStatus == UPDATE_DATA:
             # OldProcIdStr를 조건으로 사용하여 업데이트
-            query = (
-                f"UPDATE {DC_CNF_SUB_PROC} SET "
-                f"ID_STR = '{info.ProcIdStr}', PARENT = {info.ParentProc}, "
-                f"PARENTID = '{info.ParentId}', IPADDRESS = '{info.IpAddress}', "
-                f"HOSTNAME = '{info.HostName}', STATUS = {info.SettingStatus}, "
-                f"LOGCYCLE = {info.LogCycle}, DESCRIPTION = '{info.Description}', "
-                f"BIN_NAME = '{info.BinaryName}', ARGS = '{info.Args}' "
-                f"WHERE ID_STR = '{info.OldProcIdStr}'"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "ID_STR": info.ProcIdStr, "PARENT": info.ParentProc, "PARENTID": info.ParentId,
+                "IPADDRESS": info.IpAddress, "HOSTNAME": info.HostName, "STATUS": info.SettingStatus,
+                "LOGCYCLE": info.LogCycle, "DESCRIPTION": info.Description,
+                "BIN_NAME": info.BinaryName, "ARGS": info.Args, "OLD_ID_STR": info.OldProcIdStr,
+            }
+
+            if not self.execute_statement("UPDATE_SUB_PROC", values):
                 print(f"[DbManager] Sub Proc Update({info.OldProcIdStr}) Error")
                 return False
             return True
@@ -1045,9 +1198,7 @@ class DbManager:
         # 3. DELETE
         # ---------------------------------------------------
         elif info.RequestStatus == DELETE_DATA:
-            query = f"DELETE FROM {DC_CNF_SUB_PROC} WHERE ID_STR = '{info.ProcIdStr}'"
-            
-            if not self.execute_query(query):
+            if not self.execute_statement("DELETE_SUB_PROC", {"ID_STR": info.ProcIdStr}):
                 print(f"[DbManager] Sub Proc Delete({info.ProcIdStr}) Error")
                 return False
             return True
@@ -1068,15 +1219,13 @@ class DbManager:
         # 1. CREATE (INSERT)
         # ---------------------------------------------------
         if info.RequestStatus == CREATE_DATA:
-            query = (
-                f"INSERT INTO {DC_CMD_SESSION_IDENT} "
-                f"(ID, MAXCMDQUEUE, PRIORITY, LOGMODE, ACKMODE, DESCRIPTION, MAX_SESSION_CNT ) "
-                f"VALUES "
-                f"('{info.Id}', {info.MaxCmdQueue}, {info.Priority}, {info.LogMode}, "
-                f"{info.AckMode}, '{info.Description}', {info.MaxSessionCnt}) "
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "ID": info.Id, "MAXCMDQUEUE": info.MaxCmdQueue, "PRIORITY": info.Priority,
+                "LOGMODE": info.LogMode, "ACKMODE": info.AckMode, "DESCRIPTION": info.Description,
+                "MAX_SESSION_CNT": info.MaxSessionCnt,
+            }
+
+            if not self.execute_statement("INSERT_CMD_SESSION_IDENT", values):
                 print(f"[DbManager] Command Authority Create({info.Id}) Error")
                 return False
             return True
@@ -1085,15 +1234,13 @@ class DbManager:
         # 2. UPDATE
         # ---------------------------------------------------
         elif info.RequestStatus == UPDATE_DATA:
-            query = (
-                f"UPDATE {DC_CMD_SESSION_IDENT} SET "
-                f"ID = '{info.Id}', MAXCMDQUEUE = {info.MaxCmdQueue}, PRIORITY = {info.Priority}, "
-                f"DESCRIPTION = '{info.Description}', LOGMODE = {info.LogMode}, "
-                f"ACKMODE = {info.AckMode}, MAX_SESSION_CNT = {info.MaxSessionCnt} "
-                f"WHERE ID = '{info.OldId}'"
-            )
-
-            if not self.execute_query(query):
+            values = {
+                "ID": info.Id, "MAXCMDQUEUE": info.MaxCmdQueue, "PRIORITY": info.Priority,
+                "DESCRIPTION": info.Description, "LOGMODE": info.LogMode, "ACKMODE": info.AckMode,
+                "MAX_SESSION_CNT": info.MaxSessionCnt, "OLD_ID": info.OldId,
+            }
+
+            if not self.execute_statement("UPDATE_CMD_SESSION_IDENT", values):
                 print(f"[DbManager] Command Authority Update({info.OldId}) Error")
                 return False
             return True
@@ -1102,9 +1249,7 @@ class DbManager:
         # 3. DELETE
         # ---------------------------------------------------
         elif info.RequestStatus == DELETE_DATA:
-            query = f"DELETE FROM {DC_CMD_SESSION_IDENT} WHERE ID = '{info.Id}'"
-
-            if not self.execute_query(query):
+            if not self.execute_statement("DELETE_CMD_SESSION_IDENT", {"ID": info.Id}):
                 print(f"[DbManager] Command Authority Delete({info.Id}) Error")
                 return False
             return True
@@ -1119,14 +1264,9 @@ class DbManager:
         if not self.m_DbSession:
             return False
 
-        # 쿼리 생성
-        query = (
-            f"UPDATE {DC_CNF_CONNECTOR} "
-            f"SET RULEID = '{info.RuleId}' "
-            f"WHERE GATEWAYID = '{info.ManagerId}' AND ID = '{info.ProcessId}'"
-        )
+        values = {"RULEID": info.RuleId, "GATEWAYID": info.ManagerId, "ID": info.ProcessId}
 
-        if not self.execute_query(query):
+        if not self.execute_statement("UPDATE_CONNECTOR_RULE", values):
             print(f"[DbManager] Parsing rule change({info.ProcessId}:{info.RuleId}) Error")
             return False
             
@@ -1137,15 +1277,10 @@ class DbManager:
         C++: bool RecvInfoChange(AS_CONNECTOR_DESC_CHANGE_INFO_T* Info)
         커넥터 설명(Description) 업데이트
         """
-        # 쿼리 생성
-        query = (
-            f"UPDATE {DC_CNF_CONNECTOR} "
-            f"SET DESCRIPTION = '{info.Description}' "
-            f"WHERE GATEWAYID = '{info.ManagerId}' AND ID = '{info.ConnectorId}'"
-        )
+        values = {"DESCRIPTION": info.Description, "GATEWAYID": info.ManagerId, "ID": info.ConnectorId}
 
         # 실행
-        if not self.execute_query(query):
+        if not self.execute_statement("UPDATE_CONNECTOR_DESC", values):
             print(f"[DbManager] Connector description change({info.ConnectorId}) Error")
             return False
             
@@ -1221,8 +1356,7 @@ class DbManager:
         if not self.m_DbSession:
             return False
 
-        # 1. 날짜 포맷팅 Query 생성 (TO_DATE 등)
-        cur_time_query = self.m_DbSession.make_insert_query(E_QUERY_DATA_TYPE.DATE, time_str)
+        # 1. 날짜는 문자열 바인드 ({DATE(:LAST_ACTION_DATE)} 가 TO_DATE 등으로 변환)
         
         # 2. 기존 포트 상태 정보 정리 (ASCII_CONNECTOR = 1203)
         # (이미 구현된 update_connection_status 호출)
@@ -1235,30 +1369,29 @@ class DbManager:
         act_type = ACT_START if proc_ctl.Status == START else ACT_STOP
         action_str = AsUtil.get_action_type_string(act_type)
 
-        # 5. 쿼리 생성 & 실행
-        query = (
-            f"UPDATE {DC_CNF_CONNECTOR} SET "
-            f"STATUS = {status}, "
-            f"LAST_ACTION_DATE = {cur_time_query}, "
-            f"LAST_ACTION = '{action_str}', "
-            f"LAST_ACTION_DESC = '{proc_ctl.Desc}' "
-            f"WHERE GATEWAYID = '{proc_ctl.ManagerId}' AND ID = '{proc_ctl.ProcessId}'"
-        )
+        # 5. 쿼리 실행
+        values = {
+            "STATUS": status, "LAST_ACTION_DATE": time_str, "LAST_ACTION": action_str,
+            "LAST_ACTION_DESC": proc_ctl.Desc, "GATEWAYID": proc_ctl.ManagerId, "ID": proc_ctl.ProcessId,
+        }
 
-        return self.execute_query(query)
+        return self.execute_statement("UPDATE_CONNECTOR_STATUS", values)
     
     def update_connection_status(self, type_val, id_val, sequence, info=None):
         """
         C++: bool UpdateConnectionStatus(int Type, string Id, int Sequence, AS_PORT_STATUS_INFO_T* Info)
         DC_STATUS_CMD_PORT 테이블 관리 (매니저/커넥터 단위 삭제 또는 개별 포트 상태 갱신)
+        PortStatusWriter 사용 시 개별 포트 갱신은 모아서 Array DML 로 반영
         """
+        # 일괄 삭제 전에 대기 중인 개별 포트 갱신을 먼저 반영 (순서 유지)
+        if type_val in (ASCII_MANAGER, ASCII_CONNECTOR) and self.m_PortStatusWriter:
+            self.m_PortStatusWriter.flush()
         
         # ---------------------------------------------------
         # 1. Manager 단위 일괄 삭제
         # ---------------------------------------------------
         if type_val == ASCII_MANAGER:
-            query = f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE MANAGERID = '{id_val}'"
-            if not self.execute_query(query):
+            if not self.execute_statement("DELETE_CMD_PORT_BY_MANAGER", {"MANAGERID": id_val}):
                 print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
                 return False
             return True
@@ -1267,8 +1400,7 @@ class DbManager:
         # 2. Connector 단위 일괄 삭제
         # ---------------------------------------------------
         elif type_val == ASCII_CONNECTOR:
-            query = f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE CONNECTORID = '{id_val}'"
-            if not self.execute_query(query):
+            if not self.execute_statement("DELETE_CMD_PORT_BY_CONNECTOR", {"CONNECTORID": id_val}):
                 print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
                 return False
             return True
@@ -1277,37 +1409,34 @@ class DbManager:
         # 3. 개별 포트 상태 업데이트 (Sequence 기준)
         # ---------------------------------------------------
         else:
-            if info:
-                # 특정 Command Port 타입들만 상태 테이블에 기록 (C++ 로직)
-                # CMD, LUCENT_ECP_CMD, LUCENT_DCS_CMD 상수는 CommType.py에 정의됨
-                if info.PortType in [CMD, LUCENT_ECP_CMD, LUCENT_DCS_CMD]:
-                    
-                    # 3-1. 기존 데이터 삭제
-                    del_query = f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE SEQUENCE = {sequence}"
-                    if not self.execute_query(del_query):
-                        print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
-                        return False
-
-                    # 3-2. 상태가 '제거(ELIMINATION)'가 아니면 신규 상태 Insert
-                    if info.Status != PORT_ELIMINATION:
-                        # EQUIPID 컬럼에는 ConnectorId를 넣는 것이 C++ 원본 로직임
-                        ins_query = (
-                            f"INSERT INTO {DC_STATUS_CMD_PORT} "
-                            f"(SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS) "
-                            f"VALUES ({sequence}, '{info.ManagerId}', '{info.ConnectorId}', "
-                            f"'{info.ConnectorId}', {info.Status})"
-                        )
-                        
-                        if not self.execute_query(ins_query):
-                            print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
-                            return False
-            
-            # Info가 없는 경우 (단순 삭제 요청)
-            else:
-                query = f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE SEQUENCE = {sequence}"
-                if not self.execute_query(query):
-                    print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
-                    return False
+            # 특정 Command Port 타입들만 상태 테이블에 기록 (C++ 로직)
+            # CMD, LUCENT_ECP_CMD, LUCENT_DCS_CMD 상수는 CommType.py에 정의됨
+            # Info가 없는 경우는 단순 삭제 요청
+            if info and info.PortType not in [CMD, LUCENT_ECP_CMD, LUCENT_DCS_CMD]:
+                return True
+
+            # 3-1. 기존 데이터 삭제 후, 상태가 '제거(ELIMINATION)'가 아니면 신규 상태 Insert
+            values = None
+            if info and info.Status != PORT_ELIMINATION:
+                # EQUIPID 컬럼에는 ConnectorId를 넣는 것이 C++ 원본 로직임
+                values = {
+                    "SEQUENCE": sequence, "MANAGERID": info.ManagerId,
+                    "CONNECTORID": info.ConnectorId, "EQUIPID": info.ConnectorId,
+                    "STATUS": info.Status,
+                }
+
+            if self.m_PortStatusWriter:
+                self.m_PortStatusWriter.add(sequence, values)
+                return True
+
+            if not self.execute_statement("DELETE_CMD_PORT_BY_SEQUENCE", {"SEQUENCE": sequence}):
+                print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
+                return False
+
+            # 3-2. 신규 상태 Insert
+            if values and not self.execute_statement("INSERT_CMD_PORT", values):
+                print(f"[DbManager] UpdateConnectionStatus error({id_val}, {sequence})")
+                return False
 
         return True
 
@@ -1321,13 +1450,9 @@ class DbManager:
 
         status = START if session_ctl.Status == START else STOP
 
-        query = (
-            f"UPDATE {DC_CNF_CONNECTION} SET "
-            f"STATUS = {status}, DESCRIPTION = '{session_ctl.Desc}' "
-            f"WHERE SEQUENCE = {session_ctl.Sequence}"
-        )
+        values = {"STATUS": status, "DESCRIPTION": session_ctl.Desc, "SEQUENCE": session_ctl.Sequence}
 
-        return self.execute_query(query)
+        return self.execute_statement("UPDATE_CONNECTION_STATUS", values)
 
     def update_manager_status(self, manager_id, status, desc):
         """
@@ -1339,13 +1464,8 @@ class DbManager:
 
         st_val = START if status == START else STOP
         
-        query = (
-            f"UPDATE {DC_CNF_MANAGER} SET "
-            f"STATUS = {st_val}, DESCRIPTION = '{desc}' "
-            f"WHERE ID = '{manager_id}'"
-        )
-        
-        return self.execute_query(query)
+        return self.execute_statement("UPDATE_MANAGER_STATUS",
+                                      {"STATUS": st_val, "DESCRIPTION": desc, "ID": manager_id})
 
     def update_data_handler_status(self, data_handler_id, status):
         """
@@ -1354,16 +1474,8 @@ class DbManager:
         """
         st_val = START if status == START else STOP
         
-        # DB 타입에 따라 현재 시간 함수 결정 (Oracle: SYSDATE, MySQL: NOW())
-        time_func = "SYSDATE" if self.m_DbSession.get_db_type() == EDB_TYPE.ORACLE else "NOW()"
-        
-        query = (
-            f"UPDATE {DC_EVENT_CONSUMER} SET "
-            f"STATUS = {st_val}, MODIFY_DATE = {time_func} "
-            f"WHERE ID = '{data_handler_id}'"
-        )
-        
-        return self.execute_query(query)
+        # 현재 시간 함수는 {SYSDATE} 매크로가 DB 타입에 맞게 결정 (Oracle: SYSDATE, MySQL: sysdate())
+        return self.execute_statement("UPDATE_DATA_HANDLER_STATUS", {"STATUS": st_val, "ID": data_handler_id})
 
     def update_sub_proc_status(self, proc_id_str, status):
         """
@@ -1372,30 +1484,16 @@ class DbManager:
         """
         st_val = START if status == START else STOP
         
-        query = (
-            f"UPDATE {DC_CNF_SUB_PROC} SET "
-            f"STATUS = {st_val} "
-            f"WHERE ID_STR = '{proc_id_str}'"
-        )
-        
-        return self.execute_query(query)
+        return self.execute_statement("UPDATE_SUB_PROC_STATUS", {"STATUS": st_val, "ID_STR": proc_id_str})
     
     def get_manager_info_find_id(self, manager_info):
         """
         C++: bool GetManagerInfoFindId(ManagerInfo* managerinfo)
         매니저 ID로 상세 정보(IP, SSH정보 등)를 조회하여 업데이트
         """
-        # 쿼리 생성
         # DC_CNF_MANAGER는 CommDbType.py에 정의됨
-        query = (
-            f"SELECT ID, IP, STATUS, SSHID, SSHPW "
-            f"FROM {DC_CNF_MANAGER} "
-            f"WHERE ID = '{manager_info.m_ManagerInfo.ManagerId}'"
-        )
-
-        self.m_DbParam.SetQuery(query)
-
-        if not self.execute_query(self.m_DbParam):
+        if not self.execute_statement("SELECT_MANAGER_BY_ID", {"ID": manager_info.m_ManagerInfo.ManagerId},
+                                      param=self.m_DbParam):
             return False
 
         # 결과 Fetch
@@ -1489,13 +1587,7 @@ class DbManager:
         # DC_CNF_MANAGER: 테이블 이름 (CommDbType.py)
         # STOP: 상태 상수 (CommType.py, 보통 2)
         
-        query = (
-            f"UPDATE {DC_CNF_MANAGER} "
-            f"SET STATUS = {STOP} "
-            f"WHERE IP = '{manager_ip}'"
-        )
-
-        return self.execute_query(query)
+        return self.execute_statement("DISABLE_MANAGER_FROM_IP", {"STATUS": STOP, "IP": manager_ip})
     
     def update_server_info(self, ip, gui_port, cmd_port, log_port, sock_mgr_port, net_finder_port):
         """
@@ -0,0 +1,291 @@
+import sys
+import os
+import threading
+import time
+import queue
+from collections import deque
+
+# 프로젝트 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Event.fr_msg_sensor import FrMsgSensor
+
+# -------------------------------------------------------
+# DbJob Class
+# DbWorkerPool 에 제출되는 DB 작업 1건
+# -------------------------------------------------------
+class DbJob:
+    def __init__(self, key, func, args, callback):
+        self.m_Key = key
+        self.m_Func = func          # func(db_manager, *args) -> result
+        self.m_Args = args
+        self.m_Callback = callback  # callback(result, error) : World 스레드에서 호출
+        self.m_Result = None
+        self.m_Error = ""
+        self.m_SubmitTime = time.perf_counter()
+        self.m_StartTime = 0.0
+        self.m_EndTime = 0.0
+
+# -------------------------------------------------------
+# DbWorker Class
+# 자신의 DbManager(DbSession) 를 가진 작업 스레드
+# -------------------------------------------------------
+class DbWorker(threading.Thread):
+    def __init__(self, pool, index):
+        super().__init__(name=f"DbWorker-{index}", daemon=True)
+        self.m_Pool = pool
+        self.m_Index = index
+        self.m_Queue = queue.SimpleQueue()
+        self.m_DbManager = None
+
+    def put(self, job):
+        self.m_Queue.put(job)
+
+    def stop(self):
+        self.m_Queue.put(None)
+
+    def run(self):
+        # DbManager 는 작업 스레드 안에서 생성/접속 (세션을 스레드 간 공유하지 않음)
+        self.m_DbManager = self.m_Pool.create_db_manager(self.m_Index)
+
+        while True:
+            job = self.m_Queue.get()
+            if job is None:
+                break
+
+            job.m_StartTime = time.perf_counter()
+            try:
+                job.m_Result = job.m_Func(self.m_DbManager, *job.m_Args)
+                if job.m_Result is False:
+                    job.m_Error = self.m_DbManager.get_error_msg()
+            except Exception as e:
+                job.m_Result = False
+                job.m_Error = f"{type(e).__name__}: {e}"
+            job.m_EndTime = time.perf_counter()
+
+            self.m_Pool.job_done(job)
+
+        if self.m_DbManager:
+            self.m_DbManager.dis_connection()
+
+# -------------------------------------------------------
+# DbWorkerPool Class
+# AsciiServerWorld 의 DB 작업을 작업 스레드에서 수행 (C++ 원본 없음)
+# -------------------------------------------------------
+class DbWorkerPool:
+    """
+    DB 작업을 소수의 작업 스레드(DbWorker)에서 수행하여 World 이벤트 스레드가 SQL 로 블로킹되지 않도록 한다.
+
+    - 작업 스레드마다 자신의 DbManager(DbSession) 사용. 접속 실패 / 재접속도 작업 스레드에서 처리
+    - 같은 key 의 작업은 같은 작업 스레드에 배정 -> key(호출자) 단위 순서 보장
+    - 완료된 작업은 m_DoneList(deque) 에 보관하고 FrMsgSensor(World Pipe) 로는 깨우기(DB_JOB_DONE)만 전달
+      (World Pipe 는 pickle 로 직렬화하므로 callback 을 가진 작업 객체는 보낼 수 없음)
+      World 스레드가 m_DoneList 를 비우며 callback(result, error) 호출
+      (error 는 해당 작업의 오류. callback 이 없는 작업은 실패한 경우에만 적재되어 여기서 보고)
+    - 호출자의 메모리 상태 변경은 callback(DB_JOB_DONE) 에서 수행하여 DB 반영 결과와 일치시킨다
+    - 통계 : 큐 깊이(현재/최대), 대기 시간, 수행 시간, 완료 통지까지의 전체 지연
+    """
+    DB_JOB_DONE = 5101
+    DEFAULT_WORKER_CNT = 2
+    STAT_REPORT_INTERVAL = 60 # sec
+
+    def __init__(self, world, db_info, worker_cnt=0):
+        """
+        db_info : (user, passwd, tns, ip, port) - DbManager.init_db_manager 인자
+        """
+        self.m_World = world
+        self.m_DbInfo = db_info
+        self.m_WorkerCnt = worker_cnt if worker_cnt > 0 else self.DEFAULT_WORKER_CNT
+        self.m_WorkerList = []
+        self.m_DoneSensor = FrMsgSensor(self, world)
+
+        # 완료 작업 (작업 스레드 -> World 스레드), m_DoneLock 으로 보호
+        self.m_DoneLock = threading.Lock()
+        self.m_DoneList = deque()
+        self.m_WakePending = False # 깨우기 전송 후 World 가 비우기 전까지 추가 전송 생략
+
+        self.m_StatLock = threading.Lock()
+        self.reset_stat()
+        self.m_LastReportTime = time.time()
+
+    def start(self):
+        for index in range(self.m_WorkerCnt):
+            worker = DbWorker(self, index)
+            self.m_WorkerList.append(worker)
+            worker.start()
+        print(f"[DbWorkerPool] Start : {self.m_WorkerCnt} workers")
+
+    def stop(self):
+        for worker in self.m_WorkerList:
+            worker.stop()
+        for worker in self.m_WorkerList:
+            worker.join()
+        self.m_WorkerList = []
+        self.print_stat()
+
+    def create_db_manager(self, index):
+        """
+        작업 스레드에서 호출. 접속 실패 시에도 DbManager 를 반환하며 이후 작업에서 재접속 시도.
+        """
+        from Class.ProcNaServer.DbManager import DbManager
+        db_mgr = DbManager()
+        db_mgr.m_ReportErrorToMain = False # World 객체는 작업 스레드에서 직접 사용하지 않음
+        if not db_mgr.init_db_manager(*self.m_DbInfo):
+            print(f"[DbWorkerPool] [CORE_ERROR] Worker({index}) Db Connection Error : {db_mgr.get_error_msg()}")
+        return db_mgr
+
+    # ---------------------------------------------------
+    # Submit / Complete
+    # ---------------------------------------------------
+    def submit(self, key, func, *args, callback=None):
+        """
+        func(db_manager, *args) 를 작업 스레드에서 수행.
+        callback(result, error) 은 완료 후 World 스레드에서 호출. (None 이면 실패 시 여기서 보고)
+        """
+        if not self.m_WorkerList:
+            return False
+
+        job = DbJob(key, func, args, callback)
+        worker = self.m_WorkerList[hash(key) % len(self.m_WorkerList)]
+
+        with self.m_StatLock:
+            self.m_SubmitCnt += 1
+            depth = self.m_SubmitCnt - self.m_DoneCnt
+            if depth > self.m_MaxQueueDepth:
+                self.m_MaxQueueDepth = depth
+
+        worker.put(job)
+        return True
+
+    def job_done(self, job):
+        """
+        작업 스레드에서 호출 : 수행 통계 갱신 후 m_DoneList 에 적재, World 깨우기
+        """
+        wait_time = job.m_StartTime - job.m_SubmitTime
+        exec_time = job.m_EndTime - job.m_StartTime
+
+        with self.m_StatLock:
+            self.m_DoneCnt += 1
+            if job.m_Result is False:
+                self.m_FailCnt += 1
+            self.m_TotalWaitTime += wait_time
+            self.m_TotalExecTime += exec_time
+            if wait_time > self.m_MaxWaitTime:
+                self.m_MaxWaitTime = wait_time
+            if exec_time > self.m_MaxExecTime:
+                self.m_MaxExecTime = exec_time
+
+        if job.m_Callback is None and job.m_Result is not False:
+            return
+
+        with self.m_DoneLock:
+            self.m_DoneList.append(job)
+            # 비어 있던 완료 목록에 처음 적재될 때만 깨움
+            wake = not self.m_WakePending
+            self.m_WakePending = True
+
+        if wake and not self.m_DoneSensor.send_event(self.DB_JOB_DONE):
+            # 작업은 목록에 남아 다음 깨우기 때 처리
+            with self.m_DoneLock:
+                self.m_WakePending = False
+            print(f"[DbWorkerPool] [CORE_ERROR] Job done event send fail (key={job.m_Key})")
+
+    def recv_message(self, message, addition_info=None):
+        """
+        World 스레드 : 완료 통지(깨우기) 처리 - m_DoneList 의 작업을 모두 완료 처리
+        """
+        if message != self.DB_JOB_DONE:
+            print(f"[DbWorkerPool] unknown message : {message}")
+            return
+
+        while True:
+            with self.m_DoneLock:
+                if not self.m_DoneList:
+                    self.m_WakePending = False
+                    break
+                job_list = self.m_DoneList
+                self.m_DoneList = deque()
+
+            for job in job_list:
+                # callback 예외로 남은 작업 / 깨우기 상태가 멈추지 않도록 작업 단위로 처리
+                try:
+                    self.complete_job(job)
+                except Exception as e:
+                    print(f"[DbWorkerPool] [CORE_ERROR] Job callback error (key={job.m_Key}) : {e}")
+
+    def complete_job(self, job):
+        """
+        World 스레드 : 작업 1건의 callback 호출 / 오류 보고 / 지연 통계
+        """
+        if job.m_Result is False:
+            print(f"[DbWorkerPool] DB Job Error (key={job.m_Key}) : {job.m_Error}")
+
+        if job.m_Callback:
+            job.m_Callback(job.m_Result, job.m_Error)
+        elif job.m_Result is False and self.m_World and hasattr(self.m_World, 'send_ascii_error'):
+            self.m_World.send_ascii_error(1, f"DB Query Error - {job.m_Error}")
+
+        latency = time.perf_counter() - job.m_SubmitTime
+        with self.m_StatLock:
+            self.m_NotifyCnt += 1
+            self.m_TotalLatency += latency
+            if latency > self.m_MaxLatency:
+                self.m_MaxLatency = latency
+
+        now = time.time()
+        if now - self.m_LastReportTime >= self.STAT_REPORT_INTERVAL:
+            self.m_LastReportTime = now
+            self.print_stat()
+            self.reset_stat()
+
+    # ---------------------------------------------------
+    # Statistics
+    # ---------------------------------------------------
+    def get_queue_depth(self):
+        with self.m_StatLock:
+            return self.m_SubmitCnt - self.m_DoneCnt
+
+    def reset_stat(self):
+        with self.m_StatLock:
+            # 진행 중인 작업 수는 유지
+            pending = getattr(self, 'm_SubmitCnt', 0) - getattr(self, 'm_DoneCnt', 0)
+            self.m_SubmitCnt = pending
+            self.m_DoneCnt = 0
+            self.m_FailCnt = 0
+            self.m_NotifyCnt = 0
+            self.m_MaxQueueDepth = pending
+            self.m_TotalWaitTime = 0.0
+            self.m_MaxWaitTime = 0.0
+            self.m_TotalExecTime = 0.0
+            self.m_MaxExecTime = 0.0
+            self.m_TotalLatency = 0.0
+            self.m_MaxLatency = 0.0
+
+    def get_stat(self):
+        with self.m_StatLock:
+            done = self.m_DoneCnt
+            notify = self.m_NotifyCnt
+            return {
+                "QueueDepth": self.m_SubmitCnt - self.m_DoneCnt,
+                "MaxQueueDepth": self.m_MaxQueueDepth,
+                "DoneCnt": done,
+                "FailCnt": self.m_FailCnt,
+                "AvgWaitMs": self.m_TotalWaitTime / done * 1000 if done else 0.0,
+                "MaxWaitMs": self.m_MaxWaitTime * 1000,
+                "AvgExecMs": self.m_TotalExecTime / done * 1000 if done else 0.0,
+                "MaxExecMs": self.m_MaxExecTime * 1000,
+                "NotifyCnt": notify,
+                "AvgLatencyMs": self.m_TotalLatency / notify * 1000 if notify else 0.0,
+                "MaxLatencyMs": self.m_MaxLatency * 1000,
+            }
+
+    def print_stat(self):
+        stat = self.get_stat()
+        print(f"[DbWorkerPool] Stat : Workers={self.m_WorkerCnt}, Depth={stat['QueueDepth']}"
+              f"(max {stat['MaxQueueDepth']}), Done={stat['DoneCnt']}, Fail={stat['FailCnt']}, "
+              f"Wait={stat['AvgWaitMs']:.2f}/{stat['MaxWaitMs']:.2f} ms, "
+              f"Exec={stat['AvgExecMs']:.2f}/{stat['MaxExecMs']:.2f} ms, "
+              f"Latency={stat['AvgLatencyMs']:.2f}/{stat['MaxLatencyMs']:.2f} ms (avg/max)")
@@ -1,6 +1,7 @@
 import sys
 import os
 import threading
+import copy
 import time
 
 # -------------------------------------------------------
@@ -120,7 +121,8 @@ class ManagerConnMgr(ConnectionMgr):
 
             # SSH Info Check
             if not info.m_ManagerInfo.SshID:
-                # DB에서 다시 조회
+                # DB에서 다시 조회 (World 스레드 동기 조회 유지 : 기동 시 적재한 정보에 SSH 계정이 없을 때만
+                # 매니저당 1회 수행되며, 이어지는 ping / ssh 실행도 이 스레드에서 동기로 수행됨)
                 if not world.m_DbManager.get_manager_info_find_id(info):
                     return False
                 
@@ -265,16 +267,11 @@ class ManagerConnMgr(ConnectionMgr):
             if info.m_ManagerInfo.RequestStatus != WAIT_NO:
                 return False
 
-            # DB Update
-            if not db_mgr.update_manager_status(proc_ctl.ManagerId, proc_ctl.Status, proc_ctl.Desc):
-                return False
-            
-            info.m_ManagerInfo.SettingStatus = proc_ctl.Status
-            
-            if proc_ctl.Status == START:
-                return self.execute_manager(info)
-            else:
-                return self.stop_manager(info)
+            # DB Update (DbWorkerPool) -> 완료 통지에서 상태 변경 및 실행/중지
+            manager_id, status, desc = proc_ctl.ManagerId, proc_ctl.Status, proc_ctl.Desc
+            return world.submit_cmd_port_job(
+                lambda db: db.update_manager_status(manager_id, status, desc),
+                callback=lambda result, error: self.manager_status_done(manager_id, status, result, error))
 
         # 2. Connector Control
         elif proc_ctl.ProcessType == ASCII_CONNECTOR:
@@ -292,33 +289,78 @@ class ManagerConnMgr(ConnectionMgr):
                 con = self.find_session(proc_ctl.ManagerId)
                 if not con: return False
 
-                # DB Update
+                # DB Update (DbWorkerPool) -> 완료 통지에서 메모리 갱신 및 패킷 전송
                 time_str = FrTime.get_current_time_string()
-                if not db_mgr.update_connector_status(proc_ctl, time_str):
-                    return False
-                
-                # Update Memory Info
-                conn_info.m_ConnectorInfo.SettingStatus = proc_ctl.Status
-                conn_info.m_ConnectorInfo.RequestStatus = WAIT_START if proc_ctl.Status == START else WAIT_STOP
-                conn_info.m_ConnectorInfo.LastActionDate = time_str
-                conn_info.m_ConnectorInfo.LastActionDesc = proc_ctl.Desc
-                conn_info.m_ConnectorInfo.LastActionType = AsUtil.get_action_type_string(
-                    ACT_START if proc_ctl.Status == START else ACT_STOP
-                )
-                
-                # Copy attributes for Command
-                proc_ctl.RuleId = conn_info.m_ConnectorInfo.RuleId
-                proc_ctl.MmcIdentType = conn_info.m_ConnectorInfo.MmcIdentType
-                # ... 기타 속성 복사 ...
-
-                world.send_info_change(conn_info.m_ConnectorInfo)
-                
-                # Send Packet
-                con.send_packet(PROC_CONTROL, proc_ctl.pack()) # PROC_CONTROL Message ID 사용 가정
-                return True
+                db_ctl = copy.copy(proc_ctl)
+                return world.submit_cmd_port_job(
+                    lambda db: db.update_connector_status(db_ctl, time_str),
+                    callback=lambda result, error: self.connector_status_done(db_ctl, time_str, result, error))
 
         return False
 
+    def manager_status_done(self, manager_id, status, result, error):
+        """
+        recv_process_control(ASCII_MANAGER) 의 DB 갱신 완료 (World 스레드, DB_JOB_DONE)
+        """
+        from AsciiServerWorld import AsciiServerWorld
+        world = AsciiServerWorld._instance
+
+        if result is False:
+            msg = f"Update Manager Status Error({manager_id}) : {error}"
+            print(f"[ManagerConnMgr] {msg}")
+            world.send_ascii_error(1, msg)
+            return
+
+        info = self.find_manager_info(manager_id)
+        if not info: return
+
+        info.m_ManagerInfo.SettingStatus = status
+
+        if status == START:
+            self.execute_manager(info)
+        else:
+            self.stop_manager(info)
+
+    def connector_status_done(self, proc_ctl, time_str, result, error):
+        """
+        recv_process_control(ASCII_CONNECTOR) 의 DB 갱신 완료 (World 스레드, DB_JOB_DONE)
+        """
+        from AsciiServerWorld import AsciiServerWorld
+        world = AsciiServerWorld._instance
+
+        if result is False:
+            msg = f"Update Connector Status Error({proc_ctl.ProcessId}) : {error}"
+            print(f"[ManagerConnMgr] {msg}")
+            world.send_ascii_error(1, msg)
+            return
+
+        info = self.find_manager_info(proc_ctl.ManagerId)
+        conn_info = info.get_connector_info(proc_ctl.ProcessId) if info else None
+        con = self.find_session(proc_ctl.ManagerId)
+        if not conn_info or not con: return
+
+        # DB 반영 중 다른 요청이 먼저 처리됨
+        if conn_info.m_ConnectorInfo.RequestStatus != WAIT_NO: return
+
+        # Update Memory Info
+        conn_info.m_ConnectorInfo.SettingStatus = proc_ctl.Status
+        conn_info.m_ConnectorInfo.RequestStatus = WAIT_START if proc_ctl.Status == START else WAIT_STOP
+        conn_info.m_ConnectorInfo.LastActionDate = time_str
+        conn_info.m_ConnectorInfo.LastActionDesc = proc_ctl.Desc
+        conn_info.m_ConnectorInfo.LastActionType = AsUtil.get_action_type_string(
+            ACT_START if proc_ctl.Status == START else ACT_STOP
+        )
+
+        # Copy attributes for Command
+        proc_ctl.RuleId = conn_info.m_ConnectorInfo.RuleId
+        proc_ctl.MmcIdentType = conn_info.m_ConnectorInfo.MmcIdentType
+        # ... 기타 속성 복사 ...
+
+        world.send_info_change(conn_info.m_ConnectorInfo)
+
+        # Send Packet
+        con.send_packet(PROC_CONTROL, proc_ctl.pack()) # PROC_CONTROL Message ID 사용 가정
+
     def send_session_control(self, session_ctl):
         con = self.find_session(session_ctl.ManagerId)
         if con:
@@ -614,20 +656,25 @@ class ManagerConnMgr(ConnectionMgr):
                 print(f"[ManagerConnMgr] Manager Info Can't Find : {manager_id}")
                 return
 
-            # 4. DB 업데이트 (상태를 STOP으로 변경)
-            if not db_mgr.update_manager_status(manager_id, STOP, "Error during trying start."):
-                print(f"[ManagerConnMgr] Update Manager Status Error : {db_mgr.get_error_msg()}")
-                return
+            # 4. DB 업데이트 (상태를 STOP으로 변경) -> 완료 통지에서 5, 6 수행
+            def stop_done(result, error):
+                if result is False:
+                    print(f"[ManagerConnMgr] Update Manager Status Error({manager_id}) : {error}")
+                    return
 
-            print(f"[ManagerConnMgr] Manager({manager_id}) is setting STOP")
+                print(f"[ManagerConnMgr] Manager({manager_id}) is setting STOP")
 
-            # 5. 메모리 상의 상태 정보 갱신
-            info.m_ManagerInfo.SettingStatus = STOP
-            info.m_ManagerInfo.CurStatus = STOP
-            info.m_ManagerInfo.RequestStatus = WAIT_NO
+                # 5. 메모리 상의 상태 정보 갱신
+                info.m_ManagerInfo.SettingStatus = STOP
+                info.m_ManagerInfo.CurStatus = STOP
+                info.m_ManagerInfo.RequestStatus = WAIT_NO
+
+                # 6. 변경 정보 전파 (GUI 등)
+                world.send_info_change(info.m_ManagerInfo)
 
-            # 6. 변경 정보 전파 (GUI 등)
-            world.send_info_change(info.m_ManagerInfo)
+            world.submit_cmd_port_job(
+                lambda db: db.update_manager_status(manager_id, STOP, "Error during trying start."),
+                callback=stop_done)
 
             # C++의 'delete key'는 Python GC가 자동으로 처리하므로 불필요
         
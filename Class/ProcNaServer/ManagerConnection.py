@@ -1,5 +1,6 @@
 import sys
 import os
+import copy
 
 # 프로젝트 경로 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -323,75 +324,96 @@ class ManagerConnection(AsSocket):
         print(f"[ManagerConnection] SendConnectorPortInfo : {con_info_req.ConnectorId}")
         print("-----------------------------------------------------------")
 
+        # 1. DB에서 IP 정보 조회 (DbWorkerPool) -> 완료 통지에서 포트 오픈 명령 전송
+        # 순환 참조 방지 Import
+        from AsciiServerWorld import AsciiServerWorld
+        world = AsciiServerWorld._instance
+
+        connector_id = con_info_req.ConnectorId
+        world.submit_db_job(connector_id, ManagerConnection.load_connection_ip, connector_id,
+                            callback=lambda ip_list, error: self.connector_port_info_done(connector_id, ip_list, error))
+
+    @staticmethod
+    def load_connection_ip(db_mgr, connector_id, sequence=-1):
+        """
+        DbWorkerPool 작업 : { sequence: ip_string } 반환, 조회 실패 시 False
+        """
+        ip_list = {}
+        if not db_mgr.get_connection_ip_info(ip_list, connector_id, sequence):
+            return False
+        return ip_list
+
+    def connector_port_info_done(self, connector_id, ip_list, error):
+        """
+        send_connector_port_info 의 IP 조회 완료 (World 스레드, DB_JOB_DONE)
+        """
+        if ip_list is False:
+            print(f"[ManagerConnection] Get Connection Ip Error({connector_id}) : {error}")
+            return
+
+        # 조회 중 매니저 연결이 끊긴 경우
+        if not self.is_connect():
+            return
+
+        from AsciiServerWorld import AsciiServerWorld
+        world = AsciiServerWorld._instance
         session_name = self.get_session_name()
 
-        # 1. 메모리에서 커넥터 정보 찾기
-        connector_info = self.m_ManagerConnMgr.find_connector_info(session_name, con_info_req.ConnectorId)
-        
+        # 2. 메모리에서 커넥터 정보 찾기
+        connector_info = self.m_ManagerConnMgr.find_connector_info(session_name, connector_id)
+
         if connector_info is None:
-            print(f"[ManagerConnection] Can't Find Connector : {con_info_req.ConnectorId}")
+            print(f"[ManagerConnection] Can't Find Connector : {connector_id}")
             return
 
         info_list = connector_info.m_ConnectionInfoList
 
-        # 2. DB에서 IP 정보 조회 (Sequence -> IP 매핑)
-        # 순환 참조 방지 Import
-        from AsciiServerWorld import AsciiServerWorld
-        world = AsciiServerWorld._instance
-        db_mgr = world.m_DbManager
-        
-        # ip_list = { sequence: ip_string }
-        ip_list = {}
-        
-        # GetConnectionIpInfo 구현 필요 (DbManager에 이미 추가됨)
-        if db_mgr.get_connection_ip_info(ip_list, con_info_req.ConnectorId):
+        # 3. 연결 정보 리스트 순회
+        for info_itr in info_list:
+            
+            # IP 정보 매칭 확인
+            if info_itr.Sequence not in ip_list:
+                print(f"[ManagerConnection] Can't Find Ip for connection sequence : {info_itr.Sequence}")
+                continue
             
-            # 3. 연결 정보 리스트 순회
-            for info_itr in info_list:
+            ip_addr = ip_list[info_itr.Sequence]
+
+            # 4. 상태가 START인 경우에만 명령 전송
+            if info_itr.SettingStatus == START:
+                cmd_open_port = AsCmdOpenPortT()
                 
-                # IP 정보 매칭 확인
-                if info_itr.Sequence not in ip_list:
-                    print(f"[ManagerConnection] Can't Find Ip for connection sequence : {info_itr.Sequence}")
-                    continue
+                # Msg ID 발급
+                cmd_open_port.Id = world.get_msg_id()
                 
-                ip_addr = ip_list[info_itr.Sequence]
-
-                # 4. 상태가 START인 경우에만 명령 전송
-                if info_itr.SettingStatus == START:
-                    cmd_open_port = AsCmdOpenPortT()
-                    
-                    # Msg ID 발급
-                    cmd_open_port.Id = world.get_msg_id()
-                    
-                    # 데이터 채우기
-                    cmd_open_port.Sequence = info_itr.Sequence
-                    cmd_open_port.EquipId = info_itr.ConnectorId
-                    cmd_open_port.AgentEquipId = info_itr.AgentEquipId
-                    cmd_open_port.ConnectorId = info_itr.ConnectorId
-                    cmd_open_port.IpAddress = ip_addr
-                    cmd_open_port.PortNo = info_itr.PortNo
-                    cmd_open_port.UserId = info_itr.UserId
-                    cmd_open_port.Password = info_itr.UserPassword
-                    cmd_open_port.ProtocolType = info_itr.ProtocolType
-                    cmd_open_port.PortType = info_itr.PortType
-                    cmd_open_port.GatFlag = info_itr.GatFlag
-                    cmd_open_port.CommandPortFlag = info_itr.CommandPortFlag
-                    
-                    # Name 생성: "Sequence_PortTypeStr"
-                    type_str = AsUtil.get_port_type_string(cmd_open_port.PortType)
-                    cmd_open_port.Name = f"{cmd_open_port.Sequence}_{type_str}"
-                    
-                    # 디버깅 출력 & 전송
-                    AsUtil.cmd_open_port_display(cmd_open_port)
-                    self.cmd_open_port_info(cmd_open_port)
+                # 데이터 채우기
+                cmd_open_port.Sequence = info_itr.Sequence
+                cmd_open_port.EquipId = info_itr.ConnectorId
+                cmd_open_port.AgentEquipId = info_itr.AgentEquipId
+                cmd_open_port.ConnectorId = info_itr.ConnectorId
+                cmd_open_port.IpAddress = ip_addr
+                cmd_open_port.PortNo = info_itr.PortNo
+                cmd_open_port.UserId = info_itr.UserId
+                cmd_open_port.Password = info_itr.UserPassword
+                cmd_open_port.ProtocolType = info_itr.ProtocolType
+                cmd_open_port.PortType = info_itr.PortType
+                cmd_open_port.GatFlag = info_itr.GatFlag
+                cmd_open_port.CommandPortFlag = info_itr.CommandPortFlag
+                
+                # Name 생성: "Sequence_PortTypeStr"
+                type_str = AsUtil.get_port_type_string(cmd_open_port.PortType)
+                cmd_open_port.Name = f"{cmd_open_port.Sequence}_{type_str}"
+                
+                # 디버깅 출력 & 전송
+                AsUtil.cmd_open_port_display(cmd_open_port)
+                self.cmd_open_port_info(cmd_open_port)
+                
+                # 커맨드 포트 관리 목록 업데이트
+                if cmd_open_port.CommandPortFlag:
+                    print(f"[ManagerConnection] Insert HasCmdPortNeListSet : {info_itr.ConnectorId}({session_name})")
+                    self.m_HasCmdPortNeListSet.add(info_itr.ConnectorId)
                     
-                    # 커맨드 포트 관리 목록 업데이트
-                    if cmd_open_port.CommandPortFlag:
-                        print(f"[ManagerConnection] Insert HasCmdPortNeListSet : {info_itr.ConnectorId}({session_name})")
-                        self.m_HasCmdPortNeListSet.add(info_itr.ConnectorId)
-                        
-                    # 요청 상태 변경
-                    info_itr.RequestStatus = WAIT_START
+                # 요청 상태 변경
+                info_itr.RequestStatus = WAIT_START
 
     def cmd_open_port_info(self, port_info):
         """
@@ -601,7 +623,6 @@ class ManagerConnection(AsSocket):
         )
 
         world = AsciiServerWorld._instance
-        db_mgr = world.m_DbManager
 
         # 1. 연결 정보 메모리 조회
         connection_info = self.m_ManagerConnMgr.find_connection_info(
@@ -615,108 +636,159 @@ class ManagerConnection(AsSocket):
             return False
 
         # 2. 요청 상태 확인 (중복 요청 방지)
-        if connection_info.RequestStatus == WAIT_NO:
-            
-            # 2-1. DB 업데이트
-            # update_connection_status_by_ctl 메서드는 DbManager.py에 구현됨
-            if not db_mgr.update_connection_status_by_ctl(session_ctl):
-                err_msg = f"Update Connection Error : {db_mgr.get_error_msg()}"
-                print(f"[ManagerConnection] {err_msg}")
-                return False
-
-            # 2-2. 현재 상태와 요청 상태 비교
-            if session_ctl.Status == START and connection_info.SettingStatus == START:
-                msg = f"Already Start Connection : {session_ctl.Sequence}"
-                print(f"[ManagerConnection] {msg}")
-                world.send_ascii_error(1, msg)
-                return False
-            elif session_ctl.Status == STOP and connection_info.SettingStatus == STOP:
-                msg = f"Already Stop Connection : {session_ctl.Sequence}"
-                print(f"[ManagerConnection] {msg}")
-                world.send_ascii_error(1, msg)
-                return False
-
-            # 2-3. 메모리 상태 갱신
-            connection_info.SettingStatus = START if session_ctl.Status == START else STOP
-            connection_info.RequestStatus = WAIT_START if session_ctl.Status == START else WAIT_STOP
-            
-            # GUI 등에 변경 알림
-            world.send_info_change(connection_info)
-
-            # ---------------------------------------------------
-            # 3-A. STOP 처리
-            # ---------------------------------------------------
-            if session_ctl.Status != START:
-                connection_info.RequestStatus = WAIT_STOP
-                
-                if connection_info.CommandPortFlag:
-                    self.remove_cmd_ne_list(session_ctl.ConnectorId)
-                
-                # SESSION_CONTROL 패킷 전송
-                body = session_ctl.pack()
-                packet = PacketT(SESSION_CONTROL, len(body), body)
-                self.packet_send(packet)
-
-            # ---------------------------------------------------
-            # 3-B. START 처리 (Open Port 명령 전송)
-            # ---------------------------------------------------
-            else:
-                print("-----------------------------------------------------------")
-                print(f"[ManagerConnection] SendConnectorPortInfo : {session_ctl.ConnectorId}")
-                print("-----------------------------------------------------------")
-
-                ip_list = {} # {sequence: ip}
-                
-                # DB에서 IP 조회
-                if db_mgr.get_connection_ip_info(ip_list, session_ctl.ConnectorId, session_ctl.Sequence):
-                    
-                    if connection_info.Sequence not in ip_list:
-                        msg = f"Can't Find Ip for connection sequence : {session_ctl.ConnectorId},{connection_info.Sequence}"
-                        print(f"[ManagerConnection] {msg}")
-                        world.send_ascii_error(1, msg)
-                        return False
-                    
-                    ip_addr = ip_list[connection_info.Sequence]
-
-                    # CMD_OPEN_PORT 패킷 구성
-                    cmd_open = AsCmdOpenPortT()
-                    cmd_open.Id = world.get_msg_id()
-                    cmd_open.Sequence = connection_info.Sequence
-                    cmd_open.EquipId = connection_info.ConnectorId
-                    cmd_open.AgentEquipId = connection_info.AgentEquipId
-                    cmd_open.ConnectorId = connection_info.ConnectorId
-                    cmd_open.IpAddress = ip_addr
-                    cmd_open.PortNo = connection_info.PortNo
-                    cmd_open.UserId = connection_info.UserId
-                    cmd_open.Password = connection_info.UserPassword
-                    cmd_open.ProtocolType = connection_info.ProtocolType
-                    cmd_open.PortType = connection_info.PortType
-                    cmd_open.GatFlag = connection_info.GatFlag
-                    cmd_open.CommandPortFlag = connection_info.CommandPortFlag
-                    
-                    # Name 생성 (예: "1_CMD")
-                    p_type_str = AsUtil.get_port_type_string(cmd_open.PortType)
-                    cmd_open.Name = f"{cmd_open.Sequence}_{p_type_str}"
-                    
-                    # 디버깅 및 전송
-                    AsUtil.cmd_open_port_display(cmd_open)
-                    self.cmd_open_port_info(cmd_open) # AsSocket Helper 호출
-
-                    if connection_info.CommandPortFlag:
-                        print(f"[ManagerConnection] Insert HasCmdPortNeListSet : {connection_info.ConnectorId}({self.get_session_name()})")
-                        self.m_HasCmdPortNeListSet.add(connection_info.ConnectorId)
-                
-                connection_info.RequestStatus = WAIT_START
-            
-            return True
+        if connection_info.RequestStatus != WAIT_NO:
+            self.already_request_session(session_ctl, connection_info)
+            return False
 
-        else:
-            # 이미 처리 중인 요청이 있음
-            req_str = "Start" if connection_info.RequestStatus == WAIT_START else "Stop"
-            msg = f"Already Request Connection: {session_ctl.Sequence}({req_str})"
+        # 2-1. 현재 상태와 요청 상태 비교
+        if session_ctl.Status == START and connection_info.SettingStatus == START:
+            msg = f"Already Start Connection : {session_ctl.Sequence}"
             print(f"[ManagerConnection] {msg}")
             world.send_ascii_error(1, msg)
             return False
+        elif session_ctl.Status == STOP and connection_info.SettingStatus == STOP:
+            msg = f"Already Stop Connection : {session_ctl.Sequence}"
+            print(f"[ManagerConnection] {msg}")
+            world.send_ascii_error(1, msg)
+            return False
+
+        # 2-2. DB 업데이트 + START 시 IP 조회 (DbWorkerPool)
+        # 메모리 상태 갱신과 패킷 전송은 완료 통지(session_control_done)에서 수행
+        db_ctl = copy.copy(session_ctl)
+        return world.submit_cmd_port_job(
+            ManagerConnection.session_control_job, db_ctl,
+            callback=lambda ip_list, error: self.session_control_done(db_ctl, ip_list, error))
+
+    @staticmethod
+    def session_control_job(db_mgr, db_ctl):
+        """
+        DbWorkerPool 작업 : 연결 상태 갱신 실패 시 False,
+        STOP 은 {}, START 는 { sequence: ip_string } (IP 조회 실패 시 None)
+        """
+        if not db_mgr.update_connection_status_by_ctl(db_ctl):
+            return False
+        if db_ctl.Status != START:
+            return {}
+        ip_list = ManagerConnection.load_connection_ip(db_mgr, db_ctl.ConnectorId, db_ctl.Sequence)
+        if ip_list is False:
+            print(f"[ManagerConnection] Get Connection Ip Error({db_ctl.ConnectorId}) : {db_mgr.get_error_msg()}")
+            return None
+        return ip_list
+
+    def session_control_done(self, session_ctl, ip_list, error):
+        """
+        send_session_control 의 DB 작업 완료 (World 스레드, DB_JOB_DONE)
+        """
+        from AsciiServerWorld import AsciiServerWorld
+        from Class.Common.CommType import (
+            START, WAIT_NO, WAIT_START, WAIT_STOP,
+            SESSION_CONTROL, AsCmdOpenPortT, PacketT
+        )
+
+        world = AsciiServerWorld._instance
+
+        if ip_list is False:
+            err_msg = f"Update Connection Error : {error}"
+            print(f"[ManagerConnection] {err_msg}")
+            world.send_ascii_error(1, err_msg)
+            return
+
+        connection_info = self.m_ManagerConnMgr.find_connection_info(
+            session_ctl.ManagerId, session_ctl.ConnectorId, session_ctl.Sequence
+        )
+        if connection_info is None:
+            return
+
+        # 작업 대기 중 들어온 다른 요청이 먼저 처리된 경우
+        if connection_info.RequestStatus != WAIT_NO:
+            self.already_request_session(session_ctl, connection_info)
+            return
+
+        # 3. 메모리 상태 갱신
+        connection_info.SettingStatus = START if session_ctl.Status == START else STOP
+        connection_info.RequestStatus = WAIT_START if session_ctl.Status == START else WAIT_STOP
+
+        # GUI 등에 변경 알림
+        world.send_info_change(connection_info)
+
+        # 조회 중 매니저 연결이 끊긴 경우 : 상태만 반영
+        if not self.is_connect():
+            return
+
+        # ---------------------------------------------------
+        # 4-A. STOP 처리
+        # ---------------------------------------------------
+        if session_ctl.Status != START:
+            connection_info.RequestStatus = WAIT_STOP
+
+            if connection_info.CommandPortFlag:
+                self.remove_cmd_ne_list(session_ctl.ConnectorId)
+
+            # SESSION_CONTROL 패킷 전송
+            body = session_ctl.pack()
+            packet = PacketT(SESSION_CONTROL, len(body), body)
+            self.packet_send(packet)
+
+        # ---------------------------------------------------
+        # 4-B. START 처리 (Open Port 명령 전송)
+        # ---------------------------------------------------
+        else:
+            print("-----------------------------------------------------------")
+            print(f"[ManagerConnection] SendConnectorPortInfo : {session_ctl.ConnectorId}")
+            print("-----------------------------------------------------------")
+
+            # ip_list : {sequence: ip}, None 이면 IP 조회 실패
+            if ip_list is not None:
+
+                if connection_info.Sequence not in ip_list:
+                    msg = f"Can't Find Ip for connection sequence : {session_ctl.ConnectorId},{connection_info.Sequence}"
+                    print(f"[ManagerConnection] {msg}")
+                    world.send_ascii_error(1, msg)
+                    return
+
+                ip_addr = ip_list[connection_info.Sequence]
+
+                # CMD_OPEN_PORT 패킷 구성
+                cmd_open = AsCmdOpenPortT()
+                cmd_open.Id = world.get_msg_id()
+                cmd_open.Sequence = connection_info.Sequence
+                cmd_open.EquipId = connection_info.ConnectorId
+                cmd_open.AgentEquipId = connection_info.AgentEquipId
+                cmd_open.ConnectorId = connection_info.ConnectorId
+                cmd_open.IpAddress = ip_addr
+                cmd_open.PortNo = connection_info.PortNo
+                cmd_open.UserId = connection_info.UserId
+                cmd_open.Password = connection_info.UserPassword
+                cmd_open.ProtocolType = connection_info.ProtocolType
+                cmd_open.PortType = connection_info.PortType
+                cmd_open.GatFlag = connection_info.GatFlag
+                cmd_open.CommandPortFlag = connection_info.CommandPortFlag
+
+                # Name 생성 (예: "1_CMD")
+                p_type_str = AsUtil.get_port_type_string(cmd_open.PortType)
+                cmd_open.Name = f"{cmd_open.Sequence}_{p_type_str}"
+
+                # 디버깅 및 전송
+                AsUtil.cmd_open_port_display(cmd_open)
+                self.cmd_open_port_info(cmd_open) # AsSocket Helper 호출
+
+                if connection_info.CommandPortFlag:
+                    print(f"[ManagerConnection] Insert HasCmdPortNeListSet : {connection_info.ConnectorId}({self.get_session_name()})")
+                    self.m_HasCmdPortNeListSet.add(connection_info.ConnectorId)
+
+            connection_info.RequestStatus = WAIT_START
+
+    def already_request_session(self, session_ctl, connection_info):
+        """
+        이미 처리 중인 요청이 있음
+        """
+        from AsciiServerWorld import AsciiServerWorld
+        from Class.Common.CommType import WAIT_START
+
+        req_str = "Start" if connection_info.RequestStatus == WAIT_START else "Stop"
+        msg = f"Already Request Connection: {session_ctl.Sequence}({req_str})"
+        print(f"[ManagerConnection] {msg}")
+        AsciiServerWorld._instance.send_ascii_error(1, msg)
 
     def parser_rule_change(self, change_info):
         """
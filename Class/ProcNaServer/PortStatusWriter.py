@@ -0,0 +1,232 @@
+import sys
+import os
+import time
+
+# 프로젝트 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# -------------------------------------------------------
+# PortStatusWriter Class
+# DC_STATUS_CMD_PORT 개별 포트 상태 갱신을 모아서 Array DML 로 반영 (C++ 원본 없음)
+# -------------------------------------------------------
+class PortStatusWriter:
+    """
+    DbManager.update_connection_status 의 포트 단위 DELETE + INSERT 를 모아서
+    flush 1회당 DELETE / INSERT 각 1회 Array DML + 1 트랜잭션으로 처리.
+
+    동일 Sequence 의 갱신이 flush 전에 여러 번 오면 마지막 상태만 반영 (DELETE 후 INSERT 이므로 결과 동일).
+    flush 조건 : 대기 건수 >= m_FlushSize 또는 첫 대기 후 m_FlushMsec 경과 (PortStatusWriterTimer)
+    DbWorkerPool 이 설정되면 DB 반영은 DB_JOB_KEY 작업으로 제출 (World 스레드 비블로킹)
+    flush 실패 시 해당 묶음을 대기 목록에 되돌려 다음 주기에 재시도 (연속 MAX_FLUSH_RETRY 회까지, 이후 폐기)
+    단, 이후 flush 가 이미 다룬 Sequence 는 되돌리지 않음 (flush 세대 번호로 판단, 새 상태를 옛 상태로 덮지 않도록)
+    """
+    DB_JOB_KEY = "DC_STATUS_CMD_PORT"
+    FLUSH_TIMER = 1
+    DEFAULT_FLUSH_SIZE = 500
+    DEFAULT_FLUSH_MSEC = 200
+    MAX_FLUSH_RETRY = 3
+
+    def __init__(self, db_manager, flush_size=0, flush_msec=0):
+        """
+        flush_size / flush_msec : 0 이면 기본값
+        """
+        self.m_DbManager = db_manager
+        self.m_Timer = None
+        self.m_WorkerPool = None
+        self.m_FlushSize = flush_size if flush_size > 0 else self.DEFAULT_FLUSH_SIZE
+        self.m_FlushMsec = flush_msec if flush_msec > 0 else self.DEFAULT_FLUSH_MSEC
+        self.m_TimerKey = -1
+
+        # Sequence -> INSERT 값(dict) / None (삭제만)
+        self.m_PendingMap = {}
+        self.m_RetryCnt = 0 # 연속 flush 실패 횟수
+
+        # flush 세대 : Sequence -> 해당 Sequence 를 마지막으로 제출한 flush 세대
+        self.m_FlushGen = 0
+        self.m_SeqGenMap = {}
+        self.m_DiscardGen = 0 # 이 세대 이하의 flush 묶음은 실패해도 되돌리지 않음
+
+        # 통계
+        self.m_FlushCnt = 0
+        self.m_FlushFailCnt = 0
+        self.m_DropCnt = 0
+        self.m_TotalRowCnt = 0
+        self.m_TotalRoundTripCnt = 0
+
+    def set_timer(self, timer):
+        """
+        m_FlushMsec 경과 flush 용 타이머 (PortStatusWriterTimer). 없으면 크기 기준 / 명시적 flush 만 수행.
+        """
+        self.m_Timer = timer
+
+    def set_worker_pool(self, pool):
+        self.m_WorkerPool = pool
+
+    def get_pending_cnt(self):
+        return len(self.m_PendingMap)
+
+    def add(self, sequence, values):
+        """
+        포트 상태 갱신 등록. values 가 None 이면 해당 Sequence 삭제만 수행.
+        """
+        self.m_PendingMap[sequence] = values
+
+        if len(self.m_PendingMap) >= self.m_FlushSize:
+            self.flush()
+        elif self.m_TimerKey < 0 and self.m_Timer:
+            self.m_TimerKey = self.m_Timer.set_timer2(self.m_FlushMsec, self.FLUSH_TIMER)
+
+    def discard(self):
+        """
+        대기 중인 갱신 폐기 (DC_STATUS_CMD_PORT 전체 삭제 시).
+        """
+        self._cancel_flush_timer()
+        self.m_PendingMap.clear()
+        self.m_RetryCnt = 0
+        self.m_DiscardGen = self.m_FlushGen
+
+    def receive_time_out(self, reason, extra_reason=None):
+        """
+        PortStatusWriterTimer 에서 전달
+        """
+        if reason == self.FLUSH_TIMER:
+            self.m_TimerKey = -1
+            self.flush()
+
+    def flush(self):
+        """
+        대기 중인 갱신을 1 트랜잭션으로 반영.
+          DELETE ... WHERE SEQUENCE = :SEQUENCE  (대기 Sequence 전체, Array DML)
+          INSERT ... VALUES (...)                (ELIMINATION 제외, Array DML)
+        """
+        self._cancel_flush_timer()
+        if not self.m_PendingMap:
+            return True
+
+        pending = self.m_PendingMap
+        self.m_PendingMap = {}
+
+        self.m_FlushGen += 1
+        gen = self.m_FlushGen
+        for sequence in pending:
+            self.m_SeqGenMap[sequence] = gen
+
+        delete_list = [{"SEQUENCE": sequence} for sequence in pending]
+        insert_list = [values for values in pending.values() if values]
+
+        if self.m_WorkerPool:
+            return self.m_WorkerPool.submit(self.DB_JOB_KEY, PortStatusWriter.apply, delete_list, insert_list,
+                                            callback=lambda result, error: self.flush_done(result, error, pending, gen))
+        return self.flush_done(PortStatusWriter.apply(self.m_DbManager, delete_list, insert_list), "", pending, gen)
+
+    @staticmethod
+    def apply(db_mgr, delete_list, insert_list):
+        """
+        DELETE / INSERT Array DML 후 commit (DbWorkerPool 작업 스레드 또는 World 스레드에서 수행)
+        Returns (result, delete 건수, insert 건수, round trip 수, 수행 시간 ms, 오류 메시지)
+        """
+        start = time.perf_counter()
+        round_trip = 0
+
+        result = db_mgr.execute_statement_array("DELETE_CMD_PORT_BY_SEQUENCE", delete_list, False)
+        round_trip += 1
+        if result and insert_list:
+            result = db_mgr.execute_statement_array("INSERT_CMD_PORT", insert_list, False)
+            round_trip += 1
+
+        error = ""
+        if result:
+            db_mgr.commit()
+        else:
+            error = db_mgr.get_error_msg() # rollback 전 오류
+            db_mgr.rollback()
+        round_trip += 1
+        elapsed = (time.perf_counter() - start) * 1000
+        return result, len(delete_list), len(insert_list), round_trip, elapsed, error
+
+    def flush_done(self, flush_result, error="", pending=None, gen=0):
+        """
+        flush 결과 통계 / 로그 (World 스레드). 실패한 묶음(pending, flush 세대 gen)은 재시도 대기 목록으로.
+        """
+        self.m_FlushCnt += 1
+        pending = pending or {}
+        if flush_result is not False:
+            result, delete_cnt, insert_cnt, round_trip, elapsed, error = flush_result
+            self.m_TotalRoundTripCnt += round_trip
+        else:
+            # 작업 스레드 예외 (apply 가 결과를 만들지 못함)
+            result = False
+
+        if not result:
+            self.m_FlushFailCnt += 1
+            self._requeue(pending, gen, error)
+            self._release_gen(pending, gen)
+            return False
+
+        self.m_RetryCnt = 0
+        self._release_gen(pending, gen)
+        row_cnt = delete_cnt + insert_cnt
+        self.m_TotalRowCnt += row_cnt
+        print(f"[PortStatusWriter] Flush : ports={delete_cnt}, rows={row_cnt} "
+              f"(delete={delete_cnt}, insert={insert_cnt}), round trips={round_trip}, "
+              f"{elapsed:.1f} ms")
+        return True
+
+    def _requeue(self, pending, gen, error):
+        """
+        실패한 묶음을 대기 목록에 되돌림. 그 사이 새로 들어온 같은 Sequence 의 갱신이 우선이며,
+        이후 flush (세대 > gen) 가 이미 제출한 Sequence 와 discard 이전 묶음은 되돌리지 않음.
+        연속 MAX_FLUSH_RETRY 회 실패하면 되돌리지 않고 폐기.
+        """
+        if gen <= self.m_DiscardGen:
+            return
+        seq_gen_map = self.m_SeqGenMap
+        pending = {sequence: values for sequence, values in pending.items()
+                   if seq_gen_map.get(sequence, gen) <= gen}
+        if not pending:
+            return
+
+        self.m_RetryCnt += 1
+        if self.m_RetryCnt > self.MAX_FLUSH_RETRY:
+            self.m_DropCnt += len(pending)
+            print(f"[PortStatusWriter] [CORE_ERROR] Flush error : {error}, "
+                  f"{len(pending)} ports dropped after {self.MAX_FLUSH_RETRY} retries")
+            self.m_RetryCnt = 0
+            return
+
+        print(f"[PortStatusWriter] Flush error : {error}, {len(pending)} ports requeued "
+              f"(retry {self.m_RetryCnt}/{self.MAX_FLUSH_RETRY})")
+        for sequence, values in pending.items():
+            self.m_PendingMap.setdefault(sequence, values)
+
+        # 다음 주기에 재시도 (즉시 flush 하지 않음)
+        if self.m_PendingMap and self.m_TimerKey < 0 and self.m_Timer:
+            self.m_TimerKey = self.m_Timer.set_timer2(self.m_FlushMsec, self.FLUSH_TIMER)
+
+    def _release_gen(self, pending, gen):
+        """
+        완료된 flush 세대 정리 (이후 flush 가 다시 제출한 Sequence 는 유지)
+        """
+        seq_gen_map = self.m_SeqGenMap
+        for sequence in pending:
+            if seq_gen_map.get(sequence) == gen:
+                del seq_gen_map[sequence]
+
+    def get_stat(self):
+        return {
+            "FlushCnt": self.m_FlushCnt,
+            "FlushFailCnt": self.m_FlushFailCnt,
+            "DropCnt": self.m_DropCnt,
+            "TotalRowCnt": self.m_TotalRowCnt,
+            "TotalRoundTripCnt": self.m_TotalRoundTripCnt,
+            "PendingCnt": len(self.m_PendingMap),
+        }
+
+    def _cancel_flush_timer(self):
+        if self.m_TimerKey >= 0:
+            if self.m_Timer:
+                self.m_Timer.cancel_timer(self.m_TimerKey)
+            self.m_TimerKey = -1
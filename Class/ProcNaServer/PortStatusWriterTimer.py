@@ -0,0 +1,29 @@
+import sys
+import os
+
+# 프로젝트 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Event.fr_timer_sensor import FrTimerSensor
+
+# -------------------------------------------------------
+# PortStatusWriterTimer Class
+# PortStatusWriter 의 주기 flush 타이머 (C++ 원본 없음)
+# -------------------------------------------------------
+class PortStatusWriterTimer(FrTimerSensor):
+    def __init__(self, writer):
+        super().__init__()
+        self.m_PortStatusWriter = writer
+
+    def __del__(self):
+        super().__del__()
+
+    def receive_time_out(self, reason, extra_reason=None):
+        """
+        타이머 만료 시 PortStatusWriter 로 전달
+        """
+        if self.m_PortStatusWriter:
+            self.m_PortStatusWriter.receive_time_out(reason, extra_reason)
@@ -240,20 +240,13 @@ class SubProcConnMgr(SockMgrConnMgr):
                 world.send_ascii_error(1, msg)
                 return False
 
-            if world.m_DbManager and not world.m_DbManager.update_sub_proc_status(proc_ctl.ProcessId, proc_ctl.Status):
-                 print(f"[SubProcConnMgr] [CORE_ERROR] Update SubProc Status Error : {world.m_DbManager.get_error_msg()}")
-                 return False
-
-            info.SettingStatus = START if proc_ctl.Status == START else STOP
-
-            if proc_ctl.Status == START:
-                if self.execute_sub_proc(info):
-                    world.send_ascii_error(1, f"The SubProc({proc_ctl.ProcessId}) start successfull")
-                else:
-                    world.send_ascii_error(1, "Execute Fail") # GetGErrMsg stub
-                    
-            elif proc_ctl.Status == STOP:
-                self.stop_sub_proc(info)
+            # DB Update (DbWorkerPool) -> 완료 통지에서 상태 변경 및 실행/중지
+            proc_id, status = proc_ctl.ProcessId, proc_ctl.Status
+            if world.m_DbManager:
+                world.submit_db_job(proc_id, lambda db: db.update_sub_proc_status(proc_id, status),
+                                    callback=lambda result, error: self.sub_proc_status_done(proc_id, status, result, error))
+            else:
+                self.sub_proc_status_done(proc_id, status, True, "")
 
         else:
             status_str = "Start" if info.RequestStatus == WAIT_START else "Stop"
@@ -264,6 +257,34 @@ class SubProcConnMgr(SockMgrConnMgr):
             
         return False
 
+    def sub_proc_status_done(self, proc_id, status, result, error):
+        """
+        recv_process_control 의 DB 갱신 완료 (World 스레드, DB_JOB_DONE)
+        """
+        from AsciiServerWorld import AsciiServerWorld
+        world = AsciiServerWorld._instance
+
+        if result is False:
+            msg = f"Update SubProc Status Error({proc_id}) : {error}"
+            print(f"[SubProcConnMgr] [CORE_ERROR] {msg}")
+            world.send_ascii_error(1, msg)
+            return
+
+        info = self.find_sub_proc_info(proc_id)
+        if info is None:
+            return
+
+        info.SettingStatus = START if status == START else STOP
+
+        if status == START:
+            if self.execute_sub_proc(info):
+                world.send_ascii_error(1, f"The SubProc({proc_id}) start successfull")
+            else:
+                world.send_ascii_error(1, "Execute Fail") # GetGErrMsg stub
+
+        elif status == STOP:
+            self.stop_sub_proc(info)
+
     def find_sub_proc_info(self, proc_id_str):
         """
         C++: AS_SUB_PROC_INFO_T* FindSubProcInfo(string ProcIdStr)
@@ -294,15 +315,21 @@ class SubProcConnMgr(SockMgrConnMgr):
 
             print(f"[SubProcConnMgr] SubProc {proc_id} Status is setting STOP")
 
-            if world.m_DbManager and not world.m_DbManager.update_sub_proc_status(proc_id, STOP):
-                print(f"[SubProcConnMgr] [CORE_ERROR] Update SubProc Status Error : {world.m_DbManager.get_error_msg()}")
-                return
+            def stop_done(result, error):
+                if result is False:
+                    print(f"[SubProcConnMgr] [CORE_ERROR] Update SubProc Status Error({proc_id}) : {error}")
+                    return
 
-            info.SettingStatus = STOP
-            info.CurStatus = STOP
-            info.RequestStatus = WAIT_NO
+                info.SettingStatus = STOP
+                info.CurStatus = STOP
+                info.RequestStatus = WAIT_NO
 
-            world.send_info_change(info)
+                world.send_info_change(info)
+
+            if world.m_DbManager:
+                world.submit_db_job(proc_id, lambda db: db.update_sub_proc_status(proc_id, STOP), callback=stop_done)
+            else:
+                stop_done(True, "")
 
     def kill_sub_proc(self, proc_id_str):
         """
@@ -39,13 +39,14 @@ class DataExtractMgr:
         if self.m_DataExtractor:
             self.m_DataExtractor.init_guid_maker(pid, tid, ip)
 
-    def data_extract(self, ident_rule, ident_id_string, raw_msg, session_name):
+    def data_extract(self, ident_rule, ident_id_string, raw_msg, session_name, line_index=None):
         """
         Entry point called by DataRouterConnection.
         Delegates the actual parsing work to DataExtractor.
+        line_index : LineIndex over raw_msg carried by ExtractDataInfo (optional).
         """
         if self.m_DataExtractor:
-            self.m_DataExtractor.parsing(ident_rule, ident_id_string, raw_msg, session_name)
+            self.m_DataExtractor.parsing(ident_rule, ident_id_string, raw_msg, session_name, line_index)
 
     def parsing_result(self, consumers, p_data):
         """
@@ -13,8 +13,10 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 from Class.Common.CommType import AsParsedDataT, PARSED_DATA_SEG_BLK_SIZE
-from Class.ProcParser.ParsingIdentMgr import ParsingIdentMgr
 from Class.ProcParser.RuleType import * # Import Rule Constants
+from Class.ProcParser.LineIndex import LineIndex
+from Class.ProcParser.MsgTokenizer import MsgTokenizer
+from Class.ProcParser.ResultBuilder import ResultBuilder
 
 # -------------------------------------------------------
 # XML Related Imports
@@ -89,11 +91,13 @@ class DataExtractor:
         self.m_CurAtomicAttrCnt = 0
         self.m_BscNo = -1
         
-        self.m_LongResult = bytearray(self.MAX_PARSED_DATA_SIZE)
+        self.m_ResultBuilder = ResultBuilder(self.MAX_PARSED_DATA_SIZE)
+        self.m_LongResult = self.m_ResultBuilder.m_Buf # Same storage as m_ResultBuilder
         self.m_LongResultLen = self.MAX_PARSED_DATA_SIZE
         
-        self.m_SplitMsgMap = {} # Line Number -> Line String
+        self.m_LineIndex = LineIndex("") # Line offsets of m_MsgBuf
         self.m_TokenListMap = {} # Line Number -> Token List
+        self.m_Tokenizer = MsgTokenizer() # Per (Line, Delimiter) token cache
         self.m_PreParsedDataCopy = [] # Cache for previous rule results
         
         self.m_GUIDMaker = GUIDMaker()
@@ -112,9 +116,9 @@ class DataExtractor:
         Performs cleanup. In Python, GC handles memory, but explicit clearing
         can help break circular references or release resources immediately.
         """
-        # m_SplitMsgMap.clear()
-        if hasattr(self, 'm_SplitMsgMap') and self.m_SplitMsgMap:
-            self.m_SplitMsgMap.clear()
+        # m_SplitMsgMap.clear() (replaced by m_LineIndex)
+        if hasattr(self, 'm_LineIndex'):
+            self.m_LineIndex = None
 
         # m_TokenListMap.Clear()
         if hasattr(self, 'm_TokenListMap') and self.m_TokenListMap:
@@ -125,6 +129,7 @@ class DataExtractor:
 
         # delete m_LongResult
         self.m_LongResult = None
+        self.m_ResultBuilder = None
 
         # if(m_XmlParserMgr) delete m_XmlParserMgr
         if hasattr(self, 'm_XmlParserMgr'):
@@ -155,7 +160,6 @@ class DataExtractor:
         """
         self.m_MsgBuf = msg_buf
         self.line_scanning() # Pre-scan lines
-        self.m_TokenListMap.clear()
 
         start_line_number = 1
         parsing_success_flag = False
@@ -434,29 +438,40 @@ class DataExtractor:
         
         return False, ""
 
-    def line_scanning(self):
+    def line_scanning(self, line_index=None):
         """
         C++: void LineScanning()
-        Splits m_MsgBuf into lines and stores in m_SplitMsgMap.
+        Indexes m_MsgBuf lines into m_LineIndex (offset array, no per-line copies).
+        Reuses line_index when it was built over the same text.
         """
-        self.m_SplitMsgMap.clear()
-        lines = self.m_MsgBuf.splitlines() # Python splitlines handles \n, \r\n
-        
-        for i, line in enumerate(lines):
-            self.m_SplitMsgMap[i] = line
-            
-        self.m_EndLineNumber = len(lines)
+        if line_index is None or line_index.get_msg_buf() is not self.m_MsgBuf:
+            line_index = LineIndex(self.m_MsgBuf)
+        self.m_LineIndex = line_index
+        self.m_EndLineNumber = line_index.get_line_count()
+
+        # New message: drop the token lists of the previous one
+        self.m_TokenListMap.clear()
+        self.m_Tokenizer.clear()
 
     def get_line(self, line_number):
         """
         C++: char* GetLine(int LineNumber)
         LineNumber is 1-based index.
         """
-        idx = line_number - 1
-        return self.m_SplitMsgMap.get(idx)
+        return self.m_LineIndex.get_line(line_number)
 
     def is_end_line(self, line_number):
         return line_number > self.m_EndLineNumber
+
+    def get_token_list(self, line_buf, offset, delimiter_type, delimiter):
+        """
+        Token list of line_buf[offset:] (offset = end of the rule's start string).
+        Cached by m_Tokenizer per (remainder, delimiter), so every rule of a list template
+        reading the same row tokenizes it once. Returns None if the delimiter does not occur.
+        """
+        if delimiter_type == 1:
+            return self.m_Tokenizer.tokenize_char(line_buf[offset:], delimiter)
+        return self.m_Tokenizer.tokenize_string(line_buf[offset:], delimiter)
     
     def msg_tokenize_string(self, line, arg2, arg3=None, arg4=None):
         """
@@ -490,66 +505,25 @@ class DataExtractor:
         void MsgTokenizeString(const char* Line, CharPtrVector& StrList, string Delimiter)
         void MsgTokenizeString(const char* Line, StringVector& StrList, string Delimiter)
         """
-        if not delimiter: 
-            delimiter = " "
-
-        # C++ check: if(!strstr(Line, Delimiter.c_str()))
-        if delimiter != " " and delimiter not in line:
-            if delimiter != " ": 
-                return
+        tokens = self.m_Tokenizer.tokenize_string(line, delimiter)
+        if tokens is None:
+            return
 
         # Garbage string for 1-based indexing
         str_list.append("")
-
-        # Tokenize Logic
-        if delimiter == " ":
-            # C++ Logic: Delimiter " " implies skipping empty tokens (standard split)
-            tokens = line.split()
-            for token in tokens:
-                str_list.append(token.strip())
-        else:
-            # C++ Logic: Explicit delimiter preserves empty tokens if they exist between delimiters?
-            # Looking at C++ code: 
-            # if(end-start) -> copy
-            # else -> if(Delimiter != " ") -> push token (empty)
-            # This matches Python's split(delimiter) behavior exactly.
-            
-            tokens = line.split(delimiter)
-            for token in tokens:
-                str_list.append(token.strip())
+        str_list.extend(tokens)
 
     def _msg_tokenize_index(self, line, token_pos, delimiter=" "):
         """
         Internal implementation for retrieving a specific token.
         Corresponds to:
         char* MsgTokenizeString(char* &Line, int TokenPos, char* TempBuf, string Delimiter)
+        TokenPos > 0: Forward, < 0: Backward
         
         Returns:
             The found token string, or None if not found.
         """
-        if not delimiter: 
-            delimiter = " "
-
-        if delimiter != " " and delimiter not in line:
-            return None # C++ returns NULL
-
-        tokens = []
-        if delimiter == " ":
-            tokens = line.split()
-        else:
-            tokens = line.split(delimiter)
-
-        # 1-based Indexing check
-        # C++ Loop counts 1, 2, 3... and checks == TokenPos
-        target_idx = token_pos - 1
-
-        if 0 <= target_idx < len(tokens):
-            val = tokens[target_idx].strip()
-            # C++ copies to TempBuf and returns pointer. 
-            # Python returns the value directly. Caller must handle return value.
-            return val
-            
-        return None # Not found
+        return self.m_Tokenizer.get_string_token(line, token_pos, delimiter)
     
     def msg_tokenize_char(self, line, arg2, arg3=None, arg4=None):
         """
@@ -583,77 +557,20 @@ class DataExtractor:
           - If delimiter is ' ' (space), consecutive spaces are ignored.
           - If delimiter is other char, consecutive delimiters produce empty strings.
         """
-        if not delimiter: 
-            delimiter = " "
-
-        # Check if any delimiter char exists in line
-        has_delimiter = any(d in line for d in delimiter)
-        if not has_delimiter:
+        tokens = self.m_Tokenizer.tokenize_char(line, delimiter)
+        if tokens is None:
             return
 
         # Garbage string for 1-based indexing
         str_list.append("")
-        
-        tmp = ""
-        
-        for char in line:
-            # Check if current char is one of the delimiters
-            if char in delimiter:
-                if not tmp:
-                    # Buffer is empty (Consecutive delimiters or start with delimiter)
-                    if char != ' ':
-                        # If delimiter is NOT space, treat as empty token
-                        str_list.append("")
-                    # If delimiter IS space, ignore (skip)
-                else:
-                    # Buffer has content, push it
-                    str_list.append(tmp.strip())
-                    tmp = ""
-            else:
-                tmp += char
-                
-        # Flush remaining buffer
-        if tmp:
-            str_list.append(tmp.strip())
+        str_list.extend(tokens)
 
     def _msg_tokenize_char_index(self, line, token_pos, delimiter):
         """
         Internal implementation for retrieving a specific token index.
+        TokenPos > 0: Forward, < 0: Backward
         """
-        if not delimiter: 
-            delimiter = " "
-
-        # Check if any delimiter char exists in line
-        has_delimiter = any(d in line for d in delimiter)
-        if not has_delimiter:
-            return None
-
-        # 1-based Indexing logic
-        token_cnt = 0
-        tmp = ""
-        
-        for char in line:
-            if char in delimiter:
-                if not tmp:
-                    if char != ' ':
-                        token_cnt += 1
-                        if token_cnt == token_pos:
-                            return "" # Found empty token
-                else:
-                    token_cnt += 1
-                    if token_cnt == token_pos:
-                        return tmp.strip()
-                    tmp = ""
-            else:
-                tmp += char
-                
-        # Flush remaining check
-        if tmp:
-            token_cnt += 1
-            if token_cnt == token_pos:
-                return tmp.strip()
-                
-        return None # Not found
+        return self.m_Tokenizer.get_char_token(line, token_pos, delimiter)
     
     def check_data_type(self, data_type, data):
         """
@@ -738,13 +655,14 @@ class DataExtractor:
         """
         return True
     
-    def parsing(self, ident_rule_ptr, id_string, msg_buf, consumer):
+    def parsing(self, ident_rule_ptr, id_string, msg_buf, consumer, line_index=None):
         """
         C++: void Parsing(...)
         Entry point for parsing. Delegates to ASCII or XML parser.
+        line_index : LineIndex over msg_buf built at identification time (optional).
         """
         if not ident_rule_ptr.m_XMLFlag:
-            self.parsing_ascii(ident_rule_ptr, id_string, msg_buf, consumer)
+            self.parsing_ascii(ident_rule_ptr, id_string, msg_buf, consumer, line_index)
         else:
             self.parsing_xml(ident_rule_ptr, id_string, msg_buf, consumer)
             
@@ -760,7 +678,7 @@ class DataExtractor:
     TMPL_NEXT = 1
     FIRST_LIST_TMPL = 2
 
-    def parsing_ascii(self, ident_rule_ptr, id_string, msg_buf, consumer):
+    def parsing_ascii(self, ident_rule_ptr, id_string, msg_buf, consumer, line_index=None):
         """
         C++: void ParsingASCII(...)
         Core engine for line-based text parsing.
@@ -771,10 +689,9 @@ class DataExtractor:
             return
 
         self.m_MsgBuf = msg_buf
-        self.m_TokenListMap.clear()
 
-        # Pre-scan lines into map
-        self.line_scanning()
+        # Line index (reused from identification when available)
+        self.line_scanning(line_index)
 
         # Local variables
         parsing_result = False
@@ -973,14 +890,15 @@ class DataExtractor:
             self.m_ParsedData.reset_data() # Assuming reset method exists or manually reset
             # In C++ memset clears the result buffer. In Python, we just overwrite.
             self.m_ParsedData.result = bytearray() 
-            result_offset = 0
             current_attr_cnt = 0
         else:
             # Optimize: Continue from previous position (Atomic Tmpl accumulation)
-            result_offset = self.m_CurResultPtr
             current_attr_cnt = self.m_CurAtomicAttrCnt
             # Clear previous result fields in ParsedData except the buffer
 
+        result_builder = self.m_ResultBuilder
+        result_builder.reset(self.m_CurResultPtr)
+
         # Metadata Setup
         self.m_ParsedData.eventId = tmpl_ptr.m_EventId
         self.m_ParsedData.idString = id_string
@@ -990,6 +908,7 @@ class DataExtractor:
         self.m_ParsedData.equipFlag = 0
 
         # 2. Iterate Rules
+        item_list = []
         for i, rule in enumerate(tmpl_ptr.m_RuleList):
             item_buf = ""
             
@@ -1071,28 +990,23 @@ class DataExtractor:
                 else:
                     return False # Fatal Failure
 
-            # 3. Write to Buffer
-            # C++ writes string + Null Terminator (\0)
-            # Python bytearray manipulation
-            encoded_data = item_buf.encode('utf-8') + b'\0'
-            data_len = len(encoded_data)
-            
-            if result_offset + data_len > self.MAX_PARSED_DATA_SIZE:
-                print(f"[DataExtractor] [CORE_ERROR] Result Buffer Overflow. Max: {self.MAX_PARSED_DATA_SIZE}")
-                return False
-                
-            self.m_LongResult[result_offset : result_offset + data_len] = encoded_data
-            result_offset += data_len
+            # 3. Collect Item (written to the buffer once the record is complete)
+            item_list.append(item_buf)
             current_attr_cnt += 1
 
         # End of Rule Loop
+        # C++ writes string + Null Terminator (\0) per item
+        if not result_builder.append_items(item_list):
+            print(f"[DataExtractor] [CORE_ERROR] Result Buffer Overflow. Max: {self.MAX_PARSED_DATA_SIZE}")
+            return False
+
         self.m_ParsedData.attributeNo = current_attr_cnt
 
         # 4. Dispatch Result (Callback)
         if tmpl_type == TMPL_ATOMIC_TYPE and tmpl_ptr.m_AtomResultHideFlag:
             pass # Hide result
         else:
-            total_len = result_offset
+            total_len = result_builder.get_len()
             
             # Segmentation Check
             # Assuming PARSED_DATA_SEG_BLK_SIZE is defined (e.g. 3000 bytes)
@@ -1114,26 +1028,20 @@ class DataExtractor:
                     if k == block_cnt - 1:
                         self.m_ParsedData.segBlkCnt *= -1
                         
-                    start_idx = k * PARSED_DATA_SEG_BLK_SIZE
-                    end_idx = start_idx + PARSED_DATA_SEG_BLK_SIZE
-                    
-                    # Extract Chunk
-                    chunk = self.m_LongResult[start_idx : min(end_idx, total_len)]
-                    
-                    # Set Chunk to Extended Result Field
-                    self.m_ParsedData.resultExResult = chunk 
+                    # Set Chunk to Extended Result Field (view, no copy)
+                    self.m_ParsedData.resultExResult = result_builder.get_segment_view(k, PARSED_DATA_SEG_BLK_SIZE)
                     
                     # Send
                     self.m_DataExtractMgr.parsing_result(tmpl_ptr.m_Consumers, self.m_ParsedData)
             else:
                 # No Segmentation
-                # Copy buffer to result field (bytes)
-                self.m_ParsedData.result = self.m_LongResult[:total_len]
+                # Result field is a view of the buffer (no copy)
+                self.m_ParsedData.result = result_builder.get_view()
                 self.m_DataExtractMgr.parsing_result(tmpl_ptr.m_Consumers, self.m_ParsedData)
 
         # 5. Update State for Atomic Accumulation
         if tmpl_type == TMPL_ATOMIC_TYPE:
-            self.m_CurResultPtr = result_offset
+            self.m_CurResultPtr = result_builder.get_len()
             self.m_CurAtomicAttrCnt = current_attr_cnt
             
         return True
@@ -1229,11 +1137,24 @@ class DataExtractor:
         """
         C++: bool ExtractDataFromParsingRule(...)
         Executes the specific string extraction logic based on ParsingType.
+        Rules loaded by ParsingRuleMgr carry a precompiled m_ExtractFunc;
+        others go through the generic ParsingType branches.
         Returns: tuple(success: bool, result: str)
         """
         if not line_buf:
             return False, ""
 
+        extract_func = rule.m_ExtractFunc
+        if extract_func is not None:
+            return extract_func(self, line_buf, line_number)
+
+        return self.extract_data_from_parsing_rule_generic(rule, line_buf, line_number)
+
+    def extract_data_from_parsing_rule_generic(self, rule, line_buf, line_number):
+        """
+        ParsingType branch evaluation per call (line_buf already checked non-empty).
+        Reference behaviour for ParsingRuleCompiler.
+        """
         p_type = rule.m_ParsingType
         temp_buf = ""
 
@@ -1248,21 +1169,12 @@ class DataExtractor:
             
             # Move index past the start string
             start_idx += len(rule.m_StartString)
-            sub_line = line_buf[start_idx:]
             
-            # Delimiter Type 0: String/Space
-            if rule.m_DelimiterType == 0:
-                # TokenIndex > 0: Forward, < 0: Backward
-                # Using our helper msg_tokenize_string
-                val = self.msg_tokenize_string(sub_line, rule.m_TokenIndex, None, rule.m_TokenDelimiter)
-                if val is not None:
-                    temp_buf = val
-                else:
-                    temp_buf = ""
-            
-            # Delimiter Type 1: Char
-            elif rule.m_DelimiterType == 1:
-                val = self.msg_tokenize_char(sub_line, rule.m_TokenIndex, None, rule.m_TokenDelimiter)
+            # Delimiter Type 0: String/Space, 1: Char
+            # TokenIndex > 0: Forward, < 0: Backward
+            if rule.m_DelimiterType in (0, 1):
+                tokens = self.get_token_list(line_buf, start_idx, rule.m_DelimiterType, rule.m_TokenDelimiter or " ")
+                val = MsgTokenizer.token_at(tokens, rule.m_TokenIndex)
                 if val is not None:
                     temp_buf = val
                 else:
@@ -1491,12 +1403,10 @@ class DataExtractor:
             else:
                 sub_line = search_area # No start string, just column
 
-            # Tokenize Logic
-            if rule.m_DelimiterType == 0:
-                val = self.msg_tokenize_string(sub_line, rule.m_TokenIndex, None, rule.m_TokenDelimiter)
-                temp_buf = val if val else ""
-            elif rule.m_DelimiterType == 1:
-                val = self.msg_tokenize_char(sub_line, rule.m_TokenIndex, None, rule.m_TokenDelimiter)
+            # Tokenize Logic (sub_line is a suffix of line_buf)
+            if rule.m_DelimiterType in (0, 1):
+                tokens = self.get_token_list(line_buf, len(line_buf) - len(sub_line), rule.m_DelimiterType, rule.m_TokenDelimiter or " ")
+                val = MsgTokenizer.token_at(tokens, rule.m_TokenIndex)
                 temp_buf = val if val else ""
             else:
                 return False, ""
@@ -16,20 +16,24 @@ from Class.Common.CommType import *
 from Class.Common.AsUtil import AsUtil
 from Class.ProcParser.ParserType import *
 from Class.ProcParser.DataExtractManager import DataExtractManager
+from Class.Common.ParsedDataBatch import ParsedDataBatch
 from Class.Util.fr_util_misc import FrUtilMisc
 
 class DataRouterConnection(AsSocket):
     """
     Manages connection to DataRouter (Unix Socket) and handles data extraction/sending.
-    Polls data from DataSender, extracts fields, and sends to DataRouter.
+    Drains data from DataSender (woken on push), extracts fields, and sends to DataRouter.
     """
     
     # Timer Constants
     PARSINGDATA_POLLING_TIME_OUT = 2001
     DATA_ROUTER_CONN_TIME_OUT = 2002
+    PARSED_DATA_BATCH_FLUSH_TIME_OUT = 2003
     
     PARSINGDATA_POLLING_TIME = 0.01 # 10ms (approx)
+    PARSINGDATA_SAFETY_POLLING_TIME = 1 # 1 sec, pushes normally wake the connection
     DATA_ROUTER_CONN_TIME = 1 # 1 sec
+    PARSED_DATA_BATCH_FLUSH_TIME = 0.005 # 5ms, max delay of a batched record
 
     def __init__(self, consumer):
         """
@@ -56,6 +60,10 @@ class DataRouterConnection(AsSocket):
         self.m_DataRouterListen = ""
         self.m_SendedRecordCnt = 0
 
+        # AS_PARSED_DATA_BATCH (None : one AS_PARSED_DATA packet per record)
+        self.m_ParsedDataBatch = None
+        self.m_BatchFlushTimerKey = -1
+
     def __del__(self):
         """
         C++: ~DataRouterConnection()
@@ -97,6 +105,10 @@ class DataRouterConnection(AsSocket):
         if reason == self.PARSINGDATA_POLLING_TIME_OUT:
             self._handle_polling_timeout()
             
+        elif reason == self.PARSED_DATA_BATCH_FLUSH_TIME_OUT:
+            self.m_BatchFlushTimerKey = -1
+            self.flush_parsed_data_batch()
+            
         elif reason == self.DATA_ROUTER_CONN_TIME_OUT:
             self.m_DataRouterConnTimerKey = -1
             self.start(self.m_DataRouterListen)
@@ -107,79 +119,91 @@ class DataRouterConnection(AsSocket):
     def _handle_polling_timeout(self):
         """
         Internal logic for PARSINGDATA_POLLING_TIME_OUT
+        Safety net only : pushes wake the connection through EXTRACT_DATA_INFO_PUSHED.
         """
-        cnt = 0
-        while True:
-            if not self.is_connect():
-                return
+        self.drain_extract_data_info()
+        
+        # Reset Timer
+        self.m_ParsingDataPollingTimerKey = self.set_timer(self.PARSINGDATA_SAFETY_POLLING_TIME, self.PARSINGDATA_POLLING_TIME_OUT)
+
+    def drain_extract_data_info(self):
+        """
+        Processes one batch of the DataSender queue under a single lock acquisition.
+        If the batch was not empty, wakes itself again so socket events and timers
+        of this world run between batches (instead of the old 7ms sleep).
+        """
+        if not self.is_connect():
+            return
 
-            if cnt > 30:
-                time.sleep(0.007) # 7ms
-                cnt = 0
+        info_list = self.m_DataSender.get_extract_data_info_list()
+        if not info_list:
+            return
 
-            self.m_DataSender.sender_lock()
-            
-            info = self.m_DataSender.get_extract_data_info()
-            cnt += 1
-            
-            if info:
-                if info.m_MsgId != -1: # RAW_MSG_CHANGE_FLAG equivalent (-1)
-                    self.m_NowNeId = info.m_NeId
-                    self.m_NowPortNo = info.m_PortNo
-                    
-                    try:
-                        self.m_RawMsgFp.seek(info.m_FilePos)
-                        
-                        # Resize logic (Python handles automatically usually)
-                        if info.m_MsgSize + 1 > len(self.m_MsgBuf):
-                            self.m_MsgBuf = bytearray(info.m_MsgSize + 1)
-                            
-                        data = self.m_RawMsgFp.read(info.m_MsgSize)
-                        # data is bytes
-                        
-                        if len(data) != info.m_MsgSize:
-                            print(f"[DataRouterConnection] Msg Read Error -- Read: {len(data)}, Expected: {info.m_MsgSize}")
-                        
-                        self.m_SendedRecordCnt = 0
-                        
-                        # Extract Data
-                        # Needs decoding bytes to string for extraction? Usually extraction works on strings
-                        msg_str = data.decode('utf-8', errors='ignore')
-                        
-                        self.m_DataExtractManager.data_extract(
-                            info.m_IdentRulePtr, 
-                            info.m_IdentIdString, 
-                            msg_str, 
-                            self.get_session_name()
-                        )
-                        
-                        print(f"[DataRouterConnection] Total Sended Record Count : {self.m_SendedRecordCnt}({self.get_session_name()},{info.m_IdentRulePtr.m_IdentName})")
-
-                    except Exception as e:
-                        print(f"[DataRouterConnection] Parsing Error: {e}")
-
-                else: # Raw File Change
-                    print(f"[DataRouterConnection] Raw msg file change({self.get_session_name()})")
-                    if self.m_RawMsgFp:
-                        self.m_RawMsgFp.close()
-                    
-                    from ParserWorld import ParserWorld
-                    file_name = ParserWorld.get_instance().get_cur_raw_file_name()
-                    try:
-                        self.m_RawMsgFp = open(file_name, "rb")
-                    except:
-                        pass
-                
+        self.m_DataSender.sender_lock()
+        try:
+            for idx, info in enumerate(info_list):
+                if not self.is_connect():
+                    # Keep the rest for the reconnection (start() re-arms the polling timer)
+                    self.m_DataSender.restore_extract_data_info_list(info_list[idx:])
+                    return
+                self.process_extract_data_info(info)
                 # Cleanup Info (C++ delete info)
                 # Python GC handles it
-                self.m_DataSender.sender_unlock()
-            
-            else: # No Info
-                self.m_DataSender.sender_unlock()
-                break
-        
-        # Reset Timer
-        self.m_ParsingDataPollingTimerKey = self.set_timer(self.PARSINGDATA_POLLING_TIME, self.PARSINGDATA_POLLING_TIME_OUT)
+        finally:
+            self.m_DataSender.sender_unlock()
+
+        self.m_DataSender.wake_consumer()
+
+    def process_extract_data_info(self, info):
+        """
+        Reads the message of info from the RAW file and extracts/sends its data.
+        """
+        if info.m_MsgId != -1: # RAW_MSG_CHANGE_FLAG equivalent (-1)
+            self.m_NowNeId = info.m_NeId
+            self.m_NowPortNo = info.m_PortNo
+
+            try:
+                self.m_RawMsgFp.seek(info.m_FilePos)
+
+                # Resize logic (Python handles automatically usually)
+                if info.m_MsgSize + 1 > len(self.m_MsgBuf):
+                    self.m_MsgBuf = bytearray(info.m_MsgSize + 1)
+
+                data = self.m_RawMsgFp.read(info.m_MsgSize)
+                # data is bytes
+
+                if len(data) != info.m_MsgSize:
+                    print(f"[DataRouterConnection] Msg Read Error -- Read: {len(data)}, Expected: {info.m_MsgSize}")
+
+                self.m_SendedRecordCnt = 0
+
+                # Extract Data
+                # Needs decoding bytes to string for extraction? Usually extraction works on strings
+                msg_str = data.decode('utf-8', errors='ignore')
+
+                self.m_DataExtractManager.data_extract(
+                    info.m_IdentRulePtr, 
+                    info.m_IdentIdString, 
+                    msg_str, 
+                    self.get_session_name()
+                )
+
+                print(f"[DataRouterConnection] Total Sended Record Count : {self.m_SendedRecordCnt}({self.get_session_name()},{info.m_IdentRulePtr.m_IdentName})")
+
+            except Exception as e:
+                print(f"[DataRouterConnection] Parsing Error: {e}")
+
+        else: # Raw File Change
+            print(f"[DataRouterConnection] Raw msg file change({self.get_session_name()})")
+            if self.m_RawMsgFp:
+                self.m_RawMsgFp.close()
+
+            from ParserWorld import ParserWorld
+            file_name = ParserWorld.get_instance().get_cur_raw_file_name()
+            try:
+                self.m_RawMsgFp = open(file_name, "rb")
+            except:
+                pass
 
     def parsing_result(self, consumers, p_data):
         """
@@ -209,18 +233,89 @@ class DataRouterConnection(AsSocket):
     def send_parsed_data(self, p_data):
         """
         C++: void SendParsedData(const AS_PARSED_DATA_T* Pdata)
+        With batching on, the record is queued in m_ParsedDataBatch and sent when
+        the batch is full, at EOR (listSequence == -1) or after PARSED_DATA_BATCH_FLUSH_TIME.
         """
         body = p_data.pack()
-        if not self.packet_send(PacketT(AS_PARSED_DATA, len(body), body)):
+
+        batch = self.m_ParsedDataBatch
+        if batch is None or not batch.can_hold(len(body)):
+            if not self.flush_parsed_data_batch():
+                return
+            self.send_parsed_data_packet(PacketT(AS_PARSED_DATA, len(body), body))
+            return
+
+        if not batch.append(body):
+            # Full : send what is queued and start a new batch
+            if not self.flush_parsed_data_batch():
+                return
+            batch.append(body)
+
+        if p_data.listSequence == -1: # EOR
+            self.flush_parsed_data_batch()
+        elif self.m_BatchFlushTimerKey == -1:
+            self.m_BatchFlushTimerKey = self.set_timer(self.PARSED_DATA_BATCH_FLUSH_TIME, self.PARSED_DATA_BATCH_FLUSH_TIME_OUT)
+
+    def send_parsed_data_packet(self, packet):
+        """
+        Sends one AS_PARSED_DATA / AS_PARSED_DATA_BATCH packet.
+        On failure closes the session and schedules a reconnect.
+        """
+        if not self.packet_send(packet):
             self.close()
             if self.m_DataRouterConnTimerKey == -1:
                 self.m_DataRouterConnTimerKey = self.set_timer(self.DATA_ROUTER_CONN_TIME, self.DATA_ROUTER_CONN_TIME_OUT)
+            return False
+        return True
+
+    def flush_parsed_data_batch(self):
+        """
+        Sends the queued records as one AS_PARSED_DATA_BATCH packet.
+        Returns False if the send failed (queued records are dropped with the session).
+        """
+        if self.m_BatchFlushTimerKey != -1:
+            self.cancel_timer(self.m_BatchFlushTimerKey)
+            self.m_BatchFlushTimerKey = -1
+
+        batch = self.m_ParsedDataBatch
+        if batch is None or batch.is_empty():
+            return True
+
+        payload = batch.get_payload()
+        result = self.send_parsed_data_packet(PacketT(AS_PARSED_DATA_BATCH, len(payload), payload))
+        batch.clear()
+        return result
+
+    def set_parsed_data_batch(self, flag):
+        """
+        Enables AS_PARSED_DATA_BATCH framing (ParserWorld parsed_data_batch config).
+        Only for DataRouters that unpack it (AsSocket splits it back into
+        AS_PARSED_DATA packets); off keeps the one-packet-per-record protocol.
+        """
+        if flag:
+            if self.m_ParsedDataBatch is None:
+                self.m_ParsedDataBatch = ParsedDataBatch()
+        else:
+            self.flush_parsed_data_batch()
+            self.m_ParsedDataBatch = None
 
     def close_socket(self, errno_val=0):
         """
         C++: void CloseSocket(int Errno)
         """
         print(f"[DataRouterConnection] DataRouter Connection Broken({self.get_session_name()})")
+
+        # Records queued for the broken session are dropped like unsent AS_PARSED_DATA
+        if self.m_BatchFlushTimerKey != -1:
+            self.cancel_timer(self.m_BatchFlushTimerKey)
+            self.m_BatchFlushTimerKey = -1
+        if self.m_ParsedDataBatch:
+            self.m_ParsedDataBatch.clear()
+
+        # A wake-up already pending is lost with the session
+        if self.m_DataSender:
+            self.m_DataSender.reset_wake_pending()
+
         if self.m_DataRouterConnTimerKey == -1:
             self.m_DataRouterConnTimerKey = self.set_timer(self.DATA_ROUTER_CONN_TIME, self.DATA_ROUTER_CONN_TIME_OUT)
 
@@ -239,6 +334,10 @@ class DataRouterConnection(AsSocket):
                 self.cancel_timer(self.m_ParsingDataPollingTimerKey)
                 
             self.m_ParsingDataPollingTimerKey = self.set_timer(self.PARSINGDATA_POLLING_TIME, self.PARSINGDATA_POLLING_TIME_OUT)
+
+            # Entries queued (or restored) while disconnected
+            if self.m_DataSender:
+                self.drain_extract_data_info()
         else:
             print(f"[DataRouterConnection] DataRouter Connect Fail")
             if self.m_DataRouterConnTimerKey == -1:
@@ -247,11 +346,15 @@ class DataRouterConnection(AsSocket):
     def recv_message(self, message, addition_info=None):
         """
         C++: void RecvMessage(int Message, void* AdditionInfo)
-        Handles inter-thread message (DELETE_DATA_HANDLER) to destroy self.
+        Handles inter-thread messages :
+          EXTRACT_DATA_INFO_PUSHED : DataSender queue turned non-empty
+          DELETE_DATA_HANDLER      : destroy self
         """
-        print(f"[DataRouterConnection] Recv DataSender Destroy Message({message})")
-        
-        if message == DELETE_DATA_HANDLER: # Enum constant
+        if message == EXTRACT_DATA_INFO_PUSHED:
+            self.drain_extract_data_info()
+
+        elif message == DELETE_DATA_HANDLER: # Enum constant
+            print(f"[DataRouterConnection] Recv DataSender Destroy Message({message})")
             ptr = self.m_DataSender
             # Python GC handles delete this
             # Need to signal parent thread loop to stop managing this connection?
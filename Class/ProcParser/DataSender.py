@@ -13,14 +13,27 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 from Class.Event.fr_thread_world import FrThreadWorld
-from Class.ProcParser.RuleType import RAW_MSG_CHANGE_FLAG
-from Class.Event.FrLogger import FrLogger
+from Class.Event.fr_msg_sensor import FrMsgSensor
+from Class.ProcParser.ParserType import RAW_MSG_CHANGE_FLAG, EXTRACT_DATA_INFO_PUSHED
+from Class.ProcParser.ExtractDataInfoSpill import ExtractDataInfoSpill
 
 class DataSender(FrThreadWorld):
     """
     Manages a thread-safe queue of ExtractDataInfo objects.
     Used by DataRouterConnection to fetch parsed data.
+
+    Push wakes the DataRouterConnection through this world's pipe
+    (EXTRACT_DATA_INFO_PUSHED) when the queue turns non-empty,
+    and the connection drains it in batches (get_extract_data_info_list).
+
+    Beyond the high-water mark, entries spill to an append-only index file next to
+    the RAW file (ExtractDataInfoSpill) and are read back as the in-memory queue drains.
+    Once spilling, every push goes to the file until it is empty (FIFO order kept).
+    Spill file I/O runs under m_SpillLock only, so the consumer's pops under
+    m_IdentListLock never wait on the disk (lock order : m_SpillLock -> m_IdentListLock).
     """
+    DRAIN_BATCH_SIZE = 64
+    DEFAULT_HIGH_WATER_MARK = 100000
     def __init__(self, consumer, conn):
         """
         C++: DataSender(string Consumer, DataRouterConnection* Conn)
@@ -33,6 +46,26 @@ class DataSender(FrThreadWorld):
         self.m_IdentListLock = threading.Lock()
         self.m_SenderLock = threading.Lock()
 
+        # Wake-up of DataRouterConnection (recv_message) through this world's pipe
+        self.m_WakeSensor = FrMsgSensor(conn, self)
+        self.m_WakePending = False
+
+        # Backpressure stat (queue depth / time-in-queue), guarded by m_IdentListLock
+        self.m_PushCnt = 0
+        self.m_PopCnt = 0
+        self.m_MaxQueueDepth = 0
+        self.m_TotalQueueTime = 0.0
+        self.m_MaxQueueTime = 0.0
+
+        # Spill-to-disk beyond m_HighWaterMark (0 : unbounded), guarded by m_SpillLock
+        self.m_SpillLock = threading.Lock()
+        self.m_HighWaterMark = self.DEFAULT_HIGH_WATER_MARK
+        self.m_Spill = ExtractDataInfoSpill(consumer)
+        # Pushed after a spill write failed : kept in memory behind the spilled entries
+        self.m_SpillTail = deque()
+        self.m_SpillTotalCnt = 0
+        self.m_ReadBackTotalCnt = 0
+
     def __del__(self):
         """
         C++: ~DataSender()
@@ -43,16 +76,101 @@ class DataSender(FrThreadWorld):
         """
         C++: void ClearExtractDataInfoList()
         """
-        with self.m_IdentListLock:
+        with self.m_SpillLock, self.m_IdentListLock:
             self.m_ExtractDataInfoList.clear()
+            self.m_Spill.clear()
+            self.m_SpillTail.clear()
             # Python GC handles deletion of objects inside
 
+    def set_high_water_mark(self, high_water_mark):
+        """
+        In-memory entry limit of this consumer (0 : unbounded, no spill).
+        """
+        with self.m_SpillLock:
+            self.m_HighWaterMark = max(int(high_water_mark), 0)
+        print(f"[DataSender] HighWaterMark({self.m_Consumer}) : {self.m_HighWaterMark}")
+
     def push_extract_data_info(self, info):
         """
         C++: bool PushExtractDataInfo(ExtractDataInfo* Info)
         """
-        with self.m_IdentListLock:
-            self.m_ExtractDataInfoList.append(info)
+        info.m_PushTime = time.monotonic()
+
+        with self.m_SpillLock:
+            spilled = self._spill_extract_data_info(info)
+            with self.m_IdentListLock:
+                if not spilled:
+                    self.m_ExtractDataInfoList.append(info)
+                self.m_PushCnt += 1
+                depth = len(self.m_ExtractDataInfoList) + self._get_spill_cnt()
+                if depth > self.m_MaxQueueDepth:
+                    self.m_MaxQueueDepth = depth
+
+                # Only the empty -> non-empty edge wakes the consumer
+                wake = not self.m_WakePending
+                self.m_WakePending = True
+
+        if wake:
+            self.wake_consumer()
+        return True
+
+    def _spill_extract_data_info(self, info):
+        # Caller holds m_SpillLock (not m_IdentListLock). False : keep info in memory
+        if self.m_SpillTail:
+            self.m_SpillTail.append(info)
+            return True
+
+        if self.m_Spill.is_empty():
+            if not self.m_HighWaterMark or len(self.m_ExtractDataInfoList) < self.m_HighWaterMark:
+                return False
+            if not self.m_Spill.open(self.get_spill_file_name()):
+                return False
+
+        if not self.m_Spill.append(info):
+            if self.m_Spill.is_empty():
+                return False
+            # Older entries are in the file : queue behind them until it is read back
+            self.m_SpillTail.append(info)
+            return True
+        self.m_SpillTotalCnt += 1
+        return True
+
+    def _get_spill_cnt(self):
+        return self.m_Spill.get_cnt() + len(self.m_SpillTail)
+
+    def _read_back_spill(self):
+        # Caller holds no lock. Refills memory up to half the high-water mark
+        if not self._get_spill_cnt() or len(self.m_ExtractDataInfoList) >= self.DRAIN_BATCH_SIZE:
+            return
+
+        with self.m_SpillLock:
+            read_cnt = max(self.m_HighWaterMark // 2, self.DRAIN_BATCH_SIZE) - len(self.m_ExtractDataInfoList)
+            info_list = self.m_Spill.read(read_cnt)
+            if self.m_Spill.is_empty() and self.m_SpillTail:
+                info_list.extend(self.m_SpillTail)
+                self.m_SpillTail.clear()
+
+            with self.m_IdentListLock:
+                self.m_ExtractDataInfoList.extend(info_list)
+                self.m_ReadBackTotalCnt += len(info_list)
+
+    def get_spill_file_name(self):
+        """
+        Spill file next to the current RAW file : <RawFile>.<Consumer>.spill
+        """
+        from ParserWorld import ParserWorld
+        raw_file_name = ParserWorld.get_instance().get_cur_raw_file_name()
+        return f"{raw_file_name}.{self.m_Consumer}.spill"
+
+    def wake_consumer(self):
+        """
+        Sends EXTRACT_DATA_INFO_PUSHED to the DataRouterConnection.
+        On failure the connection's polling timer still drains the queue.
+        """
+        if not self.m_WakeSensor.send_event(EXTRACT_DATA_INFO_PUSHED):
+            with self.m_IdentListLock:
+                self.m_WakePending = False
+            return False
         return True
 
     def get_extract_data_info(self):
@@ -61,11 +179,96 @@ class DataSender(FrThreadWorld):
         Pop from front (FIFO).
         """
         ptr = None
+        self._read_back_spill()
         with self.m_IdentListLock:
             if self.m_ExtractDataInfoList:
                 ptr = self.m_ExtractDataInfoList.popleft()
+                self._update_queue_stat(ptr, time.monotonic())
         return ptr
 
+    def get_extract_data_info_list(self, max_cnt=DRAIN_BATCH_SIZE):
+        """
+        Pops up to max_cnt items (FIFO) under one lock acquisition.
+        An empty result re-arms the wake-up for the next push.
+        """
+        info_list = []
+        self._read_back_spill()
+        with self.m_IdentListLock:
+            queue = self.m_ExtractDataInfoList
+            now = time.monotonic()
+            while queue and len(info_list) < max_cnt:
+                ptr = queue.popleft()
+                self._update_queue_stat(ptr, now)
+                info_list.append(ptr)
+
+            if not info_list:
+                self.m_WakePending = False
+        return info_list
+
+    def restore_extract_data_info_list(self, info_list):
+        """
+        Puts back unprocessed items of get_extract_data_info_list() at the front (order kept).
+        The consumer stopped draining, so the next push wakes it again.
+        """
+        with self.m_IdentListLock:
+            self.m_ExtractDataInfoList.extendleft(reversed(info_list))
+            self.m_WakePending = False
+
+    def reset_wake_pending(self):
+        """
+        Called when the consumer disconnects : the next push wakes it again.
+        """
+        with self.m_IdentListLock:
+            self.m_WakePending = False
+
+    def _update_queue_stat(self, info, now):
+        # Caller holds m_IdentListLock
+        queue_time = now - info.m_PushTime
+        self.m_PopCnt += 1
+        self.m_TotalQueueTime += queue_time
+        if queue_time > self.m_MaxQueueTime:
+            self.m_MaxQueueTime = queue_time
+
+    def get_queue_stat(self):
+        """
+        Queue depth and time-in-queue (sec) of this consumer.
+        """
+        with self.m_IdentListLock:
+            mem_cnt = len(self.m_ExtractDataInfoList)
+            spill_cnt = self._get_spill_cnt()
+            return {
+                'Depth': mem_cnt + spill_cnt,
+                'MemCnt': mem_cnt,
+                'SpillCnt': spill_cnt,
+                'SpillTotalCnt': self.m_SpillTotalCnt,
+                'ReadBackTotalCnt': self.m_ReadBackTotalCnt,
+                'MaxDepth': self.m_MaxQueueDepth,
+                'PushCnt': self.m_PushCnt,
+                'PopCnt': self.m_PopCnt,
+                'AvgQueueTime': self.m_TotalQueueTime / self.m_PopCnt if self.m_PopCnt else 0.0,
+                'MaxQueueTime': self.m_MaxQueueTime,
+            }
+
+    def reset_queue_stat(self):
+        """
+        Restarts the max/avg window (current depth is kept).
+        """
+        with self.m_IdentListLock:
+            self.m_PushCnt = 0
+            self.m_PopCnt = 0
+            self.m_MaxQueueDepth = len(self.m_ExtractDataInfoList) + self._get_spill_cnt()
+            self.m_SpillTotalCnt = 0
+            self.m_ReadBackTotalCnt = 0
+            self.m_TotalQueueTime = 0.0
+            self.m_MaxQueueTime = 0.0
+
+    def print_queue_stat(self):
+        stat = self.get_queue_stat()
+        print(f"[DataSender] Queue Stat({self.m_Consumer}) Depth : {stat['Depth']}(Mem {stat['MemCnt']}, Spill {stat['SpillCnt']}), "
+              f"MaxDepth : {stat['MaxDepth']}, Spilled : {stat['SpillTotalCnt']}, ReadBack : {stat['ReadBackTotalCnt']}, "
+              f"Push : {stat['PushCnt']}, Pop : {stat['PopCnt']}, "
+              f"QueueTime(avg/max) : {stat['AvgQueueTime'] * 1000:.2f}/{stat['MaxQueueTime'] * 1000:.2f} ms")
+
     def get_end_extract_data_info(self):
         """
         C++: ExtractDataInfo* GetEndExtractDataInfo()
@@ -92,6 +295,18 @@ class DataSender(FrThreadWorld):
         """
         tmp_extract_data_info_list = []
         
+        # Spilled entries are re-identified too (re-pushing spills again beyond the high-water mark)
+        with self.m_SpillLock:
+            info_list = []
+            while not self.m_Spill.is_empty():
+                info_list.extend(self.m_Spill.read(self.DRAIN_BATCH_SIZE))
+            info_list.extend(self.m_SpillTail)
+            self.m_SpillTail.clear()
+
+            with self.m_IdentListLock:
+                self.m_ExtractDataInfoList.extend(info_list)
+                self.m_ReadBackTotalCnt += len(info_list)
+
         print(f"[DataSender] ReIdentify({self.m_Consumer}) Cnt : {len(self.m_ExtractDataInfoList)}")
 
         # 1. Drain current queue to temp list
@@ -136,6 +351,7 @@ class DataSender(FrThreadWorld):
                             if self.m_Consumer in info.m_IdentRulePtr.m_ConsumerVector:
                                 ptr.m_IdentRulePtr = info.m_IdentRulePtr
                                 ptr.m_IdentIdString = info.m_IdentIdString
+                                ptr.m_LineIndex = info.m_LineIndex.detach() if info.m_LineIndex else None
                                 self.push_extract_data_info(ptr)
                                 re_ident_cnt += 1
                                 consumer_matched = True
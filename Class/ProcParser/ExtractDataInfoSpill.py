@@ -0,0 +1,195 @@
+import sys
+import os
+import struct
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from array import array
+from Class.ProcParser.ParserType import ExtractDataInfo
+from Class.ProcParser.LineIndex import LineIndex
+
+class ExtractDataInfoSpill:
+    """
+    Append-only spill file of ExtractDataInfo entries (no C++ original).
+    Used by DataSender beyond its high-water mark : only the index entry is written,
+    the message payload already lives in the RAW file at m_FilePos.
+    Entries are read back in FIFO order; the file is removed once fully read.
+
+    Record layout (header in network byte order, LineOffset in native 'q' array layout):
+        RecordLen(4) + Header + IdentIdString + NeId + DataHandlerId + LineOffset[LineCount + 1]
+
+    IdentRule objects can't be written to the file, so the record keeps a key into
+    m_RuleMap, which holds the rules referenced by spilled entries (one per rule).
+    """
+    LEN_FMT = "!I"
+    # MsgId, FilePos, MsgSize, PortNo, RefCnt, PushTime, RuleKey, LineBufLen, LineBufHash, LineCount,
+    # Len(IdentIdString/NeId/DataHandlerId). LineBufHash is a str hash() : the file is only read by this process
+    HDR_FMT = "!iqIiidQqqIHHH"
+    LEN_SIZE = struct.calcsize(LEN_FMT)
+    HDR_SIZE = struct.calcsize(HDR_FMT)
+    NO_LINE_INDEX = 0xFFFFFFFF
+
+    def __init__(self, consumer):
+        self.m_Consumer = consumer
+        self.m_FileName = ""
+        self.m_WriteFp = None
+        self.m_ReadFp = None
+        self.m_Cnt = 0
+        self.m_RuleMap = {}
+
+    def __del__(self):
+        self.clear()
+
+    def get_cnt(self):
+        return self.m_Cnt
+
+    def is_empty(self):
+        return self.m_Cnt == 0
+
+    def get_file_name(self):
+        return self.m_FileName
+
+    def open(self, file_name):
+        """
+        Creates (truncates) the spill file. Called when the first entry is spilled.
+        """
+        self.clear()
+        try:
+            self.m_WriteFp = open(file_name, "wb")
+            self.m_ReadFp = open(file_name, "rb")
+        except OSError as e:
+            print(f"[ExtractDataInfoSpill] [CORE_ERROR] Spill File Open Error({file_name}) : {e}")
+            self.clear()
+            return False
+
+        self.m_FileName = file_name
+        print(f"[ExtractDataInfoSpill] Spill Start({self.m_Consumer}) : {file_name}")
+        return True
+
+    def clear(self):
+        """
+        Drops all spilled entries and removes the file.
+        """
+        if self.m_WriteFp:
+            self.m_WriteFp.close()
+            self.m_WriteFp = None
+        if self.m_ReadFp:
+            self.m_ReadFp.close()
+            self.m_ReadFp = None
+
+        if self.m_FileName:
+            try:
+                os.remove(self.m_FileName)
+            except OSError:
+                pass
+            self.m_FileName = ""
+
+        self.m_Cnt = 0
+        self.m_RuleMap.clear()
+
+    def append(self, info):
+        """
+        Appends the index entry of info. Returns False if the file is not open or the write fails.
+        """
+        if not self.m_WriteFp:
+            return False
+
+        rule_key = 0
+        if info.m_IdentRulePtr is not None:
+            rule_key = id(info.m_IdentRulePtr)
+            self.m_RuleMap[rule_key] = info.m_IdentRulePtr
+
+        ident_id = info.m_IdentIdString.encode('utf-8')
+        ne_id = info.m_NeId.encode('utf-8')
+        dh_id = info.m_DataHandlerId.encode('utf-8')
+
+        line_index = info.m_LineIndex
+        if line_index is not None:
+            buf_len = line_index.m_BufLen
+            buf_hash = line_index.m_BufHash
+            line_cnt = line_index.m_LineCount
+            offsets = line_index.m_LineOffset.tobytes()
+        else:
+            buf_len = 0
+            buf_hash = 0
+            line_cnt = self.NO_LINE_INDEX
+            offsets = b""
+
+        header = struct.pack(self.HDR_FMT, info.m_MsgId, info.m_FilePos, info.m_MsgSize, info.m_PortNo,
+                             info.m_RefCnt, info.m_PushTime, rule_key, buf_len, buf_hash, line_cnt,
+                             len(ident_id), len(ne_id), len(dh_id))
+        body = b"".join((header, ident_id, ne_id, dh_id, offsets))
+
+        try:
+            self.m_WriteFp.write(struct.pack(self.LEN_FMT, len(body)))
+            self.m_WriteFp.write(body)
+        except OSError as e:
+            print(f"[ExtractDataInfoSpill] [CORE_ERROR] Spill Write Error({self.m_FileName}) : {e}")
+            return False
+
+        self.m_Cnt += 1
+        return True
+
+    def read(self, max_cnt):
+        """
+        Reads back up to max_cnt entries (FIFO) as ExtractDataInfo.
+        The file is removed when the last entry has been read.
+        """
+        info_list = []
+        if self.m_Cnt == 0 or not self.m_ReadFp:
+            return info_list
+
+        self.m_WriteFp.flush()
+
+        while self.m_Cnt > 0 and len(info_list) < max_cnt:
+            data = self.m_ReadFp.read(self.LEN_SIZE)
+            if len(data) != self.LEN_SIZE:
+                break
+            body_len = struct.unpack(self.LEN_FMT, data)[0]
+            body = self.m_ReadFp.read(body_len)
+            if len(body) != body_len:
+                break
+
+            info_list.append(self._unpack(body))
+            self.m_Cnt -= 1
+
+        if self.m_Cnt > 0 and len(info_list) < max_cnt:
+            print(f"[ExtractDataInfoSpill] [CORE_ERROR] Spill File Broken({self.m_FileName}), Lost : {self.m_Cnt}")
+            self.m_Cnt = 0
+
+        if self.m_Cnt == 0:
+            print(f"[ExtractDataInfoSpill] Spill Finish({self.m_Consumer}) : {self.m_FileName}")
+            self.clear()
+        return info_list
+
+    def _unpack(self, body):
+        (msg_id, file_pos, msg_size, port_no, ref_cnt, push_time, rule_key, buf_len, buf_hash, line_cnt,
+         ident_id_len, ne_id_len, dh_id_len) = struct.unpack_from(self.HDR_FMT, body, 0)
+
+        offset = self.HDR_SIZE
+        ident_id = body[offset:offset + ident_id_len].decode('utf-8')
+        offset += ident_id_len
+        ne_id = body[offset:offset + ne_id_len].decode('utf-8')
+        offset += ne_id_len
+        dh_id = body[offset:offset + dh_id_len].decode('utf-8')
+        offset += dh_id_len
+
+        line_index = None
+        if line_cnt != self.NO_LINE_INDEX:
+            line_index = LineIndex()
+            line_index.m_BufLen = buf_len
+            line_index.m_BufHash = buf_hash
+            line_index.m_LineCount = line_cnt
+            line_index.m_LineOffset = array('q')
+            line_index.m_LineOffset.frombytes(body[offset:])
+
+        info = ExtractDataInfo(msg_id, self.m_RuleMap.get(rule_key), ident_id, ne_id, port_no,
+                               file_pos, msg_size, dh_id, ref_cnt, line_index)
+        info.m_PushTime = push_time
+        return info
@@ -14,6 +14,7 @@ if project_root not in sys.path:
 # -------------------------------------------------------
 from Class.ProcParser.ObjectBase import ObjectBase
 from Class.ProcParser.ParsingIdentMgr import ParsingIdentMgr
+from Class.ProcParser.LineIndex import LineIndex
 from Class.Event.FrLogger import FrLogger
 
 # Lazy Import for Managers to avoid potential circular dependency issues during load
@@ -45,6 +46,7 @@ class IdentMgr(ObjectBase):
         
         self.m_PreBuf = "" # Cached string for message check
         self.m_CleanMsg = "" # Processed message
+        self.m_LineIndex = LineIndex("") # Line offsets of m_CleanMsg
 
     def __del__(self):
         """
@@ -154,6 +156,7 @@ class IdentMgr(ObjectBase):
         # Python's strip() is generally robust for this purpose.
         
         self.m_CleanMsg = msg.strip()
+        self.m_LineIndex = LineIndex(self.m_CleanMsg)
         return self.m_CleanMsg
 
     def identify_msg(self, msg):
@@ -164,12 +167,13 @@ class IdentMgr(ObjectBase):
         clean_msg = self.msg_check(msg)
 
         if clean_msg:
-            # Delegate to ParsingIdentMgr
-            info = self.m_ParsingIdentMgr.identify(clean_msg)
+            # Delegate to ParsingIdentMgr (shares the line index built in msg_check)
+            info = self.m_ParsingIdentMgr.identify(clean_msg, self.m_LineIndex)
             
             # Store the converted/cleaned message in info
             if info:
                 info.m_ConvertMsg = clean_msg
+                info.m_LineIndex = self.m_LineIndex
             return info
             
         return None
@@ -198,7 +202,5 @@ class IdentMgr(ObjectBase):
         # C++ implementation searched backwards from rear buffer.
         # In Python, assuming m_CleanMsg holds the current context string.
         if self.m_CleanMsg:
-            lines = self.m_CleanMsg.splitlines()
-            if lines:
-                return lines[-1]
+            return self.m_LineIndex.get_last_line()
         return None
\ No newline at end of file
@@ -0,0 +1,92 @@
+import sys
+import os
+from array import array
+from itertools import accumulate
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Line boundaries recognised by str.splitlines()
+LINE_TERMINATOR_CHARS = "\r\n\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+class LineIndex:
+    """
+    Line offset index over one message buffer.
+    Built once per message and shared by IdentMgr, ParsingIdentMgr and DataExtractor
+    (it travels with ExtractDataInfo), replacing the per-component dict of lines.
+    Lines are the same as str.splitlines() and are sliced out only on access.
+    """
+    def __init__(self, msg_buf=None):
+        self.m_MsgBuf = None
+        self.m_BufLen = 0
+        self.m_BufHash = 0 # hash() of the scanned text (str caches it, checked by with_buffer)
+        self.m_LineCount = 0
+        # Line N (1-based) spans [m_LineOffset[N-1], m_LineOffset[N]) including its terminator
+        self.m_LineOffset = array('q', [0])
+
+        if msg_buf is not None:
+            self.scan(msg_buf)
+
+    def scan(self, msg_buf):
+        """
+        Builds the offset array for msg_buf.
+        """
+        self.m_MsgBuf = msg_buf
+        self.m_BufLen = len(msg_buf)
+        self.m_BufHash = hash(msg_buf)
+        self.m_LineOffset = array('q', [0])
+        self.m_LineOffset.extend(accumulate(map(len, msg_buf.splitlines(True))))
+        self.m_LineCount = len(self.m_LineOffset) - 1
+
+    def detach(self):
+        """
+        Returns an index sharing the offsets but not holding the buffer.
+        Used while the message waits in a DataSender queue (payload stays in the RAW file).
+        """
+        index = LineIndex()
+        index.m_BufLen = self.m_BufLen
+        index.m_BufHash = self.m_BufHash
+        index.m_LineCount = self.m_LineCount
+        index.m_LineOffset = self.m_LineOffset
+        return index
+
+    def with_buffer(self, msg_buf):
+        """
+        Returns an index over msg_buf reusing these offsets.
+        The offsets are shared read-only, so one detached index may serve several consumers.
+        Rescans if msg_buf is not the text the offsets were built from
+        (not the same object and a different length or hash).
+        """
+        if msg_buf is not self.m_MsgBuf and (len(msg_buf) != self.m_BufLen or hash(msg_buf) != self.m_BufHash):
+            return LineIndex(msg_buf)
+
+        index = self.detach()
+        index.m_MsgBuf = msg_buf
+        return index
+
+    def get_msg_buf(self):
+        return self.m_MsgBuf
+
+    def get_line_count(self):
+        return self.m_LineCount
+
+    def get_line(self, line_number):
+        """
+        1-based line access without the line terminator. None if out of range.
+        """
+        if line_number < 1 or line_number > self.m_LineCount or self.m_MsgBuf is None:
+            return None
+
+        offset = self.m_LineOffset
+        return self.m_MsgBuf[offset[line_number - 1]:offset[line_number]].rstrip(LINE_TERMINATOR_CHARS)
+
+    def get_last_line(self):
+        return self.get_line(self.m_LineCount)
+
+    def is_end_line(self, line_number):
+        return line_number > self.m_LineCount
@@ -0,0 +1,147 @@
+import sys
+import os
+import re
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+class MsgTokenizer:
+    """
+    Token splitter behind DataExtractor.MsgTokenizeString / MsgTokenizeChar.
+    Splits whole lines with str.split / a precompiled per-delimiter regex
+    instead of walking characters, and caches the token list per (line, delimiter)
+    so several rules on the same list row tokenize it once.
+
+    Token lists are 1-based at the API (TokenPos 1 = first token);
+    a negative TokenPos counts backward (-1 = last token).
+    Cached lists are shared: callers must not modify them.
+    """
+
+    MAX_CACHE_ENTRY = 4096
+
+    def __init__(self):
+        self.m_StringTokenCache = {} # (Line, Delimiter) -> Token List or None
+        self.m_CharTokenCache = {}   # (Line, Delimiter) -> Token List or None
+        self.m_CharSplitterMap = {}  # Delimiter -> compiled splitter
+        self.m_HitCnt = 0
+        self.m_MissCnt = 0
+
+    def clear(self):
+        """
+        Drops cached token lists (called when a new message starts).
+        """
+        self.m_StringTokenCache.clear()
+        self.m_CharTokenCache.clear()
+
+    def get_cache_stat(self):
+        """
+        Returns (hit count, miss count) of the token list caches.
+        """
+        return self.m_HitCnt, self.m_MissCnt
+
+    def reset_cache_stat(self):
+        self.m_HitCnt = 0
+        self.m_MissCnt = 0
+
+    # -------------------------------------------------------
+    # MsgTokenizeString : Delimiter is one string
+    # -------------------------------------------------------
+    def tokenize_string(self, line, delimiter=" "):
+        """
+        Returns the token list of line, or None when the delimiter does not occur
+        (C++ returns without tokens). Delimiter " " skips empty tokens,
+        any other delimiter keeps them.
+        """
+        if not delimiter:
+            delimiter = " "
+
+        key = (line, delimiter)
+        tokens = self.m_StringTokenCache.get(key, key)
+        if tokens is not key:
+            self.m_HitCnt += 1
+            return tokens
+        self.m_MissCnt += 1
+
+        if delimiter == " ":
+            tokens = [token.strip() for token in line.split()]
+        elif delimiter not in line:
+            tokens = None
+        else:
+            tokens = [token.strip() for token in line.split(delimiter)]
+
+        if len(self.m_StringTokenCache) >= self.MAX_CACHE_ENTRY:
+            self.m_StringTokenCache.clear()
+        self.m_StringTokenCache[key] = tokens
+        return tokens
+
+    def get_string_token(self, line, token_pos, delimiter=" "):
+        """
+        C++: char* MsgTokenizeString(char* &Line, int TokenPos, char* TempBuf, string Delimiter)
+        Returns the token at TokenPos, or None if not found.
+        """
+        return self.token_at(self.tokenize_string(line, delimiter), token_pos)
+
+    # -------------------------------------------------------
+    # MsgTokenizeChar : Delimiter is a set of characters
+    # -------------------------------------------------------
+    def tokenize_char(self, line, delimiter=" "):
+        """
+        Returns the token list of line split on ANY character of delimiter,
+        or None when none of them occurs.
+        A delimiter char right after another delimiter (or at line start) yields an
+        empty token unless that char is a space.
+        """
+        if not delimiter:
+            delimiter = " "
+
+        key = (line, delimiter)
+        tokens = self.m_CharTokenCache.get(key, key)
+        if tokens is not key:
+            self.m_HitCnt += 1
+            return tokens
+        self.m_MissCnt += 1
+
+        splitter = self.m_CharSplitterMap.get(delimiter)
+        if splitter is None:
+            char_set = "".join(re.escape(char) for char in sorted(set(delimiter)))
+            splitter = re.compile(f"([{char_set}])")
+            self.m_CharSplitterMap[delimiter] = splitter
+
+        # [piece, delim, piece, delim, ..., last piece]
+        parts = splitter.split(line)
+        if len(parts) == 1:
+            tokens = None
+        else:
+            tokens = [piece.strip() for piece, char in zip(parts[0:-1:2], parts[1::2]) if piece or char != " "]
+            if parts[-1]:
+                tokens.append(parts[-1].strip())
+
+        if len(self.m_CharTokenCache) >= self.MAX_CACHE_ENTRY:
+            self.m_CharTokenCache.clear()
+        self.m_CharTokenCache[key] = tokens
+        return tokens
+
+    def get_char_token(self, line, token_pos, delimiter=" "):
+        """
+        C++: char* MsgTokenizeChar(char* &Line, int TokenPos, char* TempBuf, char* Delimiter)
+        Returns the token at TokenPos, or None if not found.
+        """
+        return self.token_at(self.tokenize_char(line, delimiter), token_pos)
+
+    @staticmethod
+    def token_at(tokens, token_pos):
+        """
+        1-based forward (TokenPos > 0) or backward (TokenPos < 0) token access.
+        """
+        if not tokens:
+            return None
+        if 0 < token_pos <= len(tokens):
+            return tokens[token_pos - 1]
+        if 0 < -token_pos <= len(tokens):
+            return tokens[token_pos]
+        return None
@@ -18,6 +18,7 @@ TMP_DH_ID = "TEMP"
 
 # Message IDs / Timer Reasons
 DELETE_DATA_HANDLER             = 13001
+EXTRACT_DATA_INFO_PUSHED        = 13002
 
 PARSINGDATA_POLLING_TIME        = 0.01 
 PARSINGDATA_POLLING_TIME_OUT    = 12001
@@ -114,7 +115,7 @@ class ExtractDataInfo:
 
     def __init__(self, msg_id=RAW_MSG_CHANGE_FLAG, ident_rule_ptr=None, ident_id_string="", 
                  ne_id="", port_no=0, file_pos=0, msg_size=0, 
-                 data_handler_id=TMP_DH_ID, ref_cnt=0):
+                 data_handler_id=TMP_DH_ID, ref_cnt=0, line_index=None):
         
         self.m_MsgId = msg_id
         self.m_IdentRulePtr = ident_rule_ptr
@@ -125,6 +126,10 @@ class ExtractDataInfo:
         self.m_MsgSize = msg_size
         self.m_DataHandlerId = data_handler_id
         self.m_RefCnt = ref_cnt
+        # LineIndex offsets of the message (detached : payload stays in the RAW file)
+        self.m_LineIndex = line_index.detach() if line_index else None
+        # time.monotonic() of DataSender.push_extract_data_info (time-in-queue stat)
+        self.m_PushTime = 0.0
         
         # Assign Unique ID
         with ExtractDataInfo.m_MsgIdLock:
@@ -174,5 +179,6 @@ class ExtractDataInfo:
             self.m_FilePos,
             self.m_MsgSize,
             target_dh_id,
-            ref_cnt
+            ref_cnt,
+            self.m_LineIndex
         )
\ No newline at end of file
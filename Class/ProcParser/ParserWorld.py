@@ -85,6 +85,8 @@ class ParserWorld(AsWorld):
         self.m_IsMsgLogging = False
         self.m_LockManager = None
         self.m_DefaultBufferSize = self.DEFAULT_MAX_RAW_MSG_BUF
+        self.m_ParsedDataBatchFlag = False # parsed_data_batch : AS_PARSED_DATA_BATCH to DataRouter (peer must support it)
+        self.m_DataSenderHighWaterMark = DataSender.DEFAULT_HIGH_WATER_MARK # 0 : unbounded
         self.m_RawLoggingFlagUse = True
         
         # Managers & Connections
@@ -139,6 +141,12 @@ class ParserWorld(AsWorld):
         val = self.get_env_value(ASCII_PARSER, "raw_logging_flag_use")
         if val: self.m_RawLoggingFlagUse = True if int(val) else False
 
+        val = self.get_env_value(ASCII_PARSER, "data_sender_high_water_mark")
+        if val: self.m_DataSenderHighWaterMark = int(val)
+
+        val = self.get_env_value(ASCII_PARSER, "parsed_data_batch")
+        if val: self.m_ParsedDataBatchFlag = True if int(val) else False
+
         self.set_log_file(ASCII_PARSER)
         self.set_system_info(ASCII_PARSER, self.m_ProcName)
 
@@ -258,7 +266,8 @@ class ParserWorld(AsWorld):
                         # Create ExtractDataInfo and Route
                         if info.m_IdentRulePtr and info.m_IdentRulePtr.m_ConsumerVector:
                             ptr = ExtractDataInfo(msg_id, info.m_IdentRulePtr, info.m_IdentIdString,
-                                                  ne_id, port_no, file_pos, len(info.m_ConvertMsg))
+                                                  ne_id, port_no, file_pos, len(info.m_ConvertMsg),
+                                                  line_index=info.m_LineIndex)
                             self.insert_parsing_data(ptr)
             else:
                 # Rule Change in Progress -> Buffer to Temp
@@ -361,6 +370,7 @@ class ParserWorld(AsWorld):
             
         conn = DataRouterConnection(data_handler_id)
         sender = DataSender(data_handler_id, conn)
+        sender.set_high_water_mark(self.get_data_sender_high_water_mark(data_handler_id))
         sender.run()
         
         # Connect to DataRouter (Unix Socket or TCP)
@@ -368,6 +378,7 @@ class ParserWorld(AsWorld):
         conn.start(socket_path) # Custom Start method in DataRouterConnection
         
         conn.set_data_sender(sender, self.m_MappingMgr)
+        conn.set_parsed_data_batch(self.get_parsed_data_batch_flag(data_handler_id))
         conn.change_world(sender)
         
         self.m_DataSenderMap[data_handler_id] = sender
@@ -503,6 +514,11 @@ class ParserWorld(AsWorld):
 
         # 3. Debug Memory Leak Check
         elif reason == self.DEBUG_MEMORY_LEAK_EXTRACTDATAINFO:
+            # DataSender backpressure (queue depth / time-in-queue per consumer)
+            for sender in list(self.m_DataSenderMap.values()):
+                sender.print_queue_stat()
+                sender.reset_queue_stat()
+
             if self.m_DeleteDebugSet:
                 with self.m_DeleteDebugSet.m_Lock:
                     # Logging size logic
@@ -712,18 +728,36 @@ class ParserWorld(AsWorld):
             
         conn = DataRouterConnection(data_handler_id)
         sender = DataSender(data_handler_id, conn)
+        sender.set_high_water_mark(self.get_data_sender_high_water_mark(data_handler_id))
         sender.run() # Start thread (if applicable)
         
         socket_path = self.get_data_router_listen_socket_path(data_handler_id)
         conn.start(socket_path)
         
         conn.set_data_sender(sender, self.m_MappingMgr)
+        conn.set_parsed_data_batch(self.get_parsed_data_batch_flag(data_handler_id))
         conn.change_world(sender) # Assuming Conn inherits from EventSrc and needs context
         
         self.m_DataSenderMap[data_handler_id] = sender
         print(f"[ParserWorld] CreateDataSender Success : {data_handler_id}")
         return True
 
+    def get_data_sender_high_water_mark(self, data_handler_id):
+        """
+        DataSender in-memory limit of a consumer :
+        data_sender_high_water_mark_<DataHandlerId>, else data_sender_high_water_mark
+        """
+        val = self.get_env_value(ASCII_PARSER, f"data_sender_high_water_mark_{data_handler_id}")
+        return int(val) if val else self.m_DataSenderHighWaterMark
+
+    def get_parsed_data_batch_flag(self, data_handler_id):
+        """
+        AS_PARSED_DATA_BATCH framing to a DataRouter :
+        parsed_data_batch_<DataHandlerId>, else parsed_data_batch (default 0)
+        """
+        val = self.get_env_value(ASCII_PARSER, f"parsed_data_batch_{data_handler_id}")
+        return bool(int(val)) if val else self.m_ParsedDataBatchFlag
+
     def destroy_data_sender(self, data_handler_id):
         """
         C++: void DestoryDataSender(string DataHandlerId)
@@ -825,6 +859,7 @@ class ParserWorld(AsWorld):
                                 if info and info.m_IdentRulePtr and info.m_IdentRulePtr.m_ConsumerVector:
                                     ptr.m_IdentRulePtr = info.m_IdentRulePtr
                                     ptr.m_IdentIdString = info.m_IdentIdString
+                                    ptr.m_LineIndex = info.m_LineIndex.detach() if info.m_LineIndex else None
                                     self.insert_parsing_data(ptr)
                             else:
                                 print(f"[ParserWorld] [CORE_ERROR] Msg Read Error -- Read: {len(data)}, Expected: {ptr.m_MsgSize}")
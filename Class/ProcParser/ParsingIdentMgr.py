@@ -13,12 +13,49 @@ if project_root not in sys.path:
 from Class.ProcParser.RuleType import *
 from Class.ProcParser.DataExtractor import DataExtractor
 from Class.ProcParser.ObjectBase import ObjectBase
+from Class.ProcParser.LineIndex import LineIndex
+from Class.Util.fr_aho_corasick import AhoCorasick
+
+class IdentExtractGroup:
+    """
+    Sibling IdentRules sharing one ParsingRule.
+    The rule's line region is extracted once and the value is looked up by IdString.
+    """
+    def __init__(self, parsing_rule):
+        self.m_ParsingRule = parsing_rule
+        self.m_FirstOrder = -1
+        self.m_IdStringOrderMap = {} # Key: IdString, Value: Lowest Child Order
+
+    def add_child(self, order, ident_rule):
+        if self.m_FirstOrder == -1:
+            self.m_FirstOrder = order
+        if ident_rule.m_IdString not in self.m_IdStringOrderMap:
+            self.m_IdStringOrderMap[ident_rule.m_IdString] = order
+
+class IdentDispatchNode:
+    """
+    Compiled identification step for one parent IdentRule.
+    Children keep their m_ChildRuleMap order, which is the match priority.
+    """
+    def __init__(self, ident_rule):
+        self.m_IdentRule = ident_rule
+        self.m_ChildList = [] # List of IdentRule (Priority Order)
+        self.m_LineStrBucketMap = {} # Key: Line Number, Value: List of (Order, IdString, StartLine)
+        self.m_LineStrLineList = [] # Sorted keys of m_LineStrBucketMap
+        self.m_LineStrMatcher = None # AhoCorasick over LINE_STR IdStrings (None : plain 'in' loop)
+        self.m_LineStrPatternBucketMap = {} # Key: Line Number, Value: {Pattern Index: List of (Order, StartLine)}
+        self.m_LineStrEmptyBucketMap = {} # Key: Line Number, Value: List of (Order, StartLine) with an empty IdString
+        self.m_ExtractGroupList = [] # List of IdentExtractGroup
+        self.m_MaxLine = 0
 
 class ParsingIdentMgr(ObjectBase):
     """
     Manages loading of Identification Rules and identifying messages.
     Builds a tree structure of IdentRule objects.
     """
+    # Sibling LINE_STR IdStrings needed before a node scans lines with AhoCorasick
+    LINE_STR_MATCHER_MIN_PATTERN = 40
+
     def __init__(self):
         """
         C++: ParsingIdentMgr()
@@ -29,7 +66,14 @@ class ParsingIdentMgr(ObjectBase):
         self.m_TotalIdentRuleMap = {} # Key: IdentName, Value: IdentRule
         
         self.m_MsgBuf = ""
-        self.m_SplitMsgMap = {} # Line cache for identification (simple list/dict)
+        self.m_LineIndex = LineIndex("") # Line offsets of the current message
+        self.m_IdString = ""
+
+        # Compiled Ident Tree (see compile_ident_tree)
+        self.m_IdentDispatchMap = None # Key: Parent IdentName ("" = Root), Value: IdentDispatchNode
+        self.m_IdentExtractor = None # Shared DataExtractor for non LINE_STR rules
+        self.m_IdentValueCache = {} # Key: (id(ParsingRule), Line Number), Value: Extracted String
+        self.m_LastBlankLineList = [] # Index: Line Number, Value: Last blank line <= Index
 
     def __del__(self):
         """
@@ -134,6 +178,7 @@ class ParsingIdentMgr(ObjectBase):
                 if not ident_rule.m_ParentName:
                     self.m_IdentRule.m_ChildRuleMap[ident_rule.m_IdentName] = ident_rule
 
+            self.compile_ident_tree()
             return True
 
         except Exception as e:
@@ -146,14 +191,21 @@ class ParsingIdentMgr(ObjectBase):
         """
         self.m_TotalIdentRuleMap.clear()
         self.m_IdentRule.m_ChildRuleMap.clear()
+        self.m_IdentDispatchMap = None
 
-    def identify(self, msg_buf):
+    def identify(self, msg_buf, line_index=None):
         """
         C++: IdentInfo* Identify(const char* MsgBuf)
         Identifies the message by traversing the rule tree.
+        line_index : LineIndex already built over msg_buf (built here if None).
         """
         self.m_MsgBuf = msg_buf
-        self.line_scanning() # Fill m_SplitMsgMap
+        self.line_scanning(line_index)
+
+        if self.m_IdentDispatchMap is None:
+            self.compile_ident_tree()
+        self.m_IdentValueCache.clear()
+        self.m_LastBlankLineList = []
         
         current_rule = self.m_IdentRule # Root
         child_ident_result = True
@@ -172,14 +224,13 @@ class ParsingIdentMgr(ObjectBase):
         while True:
             child_matched = False
             
-            # Check Children
-            for child_rule in current_rule.m_ChildRuleMap.values():
-                if self.check_identify(child_rule):
-                    child_matched = True
-                    current_rule = child_rule
-                    final_rule = child_rule
-                    # print(f"[Identify] Match: {current_rule.m_IdentName}")
-                    break
+            # Check Children (Compiled Dispatch)
+            child_rule = self.dispatch_identify(self.m_IdentDispatchMap.get(current_rule.m_IdentName))
+            if child_rule:
+                child_matched = True
+                current_rule = child_rule
+                final_rule = child_rule
+                # print(f"[Identify] Match: {current_rule.m_IdentName}")
             
             if not child_matched:
                 # Check Default Rule
@@ -237,8 +288,7 @@ class ParsingIdentMgr(ObjectBase):
                 # Since DataExtractor.extract_data_from_parsing_rule is instance method in prev code,
                 # we can make a temporary instance or make methods static.
                 # Here assuming we duplicate simple logic or create temp instance.
-                extractor = DataExtractor(None) # Dummy mgr
-                success, val = extractor.extract_data_from_parsing_rule(parsing_rule, line_buf, i)
+                success, val = self.get_ident_extractor().extract_data_from_parsing_rule(parsing_rule, line_buf, i)
                 if not success: continue
                 temp_buf = val
 
@@ -277,30 +327,204 @@ class ParsingIdentMgr(ObjectBase):
                 return False
                 
             ident_rule.m_ParsingRulePtr = p_rule
+
+        self.compile_ident_tree()
         return True
 
     def search_ident_rule(self, ident_name):
         return self.m_TotalIdentRuleMap.get(ident_name)
 
+    # -------------------------------------------------------
+    # Compiled Identification
+    # -------------------------------------------------------
+    def get_ident_extractor(self):
+        """
+        Returns the DataExtractor shared by every non LINE_STR ident rule.
+        """
+        if self.m_IdentExtractor is None:
+            self.m_IdentExtractor = DataExtractor(None) # Dummy mgr
+        return self.m_IdentExtractor
+
+    def compile_ident_tree(self):
+        """
+        Turns the IdentRule tree into one IdentDispatchNode per parent rule.
+        Called on rule load and whenever parsing rules are (re)linked.
+        """
+        self.m_IdentDispatchMap = {}
+        self._compile_ident_node(self.m_IdentRule)
+        for ident_rule in self.m_TotalIdentRuleMap.values():
+            if ident_rule.m_ChildRuleMap:
+                self._compile_ident_node(ident_rule)
+
+    def _compile_ident_node(self, parent_rule):
+        node = IdentDispatchNode(parent_rule)
+        group_map = {} # Key: id(ParsingRule), Value: IdentExtractGroup
+
+        for order, child_rule in enumerate(parent_rule.m_ChildRuleMap.values()):
+            node.m_ChildList.append(child_rule)
+
+            parsing_rule = child_rule.m_ParsingRulePtr
+            if not parsing_rule or parsing_rule.m_StartLine > parsing_rule.m_EndLine:
+                continue
+
+            node.m_MaxLine = max(node.m_MaxLine, parsing_rule.m_EndLine)
+
+            if parsing_rule.m_ParsingType == LINE_STR:
+                for line_number in range(parsing_rule.m_StartLine, parsing_rule.m_EndLine + 1):
+                    node.m_LineStrBucketMap.setdefault(line_number, []).append(
+                        (order, child_rule.m_IdString, parsing_rule.m_StartLine))
+            else:
+                group = group_map.get(id(parsing_rule))
+                if group is None:
+                    group = IdentExtractGroup(parsing_rule)
+                    group_map[id(parsing_rule)] = group
+                    node.m_ExtractGroupList.append(group)
+                group.add_child(order, child_rule)
+
+        node.m_LineStrLineList = sorted(node.m_LineStrBucketMap.keys())
+        self._compile_line_str_matcher(node)
+        self.m_IdentDispatchMap[parent_rule.m_IdentName] = node
+
+    def _compile_line_str_matcher(self, node):
+        """
+        Builds one multi-pattern automaton per node when it has enough LINE_STR siblings,
+        so each line is scanned once instead of once per sibling.
+        An empty IdString is not an automaton pattern ('in' matches every non-empty line),
+        so those siblings stay in m_LineStrEmptyBucketMap.
+        """
+        pattern_map = {} # Key: IdString, Value: Pattern Index
+        for bucket in node.m_LineStrBucketMap.values():
+            for order, id_string, start_line in bucket:
+                if id_string:
+                    pattern_map.setdefault(id_string, len(pattern_map))
+
+        if len(pattern_map) < self.LINE_STR_MATCHER_MIN_PATTERN:
+            return
+
+        node.m_LineStrMatcher = AhoCorasick(pattern_map.keys())
+        for line_number, bucket in node.m_LineStrBucketMap.items():
+            pattern_bucket = node.m_LineStrPatternBucketMap.setdefault(line_number, {})
+            for order, id_string, start_line in bucket:
+                if id_string:
+                    pattern_bucket.setdefault(pattern_map[id_string], []).append((order, start_line))
+                else:
+                    node.m_LineStrEmptyBucketMap.setdefault(line_number, []).append((order, start_line))
+
+    def dispatch_identify(self, node):
+        """
+        Returns the first child (m_ChildRuleMap order) of the node matching the
+        current message, or None. Same result as calling check_identify on each child.
+        """
+        if node is None or not node.m_ChildList:
+            return None
+
+        best_order = len(node.m_ChildList)
+        last_blank_list = self.get_last_blank_line_list(node.m_MaxLine)
+
+        # 1. LINE_STR : each line is visited once for all siblings
+        for line_number in node.m_LineStrLineList:
+            line_buf = self.get_line(line_number)
+            if not line_buf: continue
+            last_blank = last_blank_list[line_number]
+
+            if node.m_LineStrMatcher:
+                for order, start_line in node.m_LineStrEmptyBucketMap.get(line_number, ()):
+                    if order < best_order and last_blank < start_line:
+                        best_order = order
+                pattern_bucket = node.m_LineStrPatternBucketMap[line_number]
+                for pattern_idx in node.m_LineStrMatcher.search_all(line_buf):
+                    for order, start_line in pattern_bucket.get(pattern_idx, ()):
+                        if order < best_order and last_blank < start_line:
+                            best_order = order
+                continue
+
+            for order, id_string, start_line in node.m_LineStrBucketMap[line_number]:
+                if order >= best_order: continue
+                # check_identify stops at the first empty line of the rule's range
+                if last_blank >= start_line: continue
+                if id_string in line_buf:
+                    best_order = order
+
+        # 2. Extraction Rules : each ParsingRule region is extracted once per message
+        for group in node.m_ExtractGroupList:
+            if group.m_FirstOrder >= best_order: continue
+
+            parsing_rule = group.m_ParsingRule
+            for i in range(parsing_rule.m_StartLine, parsing_rule.m_EndLine + 1):
+                line_buf = self.get_line(i)
+                if not line_buf: break
+
+                temp_buf = self.get_ident_value(parsing_rule, line_buf, i)
+                if temp_buf is None: continue
+
+                order = group.m_IdStringOrderMap.get(temp_buf)
+                if order is not None and order < best_order:
+                    best_order = order
+                    if order == group.m_FirstOrder: break
+
+        if best_order == len(node.m_ChildList):
+            return None
+
+        child_rule = node.m_ChildList[best_order]
+        if child_rule.m_OutPutFlag:
+            self.m_IdString = child_rule.m_IdString
+        return child_rule
+
+    def get_ident_value(self, parsing_rule, line_buf, line_number):
+        """
+        Per message cache of ExtractDataFromParsingRule results for ident rules.
+        Returns None if extraction failed.
+        """
+        key = (id(parsing_rule), line_number)
+        if key in self.m_IdentValueCache:
+            return self.m_IdentValueCache[key]
+
+        success, val = self.get_ident_extractor().extract_data_from_parsing_rule(parsing_rule, line_buf, line_number)
+        if not success: val = None
+
+        self.m_IdentValueCache[key] = val
+        return val
+
+    def get_last_blank_line_list(self, max_line):
+        """
+        Index: line number, Value: last empty/missing line number <= index (0 = none).
+        Built lazily per message up to the deepest line used by the compiled rules.
+        """
+        blank_list = self.m_LastBlankLineList
+        if len(blank_list) > max_line:
+            return blank_list
+
+        if not blank_list:
+            blank_list.append(0)
+
+        last_blank = blank_list[-1]
+        for line_number in range(len(blank_list), max_line + 1):
+            if not self.get_line(line_number):
+                last_blank = line_number
+            blank_list.append(last_blank)
+        return blank_list
+
     # -------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------
-    def line_scanning(self):
+    def line_scanning(self, line_index=None):
         """
-        Splits message into lines for line-based access.
+        Indexes message lines for line-based access.
+        Reuses line_index when the caller already built one over m_MsgBuf.
         """
-        self.m_SplitMsgMap = {}
-        lines = self.m_MsgBuf.splitlines()
-        for i, line in enumerate(lines):
-            self.m_SplitMsgMap[i] = line
-        self.m_EndLineNumber = len(lines)
+        if line_index is None or line_index.get_msg_buf() is not self.m_MsgBuf:
+            line_index = LineIndex(self.m_MsgBuf)
+        self.m_LineIndex = line_index
+        self.m_EndLineNumber = line_index.get_line_count()
 
     def get_line(self, line_number):
         """
         1-based index access.
         """
-        idx = line_number - 1
-        return self.m_SplitMsgMap.get(idx)
+        return self.m_LineIndex.get_line(line_number)
+
+    def get_line_index(self):
+        return self.m_LineIndex
 
     # String trim helpers are built-in Python string methods (.strip, .lstrip, .rstrip)
     # used directly in code.
\ No newline at end of file
@@ -0,0 +1,318 @@
+import sys
+import os
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.ProcParser.RuleType import *
+from Class.ProcParser.MsgTokenizer import MsgTokenizer
+
+class ParsingRuleCompiler:
+    """
+    Compiles a ParsingRule into a specialised extraction callable.
+    The callable has the rule's strings, columns, sizes and delimiters bound in and
+    the same contract as DataExtractor.extract_data_from_parsing_rule:
+
+        func(extractor, line_buf, line_number) -> (success: bool, result: str)
+
+    line_buf is never empty (the extractor checks it before calling).
+    """
+
+    @staticmethod
+    def compile(rule):
+        """
+        Returns the extraction callable for rule.m_ParsingType.
+        """
+        p_type = rule.m_ParsingType
+
+        if p_type in (STRSTR_TOKEN, STRCOL_STRSTR_TOKEN):
+            return ParsingRuleCompiler._compile_token(rule)
+        elif p_type == STRCOL_STRSTR_ENDCOL:
+            return ParsingRuleCompiler._compile_strcol_strstr_endcol(rule)
+        elif p_type == STRCOL_ENDSTR:
+            return ParsingRuleCompiler._compile_strcol_endstr(rule)
+        elif p_type == STRSTR_EXTSIZE:
+            return ParsingRuleCompiler._compile_strstr_extsize(rule)
+        elif p_type == STRSTR_ENDSTR:
+            return ParsingRuleCompiler._compile_strstr_endstr(rule)
+        elif p_type == STRSTR_ENDCOL:
+            return ParsingRuleCompiler._compile_strstr_endcol(rule)
+        elif p_type == EXTSIZE_ENDSTR:
+            return ParsingRuleCompiler._compile_extsize_endstr(rule)
+        elif p_type == LINE_FULL:
+            return ParsingRuleCompiler._compile_line_full(rule)
+        elif p_type == FULL_MESSAGE_EXTRACT:
+            return ParsingRuleCompiler._compile_full_message_extract(rule)
+        elif p_type == STRCOL_STRSTR_REMAINSTR:
+            return ParsingRuleCompiler._compile_strcol_strstr_remainstr(rule)
+        elif p_type == STRCOL_STRSTR_TOKEN_REMAINSTR:
+            return ParsingRuleCompiler._compile_strcol_strstr_token_remainstr(rule)
+        elif p_type == CREATE_DATA_IN_PREDEFINED:
+            return ParsingRuleCompiler._compile_create_data_in_predefined(rule)
+
+        def extract_unknown(extractor, line_buf, line_number):
+            print(f"[DataExtractor] [CORE_ERROR] UnKnown Parsing Type : {p_type}")
+            return False, ""
+        return extract_unknown
+
+    # -------------------------------------------------------
+    # STRSTR_TOKEN / STRCOL_STRSTR_TOKEN
+    # -------------------------------------------------------
+    @staticmethod
+    def _compile_token(rule):
+        use_column = rule.m_ParsingType == STRCOL_STRSTR_TOKEN
+        start_column = rule.m_StartColumn
+        start_ptr = start_column - 1
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+        token_index = rule.m_TokenIndex
+        token_delimiter = rule.m_TokenDelimiter or " "
+        token_size = rule.m_TokenSize
+        size_abs = abs(token_size)
+        delimiter_type = rule.m_DelimiterType
+        bad_delimiter = delimiter_type not in (0, 1)
+        token_at = MsgTokenizer.token_at
+
+        def extract_token(extractor, line_buf, line_number):
+            # offset : where the tokenized remainder starts in line_buf
+            if use_column:
+                if len(line_buf) < start_column:
+                    return False, ""
+                offset = start_ptr if start_ptr >= 0 else max(len(line_buf) + start_ptr, 0)
+                if start_string:
+                    found_idx = line_buf.find(start_string, offset)
+                    if found_idx == -1:
+                        return False, ""
+                    offset = found_idx + skip_len
+            else:
+                offset = line_buf.find(start_string)
+                if offset == -1:
+                    return False, ""
+                offset += skip_len
+
+            if bad_delimiter:
+                if not use_column:
+                    print(f"[DataExtractor] [CORE_ERROR] Unknown DelimiterType: {delimiter_type}")
+                return False, ""
+
+            temp_buf = token_at(extractor.get_token_list(line_buf, offset, delimiter_type, token_delimiter), token_index)
+
+            if not temp_buf:
+                return True, ""
+
+            if token_size != 0:
+                if size_abs < len(temp_buf) + 1:
+                    if token_size > 0:
+                        temp_buf = temp_buf[:token_size]
+                    else:
+                        temp_buf = temp_buf[size_abs:] if size_abs < len(temp_buf) else ""
+                else:
+                    return False, ""
+
+            return True, temp_buf
+        return extract_token
+
+    # -------------------------------------------------------
+    # Column / String Based Types
+    # -------------------------------------------------------
+    @staticmethod
+    def _compile_strcol_strstr_endcol(rule):
+        start_column = rule.m_StartColumn
+        end_column = rule.m_EndColumn
+        start_ptr = start_column - 1
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+
+        def extract_strcol_strstr_endcol(extractor, line_buf, line_number):
+            if len(line_buf) < start_column or len(line_buf) < end_column:
+                return False, ""
+            found_idx = line_buf[start_ptr:].find(start_string)
+            if found_idx == -1:
+                return False, ""
+            abs_start = start_ptr + found_idx + skip_len
+            if abs_start > end_column:
+                return False, ""
+            return True, line_buf[abs_start:end_column]
+        return extract_strcol_strstr_endcol
+
+    @staticmethod
+    def _compile_strcol_endstr(rule):
+        start_column = rule.m_StartColumn
+        start_ptr = start_column - 1
+        end_string = rule.m_EndString
+
+        def extract_strcol_endstr(extractor, line_buf, line_number):
+            if len(line_buf) < start_column:
+                return False, ""
+            search_area = line_buf[start_ptr:]
+            found_idx = search_area.find(end_string)
+            if found_idx == -1:
+                return False, ""
+            return True, search_area[:found_idx]
+        return extract_strcol_endstr
+
+    @staticmethod
+    def _compile_strstr_extsize(rule):
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+        extract_size = rule.m_ExtractSize
+
+        def extract_strstr_extsize(extractor, line_buf, line_number):
+            found_idx = line_buf.find(start_string)
+            if found_idx == -1:
+                return False, ""
+            start_idx = found_idx + skip_len
+            return True, line_buf[start_idx : start_idx + extract_size]
+        return extract_strstr_extsize
+
+    @staticmethod
+    def _compile_strstr_endstr(rule):
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+        end_string = rule.m_EndString
+
+        def extract_strstr_endstr(extractor, line_buf, line_number):
+            start_idx = line_buf.find(start_string)
+            if start_idx == -1:
+                return False, ""
+            start_idx += skip_len
+            end_idx = line_buf.find(end_string, start_idx)
+            if end_idx == -1:
+                return False, ""
+            return True, line_buf[start_idx:end_idx]
+        return extract_strstr_endstr
+
+    @staticmethod
+    def _compile_strstr_endcol(rule):
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+        end_column = rule.m_EndColumn
+
+        def extract_strstr_endcol(extractor, line_buf, line_number):
+            if len(line_buf) < end_column:
+                return False, ""
+            start_idx = line_buf.find(start_string)
+            if start_idx == -1:
+                return False, ""
+            start_idx += skip_len
+            if start_idx > end_column:
+                return False, ""
+            return True, line_buf[start_idx:end_column]
+        return extract_strstr_endcol
+
+    @staticmethod
+    def _compile_extsize_endstr(rule):
+        extract_size = rule.m_ExtractSize
+        end_string = rule.m_EndString
+
+        def extract_extsize_endstr(extractor, line_buf, line_number):
+            if len(line_buf) < extract_size:
+                return False, ""
+            end_idx = line_buf.find(end_string)
+            if end_idx == -1:
+                return False, ""
+            if extract_size > (end_idx + 1):
+                return False, ""
+            return True, line_buf[end_idx - extract_size:end_idx]
+        return extract_extsize_endstr
+
+    @staticmethod
+    def _compile_strcol_strstr_remainstr(rule):
+        start_column = rule.m_StartColumn
+        start_ptr = start_column - 1
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+
+        def extract_strcol_strstr_remainstr(extractor, line_buf, line_number):
+            if len(line_buf) < start_column or not start_string:
+                return False, ""
+            search_area = line_buf[start_ptr:]
+            found_idx = search_area.find(start_string)
+            if found_idx == -1:
+                return False, ""
+            return True, search_area[found_idx + skip_len:]
+        return extract_strcol_strstr_remainstr
+
+    @staticmethod
+    def _compile_strcol_strstr_token_remainstr(rule):
+        start_column = rule.m_StartColumn
+        start_ptr = start_column - 1
+        start_string = rule.m_StartString
+        skip_len = len(start_string)
+        delimiter = rule.m_TokenDelimiter if rule.m_TokenDelimiter else " "
+        split_sep = None if delimiter == " " else delimiter
+        target_idx = rule.m_TokenIndex + 1 # C++ uses +1
+        list_idx = target_idx - 1
+
+        def extract_strcol_strstr_token_remainstr(extractor, line_buf, line_number):
+            if len(line_buf) < start_column:
+                return False, ""
+            sub_line = line_buf[start_ptr:]
+            if start_string:
+                found_idx = sub_line.find(start_string)
+                if found_idx == -1:
+                    return False, ""
+                sub_line = sub_line[found_idx + skip_len:]
+
+            if not (0 <= list_idx < len(sub_line.split(split_sep))):
+                return False, ""
+            split_res = sub_line.split(split_sep, target_idx - 1)
+            if len(split_res) < target_idx:
+                return False, ""
+            return True, split_res[-1]
+        return extract_strcol_strstr_token_remainstr
+
+    # -------------------------------------------------------
+    # Multi Line / Predefined Types
+    # -------------------------------------------------------
+    @staticmethod
+    def _compile_line_full(rule):
+        count = rule.m_EndLine - rule.m_StartLine
+
+        def extract_line_full(extractor, line_buf, line_number):
+            tmp_lines = []
+            max_size = extractor.TEMP_ITEM_BUF_SIZE - 1
+            get_line = extractor.get_line
+            for i in range(line_number + 1, line_number + 1 + count):
+                l_buf = get_line(i)
+                if l_buf is None:
+                    return False, ""
+                max_size -= (len(l_buf) + 1)
+                if max_size < 0:
+                    break
+                tmp_lines.append(l_buf)
+            if tmp_lines:
+                return True, line_buf + "\n" + "\n".join(tmp_lines)
+            return True, line_buf
+        return extract_line_full
+
+    @staticmethod
+    def _compile_full_message_extract(rule):
+        def extract_full_message(extractor, line_buf, line_number):
+            tmp_lines = []
+            max_size = extractor.TEMP_ITEM_BUF_SIZE - 1
+            get_line = extractor.get_line
+            for i in range(1, extractor.m_EndLineNumber + 2):
+                l_buf = get_line(i)
+                if l_buf is None:
+                    break
+                max_size -= (len(l_buf) + 1)
+                if max_size < 0:
+                    break
+                tmp_lines.append(l_buf)
+            return True, "\n".join(tmp_lines)
+        return extract_full_message
+
+    @staticmethod
+    def _compile_create_data_in_predefined(rule):
+        defined_data_type = rule.m_DefinedDataType
+        defined_data_type_format = rule.m_DefinedDataTypeFormat
+
+        def extract_predefined(extractor, line_buf, line_number):
+            return True, extractor.create_pre_defined_data(defined_data_type, defined_data_type_format)
+        return extract_predefined
@@ -11,6 +11,7 @@ if project_root not in sys.path:
 
 from Class.ProcParser.ObjectBase import ObjectBase
 from Class.ProcParser.RuleType import *
+from Class.ProcParser.ParsingRuleCompiler import ParsingRuleCompiler
 # Stub imports for DataMapper subclasses (assuming implementation exists or stubbed)
 # from Class.ProcParser.StringDataMapper import StringDataMapper
 # from Class.ProcParser.NumberDataMapper import NumberDataMapper
@@ -180,6 +181,7 @@ class ParsingRuleMgr(ObjectBase):
                         self.set_error_msg(self.m_ParsingTmplMgr.get_error_msg())
                         return False
 
+                self.determine_parsing_type(rule)
                 self.m_ParsingRuleMap[rule.m_ParsingRuleId] = rule
 
             # Post-Load Linking
@@ -207,5 +209,11 @@ class ParsingRuleMgr(ObjectBase):
         """
         self.m_ParsingRuleMap.clear()
 
-    def determine_parsing_type(self):
+    def determine_parsing_type(self, rule):
+        """
+        C++: bool DetermineParsingType()
+        Resolves rule.m_ParsingType once at load time into a specialised
+        extraction callable (rule.m_ExtractFunc) used by DataExtractor.
+        """
+        rule.m_ExtractFunc = ParsingRuleCompiler.compile(rule)
         return True
\ No newline at end of file
@@ -0,0 +1,70 @@
+import sys
+import os
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+class ResultBuilder:
+    """
+    C++: char* m_LongResult / m_CurResultPtr
+    Preallocated result buffer of one parsed record.
+    Items are written as "value\\0" in place; the record and its segment blocks are
+    handed out as memoryview slices of the buffer instead of bytes copies.
+
+    Views are valid until the next reset()/append on the buffer,
+    so consumers (ParsingResult -> SendParsedData) must use them synchronously
+    or copy (bytes(view)) to keep them.
+    """
+    def __init__(self, size):
+        self.m_Buf = bytearray(size)
+        self.m_View = memoryview(self.m_Buf)
+        self.m_Size = size
+        self.m_Len = 0
+
+    def reset(self, length=0):
+        """
+        Restarts the record at length (0, or the atomic accumulation offset).
+        """
+        self.m_Len = length
+
+    def get_len(self):
+        return self.m_Len
+
+    def append_items(self, item_list):
+        """
+        Appends every item (str) of item_list, each followed by its null terminator,
+        encoding and writing one item at a time into the buffer (no record-size temporary).
+        Returns False (record length unchanged) if they do not fit.
+        """
+        buf = self.m_Buf
+        size = self.m_Size
+        pos = self.m_Len
+        for item_buf in item_list:
+            encoded = item_buf.encode('utf-8')
+            end = pos + len(encoded)
+            if end + 1 > size:
+                return False
+            buf[pos:end] = encoded
+            buf[end] = 0
+            pos = end + 1
+
+        self.m_Len = pos
+        return True
+
+    def get_view(self):
+        """
+        Whole record (no copy).
+        """
+        return self.m_View[:self.m_Len]
+
+    def get_segment_view(self, index, blk_size):
+        """
+        index-th block of blk_size bytes (no copy). The last block may be short or empty.
+        """
+        start = index * blk_size
+        return self.m_View[min(start, self.m_Len):min(start + blk_size, self.m_Len)]
@@ -221,6 +221,7 @@ class ParsingRule:
         self.m_NullSkipFlag = False
         self.m_PreDataCopyFlag = False
         self.m_ParsingType = NOT_USE
+        self.m_ExtractFunc = None # Set by ParsingRuleMgr.determine_parsing_type()
         
         self.m_DefinedDataType = -1
         self.m_DefinedDataTypeFormat = -1
@@ -259,4 +260,5 @@ class IdentInfo:
         self.m_FinalIdentName = final_ident_name
         self.m_IdentIdString = ident_id_string
         self.m_IdentRulePtr = ident_rule
-        self.m_ConvertMsg = convert_msg
\ No newline at end of file
+        self.m_ConvertMsg = convert_msg
+        self.m_LineIndex = None # LineIndex over m_ConvertMsg
\ No newline at end of file
@@ -4,6 +4,8 @@
 from Class.Sql.fr_db_session   import DbSession
 from Class.Sql.fr_db_result_set import DbRecordSet
 from Class.Sql.proc_call_param import ProcCallParam, BindData, ProcParamType
+from Class.Sql.fr_db_statement import DbStatement, DbStatementRegistry
+from Class.Sql.fr_db_session_pool import DbSessionPool
 
 __all__ = [
     "DbSession",
@@ -11,4 +13,7 @@ __all__ = [
     "ProcCallParam",
     "BindData",
     "ProcParamType",
+    "DbStatement",
+    "DbStatementRegistry",
+    "DbSessionPool",
 ]
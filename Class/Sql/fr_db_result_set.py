@@ -39,6 +39,10 @@ class DbRecordSet:
     MoveNext() 를 반복 호출하여 한 행씩 fetch.
     모든 행을 소비하거나 소멸 시 커서를 자동 해제.
 
+    커서는 cursor.arraysize(RS_FETCH_SIZE) 단위로 prefetch 하며,
+    fetch 한 레코드는 보관하지 않으므로 (첫 행 제외) 결과 행 수와 무관하게
+    메모리 사용량이 일정하다.
+
     사용 예:
         rs = session.execute_rs("SELECT ...")
         if rs.is_valid():
@@ -61,6 +65,8 @@ class DbRecordSet:
         self._desc_list:  DbDescRecordList  = DbDescRecordList()
         self._def_list:   DbDefRecordList   = DbDefRecordList()
         self._fetch_info: RsFetchInfo | None = None
+        self._row_cnt:    int               = 0      # 지금까지 fetch 된 행 수
+        self._first_record: DbRecord | None = None   # move_first() 용
 
         self.error: str = ""    # C++ m_Error
         self.query: str = ""    # C++ m_Query
@@ -81,6 +87,11 @@ class DbRecordSet:
     # ------------------------------------------------------------------ #
     # 내부 해제
     # ------------------------------------------------------------------ #
+    def close(self) -> None:
+        """커서 해제 (DBGw DB_RS_CLOSE_REQ 등 명시적 종료)."""
+        self._close()
+        self._is_end_row = True
+
     def _close(self) -> None:
         """C++ 소멸자 대응. 커서 및 리소스 해제."""
         if self._cursor is not None:
@@ -109,7 +120,7 @@ class DbRecordSet:
 
     def get_row(self) -> int:
         """C++ GetRow() — 현재까지 fetch 된 행 수."""
-        return self._db_param.get_row()
+        return self._row_cnt
 
     def set_col(self, col: int) -> None:
         """C++ SetCol() 대응. execute_rs() 내부에서 호출."""
@@ -117,7 +128,7 @@ class DbRecordSet:
 
     def set_row(self, row: int) -> None:
         """C++ SetRow() 대응."""
-        self._db_param.set_row(row)
+        self._row_cnt = row
 
     # ------------------------------------------------------------------ #
     # 커서 이동
@@ -126,9 +137,9 @@ class DbRecordSet:
         """
         C++ MoveNext() 대응.
         다음 행을 fetch 하여 DbRecord 반환.
-        더 이상 행이 없으면 None 반환.
+        더 이상 행이 없거나 오류면 None 반환 (오류는 error 에 메시지).
         """
-        if not self.get_col() or self._is_end_row:
+        if not self.get_col() or self._is_end_row or self._cursor is None:
             return None
 
         # FetchInfo 최초 생성 (커서 + 컬럼 메타 묶음)
@@ -142,21 +153,60 @@ class DbRecordSet:
 
         record = self._db_session._fetch_data(self._fetch_info)
         if record is not None:
-            self._db_param.add_record(record)
+            self._row_cnt += 1
+            if self._first_record is None:
+                self._first_record = record
         else:
+            if self._fetch_info.failed:
+                self.error = self._db_session.get_error()
             self._is_end_row = True
+            self._close()   # 마지막 행 이후 커서 즉시 반환
 
         return record
 
+    def fetch_rows(self, max_rows: int) -> list | None:
+        """
+        최대 max_rows 행을 DB 원본 값 tuple(NULL = None) 리스트로 fetch (C++ 원본 없음).
+        DBGw 스트리밍 bulk select 가 DbRecord 변환 없이 블록 단위로 인코딩할 때 사용.
+        빈 리스트 = 끝 (커서 해제), None = 오류 (error 에 메시지).
+        """
+        if not self.get_col() or self._is_end_row or self._cursor is None:
+            return []
+
+        if self._fetch_info is None:
+            self._fetch_info = RsFetchInfo(
+                cursor    = self._cursor,
+                col_cnt   = self.get_col(),
+                desc_list = self._desc_list,
+                def_list  = self._def_list,
+            )
+
+        rows = self._db_session._fetch_rows(self._fetch_info, max_rows)
+        if rows is None:
+            self.error = self._db_session.get_error()
+            self._is_end_row = True
+            self._close()
+            return None
+        if rows:
+            self._row_cnt += len(rows)
+        else:
+            self._is_end_row = True
+            self._close()
+        return rows
+
+    def get_str_converter(self):
+        """fetch_rows() 값을 문자열로 바꿀 때 쓰는 세션의 변환 함수 (DbRecord 와 동일 규칙)."""
+        return self._db_session._val_to_str
+
     def move_first(self) -> DbRecord | None:
         """
         C++ MoveFirst() 대응 (원본 미구현).
         이미 fetch 된 레코드가 있으면 첫 번째 반환,
         없으면 move_next() 로 첫 행 fetch.
+        (스트리밍 커서이므로 이후 move_next() 는 처음으로 되감지 않음)
         """
-        if self._db_param.get_row() > 0:
-            self._db_param.rewind()
-            return self._db_param.get_record_head()
+        if self._first_record is not None:
+            return self._first_record
         return self.move_next()
 
     def move_last(self) -> DbRecord | None:
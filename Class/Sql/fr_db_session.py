@@ -11,11 +11,9 @@ from typing import Union, Optional, TYPE_CHECKING
 from Class.SqlType.fr_db_base_type import (
     DbType, QueryDataType, QueryJoinPosition,
     DB_ORACLE_OCI_STR, DB_MYSQL_STR,
-)
-from Class.SqlType.fr_db_param import (
-    DbParam, DbRecord,
     BindParamByPos, BindParamByName, QueryResult,
 )
+from Class.SqlType.fr_db_param import DbParam, DbRecord
 
 if TYPE_CHECKING:
     from Class.Sql.fr_db_result_set import DbRecordSet, RsFetchInfo
@@ -109,6 +107,11 @@ class DbSession(ABC):
     def get_error(self)         -> str:  return self._error
     def get_error_code(self)    -> int:  return self._err_code
     def get_exec_row_count(self)-> int:  return self._exec_row_cnt
+    def is_connected(self)      -> bool: return self._connect
+
+    def clear_error(self) -> None:
+        self._error    = ""
+        self._err_code = 0
 
     def _set_exec_row_count(self, cnt: int) -> None:
         self._exec_row_cnt = cnt
@@ -151,6 +154,13 @@ class DbSession(ABC):
     @abstractmethod
     def _close_cursor(self, cursor: object) -> None: ...
 
+    def _fetch_rows(self, fetch_info: "RsFetchInfo", max_rows: int) -> list | None:
+        """
+        최대 max_rows 행을 DB 원본 값 tuple 로 반환 (C++ 원본 없음).
+        빈 리스트 = 끝, None = 오류 (각 세션이 DB 예외를 처리하도록 재정의).
+        """
+        return fetch_info.next_rows(max_rows)
+
     # ------------------------------------------------------------------ #
     # sql_query
     # ------------------------------------------------------------------ #
@@ -192,6 +202,36 @@ class DbSession(ABC):
     def free(self, result: QueryResult) -> None:
         result.free()
 
+    # ------------------------------------------------------------------ #
+    # execute_array  (Array DML)
+    # ------------------------------------------------------------------ #
+    def execute_array(self, query: str, bind_list: list[BindParam],
+                      auto_commit: bool = True) -> bool:
+        """
+        동일 DML 을 bind_list 의 행마다 실행 (array DML).
+        기본 구현은 행 단위 execute_query 반복 — 세션별로 executemany 로 재정의.
+        exec_row_count 는 전체 처리 행 수.
+        """
+        total = 0
+        for bind_param in bind_list:
+            if not self.execute_query(query, bind_param, auto_commit=False):
+                return False
+            total += max(self.get_exec_row_count(), 0)
+        self._set_exec_row_count(total)
+        return self.commit() if auto_commit else True
+
+    # ------------------------------------------------------------------ #
+    # ping  (세션 유효성 확인 - DbSessionPool 대여 시 검증)
+    # ------------------------------------------------------------------ #
+    def ping(self) -> bool:
+        if not self._connect:
+            return False
+        if self._db_type in (DbType.ORACLE_OCI2, DbType.ORACLE_OCI_OLD, DbType.ORACLE_ODBC):
+            query = "SELECT 1 FROM DUAL"
+        else:
+            query = "SELECT 1"
+        return self.execute_query(query, auto_commit=False)
+
     # ------------------------------------------------------------------ #
     # 프로시저 (기본 미구현)
     # ------------------------------------------------------------------ #
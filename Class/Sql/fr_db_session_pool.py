@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""
+fr_db_session_pool.py  (C++ 원본 없음)
+Python 3.11
+
+DbSession 풀.
+
+DbSession.get_instance 로 만든 세션을 min/max 크기 안에서 재사용하고,
+DB 장애 시 재접속 폭주(reconnect storm)를 막는다.
+
+  - 대여 시 검증 : 접속 끊김 / is_db_disconnect_err 세션은 폐기,
+                   validate_idle_sec 이상 쉬던 세션은 ping 후 대여
+  - 반납 시 검증 : is_db_disconnect_err 세션은 폐기, 그 외는 rollback 후 재사용
+  - 재접속 back-off : 접속 실패가 연속되면 base * 2^(n-1) (최대 backoff_max) 에
+                      지터(50~100%)를 적용한 시간 동안 새 접속을 시도하지 않음
+  - 통계 : get_stat()
+
+같은 접속 정보의 풀은 get_shared() 로 DbManager / DBGwServer 등이 공유한다.
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from Class.SqlType.fr_db_base_type import DbType
+from Class.Sql.fr_db_session import DbSession
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MIN_SIZE:          int   = 1
+_DEFAULT_MAX_SIZE:          int   = 8
+_DEFAULT_BORROW_TIMEOUT:    float = 5.0     # sec
+_DEFAULT_VALIDATE_IDLE_SEC: float = 30.0    # sec, < 0 이면 ping 하지 않음
+_DEFAULT_MAX_IDLE_SEC:      float = 300.0   # sec, min_size 초과분 정리 기준
+_DEFAULT_BACKOFF_BASE:      float = 0.5     # sec
+_DEFAULT_BACKOFF_MAX:       float = 30.0    # sec
+
+
+class DbSessionPool:
+    """
+    접속 정보 1개에 대한 DbSession 풀 (thread-safe).
+
+    사용 예:
+        pool = DbSessionPool.get_shared(DbType.ORACLE_OCI2, user, passwd, tns, ip, port)
+        with pool.session() as db:
+            db.execute_query(...)
+    """
+
+    _shared_pools: dict[tuple, "DbSessionPool"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_type: DbType, user: str, passwd: str, db_name: str,
+                 db_ip: str = "", db_port: int = 0, *,
+                 min_size: int = _DEFAULT_MIN_SIZE,
+                 max_size: int = _DEFAULT_MAX_SIZE,
+                 borrow_timeout: float = _DEFAULT_BORROW_TIMEOUT,
+                 validate_idle_sec: float = _DEFAULT_VALIDATE_IDLE_SEC,
+                 max_idle_sec: float = _DEFAULT_MAX_IDLE_SEC,
+                 backoff_base: float = _DEFAULT_BACKOFF_BASE,
+                 backoff_max: float = _DEFAULT_BACKOFF_MAX,
+                 name: str = "",
+                 session_factory: Callable[[], Optional[DbSession]] | None = None) -> None:
+        """
+        session_factory : DbSession.get_instance 대신 사용할 세션 생성 함수 (접속 전 세션 반환)
+        """
+        self._db_type:   DbType = DbType(db_type)
+        self._user:      str    = user
+        self._passwd:    str    = passwd
+        self._db_name:   str    = db_name
+        self._db_ip:     str    = db_ip
+        self._db_port:   int    = int(db_port) if db_port else 0
+        self._name:      str    = name or f"{user}@{db_name}"
+
+        self._min_size:          int   = max(0, min_size)
+        self._max_size:          int   = max(1, max_size, self._min_size)
+        self._borrow_timeout:    float = borrow_timeout
+        self._validate_idle_sec: float = validate_idle_sec
+        self._max_idle_sec:      float = max_idle_sec
+        self._backoff_base:      float = backoff_base
+        self._backoff_max:       float = backoff_max
+        self._session_factory = session_factory
+
+        self._cond = threading.Condition()
+        self._idle:   list[tuple[DbSession, float]] = []  # (세션, 반납 시각) - 뒤쪽이 최근
+        self._in_use: set[int] = set()                    # id(session)
+        self._total:  int      = 0                        # 유휴 + 대여 + 접속 중
+        self._closed: bool     = False
+        self._error:  str      = ""
+        self._connect_error: str = ""                     # 마지막 접속 실패 사유
+
+        # 재접속 back-off
+        self._fail_cnt:     int   = 0
+        self._backoff_sec:  float = 0.0
+        self._next_connect: float = 0.0   # time.monotonic 기준
+        self._probing:      bool  = False # 장애 중에는 재접속 시도를 1개만 허용
+
+        self._reset_stat_locked()
+
+    # ------------------------------------------------------------------ #
+    # 공유 풀
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def get_shared(cls, db_type: DbType, user: str, passwd: str, db_name: str,
+                   db_ip: str = "", db_port: int = 0, **kwargs: Any) -> "DbSessionPool":
+        """
+        접속 정보별 공유 풀 반환 (없으면 kwargs 로 생성).
+        """
+        key = (int(db_type), user, passwd, db_name, db_ip, int(db_port) if db_port else 0)
+        with cls._shared_lock:
+            pool = cls._shared_pools.get(key)
+            if pool is None or pool._closed:
+                pool = cls(db_type, user, passwd, db_name, db_ip, db_port, **kwargs)
+                cls._shared_pools[key] = pool
+            return pool
+
+    @classmethod
+    def close_all_shared(cls) -> None:
+        with cls._shared_lock:
+            pools = list(cls._shared_pools.values())
+            cls._shared_pools.clear()
+        for pool in pools:
+            pool.close()
+
+    # ------------------------------------------------------------------ #
+    # 조회
+    # ------------------------------------------------------------------ #
+    def get_name(self)    -> str:    return self._name
+    def get_db_type(self) -> DbType: return self._db_type
+    def get_error(self)   -> str:    return self._error
+
+    # ------------------------------------------------------------------ #
+    # 대여 / 반납
+    # ------------------------------------------------------------------ #
+    def borrow(self, timeout: float | None = None) -> Optional[DbSession]:
+        """
+        검증된 세션 대여. 실패 시 None (사유는 get_error()).
+          timeout : 모든 세션이 대여 중일 때 대기 시간 (None 이면 borrow_timeout, 0 이면 대기 없음)
+        재접속 back-off 중에는 유휴 세션이 없으면 대기 없이 실패.
+        """
+        wait_sec = self._borrow_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + wait_sec
+
+        while True:
+            session = None
+            idle_sec = 0.0
+            with self._cond:
+                while True:
+                    if self._closed:
+                        self._error = f"DbSessionPool({self._name}) closed"
+                        return None
+
+                    if self._idle:
+                        session, idle_since = self._idle.pop()
+                        idle_sec = time.monotonic() - idle_since
+                        self._in_use.add(id(session))
+                        break
+
+                    if self._total < self._max_size:
+                        now = time.monotonic()
+                        if now < self._next_connect or (self._fail_cnt and self._probing):
+                            self._stat_backoff_reject += 1
+                            self._error = (f"DbSessionPool({self._name}) reconnect back-off "
+                                           f"({max(0.0, self._next_connect - now):.1f} sec left) : {self._connect_error}")
+                            return None
+                        self._total += 1  # 접속 슬롯 예약
+                        self._probing = self._fail_cnt > 0
+                        break
+
+                    remain = deadline - time.monotonic()
+                    if remain <= 0:
+                        self._stat_borrow_timeout += 1
+                        self._error = f"DbSessionPool({self._name}) borrow timeout ({wait_sec} sec)"
+                        return None
+                    self._cond.wait(remain)
+
+            if session is None:
+                session = self._open_session()
+                if session is None:
+                    return None
+            elif not self._validate(session, idle_sec):
+                self._discard(session, in_use=True)
+                with self._cond:
+                    self._stat_validate_fail += 1
+                continue
+
+            wait = time.monotonic() - start
+            with self._cond:
+                self._stat_borrow_cnt += 1
+                self._stat_total_wait += wait
+                if wait > self._stat_max_wait:
+                    self._stat_max_wait = wait
+                in_use = len(self._in_use)
+                if in_use > self._stat_peak_in_use:
+                    self._stat_peak_in_use = in_use
+            return session
+
+    def give_back(self, session: DbSession | None, broken: bool = False) -> None:
+        """
+        세션 반납. broken 이거나 is_db_disconnect_err 이면 폐기.
+        커밋되지 않은 작업은 rollback 하여 다음 사용자에게 넘기지 않음.
+        """
+        if session is None:
+            return
+
+        if broken or not session.is_connected() or session.is_db_disconnect_err():
+            self._discard(session, in_use=True)
+            return
+
+        if not session.rollback() and session.is_db_disconnect_err():
+            self._discard(session, in_use=True)
+            return
+
+        with self._cond:
+            self._in_use.discard(id(session))
+            if self._closed:
+                self._total -= 1
+                session.disconnect()
+                return
+            self._idle.append((session, time.monotonic()))
+            self._shrink_locked()
+            self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout: float | None = None) -> Iterator[DbSession]:
+        """
+        with pool.session() as db: ...  (대여 실패 시 ConnectionError)
+        """
+        db = self.borrow(timeout)
+        if db is None:
+            raise ConnectionError(self._error)
+        try:
+            yield db
+        finally:
+            self.give_back(db)
+
+    def prefill(self) -> int:
+        """
+        min_size 까지 세션을 미리 접속. 접속된 세션 수 반환.
+        """
+        sessions = []
+        while True:
+            with self._cond:
+                if self._total >= self._min_size or self._fail_cnt:
+                    break
+                self._total += 1
+            session = self._open_session()
+            if session is None:
+                break
+            sessions.append(session)
+        for session in sessions:
+            self.give_back(session)
+        return len(sessions)
+
+    def close(self) -> None:
+        """
+        유휴 세션 종료. 대여 중인 세션은 반납 시 종료.
+        """
+        with self._cond:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._total -= len(idle)
+            self._stat_closed += len(idle)
+            self._cond.notify_all()
+        for session, _ in idle:
+            session.disconnect()
+
+    # ------------------------------------------------------------------ #
+    # 통계
+    # ------------------------------------------------------------------ #
+    def get_stat(self) -> dict[str, Any]:
+        with self._cond:
+            borrow = self._stat_borrow_cnt
+            return {
+                "Total":          self._total,
+                "Idle":           len(self._idle),
+                "InUse":          len(self._in_use),
+                "PeakInUse":      self._stat_peak_in_use,
+                "Created":        self._stat_created,
+                "Closed":         self._stat_closed,
+                "ConnectFail":    self._stat_connect_fail,
+                "ValidateFail":   self._stat_validate_fail,
+                "BorrowCnt":      borrow,
+                "BorrowTimeout":  self._stat_borrow_timeout,
+                "BackOffReject":  self._stat_backoff_reject,
+                "AvgWaitMs":      self._stat_total_wait / borrow * 1000 if borrow else 0.0,
+                "MaxWaitMs":      self._stat_max_wait * 1000,
+                "ConsecutiveFail": self._fail_cnt,
+                "BackOffSec":     self._backoff_sec,
+            }
+
+    def reset_stat(self) -> None:
+        with self._cond:
+            self._reset_stat_locked()
+
+    def _reset_stat_locked(self) -> None:
+        self._stat_created:        int   = 0
+        self._stat_closed:         int   = 0
+        self._stat_connect_fail:   int   = 0
+        self._stat_validate_fail:  int   = 0
+        self._stat_borrow_cnt:     int   = 0
+        self._stat_borrow_timeout: int   = 0
+        self._stat_backoff_reject: int   = 0
+        self._stat_total_wait:     float = 0.0
+        self._stat_max_wait:       float = 0.0
+        self._stat_peak_in_use:    int   = len(self._in_use)
+
+    # ------------------------------------------------------------------ #
+    # 내부 헬퍼
+    # ------------------------------------------------------------------ #
+    def _open_session(self) -> Optional[DbSession]:
+        """
+        예약된 슬롯(_total)으로 새 세션 접속 (lock 밖에서 수행).
+        실패 시 슬롯 반환 후 back-off 갱신.
+        """
+        if self._session_factory:
+            session = self._session_factory()
+        else:
+            session = DbSession.get_instance(int(self._db_type), self._name)
+        ok = session is not None and session.connect(
+            self._user, self._passwd, self._db_name, self._db_ip, self._db_port)
+
+        with self._cond:
+            self._probing = False
+            if not ok:
+                self._total -= 1
+                self._stat_connect_fail += 1
+                self._fail_cnt += 1
+                delay = min(self._backoff_max, self._backoff_base * (2 ** (self._fail_cnt - 1)))
+                self._backoff_sec = random.uniform(delay / 2, delay)
+                self._next_connect = time.monotonic() + self._backoff_sec
+                self._connect_error = session.get_error() if session else "unsupported db type"
+                self._error = self._connect_error
+                self._cond.notify()
+                logger.error("DbSessionPool(%s) connect fail (%d times, retry after %.1f sec) : %s",
+                             self._name, self._fail_cnt, self._backoff_sec, self._error)
+            else:
+                if self._fail_cnt:
+                    logger.info("DbSessionPool(%s) reconnected after %d failures",
+                                self._name, self._fail_cnt)
+                self._fail_cnt = 0
+                self._backoff_sec = 0.0
+                self._next_connect = 0.0
+                self._stat_created += 1
+                self._in_use.add(id(session))
+
+        if not ok:
+            if session:
+                session.disconnect()
+            return None
+        session.clear_error()
+        return session
+
+    def _validate(self, session: DbSession, idle_sec: float) -> bool:
+        if not session.is_connected() or session.is_db_disconnect_err():
+            return False
+        if 0 <= self._validate_idle_sec <= idle_sec:
+            if not session.ping():
+                logger.warning("DbSessionPool(%s) ping fail : %s", self._name, session.get_error())
+                return False
+        return True
+
+    def _discard(self, session: DbSession, in_use: bool) -> None:
+        session.disconnect()
+        with self._cond:
+            if in_use:
+                self._in_use.discard(id(session))
+            self._total -= 1
+            self._stat_closed += 1
+            self._cond.notify()
+
+    def _shrink_locked(self) -> None:
+        """
+        min_size 를 넘는 오래된 유휴 세션 정리 (가장 오래 쉰 세션부터).
+        """
+        if self._max_idle_sec < 0:
+            return
+        now = time.monotonic()
+        while self._idle and self._total > self._min_size and now - self._idle[0][1] >= self._max_idle_sec:
+            session, _ = self._idle.pop(0)
+            self._total -= 1
+            self._stat_closed += 1
+            session.disconnect()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+fr_db_statement.py  (C++ 원본 없음)
+Python 3.11
+
+바인드 변수 기반 SQL 문장 레지스트리.
+
+논리 쿼리를 이름으로 한 번만 선언하고, 실행 시에는 값만 바인드하여
+DB 에 전달되는 SQL 텍스트가 항상 동일하도록 한다.
+(Oracle: 공유 커서 재사용 / soft parse + stmtcachesize, MySQL: 파라미터 쿼리)
+
+SQL 템플릿 문법:
+  :NAME            바인드 변수 (문자열 리터럴 '...' 내부는 제외)
+  {DATE(:NAME)}    'YYYY/MM/DD HH24:MI:SS' 문자열 바인드 → DB 별 날짜 변환 함수
+  {SYSDATE}        DB 별 현재 시각 함수
+  {TO_CHAR(expr)}  DB 별 날짜 → 'YYYY/MM/DD HH24:MI:SS' 문자열 변환
+
+렌더링 결과 (DB 타입별 1회 생성 후 캐시):
+  Oracle : :NAME 그대로 + BindParamByName
+  그 외  : %s (등장 순서, MySQL) + BindParamByPos   ('%' 리터럴은 '%%' 로 escape)
+"""
+
+import logging
+import re
+from typing import Any
+
+from Class.SqlType.fr_db_base_type import (
+    DbType, BindParamByPos, BindParamByName,
+)
+
+logger = logging.getLogger(__name__)
+
+# 문자열 리터럴을 먼저 매칭하여 리터럴 안의 ':MI' 등을 바인드로 오인하지 않음
+_BIND_RE    = re.compile(r"'(?:[^']|'')*'|(?<![:\w]):([A-Za-z_]\w*)")
+_DATE_RE    = re.compile(r"\{DATE\((:[A-Za-z_]\w*)\)\}")
+_TO_CHAR_RE = re.compile(r"\{TO_CHAR\(([^)]*)\)\}")
+
+_ORACLE_TYPES = (DbType.ORACLE_OCI2, DbType.ORACLE_OCI_OLD)
+
+
+class DbStatement:
+    """
+    이름 있는 SQL 문장 하나.
+    DB 타입별 렌더링 결과 (SQL 텍스트, 바인드 이름 순서) 를 캐시한다.
+    """
+
+    def __init__(self, name: str, sql: str) -> None:
+        self.name: str = name
+        self.sql:  str = sql
+        self._rendered: dict[DbType, tuple[str, list[str]]] = {}
+
+    def render(self, db_type: DbType) -> tuple[str, list[str]]:
+        """
+        db_type 용 SQL 텍스트와 바인드 이름 목록(등장 순서) 반환.
+        """
+        rendered = self._rendered.get(db_type)
+        if rendered is None:
+            rendered = self._render(db_type)
+            self._rendered[db_type] = rendered
+        return rendered
+
+    def _render(self, db_type: DbType) -> tuple[str, list[str]]:
+        is_oracle = db_type in _ORACLE_TYPES
+        sql = self.sql
+
+        # 1. DB 별 매크로
+        if is_oracle:
+            sql = _DATE_RE.sub(r"TO_DATE(\1, 'YYYY/MM/DD HH24:MI:SS')", sql)
+            sql = _TO_CHAR_RE.sub(r"TO_CHAR(\1, 'YYYY/MM/DD HH24:MI:SS')", sql)
+            sql = sql.replace("{SYSDATE}", "SYSDATE")
+        else:
+            sql = _DATE_RE.sub(r"STR_TO_DATE(\1, '%Y/%m/%d %H:%i:%s')", sql)
+            sql = _TO_CHAR_RE.sub(r"DATE_FORMAT(\1, '%Y/%m/%d %H:%i:%s')", sql)
+            sql = sql.replace("{SYSDATE}", "sysdate()")
+
+        # 2. 바인드 변수
+        bind_names: list[str] = []
+
+        def _bind(m: re.Match) -> str:
+            name = m.group(1)
+            if name is None:            # 문자열 리터럴
+                return m.group(0).replace("%", "%%") if not is_oracle else m.group(0)
+            bind_names.append(name)
+            return m.group(0) if is_oracle else "%s"
+
+        if not is_oracle:
+            # 리터럴 밖의 '%' (LIKE 'A%' 외) 도 PyMySQL 포맷 문자로 해석되므로 escape
+            parts = []
+            pos = 0
+            for m in _BIND_RE.finditer(sql):
+                parts.append(sql[pos:m.start()].replace("%", "%%"))
+                parts.append(_bind(m))
+                pos = m.end()
+            parts.append(sql[pos:].replace("%", "%%"))
+            sql = "".join(parts)
+        else:
+            sql = _BIND_RE.sub(_bind, sql)
+
+        return sql, bind_names
+
+    def make_bind_param(self, db_type: DbType,
+                        values: dict[str, Any]) -> tuple[str, BindParamByPos | BindParamByName]:
+        """
+        db_type 용 (SQL 텍스트, 바인드 파라미터) 생성.
+        Oracle 은 이름 기반(동일 이름 1회), 그 외는 등장 순서대로 위치 기반.
+        값이 None 이면 '' 로 바인드 (기존 f-string 쿼리의 '' 와 동일).
+        """
+        sql, bind_names = self.render(db_type)
+
+        if db_type in _ORACLE_TYPES:
+            bind: BindParamByPos | BindParamByName = BindParamByName()
+            for name in dict.fromkeys(bind_names):
+                bind.add_variable(name, self._bind_value(name, values))
+        else:
+            bind = BindParamByPos()
+            for name in bind_names:
+                bind.add_variable(self._bind_value(name, values))
+        return sql, bind
+
+    def make_bind_param_list(self, db_type: DbType,
+                             values_list: list[dict[str, Any]]) -> tuple[str, list[BindParamByPos | BindParamByName]]:
+        """
+        Array DML (DbSession.execute_array) 용 (SQL 텍스트, 행별 바인드 파라미터 목록) 생성.
+        """
+        sql, _ = self.render(db_type)
+        return sql, [self.make_bind_param(db_type, values)[1] for values in values_list]
+
+    def _bind_value(self, name: str, values: dict[str, Any]) -> Any:
+        try:
+            value = values[name]
+        except KeyError:
+            raise KeyError(f"DbStatement({self.name}) missing bind value :{name}") from None
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return int(value)
+        return value
+
+
+class DbStatementRegistry:
+    """
+    DbStatement 레지스트리.
+    DbManager 등 DB 사용자가 논리 쿼리를 한 곳에 선언하고 이름으로 실행.
+    """
+
+    def __init__(self) -> None:
+        self._statements: dict[str, DbStatement] = {}
+
+    def register(self, name: str, sql: str) -> DbStatement:
+        if name in self._statements:
+            logger.warning("DbStatementRegistry: statement(%s) redefined", name)
+        stmt = DbStatement(name, sql)
+        self._statements[name] = stmt
+        return stmt
+
+    def register_all(self, statements: dict[str, str]) -> None:
+        for name, sql in statements.items():
+            self.register(name, sql)
+
+    def get(self, name: str) -> DbStatement:
+        stmt = self._statements.get(name)
+        if stmt is None:
+            raise KeyError(f"DbStatementRegistry: unknown statement({name})")
+        return stmt
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statements
+
+    def __len__(self) -> int:
+        return len(self._statements)
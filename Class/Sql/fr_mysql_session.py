@@ -9,6 +9,7 @@ Python 3.11
 
 import logging
 import datetime
+import weakref
 from typing import TYPE_CHECKING
 
 try:
@@ -25,12 +26,13 @@ from Class.Sql.fr_db_session import DbSession, BindParam
 from Class.SqlType.fr_db_base_type import (
     DbType, QueryBindData,
     BindParamByPos, BindParamByName,
+    RS_FETCH_SIZE,
 )
 from Class.SqlType.fr_db_param import DbParam, DbRecord
 from Class.Sql.proc_call_param import BindData, ProcParamType
 
 if TYPE_CHECKING:
-    from Class.Sql.fr_db_result_set import RsFetchInfo
+    from Class.Sql.fr_db_result_set import DbRecordSet, RsFetchInfo
     from Class.Sql.proc_call_param  import ProcCallParam
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,7 @@ class MySQLSession(DbSession):
         super().__init__(name)
         self._db_type = DbType.MYSQL
         self._conn = None
+        self._open_rs = None    # SSCursor 가 연결을 점유 중인 DbRecordSet (weakref)
 
     def __del__(self) -> None:
         if self._connect:
@@ -93,6 +96,7 @@ class MySQLSession(DbSession):
 
     def disconnect(self) -> None:
         """C++ Disconnect() 대응."""
+        self._close_open_rs()
         self._connect = False
         if self._conn:
             try:
@@ -105,6 +109,7 @@ class MySQLSession(DbSession):
     # commit / rollback
     # ------------------------------------------------------------------ #
     def commit(self) -> bool:
+        self._close_open_rs()
         try:
             self._conn.commit()
             return True
@@ -113,6 +118,7 @@ class MySQLSession(DbSession):
             return False
 
     def rollback(self) -> bool:
+        self._close_open_rs()
         try:
             self._conn.rollback()
             return True
@@ -133,6 +139,7 @@ class MySQLSession(DbSession):
             self._error = "MySQL doesn't support BindParamByName"
             return False
 
+        self._close_open_rs()
         try:
             cur = self._conn.cursor()
             if isinstance(bind_param, BindParamByPos):
@@ -149,6 +156,37 @@ class MySQLSession(DbSession):
             self._set_error(e, query)
             return False
 
+    # ------------------------------------------------------------------ #
+    # execute_array  (Array DML: cursor.executemany)
+    # ------------------------------------------------------------------ #
+    def execute_array(self, query: str, bind_list: list[BindParam],
+                      auto_commit: bool = True) -> bool:
+        """
+        PyMySQL executemany : INSERT ... VALUES 는 다중 행 1문장으로 묶어 전송,
+        그 외 DML 은 행 단위 실행 (동일 트랜잭션).
+        """
+        self._set_exec_row_count(-1)
+        if not bind_list:
+            self._set_exec_row_count(0)
+            return True
+
+        if any(isinstance(bind_param, BindParamByName) for bind_param in bind_list):
+            self._error = "MySQL doesn't support BindParamByName"
+            return False
+
+        self._close_open_rs()
+        try:
+            cur = self._conn.cursor()
+            cur.executemany(query, [self._build_pos_params(bind_param) for bind_param in bind_list])
+            self._set_exec_row_count(cur.rowcount)
+            cur.close()
+
+            return self.commit() if auto_commit else True
+
+        except _PyMySQLError as e:
+            self._set_error(e, query)
+            return False
+
     # ------------------------------------------------------------------ #
     # execute  (SELECT → DbParam 결과 적재)
     # ------------------------------------------------------------------ #
@@ -162,6 +200,7 @@ class MySQLSession(DbSession):
         query = param.get_query()
         logger.debug("execute query: %s", query)
 
+        self._close_open_rs()
         try:
             cur = self._conn.cursor()
             if isinstance(bind_param, BindParamByPos):
@@ -174,12 +213,19 @@ class MySQLSession(DbSession):
                 cur.close()
                 return True
 
-            param.set_col(col_cnt)
-            for row in cur.fetchall():
-                record = DbRecord(col_cnt)
-                for i, val in enumerate(row):
-                    record.set_value(i, "" if val is None else str(val))
-                param.add_record(record)
+            rows = cur.fetchall()
+            if param.is_columnar():
+                # 컬럼 모드 : 드라이버 타입 그대로 컬럼별 적재
+                names = [desc[0] for desc in cur.description]
+                columns = list(zip(*rows)) if rows else [() for _ in range(col_cnt)]
+                param.set_columns(names, columns, self._val_to_str)
+            else:
+                param.set_col(col_cnt)
+                for row in rows:
+                    record = DbRecord(col_cnt)
+                    for i, val in enumerate(row):
+                        record.set_value(i, self._val_to_str(val))
+                    param.add_record(record)
 
             cur.close()
             param.rewind()
@@ -190,13 +236,54 @@ class MySQLSession(DbSession):
             return False
 
     # ------------------------------------------------------------------ #
-    # execute_rs  (미구현 — C++ 원본도 미구현)
+    # execute_rs  (SSCursor 스트리밍 — frDbRecordSet 용)
     # ------------------------------------------------------------------ #
-    def execute_rs(self, query: str) -> None:
-        """C++ ExecuteRs() — 미구현."""
-        self._error    = "not yet impl"
-        self._err_code = -1
-        return None
+    def execute_rs(self, query: str) -> "DbRecordSet | None":
+        """
+        C++ ExecuteRs() 대응 (C++ 원본 미구현).
+        SSCursor(unbuffered) 로 실행하여 서버에서 RS_FETCH_SIZE 행씩 읽어온다.
+
+        unbuffered 결과는 세션 연결을 점유하므로 세션당 1개만 열려 있다.
+        다 읽기 전에 같은 세션으로 다른 쿼리(execute_rs 포함)를 실행하면
+        열린 레코드셋을 먼저 닫고 error 에 사유를 남긴다 (이후 move_next() 는 None).
+        """
+        logger.debug("execute_rs query: %s", query)
+        self._close_open_rs()
+        cur = None
+        try:
+            cur = self._conn.cursor(pymysql.cursors.SSCursor)
+            cur.arraysize = RS_FETCH_SIZE
+            cur.execute(query)
+        except _PyMySQLError as e:
+            self._set_error(e, query)
+            self._close_cursor(cur)
+            return None
+
+        return self._make_record_set(cur, query)
+
+    def _make_record_set(self, cur: object, query: str) -> "DbRecordSet":
+        """실행된 unbuffered 커서를 DbRecordSet 으로 감싸고 세션의 열린 레코드셋으로 기록."""
+        from Class.Sql.fr_db_result_set import DbRecordSet
+
+        r_set = DbRecordSet(self, int(DbType.MYSQL))
+        r_set.query = query
+        r_set._cursor = cur
+        r_set.set_col(len(cur.description) if cur.description else 0)
+        r_set._is_valid = True
+        self._open_rs = weakref.ref(r_set)
+        return r_set
+
+    def _close_open_rs(self) -> None:
+        """
+        연결을 점유 중인 레코드셋이 있으면 닫는다 (남은 행은 버림).
+        PyMySQL 이 다음 쿼리에서 남은 행을 조용히 버리는 대신, 레코드셋을 명시적으로
+        종료하고 error 에 사유를 남겨 호출자가 잘린 결과를 구분할 수 있게 한다.
+        """
+        r_set = self._open_rs() if self._open_rs is not None else None
+        self._open_rs = None
+        if r_set is not None and r_set._cursor is not None:
+            r_set.close()
+            r_set.error = "record set closed: another query was issued on the session"
 
     # ------------------------------------------------------------------ #
     # update_long  (BLOB / MEDIUMBLOB 컬럼 업데이트)
@@ -211,6 +298,7 @@ class MySQLSession(DbSession):
             return False
 
         sql = f"UPDATE {table} SET {field} = %s WHERE {where}"
+        self._close_open_rs()
         try:
             cur = self._conn.cursor()
             cur.execute(sql, (value,))
@@ -249,6 +337,7 @@ class MySQLSession(DbSession):
                 call_value.err_msg = self._error
                 return False
 
+        self._close_open_rs()
         try:
             cur = self._conn.cursor()
             result_args = cur.callproc(call_value.procedure_name, in_params)
@@ -279,6 +368,7 @@ class MySQLSession(DbSession):
     # ------------------------------------------------------------------ #
     def set_db_character_set(self, charset_name: str) -> bool:
         """C++ SetDBCharacterSet() 대응."""
+        self._close_open_rs()
         try:
             self._conn.set_charset(charset_name)
             return True
@@ -289,9 +379,29 @@ class MySQLSession(DbSession):
     # ------------------------------------------------------------------ #
     # 추상 메서드 구현
     # ------------------------------------------------------------------ #
-    def _fetch_data(self, fetch_info: "RsFetchInfo") -> None:
-        """C++ _FetchData() — MySQLSession 에서 미사용."""
-        return None
+    def _fetch_data(self, fetch_info: "RsFetchInfo") -> DbRecord | None:
+        """C++ _FetchData() 대응. prefetch 버퍼에서 한 행을 DbRecord 로 반환."""
+        try:
+            row = fetch_info.next_row()
+        except _PyMySQLError as e:
+            self._set_error(e)
+            fetch_info.failed = True
+            return None
+        if row is None:
+            return None
+
+        record = DbRecord(fetch_info.col_cnt)
+        for i, val in enumerate(row):
+            record.set_value(i, self._val_to_str(val))
+        return record
+
+    def _fetch_rows(self, fetch_info: "RsFetchInfo", max_rows: int) -> list | None:
+        """DBGw 스트리밍 bulk select 용. 최대 max_rows 행을 원본 값 tuple 로 반환."""
+        try:
+            return fetch_info.next_rows(max_rows)
+        except _PyMySQLError as e:
+            self._set_error(e)
+            return None
 
     def _close_cursor(self, cursor: object) -> None:
         """C++ _CloseCursor() 대응."""
@@ -326,6 +436,10 @@ class MySQLSession(DbSession):
                 raise ValueError(self._error)
         return params
 
+    @staticmethod
+    def _val_to_str(val: object) -> str:
+        return "" if val is None else str(val)
+
     def _set_error(self, exc: Exception,
                    query: str | None = None) -> None:
         """C++ _Error() / _ErrorStmt() 통합."""
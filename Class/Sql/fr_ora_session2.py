@@ -28,11 +28,11 @@ except ImportError:
     )
 
 from Class.Sql.fr_db_session import DbSession, BindParam
-from Class.SqlType.fr_db_base_type import DbType
-from Class.SqlType.fr_db_param import (
-    DbParam, DbRecord,
+from Class.SqlType.fr_db_base_type import (
+    DbType, RS_FETCH_SIZE,
     BindParamByPos, BindParamByName, QueryBindData,
 )
+from Class.SqlType.fr_db_param import DbParam, DbRecord
 
 if TYPE_CHECKING:
     from Class.Sql.fr_db_result_set  import DbRecordSet, RsFetchInfo
@@ -42,6 +42,7 @@ logger = logging.getLogger(__name__)
 
 _ORACLE_DATE_FMT = 'YYYY/MM/DD HH24:MI:SS'
 _MAX_BUF_SIZE    = 2048
+_STMT_CACHE_SIZE = 100     # 세션별 statement cache (바인드 SQL 재사용 시 soft parse 생략)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -102,6 +103,8 @@ class OraSession2(DbSession):
                 # encoding 파라미터 없음 — Thin 모드는 항상 UTF-8
             )
             # autocommit=False 가 기본값 (cx_Oracle 동일)
+            # 동일 SQL 텍스트 재실행 시 클라이언트 측 statement 재사용
+            self._conn.stmtcachesize = _STMT_CACHE_SIZE
             self._cursor = self._conn.cursor()
             self._connect = True
             return True
@@ -164,6 +167,29 @@ class OraSession2(DbSession):
             self._set_error(e, query)
             return False
 
+    # ------------------------------------------------------------------ #
+    # execute_array  (Array DML: cursor.executemany — 1회 왕복)
+    # ------------------------------------------------------------------ #
+    def execute_array(self, query, bind_list, auto_commit=True):
+        # type: (str, List[BindParam], bool) -> bool
+        self._set_exec_row_count(-1)
+        if not bind_list:
+            self._set_exec_row_count(0)
+            return True
+
+        try:
+            rows = [self._build_params(bind_param) for bind_param in bind_list]
+            self._cursor.executemany(query, rows)
+            self._set_exec_row_count(self._cursor.rowcount)
+
+            if auto_commit:
+                return self.commit()
+            return True
+
+        except oracledb.Error as e:
+            self._set_error(e, query)
+            return False
+
     # ------------------------------------------------------------------ #
     # execute  (SELECT → DbParam 결과 적재)
     # ------------------------------------------------------------------ #
@@ -179,6 +205,15 @@ class OraSession2(DbSession):
             col_cnt = len(self._cursor.description) if self._cursor.description else 0
             if col_cnt == 0:
                 return True
+            if param.is_columnar():
+                # 컬럼 모드 : 드라이버 타입 그대로 컬럼별 적재
+                names = [desc[0] for desc in self._cursor.description]
+                rows = self._cursor.fetchall()
+                columns = list(zip(*rows)) if rows else [() for _ in range(col_cnt)]
+                param.set_columns(names, columns, self._val_to_str)
+                param.rewind()
+                return True
+
             param.set_col(col_cnt)
 
             for row in self._cursor:
@@ -199,9 +234,31 @@ class OraSession2(DbSession):
     # ------------------------------------------------------------------ #
     def execute_rs(self, query):
         # type: (str) -> Optional[DbRecordSet]
-        self._error    = 'not yet impl'
-        self._err_code = -1
-        return None
+        """
+        C++ ExecuteRs() 대응.
+        레코드셋 전용 커서를 열어 arraysize / prefetchrows = RS_FETCH_SIZE 로
+        round-trip 당 RS_FETCH_SIZE 행씩 가져온다. (세션 커서와 독립)
+        """
+        from Class.Sql.fr_db_result_set import DbRecordSet
+
+        logger.debug('execute_rs query: %s', query)
+        cur = None
+        try:
+            cur = self._conn.cursor()
+            cur.arraysize    = RS_FETCH_SIZE
+            cur.prefetchrows = RS_FETCH_SIZE + 1
+            cur.execute(query)
+        except oracledb.Error as e:
+            self._set_error(e, query)
+            self._close_cursor(cur)
+            return None
+
+        r_set = DbRecordSet(self, int(DbType.ORACLE_OCI2))
+        r_set.query = query
+        r_set._cursor = cur
+        r_set.set_col(len(cur.description) if cur.description else 0)
+        r_set._is_valid = True
+        return r_set
 
     # ------------------------------------------------------------------ #
     # update_long  (LONG / CLOB 컬럼 업데이트)
@@ -228,7 +285,29 @@ class OraSession2(DbSession):
     # ------------------------------------------------------------------ #
     def _fetch_data(self, fetch_info):
         # type: (RsFetchInfo) -> Optional[DbRecord]
-        return None
+        """C++ _FetchData() 대응. prefetch 버퍼에서 한 행을 DbRecord 로 반환."""
+        try:
+            row = fetch_info.next_row()
+        except oracledb.Error as e:
+            self._set_error(e)
+            fetch_info.failed = True
+            return None
+        if row is None:
+            return None
+
+        record = DbRecord(fetch_info.col_cnt)
+        for i, val in enumerate(row):
+            record.set_value(i, self._val_to_str(val))
+        return record
+
+    def _fetch_rows(self, fetch_info, max_rows):
+        # type: (RsFetchInfo, int) -> Optional[list]
+        """DBGw 스트리밍 bulk select 용. 최대 max_rows 행을 원본 값 tuple 로 반환."""
+        try:
+            return fetch_info.next_rows(max_rows)
+        except oracledb.Error as e:
+            self._set_error(e)
+            return None
 
     def _close_cursor(self, cursor):
         # type: (object) -> None
@@ -269,6 +348,8 @@ class OraSession2(DbSession):
             return bd.number_data
         elif bd.bind_type == QueryBindData.BIND_DATE:
             d = bd.date
+            if isinstance(d, datetime.datetime):
+                return d
             return datetime.datetime(
                 d.get_year(), d.get_month(),  d.get_day(),
                 d.get_hour(), d.get_minute(), d.get_second(),
@@ -12,6 +12,7 @@ from Class.SqlType.fr_db_base_type import (
     DB_ORACLE_OCI_STR,
     DB_MYSQL_STR,
     DB_MAX_ITEM_BUF_SIZE,
+    RS_FETCH_SIZE,
     # 날짜 구조체
     FrOCITime,
     FrOCIDate,
@@ -42,7 +43,7 @@ from Class.SqlType.fr_db_param import (
 __all__ = [
     # fr_db_base_type
     "DbType", "DbCharSet", "QueryDataType", "QueryJoinPosition",
-    "DB_ORACLE_OCI_STR", "DB_MYSQL_STR", "DB_MAX_ITEM_BUF_SIZE",
+    "DB_ORACLE_OCI_STR", "DB_MYSQL_STR", "DB_MAX_ITEM_BUF_SIZE", "RS_FETCH_SIZE",
     "FrOCITime", "FrOCIDate", "FrMySQLDate",
     "DbDescRecord", "DbDescRecordList",
     "DbDefRecord",  "DbDefRecordList",
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 DB_MAX_ITEM_BUF_SIZE = 2048
+RS_FETCH_SIZE        = 500    # execute_rs() 커서 prefetch 행 수 (cursor.arraysize)
 
 # ── DB 타입 문자열 상수 ────────────────────────────────────────────────────────
 DB_ORACLE_OCI_STR = "ORACLE"
@@ -181,8 +182,13 @@ class RsFetchInfo:
     """
     C++ RsFetchInfo 대응.
     frDbRecordSet 스트리밍 fetch 시 커서·컬럼 정보를 묶어 전달.
+
+    row_buf / row_pos : cursor.fetchmany() 로 prefetch 한 행 버퍼와 다음 행 위치.
+                        버퍼 크기(cursor.arraysize) 만큼만 메모리에 유지.
+    failed            : 세션의 _fetch_data 가 DB 오류로 None 을 반환했으면 True
+                        (행 끝과 구분).
     """
-    __slots__ = ('cursor', 'col_cnt', 'desc_list', 'def_list')
+    __slots__ = ('cursor', 'col_cnt', 'desc_list', 'def_list', 'row_buf', 'row_pos', 'failed')
 
     def __init__(self,
                  cursor:    object,
@@ -193,6 +199,38 @@ class RsFetchInfo:
         self.col_cnt   = col_cnt
         self.desc_list = desc_list
         self.def_list  = def_list
+        self.row_buf:  list = []
+        self.row_pos:  int  = 0
+        self.failed:   bool = False
+
+    def next_row(self) -> tuple | None:
+        """
+        prefetch 버퍼의 다음 행 반환. 버퍼 소진 시 cursor.fetchmany() 로 재충전.
+        더 이상 행이 없으면 None. (DB 예외는 호출한 세션에서 처리)
+        """
+        if self.row_pos >= len(self.row_buf):
+            self.row_buf = self.cursor.fetchmany()
+            self.row_pos = 0
+            if not self.row_buf:
+                return None
+
+        row = self.row_buf[self.row_pos]
+        self.row_pos += 1
+        return row
+
+    def next_rows(self, max_rows: int) -> list:
+        """
+        최대 max_rows 행을 원본 값(tuple, NULL = None) 그대로 반환.
+        prefetch 버퍼의 남은 행을 먼저 내보내고, 비어 있으면 cursor.fetchmany(max_rows).
+        빈 리스트 = 더 이상 행 없음.
+        """
+        if self.row_pos < len(self.row_buf):
+            rows = self.row_buf[self.row_pos:self.row_pos + max_rows]
+            self.row_pos += len(rows)
+            return rows
+        self.row_buf = []
+        self.row_pos = 0
+        return self.cursor.fetchmany(max_rows)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -258,12 +296,16 @@ class QueryBindData:
     BIND_FLT  = BindType.BIND_FLT
     BIND_DATE = BindType.BIND_DATE
 
+    # 실행마다 바인드 항목이 생성되므로 슬롯 사용, date/oci_date 는 BIND_DATE 일 때만 의미
+    __slots__ = ("int_data", "str_data", "number_data", "date", "oci_date", "db_date_ptr",
+                 "bind_name", "bind_type", "str_len")
+
     def __init__(self) -> None:
         self.int_data:    int      = 0
         self.str_data:    str      = ""
         self.number_data: float    = 0.0
-        self.date:        datetime.datetime = datetime.datetime.now()
-        self.oci_date:    FrOCIDate = FrOCIDate()
+        self.date:        datetime.datetime | None = None
+        self.oci_date:    FrOCIDate | None = None
         self.db_date_ptr: bytes | None = None   # MySQL MYSQL_TIME 포인터 대체
 
         self.bind_name:   str      = ""
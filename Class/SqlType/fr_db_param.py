@@ -15,15 +15,26 @@ C++ → Python 주요 변환:
   linked-list (m_Next)       → list[DbRecord] 로 내부 관리
   frDbBinder enum            → DbBinder.BindType (IntEnum)
   atoi/atol/atof             → int() / float()
+
+컬럼 모드 (C++ 원본 없음):
+  DbParam(columnar=True) 이면 세션이 결과를 DB 드라이버의 Python 타입 그대로
+  컬럼별 시퀀스로 적재 (행마다 str 변환 / DbRecord 생성 없음).
+  get_column() / get_typed_value() 로 타입 값을 읽고,
+  기존 레코드 접근자(get_value_at, get_value, next + bind 등)는 조회 시점에 str 로 변환하는 뷰.
 """
 
 import logging
 from enum import IntEnum
-from typing import Optional
+from typing import Any, Callable, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
 
+def db_value_to_str(val: Any) -> str:
+    """DB 값 → DbRecord 문자열 (None → '')."""
+    return "" if val is None else str(val)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # DbRecord  (C++ frDbRecord 대응)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -92,9 +103,11 @@ class DbParam:
 
     C++ linked-list(m_Record→m_Next) → Python list[DbRecord] 로 변환.
     get_value() 의 char*** 반환     → list[list[str]] 로 변환.
+
+    columnar=True 이면 결과를 컬럼별 타입 값으로 보관 (set_columns).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, columnar: bool = False) -> None:
         self._query:      str            = ""
         self._records:    list[DbRecord] = []
         self._cur_idx:    int            = 0      # Rewind/Next 커서
@@ -102,6 +115,12 @@ class DbParam:
         self._binders:    list[DbBinder] = []
         self._result_cache: list[list[str]] | None = None  # get_value() 캐시
 
+        # 컬럼 모드
+        self._columnar:   bool                        = columnar
+        self._col_names:  list[str]                   = []
+        self._columns:    list[Sequence[Any]] | None  = None
+        self._to_str:     Callable[[Any], str]        = db_value_to_str
+
     # ------------------------------------------------------------------ #
     # 쿼리 설정
     # ------------------------------------------------------------------ #
@@ -119,6 +138,8 @@ class DbParam:
     # ------------------------------------------------------------------ #
     def get_row(self) -> int:
         """C++ GetRow() 대응."""
+        if self._columns is not None:
+            return len(self._columns[0]) if self._columns else 0
         return len(self._records)
 
     def get_col(self) -> int:
@@ -143,8 +164,75 @@ class DbParam:
 
     def get_record_head(self) -> DbRecord | None:
         """C++ GetRecordHead() 대응."""
+        if self._columns is not None:
+            return self._make_record(0) if self.get_row() else None
         return self._records[0] if self._records else None
 
+    # ------------------------------------------------------------------ #
+    # 컬럼 모드
+    # ------------------------------------------------------------------ #
+    def is_columnar(self) -> bool:
+        return self._columnar
+
+    def set_columnar(self, columnar: bool) -> None:
+        """다음 execute 부터 적용."""
+        self._columnar = columnar
+
+    def set_columns(self, names: list[str], columns: list[Sequence[Any]],
+                    to_str: Callable[[Any], str] | None = None) -> None:
+        """
+        세션에서 호출 : 컬럼별 결과 적재.
+          columns : columns[col][row] (컬럼마다 길이 동일)
+          to_str  : 레코드 접근자용 str 변환 (세션의 기존 변환 규칙)
+        """
+        self._col_names    = list(names)
+        self._columns      = columns
+        self._col          = len(columns)
+        self._to_str       = to_str or db_value_to_str
+        self._result_cache = None
+
+    def get_col_names(self) -> list[str]:
+        return self._col_names
+
+    def get_str_converter(self) -> Callable[[Any], str]:
+        """레코드 접근자가 사용하는 세션의 str 변환 함수."""
+        return self._to_str
+
+    def get_col_index(self, name: str) -> int:
+        """컬럼 이름 → 0-based 인덱스 (대소문자 무시, 없으면 -1)."""
+        name = name.upper()
+        for i, col_name in enumerate(self._col_names):
+            if col_name.upper() == name:
+                return i
+        return -1
+
+    def get_column(self, col: int | str) -> Sequence[Any] | None:
+        """
+        컬럼 전체 (타입 값). col : 0-based 인덱스 또는 컬럼 이름.
+        레코드 모드 결과는 None.
+        """
+        if self._columns is None:
+            return None
+        idx = self.get_col_index(col) if isinstance(col, str) else col
+        if idx < 0 or idx >= self._col:
+            return None
+        return self._columns[idx]
+
+    def get_typed_value(self, row: int, col: int | str) -> Any:
+        """(row, col) 타입 값. 레코드 모드면 str 값."""
+        if self._columns is None:
+            return self.get_value_at(row, col) if isinstance(col, int) else None
+        column = self.get_column(col)
+        if column is None or row >= len(column):
+            return None
+        return column[row]
+
+    def _make_record(self, row: int) -> DbRecord:
+        record = DbRecord(self._col)
+        for i, column in enumerate(self._columns):
+            record.set_value(i, self._to_str(column[row]))
+        return record
+
     # ------------------------------------------------------------------ #
     # 값 조회  (C++ GetValue 3종 오버로드)
     # ------------------------------------------------------------------ #
@@ -152,12 +240,16 @@ class DbParam:
         """C++ GetValue(int row, int col) 대응."""
         if row >= self.get_row() or col >= self._col:
             return None
+        if self._columns is not None:
+            return self._to_str(self._columns[col][row])
         return self._records[row].values[col]
 
     def get_row_values(self, row: int) -> list[str] | None:
         """C++ GetValue(int row) → char** 대응."""
         if row >= self.get_row():
             return None
+        if self._columns is not None:
+            return [self._to_str(column[row]) for column in self._columns]
         return self._records[row].values
 
     def get_value(self) -> list[list[str]] | None:
@@ -166,6 +258,13 @@ class DbParam:
         buf[row][col] 형태의 2D 리스트 반환 (캐시).
         QueryResult.buf 에 직접 대입해서 사용.
         """
+        if self._columns is not None:
+            if not self.get_row():
+                return None
+            if self._result_cache is None:
+                to_str = self._to_str
+                self._result_cache = [[to_str(v) for v in row] for row in zip(*self._columns)]
+            return self._result_cache
         if not self._records:
             return None
         if self._result_cache is None:
@@ -201,9 +300,12 @@ class DbParam:
         현재 레코드의 값을 바인더에 복사하고 커서를 전진.
         바인더가 없어도 커서만 전진하여 True 반환.
         """
-        if self._cur_idx >= len(self._records):
+        if self._cur_idx >= self.get_row():
             return False
-        self._eval(self._records[self._cur_idx])
+        if self._columns is not None:
+            self._eval_typed(self._cur_idx)
+        else:
+            self._eval(self._records[self._cur_idx])
         self._cur_idx += 1
         return True
 
@@ -226,6 +328,25 @@ class DbParam:
             except (ValueError, IndexError) as e:
                 logger.warning("DbParam._eval bind error col=%d: %s", col, e)
 
+    def _eval_typed(self, row: int) -> None:
+        """컬럼 모드 _eval : 타입이 맞으면 변환 없이 복사."""
+        for binder in self._binders:
+            col = binder.col - 1
+            if col < 0 or col >= self._col:
+                continue
+            value = self._columns[col][row]
+            try:
+                if binder.bind_type == DbBinder.BindType.STRING:
+                    binder.var[0] = self._to_str(value)
+                elif binder.bind_type in (DbBinder.BindType.INT, DbBinder.BindType.LONG):
+                    binder.var[0] = value if type(value) is int else (int(value) if value not in (None, "") else 0)
+                elif binder.bind_type == DbBinder.BindType.FLOAT:
+                    binder.var[0] = float(value) if value not in (None, "") else 0.0
+                else:
+                    binder.var[0] = value
+            except (ValueError, TypeError) as e:
+                logger.warning("DbParam._eval_typed bind error col=%d: %s", col, e)
+
     # ------------------------------------------------------------------ #
     # 초기화
     # ------------------------------------------------------------------ #
@@ -234,5 +355,7 @@ class DbParam:
         self._binders.clear()
         self._records.clear()
         self._result_cache = None
+        self._col_names = []
+        self._columns   = None
         self._col     = 0
         self._cur_idx = 0
\ No newline at end of file
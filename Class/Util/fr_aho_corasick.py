@@ -0,0 +1,110 @@
+"""
+fr_aho_corasick.py  (Python 신규 모듈, C++ 원본 없음)
+
+다중 패턴(Aho-Corasick) 문자열 매처.
+  - 패턴 목록으로 오토마톤을 한 번 구성 (build)
+  - 텍스트를 한 번만 스캔하여 포함된 모든 패턴 번호를 반환 (search_all)
+  - 반환 값은 build 에 넘긴 패턴의 0-based 인덱스
+
+구현:
+  - goto / fail 링크로 트라이를 만든 뒤, 전이 함수를 DFA 로 펼쳐
+    스캔 시 fail 링크를 따라가지 않도록 한다. (문자당 dict 조회 1~2회)
+  - 패턴 알파벳에 없는 문자는 항상 루트(0) 상태로 전이
+
+사용 예:
+    ac = AhoCorasick(["ALM", "LM", "CRI"])
+    ac.search_all("*** ALM CRITICAL")   # {0, 1, 2}
+"""
+
+from collections import deque
+from typing import Iterable
+
+
+class AhoCorasick:
+    """여러 부분 문자열을 한 번의 스캔으로 찾는 Aho-Corasick 오토마톤."""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._patterns: list[str]            = []
+        self._delta:    list[dict[str, int]] = [{}]   # state → {char: next state} (비루트 상태는 루트와 다른 전이만)
+        self._output:   list[tuple[int, ...]] = [()]  # state → 매칭된 패턴 인덱스
+        if patterns:
+            self.build(patterns)
+
+    # ------------------------------------------------------------------ #
+    # 구성
+    # ------------------------------------------------------------------ #
+
+    def build(self, patterns: Iterable[str]) -> None:
+        """패턴 목록으로 오토마톤을 (재)구성한다. 빈 패턴은 무시한다."""
+        self._patterns = list(patterns)
+
+        goto:   list[dict[str, int]] = [{}]
+        output: list[list[int]]      = [[]]
+
+        # 1. 트라이
+        for idx, pattern in enumerate(self._patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append([])
+                state = nxt
+            output[state].append(idx)
+
+        # 2. fail 링크 (BFS) + DFA 전이 펼치기
+        #    루트 이외 상태는 루트와 다른 전이만 보관 (루트 알파벳 복사 방지)
+        root  = goto[0]
+        fail  = [0] * len(goto)
+        delta = [root] + [None] * (len(goto) - 1)
+        queue = deque(root.values())
+
+        while queue:
+            state = queue.popleft()
+            base  = delta[fail[state]] if fail[state] else {}
+            trans = dict(base)
+            for ch, nxt in goto[state].items():
+                f = base.get(ch)
+                fail[nxt] = root.get(ch, 0) if f is None else f
+                output[nxt].extend(output[fail[nxt]])
+                trans[ch] = nxt
+                queue.append(nxt)
+            delta[state] = trans
+
+        self._delta  = delta
+        self._output = [tuple(sorted(set(out))) for out in output]
+
+    # ------------------------------------------------------------------ #
+    # 검색
+    # ------------------------------------------------------------------ #
+
+    def search_all(self, text: str) -> set[int]:
+        """text 에 포함된 모든 패턴의 인덱스 집합을 반환한다."""
+        delta    = self._delta
+        output   = self._output
+        root_get = delta[0].get
+        found: set[int] = set()
+        state = 0
+
+        for ch in text:
+            nxt   = delta[state].get(ch)
+            state = root_get(ch, 0) if nxt is None else nxt
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def get_pattern(self, idx: int) -> str:
+        return self._patterns[idx]
+
+    def pattern_count(self) -> int:
+        return len(self._patterns)
+
+    def state_count(self) -> int:
+        return len(self._delta)
+
+    def __repr__(self) -> str:
+        return f"AhoCorasick(patterns={len(self._patterns)}, states={len(self._delta)})"
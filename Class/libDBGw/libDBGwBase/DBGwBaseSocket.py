@@ -70,9 +70,11 @@ class DBGwBaseSocket(AsSocket):
 
         if msg_id == DB_CONN_REQ:
             msg.ProcPid = socket.htonl(msg.ProcPid)
+            msg.m_BulkCodec = socket.htonl(msg.m_BulkCodec)
 
         elif msg_id == DB_CONN_RES:
             msg.m_Result = socket.htons(msg.m_Result)
+            msg.m_BulkCodec = socket.htonl(msg.m_BulkCodec)
 
         elif msg_id == DB_CLOSE_REQ:
             msg.m_Req = socket.htonl(msg.m_Req)
@@ -144,9 +146,11 @@ class DBGwBaseSocket(AsSocket):
 
         if msg_id == DB_CONN_REQ:
             msg.ProcPid = socket.ntohl(msg.ProcPid)
+            msg.m_BulkCodec = socket.ntohl(msg.m_BulkCodec)
 
         elif msg_id == DB_CONN_RES:
             msg.m_Result = socket.ntohs(msg.m_Result)
+            msg.m_BulkCodec = socket.ntohl(msg.m_BulkCodec)
 
         elif msg_id == DB_CLOSE_REQ:
             msg.m_Req = socket.ntohl(msg.m_Req)
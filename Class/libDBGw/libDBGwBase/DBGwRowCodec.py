@@ -0,0 +1,301 @@
+import sys
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# 4-byte signed int array typecode (column lengths, -1 = NULL)
+_LEN_TYPECODE = 'i' if array('i').itemsize == 4 else 'l'
+_NEED_SWAP = sys.byteorder == 'little'
+
+_BLOCK_HEAD = struct.Struct('>II')   # rows in block, data size
+
+NULL_LEN = -1
+
+def _cell_bytes(val, to_str):
+    if val is None:
+        return None
+    if isinstance(val, (bytes, bytearray)):
+        return bytes(val)
+    if isinstance(val, str):
+        return val.encode('utf-8')
+    return to_str(val).encode('utf-8')
+
+class DBGwRowCodec:
+    """
+    (No C++ original)
+    Column-length block codec for DB_BULK_QUERY_DATA (BULK_CODEC_COLLEN).
+
+    The bulk stream is a sequence of blocks of up to ROWS_PER_BLOCK rows:
+        [RowCnt(4)][DataSize(4)]                    Big-Endian
+        [Len(4) x RowCnt*ColCnt]                    Big-Endian int32, -1 = NULL
+        [Data(DataSize)]                            cell bytes
+    Inside a block, lengths and data are laid out column by column
+    (all rows of col 0, then col 1, ...).
+    A stream (QUERY_REQ_TYPE_STREAM) ends with an end block :
+        [0][ErrLen(4)][Error(ErrLen)]               ErrLen 0 = success
+    The legacy format ([Len][Data] per cell, row by row) is still used for
+    clients that did not negotiate the codec at DB_CONN_REQ.
+    """
+    ROWS_PER_BLOCK = 512
+
+    @staticmethod
+    def encode_columns(columns, to_str=str, rows_per_block=0):
+        """
+        Encodes a columnar result (DbParam columnar mode : columns[col][row]).
+        None is sent as NULL, bytes as-is, str as UTF-8, others via to_str().
+        """
+        block_rows = rows_per_block if rows_per_block > 0 else DBGwRowCodec.ROWS_PER_BLOCK
+        row_cnt = len(columns[0]) if columns else 0
+        for col in columns:
+            if len(col) != row_cnt:
+                raise ValueError(f"column has {len(col)} rows, expected {row_cnt}")
+
+        out = bytearray()
+        for first in range(0, row_cnt, block_rows):
+            last = min(first + block_rows, row_cnt)
+            lens = array(_LEN_TYPECODE)
+            cells = []
+            for col in columns:
+                chunk = [val.encode('utf-8') if val.__class__ is str else _cell_bytes(val, to_str)
+                         for val in col[first:last]]
+                lens.extend([NULL_LEN if cell is None else len(cell) for cell in chunk])
+                cells.extend(chunk)
+            data = b''.join([cell for cell in cells if cell])
+            out += _BLOCK_HEAD.pack(last - first, len(data))
+            if _NEED_SWAP:
+                lens.byteswap()
+            out += lens.tobytes()
+            out += data
+        return out
+
+    @staticmethod
+    def encode_rows(rows, col_cnt, to_str=str, rows_per_block=0):
+        """
+        Encodes a sequence of rows (each a sequence of col_cnt values).
+        """
+        for row in rows:
+            if len(row) != col_cnt:
+                raise ValueError(f"row has {len(row)} columns, expected {col_cnt}")
+        columns = [list(col) for col in zip(*rows)] if rows else [[] for _ in range(col_cnt)]
+        return DBGwRowCodec.encode_columns(columns, to_str, rows_per_block)
+
+    @staticmethod
+    def encode_end(error=""):
+        """
+        End block of a stream. A non-empty error means the fetch failed mid-stream.
+        """
+        data = error.encode('utf-8')
+        return _BLOCK_HEAD.pack(0, len(data)) + data
+
+    @staticmethod
+    def decode(data, col_cnt, row_cnt=-1):
+        """
+        Returns a BulkRowSet over data (rows are decoded on access).
+        Returns None if the block framing is broken or row_cnt does not match.
+        """
+        row_set = BulkRowSet(data, col_cnt)
+        if not row_set.is_valid():
+            return None
+        if row_cnt >= 0 and len(row_set) != row_cnt:
+            return None
+        return row_set
+
+class BulkRowSet:
+    """
+    (No C++ original)
+    Lazy view over a BULK_CODEC_COLLEN stream.
+    Only the block headers are read up front; a block's length array and cell
+    offsets are built the first time one of its rows is accessed.
+    row values : str, or None for NULL.
+    """
+    def __init__(self, data, col_cnt):
+        self.m_View = memoryview(data)
+        self.m_ColCnt = col_cnt
+        self.m_RowCnt = 0
+        self.m_Valid = True
+
+        # per block : [first row, rows, len offset, data offset, lens, cell offsets]
+        self.m_Blocks = []
+        self.m_BlockStarts = []
+        self._index_blocks()
+
+    def _index_blocks(self):
+        view = self.m_View
+        total = len(view)
+        offset = 0
+        while offset < total:
+            if offset + _BLOCK_HEAD.size > total:
+                self.m_Valid = False
+                return
+            rows, data_size = _BLOCK_HEAD.unpack_from(view, offset)
+            len_offset = offset + _BLOCK_HEAD.size
+            data_offset = len_offset + rows * self.m_ColCnt * 4
+            offset = data_offset + data_size
+            if offset > total:
+                self.m_Valid = False
+                return
+            self.m_BlockStarts.append(self.m_RowCnt)
+            self.m_Blocks.append([self.m_RowCnt, rows, len_offset, data_offset, None, None])
+            self.m_RowCnt += rows
+
+    def is_valid(self):
+        return self.m_Valid
+
+    def get_col(self):
+        return self.m_ColCnt
+
+    def get_row(self):
+        return self.m_RowCnt
+
+    def __len__(self):
+        return self.m_RowCnt
+
+    def _block_of(self, row):
+        # Blocks are ROWS_PER_BLOCK rows except the last one -> direct index, bisect fallback
+        blocks = self.m_Blocks
+        if blocks:
+            idx = row // blocks[0][1] if blocks[0][1] else 0
+            if idx < len(blocks) and blocks[idx][0] <= row < blocks[idx][0] + blocks[idx][1]:
+                return blocks[idx]
+        return blocks[bisect_right(self.m_BlockStarts, row) - 1]
+
+    def _load_block(self, block):
+        if block[4] is None:
+            first, rows, len_offset, data_offset = block[:4]
+            cell_cnt = rows * self.m_ColCnt
+            lens = array(_LEN_TYPECODE)
+            lens.frombytes(self.m_View[len_offset:len_offset + cell_cnt * 4])
+            if _NEED_SWAP:
+                lens.byteswap()
+            # cell offsets relative to the block data, NULL cells are empty
+            if NULL_LEN in lens:
+                offsets = list(accumulate([n if n > 0 else 0 for n in lens], initial=0))
+            else:
+                offsets = list(accumulate(lens, initial=0))
+            block[4] = lens
+            block[5] = offsets
+        return block
+
+    def _block_values(self, block):
+        """
+        All cells of a block as a flat list of str / None (column by column).
+        ASCII data (the usual case) is decoded once and sliced.
+        """
+        first, rows, len_offset, data_offset, lens, offsets = self._load_block(block)
+        data = self.m_View[data_offset:data_offset + offsets[-1]].tobytes()
+        ends = offsets[1:]
+        if data.isascii():
+            text = data.decode('ascii')
+            values = [text[a:b] for a, b in zip(offsets, ends)]
+        else:
+            values = [str(data[a:b], 'utf-8', 'ignore') for a, b in zip(offsets, ends)]
+        if NULL_LEN in lens:
+            idx = lens.index(NULL_LEN)
+            try:
+                while True:
+                    values[idx] = None
+                    idx = lens.index(NULL_LEN, idx + 1)
+            except ValueError:
+                pass
+        return values
+
+    def get_raw(self, row, col):
+        """
+        Cell as memoryview (no copy), None for NULL.
+        """
+        if row < 0 or row >= self.m_RowCnt or col < 0 or col >= self.m_ColCnt:
+            return None
+        block = self._load_block(self._block_of(row))
+        cell = col * block[1] + row - block[0]
+        if block[4][cell] == NULL_LEN:
+            return None
+        return self.m_View[block[3] + block[5][cell]:block[3] + block[5][cell + 1]]
+
+    def get_value(self, row, col):
+        raw = self.get_raw(row, col)
+        return None if raw is None else str(raw, 'utf-8', 'ignore')
+
+    def __getitem__(self, row):
+        """
+        One row as a list of str / None.
+        """
+        if row < 0:
+            row += self.m_RowCnt
+        if row < 0 or row >= self.m_RowCnt:
+            raise IndexError(row)
+        block = self._load_block(self._block_of(row))
+        rows = block[1]
+        lens = block[4]
+        offsets = block[5]
+        view = self.m_View
+        base = block[3]
+        return [None if lens[i] == NULL_LEN else str(view[base + offsets[i]:base + offsets[i + 1]], 'utf-8', 'ignore')
+                for i in range(row - block[0], rows * self.m_ColCnt, rows)]
+
+    def __iter__(self):
+        for block in self.m_Blocks:
+            values = self._block_values(block)
+            rows = block[1]
+            columns = [values[cell:cell + rows] for cell in range(0, len(values), rows)]
+            for row in zip(*columns):
+                yield list(row)
+
+class BulkStreamDecoder:
+    """
+    (No C++ original)
+    Incremental decoder for a BULK_CODEC_STREAM result.
+    feed() takes each DB_BULK_QUERY_DATA payload and returns the rows of every
+    block completed by it, so rows are available while later chunks are in flight.
+    Only the current incomplete block is buffered.
+    """
+    def __init__(self, col_cnt):
+        self.m_ColCnt = col_cnt
+        self.m_Buf = bytearray()
+        self.m_RowCnt = 0
+        self.m_End = False
+        self.m_Error = ""
+
+    def feed(self, data):
+        self.m_Buf += data
+        buf = self.m_Buf
+        total = len(buf)
+        offset = 0
+        rows = []
+
+        while not self.m_End and offset + _BLOCK_HEAD.size <= total:
+            row_cnt, data_size = _BLOCK_HEAD.unpack_from(buf, offset)
+            block_end = offset + _BLOCK_HEAD.size + row_cnt * self.m_ColCnt * 4 + data_size
+            if block_end > total:
+                break
+            if row_cnt == 0:
+                self.m_Error = str(buf[offset + _BLOCK_HEAD.size:block_end], 'utf-8', 'ignore')
+                self.m_End = True
+            else:
+                rows.extend(BulkRowSet(bytes(buf[offset:block_end]), self.m_ColCnt))
+                self.m_RowCnt += row_cnt
+            offset = block_end
+
+        del buf[:offset]
+        return rows
+
+    def is_end(self):
+        """
+        True once the end block was received (complete stream).
+        """
+        return self.m_End
+
+    def get_error(self):
+        return self.m_Error
+
+    def get_row(self):
+        return self.m_RowCnt
@@ -13,9 +13,10 @@ if project_root not in sys.path:
 from Class.Common.DbCommon import (
     DB_RS_MOVE_NEXT_REQ, DB_RS_QUERY_DATA, DB_RS_CLOSE_REQ,
     DbRsMoveNextReqT, DbRsQueryDataT, DbRsCloseReqT,
-    DEF_BUF_SIZE
+    DEF_BUF_SIZE, BULK_CODEC_COLLEN, RS_FETCH_ROWS
 )
 from Class.Common.CommType import SEG_ING, SEG_END
+from Class.libDBGw.libDBGwBase.DBGwRowCodec import DBGwRowCodec
 
 # Mock for Framework classes (frDbParam, frDbRecord)
 # Assuming these exist in the framework or need placeholders
@@ -35,10 +36,16 @@ class DBGwRecordSet:
         self.m_DBGwUser = gw_user
         self.m_IsEndRow = False
         self.m_IsValid = False
+        self.m_Error = ""
         
         # C++: m_DbParam = new frDbParam;
         self.m_DbParam = FrDbParam()
 
+        # Batched fetch (BULK_CODEC_COLLEN) : rows received but not yet returned by move_next
+        self.m_FetchSize = RS_FETCH_ROWS
+        self.m_RowBuf = None # BulkRowSet
+        self.m_RowPos = 0
+
     def __del__(self):
         """
         C++: ~DBGwRecordSet()
@@ -66,15 +73,36 @@ class DBGwRecordSet:
         """C++: void SetRow(int Row)"""
         self.m_DbParam.set_row(row)
 
+    def set_fetch_size(self, fetch_size):
+        """
+        (No C++ original)
+        Rows requested per DB_RS_MOVE_NEXT_REQ round trip (0 or 1 : one row per call).
+        Only used when the server negotiated BULK_CODEC_COLLEN.
+        """
+        self.m_FetchSize = max(0, fetch_size)
+
+    def get_fetch_size(self):
+        return self.m_FetchSize
+
     def move_next(self):
         """
         C++: frDbRecord* MoveNext()
         Fetches the next row from the server.
         Handles packet segmentation (re-assembly) if data is large.
+        With a fetch size > 1, rows come in batches and move_next is local until
+        the batch is used up. On a server error m_Error is set and None is returned.
         """
+        if self.m_RowBuf is not None:
+            if self.m_RowPos < len(self.m_RowBuf):
+                return self.next_buffered_record()
+            self.m_RowBuf = None
+
         if self.m_IsEndRow:
             return None
 
+        if self.m_FetchSize > 1 and self.m_DBGwUser.m_BulkCodec >= BULK_CODEC_COLLEN:
+            return self.fetch_batch()
+
         # Prepare Request
         req = DbRsMoveNextReqT()
         req.m_QueryId = self.m_QueryId
@@ -91,6 +119,7 @@ class DBGwRecordSet:
             
             # Error Case
             if query_data.m_Size == -1:
+                self.set_error_data(query_data)
                 return record
 
             # End of Record Set
@@ -138,6 +167,81 @@ class DBGwRecordSet:
 
         return record
 
+    def fetch_batch(self):
+        """
+        (No C++ original)
+        Requests up to m_FetchSize rows in one round trip and returns the first one.
+        """
+        req = DbRsMoveNextReqT()
+        req.m_QueryId = self.m_QueryId
+        req.m_Reserved = self.m_FetchSize
+
+        query_data = DbRsQueryDataT()
+        if self.m_DBGwUser.m_DBClientSocket.send_and_wait_packet(
+            DB_RS_MOVE_NEXT_REQ, req, DB_RS_QUERY_DATA, query_data
+        ) <= 0:
+            self.m_Error = "Can't receive record set data"
+            return None
+
+        # Error Case
+        if query_data.m_Size == -1:
+            self.set_error_data(query_data)
+            return None
+
+        # End of Record Set
+        if query_data.m_Size == -2:
+            self.m_IsEndRow = True
+            return None
+
+        data_buf = bytearray(query_data.m_Data[:query_data.m_Size])
+        while query_data.m_SegFlag == SEG_ING:
+            query_data = DbRsQueryDataT()
+            if self.m_DBGwUser.m_DBClientSocket.wait_packet(
+                DB_RS_QUERY_DATA, query_data
+            ) <= 0:
+                self.m_Error = "Can't receive record set data"
+                return None
+            data_buf.extend(query_data.m_Data[:query_data.m_Size])
+
+        row_set = DBGwRowCodec.decode(bytes(data_buf), self.get_col())
+        if row_set is None or len(row_set) == 0:
+            self.m_Error = "Invalid record set data"
+            return None
+
+        self.m_RowBuf = row_set
+        self.m_RowPos = 0
+        return self.next_buffered_record()
+
+    def next_buffered_record(self):
+        """
+        (No C++ original)
+        Next row of the current batch as a FrDbRecord.
+        NULL columns (None in the batch) are "" as in the one-row-per-trip path.
+        """
+        values = self.m_RowBuf[self.m_RowPos]
+        if None in values:
+            values = ["" if value is None else value for value in values]
+
+        record = FrDbRecord()
+        record.m_Col = self.get_col()
+        record.m_Values = values
+        self.m_RowPos += 1
+        self.m_DbParam.add_record(record)
+        return record
+
+    def set_error_data(self, query_data):
+        """
+        (No C++ original)
+        Error text of a DB_RS_QUERY_DATA with m_Size -1.
+        """
+        data = query_data.m_Data
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', errors='ignore')
+        self.m_Error = data or "Record set fetch error"
+
+    def get_error(self):
+        return self.m_Error
+
     def move_first(self):
         """C++: frDbRecord* MoveFirst()"""
         return None
@@ -160,5 +264,7 @@ class DBGwRecordSet:
                 self.m_DBGwUser.m_DBClientSocket.send_packet(DB_RS_CLOSE_REQ, req)
             
             self.m_IsValid = False
+
+        self.m_RowBuf = None
             
         return True
\ No newline at end of file
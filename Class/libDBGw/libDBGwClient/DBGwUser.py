@@ -30,13 +30,14 @@ from Class.Common.DbCommon import (
     DB_COMMIT_REQ, DB_COMMIT_RES, DB_ROLLBACK_REQ, DB_ROLLBACK_RES,
     DB_QUERY_LONG_UPDATE_REQ, DB_QUERY_LONG_UPDATE_RES,
     QUERY_TYPE_SELECT, QUERY_TYPE_UPDATE, QUERY_TYPE_INSERT,
-    QUERY_REQ_TYPE_BULK, QUERY_REQ_TYPE_RS,
+    QUERY_REQ_TYPE_BULK, QUERY_REQ_TYPE_RS, QUERY_REQ_TYPE_STREAM,
     DbConnReqT, DbConnResT, DbCloseReqT,
     DbQueryReqT, DbQueryResT, DbBulkQueryDataT,
     DbCommitResT, DbRollbackResT,
     DbQueryLongUpdateReqT, DbQueryLongUpdateResT,
-    MAX_DATA_SIZE
+    MAX_DATA_SIZE, BULK_CODEC_LEGACY, BULK_CODEC_COLLEN, BULK_CODEC_STREAM
 )
+from Class.libDBGw.libDBGwBase.DBGwRowCodec import DBGwRowCodec, BulkStreamDecoder
 from Class.Common.CommType import NO_SEG, SEG_ING, SEG_END
 
 # Import DBClientSocket
@@ -114,8 +115,11 @@ class DBGwUser:
         
         self.m_Error = ""
         self.m_DBType = eDB_TYPE.eDB_ORACLE_OCI2 # Default assumption
+        self.m_BulkCodec = BULK_CODEC_LEGACY # agreed with the server at DB_CONN_REQ
         
         self.m_SqlLock = threading.Lock()
+        self.m_StreamBusy = False # sql_query_stream iterator open
+        self.m_StreamColCnt = 0
 
     def __del__(self):
         self.close_db()
@@ -157,6 +161,7 @@ class DBGwUser:
             req.DbUser = db_user
             req.DbPasswd = db_passwd
             req.DbName = db_name
+            req.m_BulkCodec = BULK_CODEC_STREAM # old servers ignore it and answer 0
             self.get_local_info(req)
 
             res = DbConnResT()
@@ -172,6 +177,7 @@ class DBGwUser:
                 if ret > 0:
                     self.m_Error = res.m_Error
                     self.m_IsOpen = True if res.m_Result else False
+                    self.m_BulkCodec = getattr(res, 'm_BulkCodec', BULK_CODEC_LEGACY)
 
                     if self.m_IsOpen:
                         self.m_DbGwIp = db_gw_ip
@@ -230,6 +236,8 @@ class DBGwUser:
         Executes a Select query and returns a RecordSet cursor.
         """
         with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                return None
             if not self.m_DBClientSocket:
                 if not self.connect(): return None
 
@@ -269,6 +277,9 @@ class DBGwUser:
         Handles Long Query Segmentation.
         """
         with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                result.m_ErrorString = self.m_Error
+                return False
             if not self.m_DBClientSocket:
                 if not self.connect():
                     result.m_ErrorString = self.m_Error
@@ -292,30 +303,7 @@ class DBGwUser:
             req.m_QueryType = QUERY_TYPE_SELECT
             req.m_SegFlag = NO_SEG
             req.m_QueryReqType = QUERY_REQ_TYPE_BULK
-
-            # Long Query Handling
-            query_len = len(query)
-            if query_len > MAX_DATA_SIZE - 1:
-                # Segmented Sending
-                offset = 0
-                cnt = 0
-                while offset < query_len:
-                    chunk_size = min(MAX_DATA_SIZE - 1, query_len - offset)
-                    req.m_Query = query[offset : offset + chunk_size]
-                    
-                    offset += chunk_size
-                    
-                    if offset < query_len:
-                        req.m_SegFlag = SEG_ING
-                        print(f"### long query send : {cnt}")
-                        self.m_DBClientSocket.send_packet(DB_QUERY_REQ, req)
-                        cnt += 1
-                    else:
-                        req.m_SegFlag = SEG_END
-                        # Last chunk is sent via SendAndWait below
-                        break
-            else:
-                req.m_Query = query
+            self.send_query_segments(req, query)
 
             res = DbQueryResT()
             self.m_DBClientSocket.disable()
@@ -355,11 +343,160 @@ class DBGwUser:
                 return False
             return False
 
+    def send_query_segments(self, req, query):
+        """
+        Long Query Handling : sends all but the last MAX_DATA_SIZE-1 segment of query
+        (SEG_ING) and leaves the last one in req.m_Query for SendAndWait.
+        """
+        query_len = len(query)
+        if query_len > MAX_DATA_SIZE - 1:
+            # Segmented Sending
+            offset = 0
+            cnt = 0
+            while offset < query_len:
+                chunk_size = min(MAX_DATA_SIZE - 1, query_len - offset)
+                req.m_Query = query[offset : offset + chunk_size]
+                
+                offset += chunk_size
+                
+                if offset < query_len:
+                    req.m_SegFlag = SEG_ING
+                    print(f"### long query send : {cnt}")
+                    self.m_DBClientSocket.send_packet(DB_QUERY_REQ, req)
+                    cnt += 1
+                else:
+                    req.m_SegFlag = SEG_END
+                    # Last chunk is sent via SendAndWait below
+                    break
+        else:
+            req.m_Query = query
+
+    def sql_query_stream(self, query):
+        """
+        (No C++ original)
+        Select query as a row iterator : yields each row (list of str / None for NULL)
+        as soon as its DB_BULK_QUERY_DATA block arrives, while the server is still fetching.
+        Servers without BULK_CODEC_STREAM fall back to sql_query (whole result first).
+        After the iteration, m_Error is empty on success.
+        m_SqlLock is taken per block and released before yielding. While the iterator
+        is open the session is busy : other calls on this DBGwUser fail with an error
+        instead of interleaving with the stream. A closed iterator drains the remaining
+        blocks so the connection stays in sync.
+        """
+        if not self.m_DBClientSocket:
+            if not self.connect():
+                return
+
+        with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                return
+            stream = self.m_BulkCodec >= BULK_CODEC_STREAM
+            if stream and not self.stream_begin_no_lock(query):
+                return
+
+        if not stream:
+            result = QueryResult()
+            if self.sql_query(query, result) and result.m_RowCnt > 0:
+                yield from result.m_Buf
+            return
+
+        decoder = BulkStreamDecoder(self.m_StreamColCnt)
+        done = False
+        try:
+            while not done:
+                with self.m_SqlLock:
+                    rows, done = self.stream_fetch_no_lock(decoder)
+                if rows is None:
+                    return
+                yield from rows
+
+            if not decoder.is_end():
+                self.m_Error = "Invalid bulk data"
+            else:
+                self.m_Error = decoder.get_error()
+        finally:
+            with self.m_SqlLock:
+                # Iterator closed early : consume the rest of the stream
+                while not done:
+                    _, done = self.stream_fetch_no_lock(None)
+                self.m_StreamBusy = False
+
+    def is_stream_busy_no_lock(self):
+        """
+        (No C++ original)
+        True (with m_Error set) while a sql_query_stream iterator is open on this session.
+        """
+        if self.m_StreamBusy:
+            self.m_Error = "Stream query in progress"
+            return True
+        return False
+
+    def stream_begin_no_lock(self, query):
+        """
+        (No C++ original)
+        Sends a QUERY_REQ_TYPE_STREAM select and waits for DB_QUERY_RES.
+        On success the session is marked busy until the stream ends (caller holds m_SqlLock).
+        """
+        self.m_Error = ""
+        req = DbQueryReqT()
+        req.m_QueryId = self.m_QueryId
+        self.m_QueryId += 1
+        req.m_QueryType = QUERY_TYPE_SELECT
+        req.m_SegFlag = NO_SEG
+        req.m_QueryReqType = QUERY_REQ_TYPE_STREAM
+        self.send_query_segments(req, query)
+
+        res = DbQueryResT()
+        self.m_DBClientSocket.disable()
+
+        if self.m_DBClientSocket.send_and_wait_packet(
+            DB_QUERY_REQ, req, DB_QUERY_RES, res
+        ) <= 0:
+            self.m_Error = "Can't receive query result"
+            return False
+
+        if res.m_Result != 1:
+            self.m_Error = res.m_Error
+            return False
+
+        self.m_StreamColCnt = res.m_ColCnt
+        self.m_StreamBusy = True
+        return True
+
+    def stream_fetch_no_lock(self, decoder):
+        """
+        (No C++ original)
+        Receives one DB_BULK_QUERY_DATA block of the open stream (caller holds m_SqlLock).
+        Returns (rows, done); rows is None on a receive error (m_Error set),
+        decoder None only discards the block.
+        """
+        if not self.m_DBClientSocket:
+            self.m_Error = "Connection closed during stream"
+            return None, True
+
+        bulk_data = DbBulkQueryDataT()
+        if self.m_DBClientSocket.wait_packet(DB_BULK_QUERY_DATA, bulk_data) < 0:
+            self.m_Error = "Can't receive bulk data"
+            return None, True
+
+        rows = decoder.feed(bulk_data.m_Data) if decoder is not None else []
+        return rows, bulk_data.m_SegFlag != SEG_ING
+
     def decode_bulk_data(self, result, data_buf):
         """
         C++: bool DecodeBulkData(...)
         Decodes the binary result stream into FrDbParam/FrDbRecord structures.
+        With BULK_CODEC_COLLEN, m_Param / m_Buf is a lazy BulkRowSet (row = list of str / None for NULL).
         """
+        if self.m_BulkCodec >= BULK_CODEC_COLLEN:
+            row_set = DBGwRowCodec.decode(data_buf, result.m_ColCnt, result.m_RowCnt)
+            if row_set is None:
+                self.m_Error = "Invalid bulk data"
+                return False
+            result.m_Param = row_set
+            result.m_Buf = row_set
+            return True
+
         result.m_Param = FrDbParam()
         result.m_Param.set_col(result.m_ColCnt)
         
@@ -444,10 +581,14 @@ class DBGwUser:
 
     def execute(self, query, auto_commit):
         with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                return False
             return self.execute_no_lock(query, auto_commit)
 
     def commit(self):
         with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                return False
             if not self.m_DBClientSocket:
                 if not self.connect(): return False
             
@@ -463,6 +604,8 @@ class DBGwUser:
 
     def rollback(self):
         with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                return False
             if not self.m_DBClientSocket:
                 if not self.connect(): return False
             
@@ -482,6 +625,8 @@ class DBGwUser:
         Handles CLOB/BLOB updates by sending segmented data.
         """
         with self.m_SqlLock:
+            if self.is_stream_busy_no_lock():
+                return False
             if not self.m_DBClientSocket:
                 if not self.connect(): return False
             
@@ -20,9 +20,12 @@ from Class.Common.DbCommon import (
     DB_QUERY_LONG_UPDATE_REQ, DB_QUERY_LONG_UPDATE_RES,
     DB_BULK_QUERY_DATA, DB_RS_QUERY_DATA,
     QUERY_TYPE_SELECT, QUERY_TYPE_UPDATE, QUERY_TYPE_INSERT,
-    QUERY_REQ_TYPE_BULK, QUERY_REQ_TYPE_RS,
-    MAX_ERROR_SIZE, MAX_DATA_SIZE, DEF_BUF_SIZE
+    QUERY_REQ_TYPE_BULK, QUERY_REQ_TYPE_RS, QUERY_REQ_TYPE_STREAM,
+    MAX_ERROR_SIZE, MAX_DATA_SIZE, DEF_BUF_SIZE,
+    BULK_CODEC_LEGACY, BULK_CODEC_COLLEN, BULK_CODEC_STREAM, STREAM_FETCH_ROWS
 )
+from Class.libDBGw.libDBGwBase.DBGwRowCodec import DBGwRowCodec
+from Class.SqlType.fr_db_param import DbParam
 
 # Import CommType for SegFlag
 from Class.Common.CommType import NO_SEG, SEG_ING, SEG_END
@@ -67,6 +70,9 @@ except ImportError:
         @staticmethod
         def open(path): print(f"[Log Open] {path}")
 
+# DB sessions are borrowed from a pool shared by every client session with the same connect info
+from Class.Sql.fr_db_session_pool import DbSessionPool
+
 class FrDbRecordSetMap:
     """
     C++: frDbRecordSetMap
@@ -79,8 +85,9 @@ class FrDbRecordSetMap:
         self.clear()
 
     def clear(self):
-        # In Python, clearing the dict allows GC to collect the objects
-        # If RecordSets need explicit close, iterate and close them here.
+        # Close the streaming cursors now instead of waiting for GC
+        for r_set in self.m_Map.values():
+            r_set.close()
         self.m_Map.clear()
 
     def insert(self, query_id, r_set):
@@ -90,10 +97,11 @@ class FrDbRecordSetMap:
         return self.m_Map.get(query_id)
 
     def remove(self, query_id):
-        if query_id in self.m_Map:
-            del self.m_Map[query_id]
-            return True
-        return False
+        r_set = self.m_Map.pop(query_id, None)
+        if r_set is None:
+            return False
+        r_set.close()
+        return True
 
 class DBGwServer:
     """
@@ -104,12 +112,14 @@ class DBGwServer:
     def __init__(self, session, db_kind, default_db_user, default_db_passwd, default_db_name):
         self.m_DbType = db_kind
         self.m_DBServerSession = session
-        self.m_DbSession = None # FrDbSession instance
+        self.m_DbSession = None # DbSession borrowed from m_SessionPool
+        self.m_SessionPool = None
 
         self.m_DbUser = default_db_user
         self.m_DbPasswd = default_db_passwd
         self.m_DbName = default_db_name
         self.m_LogFile = ""
+        self.m_BulkCodec = BULK_CODEC_LEGACY # negotiated at DB_CONN_REQ
         
         self.m_DbRecordSetMap = FrDbRecordSetMap()
 
@@ -117,9 +127,27 @@ class DBGwServer:
         """
         C++: ~DBGwServer()
         """
-        if self.m_DbSession:
-            # self.m_DbSession.close() # Explicit close if needed
-            self.m_DbSession = None
+        self.release_db_session()
+
+    @staticmethod
+    def get_session_pool(db_kind, db_user, db_passwd, db_name, **kwargs):
+        """
+        (No C++ original)
+        Shared DbSessionPool for the connect info (kwargs only apply when the pool is created).
+        DBGwWorkerPool uses it to warm up sessions before the first DB_CONN_REQ.
+        """
+        # Hardcoded IP/Port in C++ snippet (192.168.1.4:3306), applying here
+        return DbSessionPool.get_shared(db_kind, db_user, db_passwd, db_name, "192.168.1.4", 3306, **kwargs)
+
+    def release_db_session(self):
+        """
+        Close open cursors and return the DB session to the shared pool.
+        Uncommitted work is rolled back by the pool.
+        """
+        self.m_DbRecordSetMap.clear()
+        if self.m_DbSession and self.m_SessionPool:
+            self.m_SessionPool.give_back(self.m_DbSession)
+        self.m_DbSession = None
 
     def receive_packet(self, packet):
         """
@@ -166,9 +194,8 @@ class DBGwServer:
 
         print(f"Request connect db({req.DbUser}/{req.DbPasswd}@{req.DbName})")
 
-        # Get DB Session Instance
-        # Assuming FrDbSession singleton/factory pattern matches C++
-        self.m_DbSession = FrDbSession.get_instance()
+        # A reconnect request gives the previous session back first
+        self.release_db_session()
 
         from Class.Common.DbCommon import DbConnResT
         res = DbConnResT()
@@ -181,16 +208,23 @@ class DBGwServer:
         target_passwd = req.DbPasswd if req.DbPasswd else self.m_DbPasswd
         target_name = req.DbName if req.DbName else self.m_DbName
         
-        # Hardcoded IP/Port in C++ snippet (192.168.1.4:3306), applying here
+        # The pool validates the session on borrow and backs off reconnects while the DB is down
         if target_user and target_passwd and target_name:
-             result = self.m_DbSession.connect(target_user, target_passwd, target_name, "192.168.1.4", 3306)
+             self.m_SessionPool = DBGwServer.get_session_pool(self.m_DbType, target_user, target_passwd, target_name)
+             self.m_DbSession = self.m_SessionPool.borrow()
+             result = self.m_DbSession is not None
              if not result:
-                 res.m_Error = self.m_DbSession.get_error()[:MAX_ERROR_SIZE]
+                 res.m_Error = self.m_SessionPool.get_error()[:MAX_ERROR_SIZE]
         else:
             res.m_Error = f"invalid connect info.({req.DbUser}{req.DbPasswd}@{req.DbName})"
             print(res.m_Error)
 
         res.m_Result = 1 if result else 0
+
+        # Bulk codec negotiation : old clients don't send m_BulkCodec (0) and get the legacy format
+        client_codec = getattr(req, 'm_BulkCodec', BULK_CODEC_LEGACY)
+        self.m_BulkCodec = max(BULK_CODEC_LEGACY, min(client_codec, BULK_CODEC_STREAM))
+        res.m_BulkCodec = self.m_BulkCodec
         
         self.m_DBServerSession.send_packet(DB_CONN_RES, res)
 
@@ -244,6 +278,9 @@ class DBGwServer:
                 elif req.m_QueryReqType == QUERY_REQ_TYPE_RS:
                     self.db_query_req_select_rs(req, current_query)
                     return
+                elif req.m_QueryReqType == QUERY_REQ_TYPE_STREAM and self.m_BulkCodec >= BULK_CODEC_STREAM:
+                    self.db_query_req_select_stream(req, current_query)
+                    return
                 else:
                     res.m_Error = "Unknown DbQueryReq Type"
             
@@ -262,6 +299,10 @@ class DBGwServer:
         C++: void DbQueryReqSelectBulk(...)
         Executes Select query and sends ALL results in bulk chunks.
         """
+        if self.m_BulkCodec >= BULK_CODEC_COLLEN:
+            self.db_query_req_select_bulk_codec(req, query_str)
+            return
+
         from Class.Sql.fr_db_session import QueryResult
         result = QueryResult()
         
@@ -292,10 +333,90 @@ class DBGwServer:
 
         self.m_DbSession.free(result)
 
+    def db_query_req_select_bulk_codec(self, req, query_str):
+        """
+        (No C++ original)
+        Bulk select for clients that negotiated BULK_CODEC_COLLEN.
+        The result is loaded column-wise with native types (NULL kept as None)
+        and encoded with DBGwRowCodec.
+        """
+        param = DbParam(columnar=True)
+        param.set_query(query_str)
+
+        start_time = time.time()
+        ok = self.m_DbSession.execute(param)
+        elapsed = time.time() - start_time
+
+        from Class.Common.DbCommon import DbQueryResT
+        res = DbQueryResT()
+        res.m_Result = 1 if ok else 0
+        res.m_QueryId = req.m_QueryId
+        res.m_ColCnt = param.get_col()
+        res.m_RowCnt = param.get_row()
+
+        print(f"query end form DB : elapse[{elapsed:.2f} sec] result = [{res.m_Result}], rowcnt[{res.m_RowCnt}]")
+
+        if not ok:
+            res.m_Error = self.m_DbSession.get_error()[:MAX_ERROR_SIZE]
+
+        if ok and res.m_RowCnt > 0:
+            columns = [param.get_column(col) for col in range(res.m_ColCnt)]
+            self.send_bulk_data(req.m_QueryId, res, DBGwRowCodec.encode_columns(columns, param.get_str_converter()))
+        else:
+            self.m_DBServerSession.send_packet(DB_QUERY_RES, res)
+
+    def db_query_req_select_stream(self, req, query_str):
+        """
+        (No C++ original)
+        Pipelined bulk select (QUERY_REQ_TYPE_STREAM).
+        QUERY_RES carries only the column count (RowCnt / DataSize 0), then rows are
+        fetched STREAM_FETCH_ROWS at a time from a streaming cursor, encoded as one
+        DBGwRowCodec block each and sent as soon as a full DB_BULK_QUERY_DATA chunk
+        is ready. The stream ends with the codec end block (error text if the fetch failed).
+        Only one fetch batch and one chunk are held in memory.
+        """
+        from Class.Common.DbCommon import DbQueryResT
+        res = DbQueryResT()
+        res.m_QueryId = req.m_QueryId
+
+        start_time = time.time()
+        r_set = self.m_DbSession.execute_rs(query_str)
+        if r_set is None or not r_set.is_valid():
+            res.m_Result = 0
+            res.m_Error = self.m_DbSession.get_error()[:MAX_ERROR_SIZE]
+            self.m_DBServerSession.send_packet(DB_QUERY_RES, res)
+            return
+
+        res.m_Result = 1
+        res.m_ColCnt = r_set.get_col()
+        self.m_DBServerSession.send_packet(DB_QUERY_RES, res)
+
+        to_str = r_set.get_str_converter()
+        pending = bytearray()
+        error = ""
+        while True:
+            rows = r_set.fetch_rows(STREAM_FETCH_ROWS)
+            if rows is None:
+                error = (r_set.error or "fetch error")[:MAX_ERROR_SIZE]
+                break
+            if not rows:
+                break
+            pending += DBGwRowCodec.encode_rows(rows, res.m_ColCnt, to_str, len(rows))
+            del pending[:self.send_bulk_chunks(req.m_QueryId, pending, False)]
+
+        pending += DBGwRowCodec.encode_end(error)
+        self.send_bulk_chunks(req.m_QueryId, pending, True)
+        r_set.close()
+
+        elapsed = time.time() - start_time
+        print(f"stream query end : elapse[{elapsed:.2f} sec] rowcnt[{r_set.get_row()}] error[{error}]")
+
     def db_query_req_select_rs(self, req, query_str):
         """
         C++: void DbQueryReqSelectRs(...)
         Executes Select query and stores RecordSet for creating a cursor.
+        The RecordSet streams from the DB cursor (prefetch of RS_FETCH_SIZE rows),
+        so rows are only held while DB_RS_MOVE_NEXT_REQ walks through them.
         """
         r_set = self.m_DbSession.execute_rs(query_str)
         
@@ -309,8 +430,10 @@ class DBGwServer:
             self.m_DbRecordSetMap.insert(req.m_QueryId, r_set)
         else:
             if r_set:
-                res.m_Error = r_set.m_Error[:MAX_ERROR_SIZE]
-                # delete r_set (handled by GC/Framework)
+                res.m_Error = r_set.error[:MAX_ERROR_SIZE]
+                r_set.close()
+            else:
+                res.m_Error = self.m_DbSession.get_error()[:MAX_ERROR_SIZE]
         
         self.m_DBServerSession.send_packet(DB_QUERY_RES, res)
 
@@ -368,23 +491,40 @@ class DBGwServer:
                 # htonl (Big Endian)
                 data_buffer.extend(struct.pack('>I', size))
                 data_buffer.extend(val_bytes)
-        
-        total_size = len(data_buffer)
-        
+
+        self.send_bulk_data(query_id, query_res, data_buffer)
+
+    def send_bulk_data(self, query_id, query_res, data_buffer):
+        """
+        Sends QUERY_RES (DataSize) followed by the encoded data in BULK_QUERY_DATA chunks.
+        """
         # 2. Send Header (QUERY_RES) with DataSize
-        query_res.m_DataSize = total_size
+        query_res.m_DataSize = len(data_buffer)
         self.m_DBServerSession.send_packet(DB_QUERY_RES, query_res)
         
         # 3. Send Body (BULK_QUERY_DATA) in Chunks
+        self.send_bulk_chunks(query_id, data_buffer, True)
+
+    def send_bulk_chunks(self, query_id, data_buffer, last):
+        """
+        Sends data_buffer as BULK_QUERY_DATA chunks of MAX_DATA_SIZE.
+        last=True : sends everything, the final chunk flagged SEG_END.
+        last=False : sends only full chunks (SEG_ING), the remainder is left to the caller.
+        Returns the number of bytes sent.
+        """
         from Class.Common.DbCommon import DbBulkQueryDataT
         
+        total_size = len(data_buffer)
+        if not last:
+            total_size -= total_size % MAX_DATA_SIZE
+
         offset = 0
         while offset < total_size:
             chunk_req = DbBulkQueryDataT()
             chunk_req.m_QueryId = query_id
             
             remaining = total_size - offset
-            if remaining > MAX_DATA_SIZE:
+            if remaining > MAX_DATA_SIZE or not last:
                 chunk_req.m_SegFlag = SEG_ING
                 send_size = MAX_DATA_SIZE
             else:
@@ -398,6 +538,8 @@ class DBGwServer:
             
             offset += send_size
 
+        return total_size
+
     def db_rs_move_next_req(self, req):
         """
         C++: void DbRsMoveNextReq(DB_RS_MOVE_NEXT_REQ_T* Req)
@@ -416,9 +558,40 @@ class DBGwServer:
             self.m_DBServerSession.send_packet(DB_RS_QUERY_DATA, res)
             return
 
+        # Batched fetch : only clients that negotiated the codec send a fetch size
+        if req.m_Reserved > 0 and self.m_BulkCodec >= BULK_CODEC_COLLEN:
+            self.encode_rs_rows_send(req.m_QueryId, r_set, req.m_Reserved)
+            return
+
         record = r_set.move_next()
         self.encode_rs_data_send(req.m_QueryId, r_set.get_row(), record)
 
+    def encode_rs_rows_send(self, query_id, r_set, fetch_rows):
+        """
+        (No C++ original)
+        Sends up to fetch_rows rows of the RecordSet as one DBGwRowCodec block
+        (one DB_RS_MOVE_NEXT_REQ round trip for the whole batch).
+        m_CurRow is the number of rows fetched so far; EOR / error as for a single row.
+        """
+        from Class.Common.DbCommon import DbRsQueryDataT
+
+        rows = r_set.fetch_rows(fetch_rows)
+        if not rows:
+            res = DbRsQueryDataT()
+            res.m_QueryId = query_id
+            res.m_CurRow = r_set.get_row()
+            res.m_SegFlag = NO_SEG
+            if rows is None:
+                res.m_Size = -1 # Error
+                res.m_Data = r_set.error[:MAX_ERROR_SIZE].encode('utf-8')
+            else:
+                res.m_Size = -2 # EOR
+            self.m_DBServerSession.send_packet(DB_RS_QUERY_DATA, res)
+            return
+
+        data_buffer = DBGwRowCodec.encode_rows(rows, r_set.get_col(), r_set.get_str_converter(), len(rows))
+        self.send_rs_data(query_id, r_set.get_row(), data_buffer)
+
     def encode_rs_data_send(self, query_id, row_cnt, record):
         """
         C++: void EncodeRsDataSend(...)
@@ -438,17 +611,24 @@ class DBGwServer:
         # Serialize Record
         data_buffer = bytearray()
         
-        # Iterate record columns
-        # Assuming record has m_Values (list of bytes) and m_ColSize
-        for col_idx in range(record.m_Col):
-            val = record.m_Values[col_idx]
+        # Iterate record columns (DbRecord.values : list of str)
+        for col_idx in range(record.col):
+            val = record.values[col_idx]
             # Ensure val is bytes
             if isinstance(val, str): val = val.encode('utf-8')
             
             size = len(val)
             data_buffer.extend(struct.pack('>I', size))
             data_buffer.extend(val)
-            
+
+        self.send_rs_data(query_id, row_cnt, data_buffer)
+
+    def send_rs_data(self, query_id, row_cnt, data_buffer):
+        """
+        Sends encoded RecordSet data as DB_RS_QUERY_DATA chunks of MAX_DATA_SIZE.
+        """
+        from Class.Common.DbCommon import DbRsQueryDataT
+
         total_size = len(data_buffer)
         offset = 0
         
@@ -478,7 +658,7 @@ class DBGwServer:
         self.m_DbRecordSetMap.remove(req.m_QueryId)
 
     def db_close_req(self, req):
-        pass
+        self.release_db_session()
 
     def db_commit_req(self):
         from Class.Common.DbCommon import DbCommitResT
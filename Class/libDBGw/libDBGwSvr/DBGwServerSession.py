@@ -75,6 +75,10 @@ class DBGwServerSession(AsSocket):
         """
         # Call base class Close()
         self.close() 
+
+        # Give the DB session back to the pool right away instead of waiting for GC
+        if self.m_DBGwSvr:
+            self.m_DBGwSvr.release_db_session()
         
         # m_DBGwSvr->CloseSession(nErrorCode); (Commented out in C++)
         
@@ -0,0 +1,126 @@
+import sys
+import os
+import threading
+import time
+
+# -------------------------------------------------------
+# Project Path Setup
+# -------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '../../..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+class DBGwWorkerPool:
+    """
+    (No C++ original)
+    Threaded session workers used by DBGwMgr instead of fork-per-accept.
+
+    Every accepted session is served by session_handler(session) (the session loop)
+    on its own thread, so a long-lived session never holds up the next one.
+    Modules are imported once, and DB sessions stay warm in the shared
+    DbSessionPool : start() prefills it so DB_CONN_REQ borrows a logged-on session
+    instead of logging on.
+    """
+    def __init__(self, warm_cnt, session_handler, name="DBGwWorker"):
+        self.m_WarmCnt = max(0, warm_cnt)
+        self.m_SessionHandler = session_handler
+        self.m_Name = name
+
+        self.m_Workers = {} # Thread -> Session
+        self.m_WorkerSeq = 0
+        self.m_Running = False
+
+        # Stat
+        self.m_Lock = threading.Lock()
+        self.m_ActiveCnt = 0
+        self.m_ActiveMax = 0
+        self.m_ServedCnt = 0
+        self.m_ErrorCnt = 0
+        self.m_WaitSum = 0.0
+        self.m_WaitMax = 0.0
+
+    def start(self, session_pool=None):
+        """
+        Starts accepting sessions. session_pool (DbSessionPool) is prefilled first.
+        Returns the number of warm DB sessions.
+        """
+        if self.m_Running:
+            return 0
+
+        warm_cnt = session_pool.prefill() if session_pool else 0
+        self.m_Running = True
+
+        print(f"[{self.m_Name}] started, warm db session : {warm_cnt}", flush=True)
+        return warm_cnt
+
+    def stop(self, timeout=5.0):
+        """
+        Stops accepting sessions and waits up to timeout for the sessions being served to end.
+        """
+        if not self.m_Running:
+            return
+        self.m_Running = False
+
+        with self.m_Lock:
+            workers = list(self.m_Workers)
+
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+
+    def submit(self, session):
+        """
+        Serves an accepted session on a new worker thread.
+        Returns False if the pool is stopped or the thread cannot be started.
+        """
+        if not self.m_Running:
+            return False
+
+        with self.m_Lock:
+            self.m_WorkerSeq += 1
+            worker = threading.Thread(target=self.run_worker, args=(session, time.monotonic()),
+                                      name=f"{self.m_Name}_{self.m_WorkerSeq}", daemon=True)
+            self.m_Workers[worker] = session
+
+        try:
+            worker.start()
+        except RuntimeError as e:
+            print(f"[{self.m_Name}] [CORE_ERROR] Worker Start Error: {e}", flush=True)
+            with self.m_Lock:
+                del self.m_Workers[worker]
+            return False
+        return True
+
+    def run_worker(self, session, accept_time):
+        wait = time.monotonic() - accept_time
+        with self.m_Lock:
+            self.m_ActiveCnt += 1
+            self.m_ActiveMax = max(self.m_ActiveMax, self.m_ActiveCnt)
+            self.m_WaitSum += wait
+            self.m_WaitMax = max(self.m_WaitMax, wait)
+
+        try:
+            self.m_SessionHandler(session)
+        except Exception as e:
+            print(f"[{self.m_Name}] Session Error: {e}", flush=True)
+            with self.m_Lock:
+                self.m_ErrorCnt += 1
+        finally:
+            with self.m_Lock:
+                self.m_ActiveCnt -= 1
+                self.m_ServedCnt += 1
+                self.m_Workers.pop(threading.current_thread(), None)
+
+    def get_stat(self):
+        with self.m_Lock:
+            served = self.m_ServedCnt + self.m_ActiveCnt
+            return {
+                "WarmDbSession": self.m_WarmCnt,
+                "Active": self.m_ActiveCnt,
+                "ActiveMax": self.m_ActiveMax,
+                "Served": self.m_ServedCnt,
+                "Error": self.m_ErrorCnt,
+                "AvgWaitMs": self.m_WaitSum * 1000 / served if served else 0.0,
+                "MaxWaitMs": self.m_WaitMax * 1000,
+            }
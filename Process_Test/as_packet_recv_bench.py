@@ -0,0 +1,234 @@
+import sys
+import os
+import random
+import selectors
+import socket
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+for path in (project_root, os.path.join(project_root, 'Class')):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from Common.AsciiMmcType import PacketT, MAX_MSG, MAX_PACKET
+
+PACKET_CNT = 50000
+BURST = 200                 # 라우터가 한 번에 몰아 보내는 패킷 수
+_HDR = struct.Struct("!II")
+_HDR_SIZE = _HDR.size
+_RECV_BUF_SIZE = 65536
+
+# AsSocket 수신 경로 재현 (Common.CommType / Event 모듈이 단독 import 되지 않아 AsSocket 을 직접 생성할 수 없음)
+
+class ExactReader:
+    """
+    기존 : 읽기 이벤트마다 packet_recv 1개, _recv_exact 로 헤더/페이로드 각각 read + buf += chunk
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self.recv_calls = 0
+        self.objects = 0        # 중간 bytes 객체 수 (chunk, 이어 붙인 buf)
+
+    def _recv_exact(self, size):
+        buf = b""
+        while len(buf) < size:
+            self.recv_calls += 1
+            chunk = self.sock.recv(size - len(buf))
+            if not chunk:
+                return None
+            buf += chunk
+            self.objects += 2
+        return buf
+
+    def receive_message(self):
+        hdr = self._recv_exact(_HDR_SIZE)
+        if hdr is None:
+            return None
+        msg_id, length = _HDR.unpack(hdr)
+        msg_id, length = socket.ntohl(msg_id), socket.ntohl(length)
+        if length == 0:
+            return [PacketT(msg_id=msg_id, length=0, msg="")]
+        payload = self._recv_exact(length)
+        if payload is None:
+            return None
+        return [PacketT(msg_id=msg_id, length=length, msg=payload)]
+
+class RingReader:
+    """
+    변경 : 읽기 이벤트마다 recv_into 1회, 완성된 패킷 전부 처리, 미완성 패킷은 링에 보관
+    """
+    def __init__(self, sock, notify_list=None):
+        self.sock = sock
+        self.recv_calls = 0
+        self.objects = 0
+        self.buf = bytearray(_RECV_BUF_SIZE)
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+        self.notify_list = notify_list      # FrEventSrc.m_NotifySensorList 대응
+
+    def fill(self):
+        start, end = self.start, self.end
+        if start == end:
+            start = end = 0
+        elif len(self.buf) - end < MAX_PACKET:
+            self.buf[:end - start] = self.view[start:end]
+            start, end = 0, end - start
+        self.start, self.end = start, end
+        self.recv_calls += 1
+        try:
+            n = self.sock.recv_into(self.view[end:])
+        except BlockingIOError:
+            return None
+        self.end = end + n
+        return n
+
+    def next_frame(self):
+        start = self.start
+        if self.end - start < _HDR_SIZE:
+            return None
+        msg_id, length = _HDR.unpack_from(self.buf, start)
+        msg_id, length = socket.ntohl(msg_id), socket.ntohl(length)
+        if length > MAX_MSG or self.end - start < _HDR_SIZE + length:
+            return None
+        body = start + _HDR_SIZE
+        self.start = body + length
+        self.objects += 1
+        return PacketT(msg_id=msg_id, length=length,
+                       msg=bytes(self.buf[body:self.start]) if length else "")
+
+    def has_buffered_frame(self):
+        avail = self.end - self.start
+        if avail < _HDR_SIZE:
+            return False
+        _, length = _HDR.unpack_from(self.buf, self.start)
+        length = socket.ntohl(length)
+        return length > MAX_MSG or avail >= _HDR_SIZE + length
+
+    def packet_recv(self):
+        # AsSocket.packet_recv : 패킷 1개 반환, 링에 남은 완성 패킷이 있으면 센서 재등록
+        while True:
+            packet = self.next_frame()
+            if packet is not None:
+                if self.notify_list is not None and self.has_buffered_frame():
+                    self.notify_list.append(self)
+                return packet
+            ret = self.fill()
+            if not ret:
+                return None
+
+    def receive_message(self):
+        # AsSocket.receive_message : recv 결과와 무관하게 링의 완성 패킷을 모두 처리
+        ret = self.fill()
+        packets = []
+        while True:
+            packet = self.next_frame()
+            if packet is None:
+                break
+            packets.append(packet)
+        if ret == 0 and not packets:
+            return None
+        return packets
+
+def make_stream():
+    rnd = random.Random(3)
+    frames = []
+    for idx in range(PACKET_CNT):
+        length = 0 if idx % 97 == 0 else rnd.randint(40, 1200)
+        payload = bytes((idx + i) & 0xFF for i in range(length))
+        frames.append(_HDR.pack(socket.htonl(idx & 0xFFFF), socket.htonl(length)) + payload)
+    return frames
+
+def writer(sock, frames):
+    for first in range(0, len(frames), BURST):
+        sock.sendall(b"".join(frames[first:first + BURST]))
+    sock.shutdown(socket.SHUT_WR)
+
+def measure(reader_cls, frames):
+    rsock, wsock = socket.socketpair()
+    thread = threading.Thread(target=writer, args=(wsock, frames))
+    reader = reader_cls(rsock)
+    selector = selectors.DefaultSelector()
+    selector.register(rsock, selectors.EVENT_READ)
+
+    digest = 0
+    received = 0
+    wakeups = 0
+    start = time.perf_counter()
+    thread.start()
+    while received < PACKET_CNT:
+        selector.select()
+        wakeups += 1
+        packets = reader.receive_message()
+        if packets is None:
+            break
+        for packet in packets:
+            msg = packet.msg if isinstance(packet.msg, bytes) else packet.msg.encode()
+            digest = zlib.crc32(msg, zlib.crc32(struct.pack("!I", packet.msg_id), digest))
+            received += 1
+    elapsed = time.perf_counter() - start
+    thread.join()
+    selector.close()
+    rsock.close()
+    wsock.close()
+    return reader, wakeups, received, digest, elapsed
+
+def check_coalesced_reply():
+    # 응답(wait_packet 대상)과 다음 패킷이 한 세그먼트로 도착 : 읽기 이벤트 없이 두 번째 패킷 처리
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    notify_list = deque()
+    reader = RingReader(rsock, notify_list)
+    wsock.sendall(_HDR.pack(socket.htonl(100), socket.htonl(4)) + b"ack!" +
+                  _HDR.pack(socket.htonl(200), socket.htonl(5)) + b"event")
+    time.sleep(0.01)
+
+    reply = reader.packet_recv()
+    selector = selectors.DefaultSelector()
+    selector.register(rsock, selectors.EVENT_READ)
+    no_read_event = not selector.select(0)
+
+    dispatched = []
+    while notify_list:                          # FrEventSrc.dispatch_sensor
+        for packet in notify_list.popleft().receive_message():
+            dispatched.append((packet.msg_id, packet.msg))
+    selector.close()
+    rsock.close()
+    wsock.close()
+    return (reply is not None and reply.msg_id == 100 and no_read_event
+            and dispatched == [(200, b"event")])
+
+def main():
+    print(">> AsSocket Packet Receive Benchmark Start\n")
+    frames = make_stream()
+    print(f"[1] {PACKET_CNT} packets (0~1200 B), router bursts of {BURST}\n")
+
+    results = {}
+    for title, cls in (("exact", ExactReader), ("ring", RingReader)):
+        reader, wakeups, received, digest, elapsed = measure(cls, frames)
+        results[title] = (reader, wakeups, received, digest, elapsed)
+        print(f"   {title:<5} : {elapsed * 1000:7.1f} ms, wakeups {wakeups:6d}, "
+              f"recv {reader.recv_calls / received:5.2f}/pkt, objects {reader.objects / received:5.2f}/pkt")
+
+    old, new = results["exact"], results["ring"]
+    same = old[2] == new[2] == PACKET_CNT and old[3] == new[3]
+    syscall_old = (old[1] + old[0].recv_calls) / PACKET_CNT
+    syscall_new = (new[1] + new[0].recv_calls) / PACKET_CNT
+    print(f"\n[2] Same packets : {same}, syscalls/pkt {syscall_old:.2f} -> {syscall_new:.3f} "
+          f"({syscall_old / syscall_new:.0f}x), objects/pkt {old[0].objects / PACKET_CNT:.2f} -> "
+          f"{new[0].objects / PACKET_CNT:.2f}, time {old[4] / new[4]:.1f}x faster")
+
+    coalesced_ok = check_coalesced_reply()
+    print(f"\n[3] Reply + next packet in one segment, next packet dispatched without read event : {coalesced_ok}")
+
+    ok = same and coalesced_ok and syscall_new * 3 < syscall_old and new[0].objects * 3 < old[0].objects
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
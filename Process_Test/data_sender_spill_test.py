@@ -0,0 +1,178 @@
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import types
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+class WakeSensor:
+    """
+    FrMsgSensor 대체 : 깨우기 횟수만 기록
+    (Class.Event 모듈이 단독 import 되지 않아 DataSender 의 World / Pipe 를 생성할 수 없음)
+    """
+    def __init__(self, owner, world):
+        self.m_SendCnt = 0
+
+    def send_event(self, message, addition_info=None):
+        self.m_SendCnt += 1
+        return True
+
+sys.modules.setdefault('Class.Event.fr_thread_world', types.SimpleNamespace(FrThreadWorld=object))
+sys.modules.setdefault('Class.Event.fr_msg_sensor', types.SimpleNamespace(FrMsgSensor=WakeSensor))
+
+from Class.ProcParser.ParserType import ExtractDataInfo
+from Class.ProcParser.LineIndex import LineIndex
+from Class.ProcParser.ExtractDataInfoSpill import ExtractDataInfoSpill
+from Class.ProcParser.DataSender import DataSender
+
+MSG = "HEADER LINE\r\n  FIELD-A = 1\n  FIELD-B = 2\n\nEND;\n"
+RULES = [object(), object(), None]
+
+class TestSender(DataSender):
+    def __init__(self, spill_dir, high_water_mark):
+        super().__init__("CONSUMER01", None)
+        self.m_SpillDir = spill_dir
+        self.m_HighWaterMark = high_water_mark
+
+    def get_spill_file_name(self):
+        return os.path.join(self.m_SpillDir, f"raw.{self.m_Consumer}.spill")
+
+class FailingWriter:
+    """spill 파일 쓰기 실패 (디스크 가득 참 등)"""
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+def make_info(idx):
+    line_index = LineIndex(MSG) if idx % 3 else None
+    return ExtractDataInfo(idx, RULES[idx % len(RULES)], f"IDENT_{idx}_식별", f"NE{idx % 17}",
+                           idx % 5, idx * 100, len(MSG), f"DH{idx % 4}", idx % 2, line_index)
+
+def info_key(info):
+    line_index = info.m_LineIndex
+    offsets = None if line_index is None else (line_index.m_BufLen, line_index.m_BufHash, line_index.m_LineCount,
+                                               list(line_index.m_LineOffset))
+    return (info.m_MsgId, id(info.m_IdentRulePtr), info.m_IdentIdString, info.m_NeId, info.m_PortNo,
+            info.m_FilePos, info.m_MsgSize, info.m_DataHandlerId, info.m_RefCnt, info.m_PushTime, offsets)
+
+def drain(sender, restore_every=0):
+    out = []
+    loop = 0
+    while True:
+        info_list = sender.get_extract_data_info_list()
+        if not info_list:
+            return out
+        loop += 1
+        if restore_every and loop % restore_every == 0:
+            # 연결 끊김 : 처리하지 못한 뒤쪽 절반을 되돌림
+            half = len(info_list) // 2
+            sender.restore_extract_data_info_list(info_list[half:])
+            info_list = info_list[:half]
+        out.extend(info.m_FilePos // 100 for info in info_list)
+
+def check_round_trip(spill_dir):
+    file_name = os.path.join(spill_dir, "round_trip.spill")
+    spill = ExtractDataInfoSpill("CONSUMER01")
+    infos = [make_info(idx) for idx in range(500)]
+    for idx, info in enumerate(infos):
+        info.m_PushTime = idx * 0.5
+
+    ok = spill.open(file_name) and all(spill.append(info) for info in infos) and spill.get_cnt() == len(infos)
+    read_list = []
+    while not spill.is_empty():
+        read_list.extend(spill.read(64))
+    ok = ok and [info_key(info) for info in read_list] == [info_key(info) for info in infos]
+    # 같은 길이의 다른 메시지는 offset 을 재사용하지 않고 다시 scan
+    other = MSG.replace("= 1\n", "=\n 1")
+    ok = ok and all(read.m_LineIndex.with_buffer(MSG).get_line(2) == "  FIELD-A = 1"
+                    and read.m_LineIndex.with_buffer(other).get_line(2) == "  FIELD-A ="
+                    for read in read_list if read.m_LineIndex)
+    ok = ok and not os.path.exists(file_name)
+    print(f"[1] Spill round trip ({len(infos)} entries, line index / rule / utf-8 ids), file removed : {ok}")
+    return ok
+
+def check_order(spill_dir):
+    sender = TestSender(spill_dir, 100)
+    pushed = 0
+    popped = []
+    for step in range(20):
+        for _ in range(150):
+            sender.push_extract_data_info(make_info(pushed))
+            pushed += 1
+        # 일부만 소비 (메모리 큐는 계속 high-water mark 근처)
+        for _ in range(step % 3):
+            popped.extend(info.m_FilePos // 100 for info in sender.get_extract_data_info_list())
+    stat = sender.get_queue_stat()
+    popped.extend(drain(sender, restore_every=4))
+
+    ok = popped == list(range(pushed)) and stat['SpillTotalCnt'] > 0 and stat['MemCnt'] <= 100
+    ok = ok and sender._get_spill_cnt() == 0 and not os.listdir(spill_dir)
+    print(f"[2] {pushed} pushes, high-water 100, spilled {stat['SpillTotalCnt']}, FIFO order with restore : {ok}")
+    return ok
+
+def check_append_fail(spill_dir):
+    sender = TestSender(spill_dir, 50)
+    for idx in range(120):
+        sender.push_extract_data_info(make_info(idx))
+    spilled = sender.m_Spill.get_cnt()
+
+    # spill 중 쓰기 실패 : 이후 항목은 spill 된 항목 뒤에 메모리로 대기
+    write_fp = sender.m_Spill.m_WriteFp
+    sender.m_Spill.m_WriteFp = FailingWriter()
+    for idx in range(120, 160):
+        sender.push_extract_data_info(make_info(idx))
+    sender.m_Spill.m_WriteFp = write_fp
+    for idx in range(160, 200):
+        sender.push_extract_data_info(make_info(idx))
+
+    popped = drain(sender)
+    ok = spilled == 70 and popped == list(range(200)) and not os.listdir(spill_dir)
+    print(f"[3] Spill write fails after {spilled} spilled entries, order kept : {ok}")
+    return ok
+
+def check_threaded(spill_dir):
+    total = 20000
+    sender = TestSender(spill_dir, 500)
+    popped = []
+    done = threading.Event()
+
+    def producer():
+        for idx in range(total):
+            sender.push_extract_data_info(make_info(idx))
+        done.set()
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    while not done.is_set() or sender.get_queue_stat()['Depth']:
+        popped.extend(info.m_FilePos // 100 for info in sender.get_extract_data_info_list())
+    thread.join()
+
+    ok = popped == list(range(total)) and not os.listdir(spill_dir)
+    print(f"[4] Producer / consumer threads, {total} entries, spilled {sender.m_SpillTotalCnt} : {ok}")
+    return ok
+
+def main():
+    print(">> DataSender Spill Test Start\n")
+    spill_dir = tempfile.mkdtemp()
+    try:
+        ok = check_round_trip(spill_dir)
+        ok = check_order(spill_dir) and ok
+        ok = check_append_fail(spill_dir) and ok
+        ok = check_threaded(spill_dir) and ok
+    finally:
+        shutil.rmtree(spill_dir)
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
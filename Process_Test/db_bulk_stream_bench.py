@@ -0,0 +1,182 @@
+import sys
+import os
+import socket
+import sqlite3
+import struct
+import threading
+import time
+import tracemalloc
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Common.DbCommon import MAX_DATA_SIZE, STREAM_FETCH_ROWS
+from Class.SqlType.fr_db_base_type import DbType
+from Class.SqlType.fr_db_param import DbParam
+from Class.Sql.fr_db_result_set import DbRecordSet
+from Class.Sql.fr_mysql_session import MySQLSession
+from Class.libDBGw.libDBGwBase.DBGwRowCodec import DBGwRowCodec, BulkStreamDecoder
+
+ROW_CNT = 200000
+QUERY = "SELECT ID, IP, STATUS, SSHID, SSHPW, LOAD FROM DC_CNF_MANAGER ORDER BY ID"
+
+SEG_ING = 1
+SEG_END = 2
+_CHUNK_HEAD = struct.Struct('>II')   # DB_BULK_QUERY_DATA 대용 : [SegFlag][Size][Data]
+
+def make_db():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE DC_CNF_MANAGER "
+                 "(ID TEXT, IP TEXT, STATUS INTEGER, SSHID TEXT, SSHPW TEXT, LOAD REAL)")
+    conn.executemany("INSERT INTO DC_CNF_MANAGER VALUES (?, ?, ?, ?, ?, ?)",
+                     ((f"MGR{i:07d}", f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", i % 3,
+                       f"user{i % 50}", None if i % 7 == 0 else f"pw{i % 13}", i * 0.25)
+                      for i in range(ROW_CNT)))
+    conn.commit()
+    return conn
+
+def make_session(conn):
+    # MySQLSession 의 execute / _fetch_rows 는 DB-API 커서만 사용 -> SQLite 연결로 대체
+    session = MySQLSession("bench")
+    session._conn = conn
+    session._connect = True
+    return session
+
+def execute_rs(session):
+    # MySQLSession.execute_rs 와 동일 구성 (SSCursor 대신 SQLite 커서)
+    cur = session._conn.cursor()
+    cur.arraysize = STREAM_FETCH_ROWS
+    cur.execute(QUERY)
+    r_set = DbRecordSet(session, int(DbType.MYSQL))
+    r_set._cursor = cur
+    r_set.set_col(len(cur.description))
+    r_set._is_valid = True
+    return r_set
+
+def send_chunks(sock, data, last):
+    # DBGwServer.send_bulk_chunks 대용
+    total = len(data)
+    if not last:
+        total -= total % MAX_DATA_SIZE
+    offset = 0
+    while offset < total:
+        size = min(MAX_DATA_SIZE, total - offset)
+        flag = SEG_END if last and offset + size == total else SEG_ING
+        sock.sendall(_CHUNK_HEAD.pack(flag, size) + data[offset:offset + size])
+        offset += size
+    return total
+
+def recv_exact(sock, size):
+    buf = bytearray()
+    while len(buf) < size:
+        data = sock.recv(size - len(buf))
+        if not data:
+            raise ConnectionError("closed")
+        buf += data
+    return bytes(buf)
+
+def recv_chunk(sock):
+    flag, size = _CHUNK_HEAD.unpack(recv_exact(sock, _CHUNK_HEAD.size))
+    return flag, recv_exact(sock, size)
+
+def server_whole(session, sock):
+    # db_query_req_select_bulk_codec : 전체 결과 적재 -> 전체 인코딩 -> 전송
+    param = DbParam(columnar=True)
+    param.set_query(QUERY)
+    session.execute(param)
+    columns = [param.get_column(col) for col in range(param.get_col())]
+    send_chunks(sock, DBGwRowCodec.encode_columns(columns, param.get_str_converter()), True)
+
+def server_stream(session, sock):
+    # db_query_req_select_stream : STREAM_FETCH_ROWS 단위 fetch -> 블록 인코딩 -> 즉시 전송
+    r_set = execute_rs(session)
+    to_str = r_set.get_str_converter()
+    pending = bytearray()
+    while True:
+        rows = r_set.fetch_rows(STREAM_FETCH_ROWS)
+        if not rows:
+            break
+        pending += DBGwRowCodec.encode_rows(rows, r_set.get_col(), to_str, len(rows))
+        del pending[:send_chunks(sock, pending, False)]
+    pending += DBGwRowCodec.encode_end()
+    send_chunks(sock, pending, True)
+    r_set.close()
+
+def client_whole(sock, col_cnt):
+    # DBGwUser.sql_query : 모든 청크를 이어 붙인 뒤 디코딩
+    data_buf = bytearray()
+    while True:
+        flag, data = recv_chunk(sock)
+        data_buf.extend(data)
+        if flag != SEG_ING:
+            break
+    row_set = DBGwRowCodec.decode(data_buf, col_cnt)
+    yield from row_set
+
+def client_stream(sock, col_cnt):
+    # DBGwUser.sql_query_stream
+    decoder = BulkStreamDecoder(col_cnt)
+    while True:
+        flag, data = recv_chunk(sock)
+        yield from decoder.feed(data)
+        if flag != SEG_ING:
+            break
+    if not decoder.is_end() or decoder.get_error():
+        raise RuntimeError("stream not terminated")
+
+def run(session, server, client):
+    svr_sock, cli_sock = socket.socketpair()
+    start = time.perf_counter()
+    thread = threading.Thread(target=server, args=(session, svr_sock))
+    thread.start()
+
+    first_row = None
+    row_cnt = 0
+    null_cnt = 0
+    for row in client(cli_sock, 6):
+        if first_row is None:
+            first_row = time.perf_counter() - start
+        row_cnt += 1
+        if row[4] is None:
+            null_cnt += 1
+    total = time.perf_counter() - start
+    thread.join()
+    svr_sock.close()
+    cli_sock.close()
+    return first_row, total, row_cnt, null_cnt
+
+def measure(title, session, server, client):
+    # 메모리 (tracemalloc 은 시간 측정과 분리, 서버/클라이언트 스레드 합산)
+    tracemalloc.start()
+    run(session, server, client)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    first_row, total, row_cnt, null_cnt = run(session, server, client)
+    print(f"   {title:<7}: first row {first_row * 1000:7.1f} ms, total {total * 1000:7.1f} ms, "
+          f"peak {peak / 1048576:6.1f} MB, rows {row_cnt} (NULL {null_cnt})")
+    return first_row, total, peak, row_cnt, null_cnt
+
+def main():
+    print(">> DBGw Bulk Stream Benchmark Start\n")
+    conn = make_db()
+    session = make_session(conn)
+    print(f"[1] {ROW_CNT} rows x 6 cols over socketpair (chunk {MAX_DATA_SIZE} bytes, "
+          f"fetch {STREAM_FETCH_ROWS} rows)\n")
+
+    whole = measure("Whole", session, server_whole, client_whole)
+    stream = measure("Stream", session, server_stream, client_stream)
+
+    expect_null = (ROW_CNT + 6) // 7
+    same = whole[3] == stream[3] == ROW_CNT and whole[4] == stream[4] == expect_null
+    print(f"\n[2] Rows identical : {same}, first row {whole[0] / stream[0]:.0f}x sooner, "
+          f"peak memory {whole[2] / stream[2]:.1f}x lower")
+
+    ok = same and stream[0] * 10 < whole[0] and stream[2] * 3 < whole[2]
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import sys
+import os
+import sqlite3
+import time
+import tracemalloc
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.SqlType.fr_db_param import DbParam, DbBinder
+from Class.Sql.fr_mysql_session import MySQLSession
+
+ROW_CNT = 100000
+QUERY = "SELECT ID, IP, STATUS, SSHID, SSHPW, LOAD FROM DC_CNF_MANAGER ORDER BY ID"
+
+def make_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE DC_CNF_MANAGER "
+                 "(ID TEXT, IP TEXT, STATUS INTEGER, SSHID TEXT, SSHPW TEXT, LOAD REAL)")
+    conn.executemany("INSERT INTO DC_CNF_MANAGER VALUES (?, ?, ?, ?, ?, ?)",
+                     ((f"MGR{i:06d}", f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", i % 3,
+                       f"user{i % 50}", None if i % 7 == 0 else f"pw{i % 13}", i * 0.25)
+                      for i in range(ROW_CNT)))
+    conn.commit()
+    return conn
+
+def make_session(conn):
+    # MySQLSession.execute 는 DB-API 커서만 사용 -> SQLite 연결로 대체하여 실제 적재 경로 측정
+    session = MySQLSession("bench")
+    session._conn = conn
+    session._connect = True
+    return session
+
+def load_record(session):
+    param = DbParam()
+    param.set_query(QUERY)
+    session.execute(param)
+    return param
+
+def load_columnar(session):
+    param = DbParam(columnar=True)
+    param.set_query(QUERY)
+    session.execute(param)
+    return param
+
+def use_record(param):
+    # 기존 DbManager.get_manager_info : str 값을 int() 로 재변환
+    total = 0
+    for row in range(param.get_row()):
+        try:
+            total += int(param.get_value_at(row, 2))
+        except ValueError:
+            pass
+    return total
+
+def use_columnar(param):
+    return sum(status for status in param.get_column("STATUS") if status is not None)
+
+def measure(title, session, load, use):
+    # 메모리 (tracemalloc 은 시간 측정과 분리)
+    tracemalloc.start()
+    param = load(session)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del param
+
+    start = time.perf_counter()
+    param = load(session)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = use(param)
+    use_time = time.perf_counter() - start
+
+    print(f"   {title:<9}: load {load_time * 1000:8.1f} ms, use {use_time * 1000:7.1f} ms, "
+          f"retained {retained / 1048576:6.1f} MB, peak {peak / 1048576:6.1f} MB")
+    return param, total
+
+def main():
+    print(">> Columnar DbParam Benchmark Start\n")
+    conn = make_db()
+    session = make_session(conn)
+    print(f"[1] {ROW_CNT} rows x 6 cols, MySQLSession.execute over SQLite\n")
+
+    rec_param, rec_total = measure("Record", session, load_record, use_record)
+    col_param, col_total = measure("Columnar", session, load_columnar, use_columnar)
+
+    # 2. 레코드 접근자 호환 (컬럼 모드 뷰)
+    same_view = (rec_param.get_row() == col_param.get_row()
+                 and rec_param.get_col() == col_param.get_col()
+                 and all(rec_param.get_row_values(r) == col_param.get_row_values(r)
+                         for r in (0, 6, 7, ROW_CNT - 1))
+                 and rec_param.get_value() == col_param.get_value())
+
+    status = [0]
+    col_param.bind(3, status, DbBinder.BindType.INT)
+    col_param.rewind()
+    bind_total = 0
+    while col_param.next():
+        bind_total += status[0]
+
+    print(f"\n[2] Record view identical : {same_view}, STATUS sum record={rec_total} "
+          f"columnar={col_total} bind={bind_total}")
+    print(f"    Column names : {col_param.get_col_names()}, "
+          f"typed (1, LOAD) = {col_param.get_typed_value(1, 'LOAD')!r}")
+
+    ok = same_view and rec_total == col_total == bind_total
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
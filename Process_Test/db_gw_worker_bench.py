@@ -0,0 +1,180 @@
+import sys
+import os
+import socket
+import threading
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.SqlType.fr_db_base_type import DbType
+from Class.Sql.fr_db_session import DbSession
+from Class.Sql.fr_db_session_pool import DbSessionPool
+from Class.libDBGw.libDBGwSvr.DBGwWorkerPool import DBGwWorkerPool
+
+CONN_CNT = 20
+WARM_CNT = 4
+LONG_CNT = WARM_CNT * 4   # 동시에 열려 있는 장기 세션 수 (> WARM_CNT)
+LOGON_MSEC = 30       # DB logon 소요 (네트워크 + 인증)
+REPLY_TIMEOUT = 5.0
+
+class LogonSession(DbSession):
+    """
+    접속 시 LOGON_MSEC 가 걸리는 DB 세션 대용
+    """
+    def __init__(self):
+        super().__init__("bench")
+        self._db_type = DbType.MYSQL
+
+    def connect(self, user, passwd, db_name, db_ip="", db_port=0):
+        time.sleep(LOGON_MSEC / 1000)
+        self._connect = True
+        return True
+
+    def disconnect(self):
+        self._connect = False
+
+    def execute_query(self, query, bind_param=None, auto_commit=True): return True
+    def commit(self): return True
+    def rollback(self): return True
+    def execute_rs(self, query): return None
+    def execute(self, param, bind_param=None): return False
+    def update_long(self, table, field, value, where): return False
+    def _fetch_data(self, fetch_info): return None
+    def _close_cursor(self, cursor): pass
+
+def serve_query(sock, session_pool):
+    # DB_CONN_REQ -> DB_QUERY_REQ 1 회 처리 후 응답
+    query = sock.recv(1024)
+    with session_pool.session() as db:
+        db.execute_query(query.decode())
+    sock.sendall(b"OK")
+    sock.close()
+
+def serve_long_lived(sock, session_pool):
+    # DB_CONN_REQ 로 대여한 DB 세션을 클라이언트가 끊을 때까지 유지 (DBGwServer.release_db_session)
+    query = sock.recv(1024)
+    with session_pool.session() as db:
+        db.execute_query(query.decode())
+        sock.sendall(b"OK")
+        while sock.recv(1024):
+            pass
+    sock.close()
+
+def run_child(fd):
+    # DBGwWorld -sessionid : exec 된 자식이 모듈 import + DB logon 후 세션 처리
+    sock = socket.socket(fileno=fd)
+    pool = DbSessionPool(DbType.MYSQL, "u", "p", "db", min_size=0, max_size=1, session_factory=LogonSession)
+    serve_query(sock, pool)
+    pool.close()
+
+def accept_fork(listen_sock):
+    # DBGwMgr.accept_session : fork + execv
+    client_sock, _ = listen_sock.accept()
+    fd = client_sock.fileno()
+    os.set_inheritable(fd, True)
+    pid = os.fork()
+    if pid == 0:
+        os.execv(sys.executable, [sys.executable, os.path.abspath(__file__), "-child", str(fd)])
+    client_sock.close()
+    return pid
+
+def connect_and_query(port):
+    start = time.perf_counter()
+    sock = socket.create_connection(("127.0.0.1", port))
+    sock.sendall(b"SELECT 1 FROM DUAL")
+    ok = sock.recv(16) == b"OK"
+    sock.close()
+    return time.perf_counter() - start, ok
+
+def run(title, accept, port):
+    latency = []
+    all_ok = True
+    for _ in range(CONN_CNT):
+        result = []
+        client = threading.Thread(target=lambda: result.append(connect_and_query(port)))
+        client.start()
+        accept()
+        client.join()
+        latency.append(result[0][0])
+        all_ok = all_ok and result[0][1]
+    latency.sort()
+    avg = sum(latency) / len(latency) * 1000
+    p95 = latency[int(len(latency) * 0.95) - 1] * 1000
+    print(f"   {title:<7}: accept -> first query avg {avg:7.1f} ms, p95 {p95:7.1f} ms")
+    return avg, all_ok
+
+def check_long_lived(listen_sock, port):
+    # 모든 세션이 열린 채로 각자 첫 응답을 받아야 함 (앞선 세션의 종료를 기다리지 않음)
+    session_pool = DbSessionPool(DbType.MYSQL, "u", "p", "db", min_size=WARM_CNT, max_size=LONG_CNT,
+                                 session_factory=LogonSession)
+    workers = DBGwWorkerPool(WARM_CNT, lambda sock: serve_long_lived(sock, session_pool))
+    workers.start(session_pool)
+
+    clients = []
+    replies = []
+    start = time.perf_counter()
+    for _ in range(LONG_CNT):
+        sock = socket.create_connection(("127.0.0.1", port))
+        sock.settimeout(REPLY_TIMEOUT)
+        workers.submit(listen_sock.accept()[0])
+        sock.sendall(b"SELECT 1 FROM DUAL")
+        clients.append(sock)
+    for sock in clients:
+        try:
+            replies.append(sock.recv(16))
+        except socket.timeout:
+            replies.append(b"")
+    elapsed = (time.perf_counter() - start) * 1000
+    active = workers.get_stat()["Active"]
+
+    for sock in clients:
+        sock.close()
+    workers.stop()
+    stat = workers.get_stat()
+    session_pool.close()
+
+    ok = replies == [b"OK"] * LONG_CNT and active == LONG_CNT and stat["Served"] == LONG_CNT
+    print(f"[3] {LONG_CNT} long-lived sessions open at once ({WARM_CNT} warm DB sessions), "
+          f"all answered in {elapsed:.1f} ms, active {active} : {ok}")
+    return ok
+
+def main():
+    print(">> DBGw Session Worker Benchmark Start\n")
+    print(f"[1] {CONN_CNT} connections, DB logon {LOGON_MSEC} ms, {WARM_CNT} warm DB sessions\n")
+
+    listen_sock = socket.socket()
+    listen_sock.bind(("127.0.0.1", 0))
+    listen_sock.listen(100)
+    port = listen_sock.getsockname()[1]
+
+    pids = []
+    fork_avg, fork_ok = run("Fork", lambda: pids.append(accept_fork(listen_sock)), port)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    session_pool = DbSessionPool(DbType.MYSQL, "u", "p", "db", min_size=WARM_CNT, max_size=WARM_CNT,
+                                 session_factory=LogonSession)
+    workers = DBGwWorkerPool(WARM_CNT, lambda sock: serve_query(sock, session_pool))
+    workers.start(session_pool)
+    worker_avg, worker_ok = run("Workers", lambda: workers.submit(listen_sock.accept()[0]), port)
+    stat = workers.get_stat()
+    workers.stop()
+    session_pool.close()
+
+    print(f"\n[2] speed-up {fork_avg / worker_avg:.0f}x, worker stat : {stat}\n")
+
+    long_ok = check_long_lived(listen_sock, port)
+    listen_sock.close()
+
+    ok = fork_ok and worker_ok and long_ok and worker_avg * 5 < fork_avg and stat["Served"] == CONN_CNT
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "-child":
+        run_child(int(sys.argv[2]))
+    else:
+        main()
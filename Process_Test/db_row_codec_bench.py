@@ -0,0 +1,107 @@
+import sys
+import os
+import struct
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.libDBGw.libDBGwBase.DBGwRowCodec import DBGwRowCodec
+
+ROW_CNT = 100000
+COL_CNT = 6
+
+def make_columns():
+    # DbParam 컬럼 모드 결과 형태 (columns[col][row], NULL = None)
+    return [
+        [f"MGR{i:06d}" for i in range(ROW_CNT)],
+        [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(ROW_CNT)],
+        [i % 3 for i in range(ROW_CNT)],
+        [f"user{i % 50}" for i in range(ROW_CNT)],
+        [None if i % 7 == 0 else ("" if i % 11 == 0 else f"pw{i % 13}") for i in range(ROW_CNT)],
+        [i * 0.25 for i in range(ROW_CNT)],
+    ]
+
+def legacy_encode(rows):
+    # 기존 DBGwServer.encode_bulk_data_send : 셀마다 [Len][Data] (NULL 은 "None")
+    data_buffer = bytearray()
+    for row_data in rows:
+        for val in row_data:
+            if isinstance(val, str):
+                val_bytes = val.encode('utf-8')
+            elif isinstance(val, bytes):
+                val_bytes = val
+            else:
+                val_bytes = str(val).encode('utf-8')
+            data_buffer.extend(struct.pack('>I', len(val_bytes)))
+            data_buffer.extend(val_bytes)
+    return data_buffer
+
+def legacy_decode(data_buf, row_cnt, col_cnt):
+    # 기존 DBGwUser.decode_bulk_data
+    rows = []
+    offset = 0
+    for _ in range(row_cnt):
+        values = []
+        for _ in range(col_cnt):
+            col_len = struct.unpack('>I', data_buf[offset:offset + 4])[0]
+            offset += 4
+            values.append(data_buf[offset:offset + col_len].decode('utf-8', errors='ignore'))
+            offset += col_len
+        rows.append(values)
+    return rows
+
+def timed(func, *args, repeat=3):
+    # 최소값 (repeat 회)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ret = func(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return ret, best
+
+def main():
+    print(">> DBGw Row Codec Benchmark Start\n")
+    columns = make_columns()
+    rows = list(zip(*columns))
+    print(f"[1] {ROW_CNT} rows x {COL_CNT} cols\n")
+
+    legacy_buf, legacy_enc = timed(legacy_encode, rows)
+    codec_buf, codec_enc = timed(DBGwRowCodec.encode_columns, columns)
+    legacy_rows, legacy_dec = timed(legacy_decode, bytes(legacy_buf), ROW_CNT, COL_CNT)
+    row_set, codec_open = timed(DBGwRowCodec.decode, bytes(codec_buf), COL_CNT, ROW_CNT)
+    codec_rows, codec_dec = timed(list, row_set)
+
+    # 단건 접근 : 새 뷰에서 임의 행 100 개만 읽기
+    picks = range(0, ROW_CNT, ROW_CNT // 100)
+    _, codec_pick = timed(lambda: [row for row_set_new in [DBGwRowCodec.decode(bytes(codec_buf), COL_CNT)]
+                                   for row in (row_set_new[r] for r in picks)])
+
+    print(f"   Legacy : size {len(legacy_buf) / 1024:8.1f} KB, encode {legacy_enc:7.1f} ms, "
+          f"decode all {legacy_dec:7.1f} ms")
+    print(f"   Codec  : size {len(codec_buf) / 1024:8.1f} KB, encode {codec_enc:7.1f} ms, "
+          f"decode all {codec_open + codec_dec:7.1f} ms (open {codec_open:.2f} ms), "
+          f"100 rows {codec_pick:.2f} ms")
+
+    # 2. 값 확인 : NULL 과 "" 구분, 나머지는 기존 포맷과 동일
+    expect = [[None if v is None else str(v) for v in row] for row in rows]
+    same_rows = codec_rows == expect
+    null_kept = row_set[0][4] is None and row_set[11][4] == ""
+    legacy_null = legacy_rows[0][4] == "None"
+    same_other = all(legacy_rows[r][c] == codec_rows[r][c]
+                     for r in picks for c in range(COL_CNT) if codec_rows[r][c] is not None)
+    broken = DBGwRowCodec.decode(bytes(codec_buf[:-1]), COL_CNT, ROW_CNT) is None
+
+    print(f"\n[2] Rows identical : {same_rows}, NULL kept (legacy sends 'None') : {null_kept}/{legacy_null}, "
+          f"truncated stream rejected : {broken}")
+
+    ok = (same_rows and null_kept and same_other and broken
+          and codec_enc <= legacy_enc * 1.1 and codec_open + codec_dec < legacy_dec)
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import sys
+import os
+import socket
+import sqlite3
+import struct
+import threading
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Common.DbCommon import RS_FETCH_ROWS
+from Class.SqlType.fr_db_base_type import DbType, RS_FETCH_SIZE
+from Class.Sql.fr_db_result_set import DbRecordSet
+from Class.Sql.fr_mysql_session import MySQLSession
+from Class.libDBGw.libDBGwBase.DBGwRowCodec import DBGwRowCodec
+
+ROW_CNT = 2000
+LATENCY_MSEC = 1.0     # 요청 1회당 주입하는 네트워크 지연 (RTT)
+QUERY = "SELECT ID, IP, STATUS, SSHID, SSHPW FROM DC_CNF_MANAGER ORDER BY ID"
+
+_REQ = struct.Struct('>i')        # DB_RS_MOVE_NEXT_REQ 대용 : [FetchRows] (-1 = 종료)
+_RES = struct.Struct('>ii')       # DB_RS_QUERY_DATA 대용 : [Size(-2 = EOR)][CurRow][Data]
+
+def make_db():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE DC_CNF_MANAGER (ID TEXT, IP TEXT, STATUS INTEGER, SSHID TEXT, SSHPW TEXT)")
+    conn.executemany("INSERT INTO DC_CNF_MANAGER VALUES (?, ?, ?, ?, ?)",
+                     ((f"MGR{i:06d}", f"10.0.{i >> 8 & 255}.{i & 255}", i % 3,
+                       f"user{i % 50}", None if i % 7 == 0 else f"pw{i % 13}")
+                      for i in range(ROW_CNT)))
+    conn.commit()
+    return conn
+
+def make_session(conn):
+    # MySQLSession 의 _fetch_rows 는 DB-API 커서만 사용 -> SQLite 연결로 대체
+    session = MySQLSession("bench")
+    session._conn = conn
+    session._connect = True
+    return session
+
+def execute_rs(session):
+    # MySQLSession.execute_rs 와 동일 구성 (SSCursor 대신 SQLite 커서)
+    cur = session._conn.cursor()
+    cur.arraysize = RS_FETCH_SIZE
+    cur.execute(QUERY)
+    r_set = DbRecordSet(session, int(DbType.MYSQL))
+    r_set._cursor = cur
+    r_set.set_col(len(cur.description))
+    r_set._is_valid = True
+    return r_set
+
+def recv_exact(sock, size):
+    buf = bytearray()
+    while len(buf) < size:
+        data = sock.recv(size - len(buf))
+        if not data:
+            raise ConnectionError("closed")
+        buf += data
+    return bytes(buf)
+
+def legacy_encode(record):
+    # DBGwServer.encode_rs_data_send
+    data_buffer = bytearray()
+    for col_idx in range(record.col):
+        val = record.values[col_idx].encode('utf-8')
+        data_buffer.extend(struct.pack('>I', len(val)))
+        data_buffer.extend(val)
+    return data_buffer
+
+def legacy_decode(col_cnt, data_buf):
+    # DBGwUser.decode_rs_data
+    offset = 0
+    values = []
+    for _ in range(col_cnt):
+        col_len = struct.unpack('>I', data_buf[offset:offset + 4])[0]
+        offset += 4
+        values.append(data_buf[offset:offset + col_len].decode('utf-8', errors='ignore'))
+        offset += col_len
+    return values
+
+def server(session, sock):
+    # DBGwServer.db_rs_move_next_req (지연 주입)
+    r_set = execute_rs(session)
+    while True:
+        fetch_rows = _REQ.unpack(recv_exact(sock, _REQ.size))[0]
+        if fetch_rows < 0:
+            break
+        time.sleep(LATENCY_MSEC / 1000)
+        if fetch_rows > 0:
+            rows = r_set.fetch_rows(fetch_rows)
+            data = DBGwRowCodec.encode_rows(rows, r_set.get_col(), r_set.get_str_converter(),
+                                            len(rows)) if rows else b''
+        else:
+            record = r_set.move_next()
+            data = legacy_encode(record) if record else b''
+        sock.sendall(_RES.pack(len(data) if data else -2, r_set.get_row()) + data)
+    r_set.close()
+
+class BenchRecordSet:
+    """
+    DBGwRecordSet.move_next / fetch_batch 와 동일한 버퍼링 (소켓 직접 사용)
+    """
+    def __init__(self, sock, col_cnt, fetch_size):
+        self.m_Sock = sock
+        self.m_ColCnt = col_cnt
+        self.m_FetchSize = fetch_size
+        self.m_RowBuf = None
+        self.m_RowPos = 0
+        self.m_IsEndRow = False
+        self.m_RoundTrip = 0
+
+    def request(self, fetch_rows):
+        self.m_RoundTrip += 1
+        self.m_Sock.sendall(_REQ.pack(fetch_rows))
+        size, _ = _RES.unpack(recv_exact(self.m_Sock, _RES.size))
+        if size == -2:
+            self.m_IsEndRow = True
+            return None
+        return recv_exact(self.m_Sock, size)
+
+    def move_next(self):
+        if self.m_RowBuf is not None:
+            if self.m_RowPos < len(self.m_RowBuf):
+                return self.next_buffered_row()
+            self.m_RowBuf = None
+        if self.m_IsEndRow:
+            return None
+
+        if self.m_FetchSize > 1:
+            data = self.request(self.m_FetchSize)
+            if data is None:
+                return None
+            self.m_RowBuf = DBGwRowCodec.decode(data, self.m_ColCnt)
+            self.m_RowPos = 0
+            return self.next_buffered_row()
+
+        data = self.request(0)
+        return None if data is None else legacy_decode(self.m_ColCnt, data)
+
+    def next_buffered_row(self):
+        # NULL (None) -> "" : 기존 1행 경로와 같은 값
+        row = self.m_RowBuf[self.m_RowPos]
+        self.m_RowPos += 1
+        if None in row:
+            row = ["" if value is None else value for value in row]
+        return row
+
+    def close(self):
+        self.m_Sock.sendall(_REQ.pack(-1))
+
+def run(session, fetch_size):
+    svr_sock, cli_sock = socket.socketpair()
+    thread = threading.Thread(target=server, args=(session, svr_sock))
+    thread.start()
+
+    r_set = BenchRecordSet(cli_sock, 5, fetch_size)
+    start = time.perf_counter()
+    rows = []
+    while True:
+        row = r_set.move_next()
+        if row is None:
+            break
+        rows.append(row)
+    elapsed = time.perf_counter() - start
+    r_set.close()
+    thread.join()
+    svr_sock.close()
+    cli_sock.close()
+
+    print(f"   fetch {fetch_size:4d} : {elapsed * 1000:8.1f} ms, round trips {r_set.m_RoundTrip:5d}, "
+          f"{elapsed * 1e6 / len(rows):7.1f} us/row")
+    return rows, elapsed
+
+def main():
+    print(">> DBGw RecordSet Batched Fetch Benchmark Start\n")
+    session = make_session(make_db())
+    print(f"[1] {ROW_CNT} rows, {LATENCY_MSEC} ms injected per round trip\n")
+
+    legacy_rows, legacy_time = run(session, 1)
+    batch_rows, batch_time = run(session, RS_FETCH_ROWS)
+    _, big_time = run(session, 1000)
+
+    # 2. 값 확인 : NULL 도 기존과 같이 "" (move_next 호출측 변경 없음)
+    same = len(legacy_rows) == len(batch_rows) == ROW_CNT and list(map(list, legacy_rows)) == batch_rows
+    print(f"\n[2] Rows identical : {same}, speed-up {legacy_time / batch_time:.0f}x "
+          f"(fetch {RS_FETCH_ROWS}), {legacy_time / big_time:.0f}x (fetch 1000)")
+
+    ok = same and batch_time * 10 < legacy_time
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
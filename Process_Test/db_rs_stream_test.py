@@ -0,0 +1,120 @@
+import sys
+import os
+import sqlite3
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.SqlType.fr_db_base_type import RS_FETCH_SIZE
+from Class.Sql import fr_mysql_session
+from Class.Sql.fr_mysql_session import MySQLSession
+
+ROW_CNT = 1000
+QUERY = "SELECT ID, IP, SSHPW FROM DC_CNF_MANAGER ORDER BY ID"
+
+def make_session():
+    # MySQLSession 의 레코드셋 경로는 DB-API 커서만 사용 -> SQLite 연결로 대체
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE DC_CNF_MANAGER (ID TEXT, IP TEXT, SSHPW TEXT)")
+    conn.executemany("INSERT INTO DC_CNF_MANAGER VALUES (?, ?, ?)",
+                     ((f"MGR{i:06d}", f"10.0.{i >> 8 & 255}.{i & 255}",
+                       None if i % 7 == 0 else f"pw{i % 13}") for i in range(ROW_CNT)))
+    conn.commit()
+    session = MySQLSession("test")
+    session._conn = conn
+    session._connect = True
+    return session
+
+class FailingCursor:
+    """fail_after 행 이후 fetchmany 에서 DB 오류 (연결 끊김 등)"""
+    def __init__(self, cursor, fail_after):
+        self.cursor = cursor
+        self.fail_after = fail_after
+        self.fetched = 0
+        self.arraysize = cursor.arraysize
+        self.description = cursor.description
+
+    def fetchmany(self, size=None):
+        if self.fetched >= self.fail_after:
+            raise fr_mysql_session._PyMySQLError(2013, "Lost connection to MySQL server during query")
+        rows = self.cursor.fetchmany(size or self.arraysize)
+        self.fetched += len(rows)
+        return rows
+
+    def close(self):
+        self.cursor.close()
+
+def open_rs(session, fail_after=None):
+    # MySQLSession.execute_rs 와 동일 구성 (SSCursor 대신 SQLite 커서)
+    session._close_open_rs()
+    cur = session._conn.cursor()
+    cur.arraysize = RS_FETCH_SIZE
+    cur.execute(QUERY)
+    if fail_after is not None:
+        cur = FailingCursor(cur, fail_after)
+    return session._make_record_set(cur, QUERY)
+
+def expected_rows(session):
+    return [["" if v is None else v for v in row] for row in session._conn.execute(QUERY)]
+
+def check_stream(session):
+    r_set = open_rs(session)
+    rows = [record.values for record in r_set]
+    ok = rows == expected_rows(session) and r_set.get_row() == ROW_CNT
+    ok = ok and r_set._cursor is None and r_set.error == ""
+    print(f"[1] Stream all rows ({ROW_CNT}, fetch {RS_FETCH_SIZE}) : {ok}")
+    return ok
+
+def check_interleave(session):
+    before = expected_rows(session)
+    r_set = open_rs(session)
+    head = [r_set.move_next().values for _ in range(10)]
+
+    # 같은 세션으로 다른 쿼리 -> 열린 레코드셋은 닫히고 사유가 남아야 함
+    updated = session.execute_query("UPDATE DC_CNF_MANAGER SET IP = '0.0.0.0' WHERE ID = 'MGR000000'")
+    closed = r_set.move_next() is None and r_set._cursor is None and r_set.error != ""
+
+    # 두 번째 레코드셋이 첫 번째를 닫음
+    first = open_rs(session)
+    first.move_next()
+    second = open_rs(session)
+    replaced = first.move_next() is None and first.error != ""
+    rest = [record.values for record in second]
+
+    expect = expected_rows(session)
+    ok = head == before[:10] and updated and closed
+    ok = ok and replaced and rest == expect and second.error == ""
+    print(f"[2] Other query / second record set closes the open one with error : {ok}")
+    return ok
+
+def check_error(session):
+    fail_after = RS_FETCH_SIZE * 2
+    r_set = open_rs(session, fail_after)
+    rows = [record.values for record in r_set]
+    ok = len(rows) == fail_after and "Lost connection" in r_set.error and r_set._cursor is None
+
+    r_set = open_rs(session, fail_after)
+    batches = []
+    while True:
+        batch = r_set.fetch_rows(100)
+        if not batch:
+            break
+        batches.append(batch)
+    ok = ok and batch is None and "Lost connection" in r_set.error
+    ok = ok and sum(len(b) for b in batches) == fail_after
+    print(f"[3] Fetch error mid-stream sets error (move_next / fetch_rows) : {ok}")
+    return ok
+
+def main():
+    print(">> DB RecordSet Stream Test Start\n")
+    session = make_session()
+    ok = check_stream(session)
+    ok = check_interleave(session) and ok
+    ok = check_error(session) and ok
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import sys
+import os
+import threading
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.SqlType.fr_db_base_type import DbType
+from Class.Sql.fr_db_session import DbSession
+from Class.Sql.fr_db_session_pool import DbSessionPool
+
+THREAD_CNT = 4
+RUN_SEC = 3.0
+DOWN_START = 0.5      # DB 장애 구간 (sec)
+DOWN_END = 2.0
+CONNECT_MSEC = 20     # 접속 1회 소요 (장애 시 connect timeout 대용)
+QUERY_MSEC = 1
+MYSQL_SERVER_GONE = 2006
+
+class BrownOutDb:
+    """
+    DOWN_START ~ DOWN_END 동안 접속/쿼리가 실패하는 DB 대용
+    """
+    def __init__(self):
+        self.m_StartTime = time.monotonic()
+        self.m_Lock = threading.Lock()
+        self.m_ConnectCnt = 0
+        self.m_DownConnectCnt = 0
+
+    def is_down(self):
+        elapsed = time.monotonic() - self.m_StartTime
+        return DOWN_START <= elapsed < DOWN_END
+
+    def up_time(self):
+        return self.m_StartTime + DOWN_END
+
+class BrownOutSession(DbSession):
+    def __init__(self, db):
+        super().__init__("bench")
+        self._db_type = DbType.MYSQL
+        self.m_Db = db
+
+    def connect(self, user, passwd, db_name, db_ip="", db_port=0):
+        with self.m_Db.m_Lock:
+            self.m_Db.m_ConnectCnt += 1
+            if self.m_Db.is_down():
+                self.m_Db.m_DownConnectCnt += 1
+        time.sleep(CONNECT_MSEC / 1000)
+        if self.m_Db.is_down():
+            self._error, self._err_code = "Can't connect to MySQL server", 2003
+            return False
+        self._connect = True
+        return True
+
+    def disconnect(self):
+        self._connect = False
+
+    def execute_query(self, query, bind_param=None, auto_commit=True):
+        time.sleep(QUERY_MSEC / 1000)
+        if self.m_Db.is_down():
+            self._error, self._err_code = "MySQL server has gone away", MYSQL_SERVER_GONE
+            self._connect = False
+            return False
+        return True
+
+    def commit(self): return True
+    def rollback(self): return self._connect
+    def execute_rs(self, query): return None
+    def execute(self, param, bind_param=None): return False
+    def update_long(self, table, field, value, where): return False
+    def _fetch_data(self, fetch_info): return None
+    def _close_cursor(self, cursor): pass
+
+class LegacyDbManager:
+    """
+    기존 DbManager.execute_query : 실패 시 즉시 재접속 후 세션을 None 으로 -> 다음 호출에서 다시 재접속
+    """
+    def __init__(self, db):
+        self.m_Db = db
+        self.m_DbSession = BrownOutSession(db)
+        self.m_DbSession.connect("u", "p", "db")
+
+    def get_db_instance(self):
+        if self.m_DbSession:
+            self.m_DbSession.disconnect()
+        self.m_DbSession = BrownOutSession(self.m_Db)
+        return self.m_DbSession.connect("u", "p", "db")
+
+    def execute_query(self, query):
+        if self.m_DbSession is None:
+            self.get_db_instance()
+            return False
+        if self.m_DbSession.execute_query(query):
+            return True
+        self.get_db_instance()
+        self.m_DbSession = None
+        return False
+
+class PoolDbManager:
+    """
+    DbManager + DbSessionPool : 접속 끊김일 때만 세션 교체, 재접속은 풀의 back-off 적용
+    """
+    def __init__(self, pool):
+        self.m_SessionPool = pool
+        self.m_DbSession = pool.borrow()
+
+    def execute_query(self, query):
+        if self.m_DbSession is None:
+            self.m_DbSession = self.m_SessionPool.borrow(timeout=0)
+            if self.m_DbSession is None:
+                return False
+        if self.m_DbSession.execute_query(query):
+            return True
+        if self.m_DbSession.is_db_disconnect_err():
+            self.m_SessionPool.give_back(self.m_DbSession)
+            self.m_DbSession = self.m_SessionPool.borrow(timeout=0)
+        return False
+
+    def release(self):
+        self.m_SessionPool.give_back(self.m_DbSession)
+
+def run(title, db, make_manager):
+    managers = [make_manager() for _ in range(THREAD_CNT)]
+    ok_cnt = [0] * THREAD_CNT
+    recover = [None] * THREAD_CNT
+
+    def worker(index):
+        mgr = managers[index]
+        end_time = db.m_StartTime + RUN_SEC
+        while time.monotonic() < end_time:
+            if mgr.execute_query("UPDATE T SET A = 1"):
+                ok_cnt[index] += 1
+                now = time.monotonic()
+                if recover[index] is None and now >= db.up_time():
+                    recover[index] = now - db.up_time()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREAD_CNT)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    recovered = all(r is not None for r in recover)
+    max_recover = max(r for r in recover) * 1000 if recovered else -1
+    print(f"   {title:<14}: connects during outage={db.m_DownConnectCnt:5d}, total connects={db.m_ConnectCnt:5d}, "
+          f"queries ok={sum(ok_cnt):6d}, recovery={max_recover:7.1f} ms")
+    return managers, recovered
+
+def main():
+    print(">> DbSessionPool Benchmark Start\n")
+    print(f"[1] {THREAD_CNT} threads x {RUN_SEC} sec, DB down {DOWN_START} ~ {DOWN_END} sec "
+          f"(connect {CONNECT_MSEC} ms)\n")
+
+    legacy_db = BrownOutDb()
+    _, legacy_recovered = run("Legacy", legacy_db, lambda: LegacyDbManager(legacy_db))
+
+    pool_db = BrownOutDb()
+    pool = DbSessionPool(DbType.MYSQL, "u", "p", "db", min_size=1, max_size=THREAD_CNT,
+                         backoff_base=0.05, backoff_max=0.4,
+                         session_factory=lambda: BrownOutSession(pool_db))
+    managers, pool_recovered = run("DbSessionPool", pool_db, lambda: PoolDbManager(pool))
+    for mgr in managers:
+        mgr.release()
+
+    stat = pool.get_stat()
+    print(f"\n   Pool stat : {stat}")
+    pool.close()
+
+    ok = (legacy_recovered and pool_recovered
+          and pool_db.m_DownConnectCnt * 5 < legacy_db.m_DownConnectCnt
+          and stat["InUse"] == 0)
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import sys
+import os
+import sqlite3
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.SqlType.fr_db_base_type import DbType, QueryBindData
+from Class.Sql.fr_db_statement import DbStatementRegistry
+
+CALL_CNT = 10000
+PORT_CNT = 500
+DC_STATUS_CMD_PORT = "DC_STATUS_CMD_PORT"
+PORT_ELIMINATION = 4
+
+# DbManager.DB_MANAGER_STATEMENTS 중 update_connection_status 에서 사용하는 문장
+STATEMENTS = {
+    "DELETE_CMD_PORT_BY_SEQUENCE": f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE SEQUENCE = :SEQUENCE",
+    "INSERT_CMD_PORT":
+        f"INSERT INTO {DC_STATUS_CMD_PORT} (SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS) "
+        f"VALUES (:SEQUENCE, :MANAGERID, :CONNECTORID, :EQUIPID, :STATUS)",
+}
+
+class PortStatusInfo:
+    def __init__(self, sequence):
+        self.ManagerId = f"MGR{sequence % 4:02d}"
+        self.ConnectorId = f"CON{sequence % 40:03d}"
+        self.Status = 1 + sequence % 3
+
+def make_db():
+    # cached_statements : Oracle library cache / stmtcachesize 대용 (SQL 텍스트 기준 캐시)
+    conn = sqlite3.connect(":memory:", cached_statements=128)
+    conn.execute(f"CREATE TABLE {DC_STATUS_CMD_PORT} "
+                 f"(SEQUENCE INTEGER, MANAGERID TEXT, CONNECTORID TEXT, EQUIPID TEXT, STATUS INTEGER)")
+    conn.execute(f"CREATE INDEX IDX_SEQ ON {DC_STATUS_CMD_PORT} (SEQUENCE)")
+    return conn
+
+def bind_to_params(bind):
+    # OraSession2._build_name_params 와 동일한 변환
+    params = {}
+    for bd in bind:
+        if bd.bind_type == QueryBindData.BIND_INT:
+            params[bd.bind_name] = bd.int_data
+        else:
+            params[bd.bind_name] = bd.str_data
+    return params
+
+def update_literal(conn, sql_texts, sequence, info):
+    """
+    기존 DbManager : f-string 으로 값이 포함된 SQL 텍스트 생성
+    """
+    del_query = f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE SEQUENCE = {sequence}"
+    sql_texts.add(del_query)
+    conn.execute(del_query)
+
+    if info.Status != PORT_ELIMINATION:
+        ins_query = (
+            f"INSERT INTO {DC_STATUS_CMD_PORT} "
+            f"(SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS) "
+            f"VALUES ({sequence}, '{info.ManagerId}', '{info.ConnectorId}', "
+            f"'{info.ConnectorId}', {info.Status})"
+        )
+        sql_texts.add(ins_query)
+        conn.execute(ins_query)
+    conn.commit()
+
+def update_statement(conn, sql_texts, sequence, info, registry):
+    """
+    DbStatementRegistry : 고정 SQL 텍스트 + BindParamByName
+    """
+    query, bind = registry.get("DELETE_CMD_PORT_BY_SEQUENCE").make_bind_param(
+        DbType.ORACLE_OCI2, {"SEQUENCE": sequence})
+    sql_texts.add(query)
+    conn.execute(query, bind_to_params(bind))
+
+    if info.Status != PORT_ELIMINATION:
+        values = {
+            "SEQUENCE": sequence, "MANAGERID": info.ManagerId,
+            "CONNECTORID": info.ConnectorId, "EQUIPID": info.ConnectorId,
+            "STATUS": info.Status,
+        }
+        query, bind = registry.get("INSERT_CMD_PORT").make_bind_param(DbType.ORACLE_OCI2, values)
+        sql_texts.add(query)
+        conn.execute(query, bind_to_params(bind))
+    conn.commit()
+
+def run(title, func, *args):
+    conn = make_db()
+    sql_texts = set()
+    infos = [PortStatusInfo(seq) for seq in range(PORT_CNT)]
+
+    start = time.perf_counter()
+    for i in range(CALL_CNT):
+        seq = i % PORT_CNT
+        func(conn, sql_texts, seq, infos[seq], *args)
+    elapsed = time.perf_counter() - start
+
+    rows = conn.execute(f"SELECT SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS "
+                        f"FROM {DC_STATUS_CMD_PORT} ORDER BY SEQUENCE").fetchall()
+    conn.close()
+    print(f"   {title:<22}: {elapsed * 1000:8.2f} ms, {elapsed / CALL_CNT * 1000000:6.2f} us/call, "
+          f"distinct SQL text={len(sql_texts)}")
+    return rows
+
+def main():
+    print(">> DbStatement Benchmark Start\n")
+
+    registry = DbStatementRegistry()
+    registry.register_all(STATEMENTS)
+
+    # 1. Render
+    stmt = registry.get("INSERT_CMD_PORT")
+    print(f"[1] Oracle : {stmt.render(DbType.ORACLE_OCI2)[0]}")
+    print(f"    MySQL  : {stmt.render(DbType.MYSQL)[0]}")
+    date_stmt = registry.register("DATE_TEST",
+                                  "UPDATE T SET D = {DATE(:D)}, M = {SYSDATE} WHERE C LIKE 'A:B%' AND I = :I")
+    print(f"    Oracle : {date_stmt.render(DbType.ORACLE_OCI2)}")
+    print(f"    MySQL  : {date_stmt.render(DbType.MYSQL)}")
+
+    # 2. update_connection_status x CALL_CNT (SQLite stand-in)
+    print(f"\n[2] update_connection_status x {CALL_CNT} ({PORT_CNT} ports, SQLite)")
+    literal_rows = run("Literal (f-string)", update_literal)
+    bind_rows = run("Registry (bind)", update_statement, registry)
+
+    ok = literal_rows == bind_rows and len(bind_rows) == PORT_CNT
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
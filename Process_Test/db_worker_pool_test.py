@@ -0,0 +1,184 @@
+import sys
+import os
+import pickle
+import select
+import sqlite3
+import struct
+import tempfile
+import types
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+for path in (project_root, os.path.join(project_root, 'Class', 'Event')):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from fr_list import FrMessageInfo
+from fr_sensor_registry import FrSensorRegistry
+
+JOB_CNT = 400
+KEY_CNT = 7
+WORKER_CNT = 2
+_HDR_FMT = '!I'
+_HDR_SIZE = struct.calcsize(_HDR_FMT)
+
+class PipeSensor:
+    """
+    FrMsgSensor 대체 : FrWorld.send_event -> FrWorldPipe.write_message / receive_message 경로를 그대로 재현
+    (FrMessageInfo pickle + 길이 헤더를 OS 파이프로 전송, 수신 측은 sensor_id 로 센서를 찾아 recv_event)
+    (fr_world / fr_sensor 가 단독 import 되지 않아 FrWorldPipe 를 직접 생성할 수 없음)
+    """
+    def __init__(self, owner, world):
+        self.m_Owner = owner
+        self.m_ReadFd, self.m_WriteFd = os.pipe()
+        self.m_SendCnt = 0
+        FrSensorRegistry.register(self)
+
+    def send_event(self, message, addition_info=None):
+        # FrWorldPipe.write_message
+        payload = pickle.dumps(FrMessageInfo(message, self, addition_info))
+        os.write(self.m_WriteFd, struct.pack(_HDR_FMT, len(payload)) + payload)
+        self.m_SendCnt += 1
+        return True
+
+    def receive_message(self, timeout):
+        # FrWorldPipe.receive_message / _dispatch. False : timeout
+        if not select.select([self.m_ReadFd], [], [], timeout)[0]:
+            return False
+        (payload_len,) = struct.unpack(_HDR_FMT, os.read(self.m_ReadFd, _HDR_SIZE))
+        info = pickle.loads(os.read(self.m_ReadFd, payload_len))
+        FrSensorRegistry.find(info.sensor_id).m_Owner.recv_message(info.message, info.addition_info)
+        return True
+
+    def close(self):
+        os.close(self.m_ReadFd)
+        os.close(self.m_WriteFd)
+
+sys.modules.setdefault('Class.Event.fr_msg_sensor',
+                       types.SimpleNamespace(FrMsgSensor=PipeSensor))
+
+from Class.ProcNaServer.DbWorkerPool import DbWorkerPool
+
+class SqliteDbManager:
+    """작업 스레드 전용 DbManager : update_data_handler_status 대응 쿼리만 제공"""
+    def __init__(self, path):
+        self.m_Conn = sqlite3.connect(path, isolation_level=None)
+        self.m_ErrorMsg = ""
+
+    def get_error_msg(self):
+        return self.m_ErrorMsg
+
+    def execute(self, sql, args=()):
+        try:
+            self.m_Conn.execute(sql, args)
+        except sqlite3.Error as e:
+            self.m_ErrorMsg = str(e)
+            return False
+        return True
+
+    def update_status(self, proc_id, status):
+        return self.execute("UPDATE DC_CNF_DATAHANDLER SET STATUS = ? WHERE ID = ?", (status, proc_id))
+
+    def dis_connection(self):
+        self.m_Conn.close()
+
+class World:
+    def __init__(self):
+        self.m_ErrorList = []
+
+    def send_ascii_error(self, level, msg):
+        self.m_ErrorList.append(msg)
+
+class TestPool(DbWorkerPool):
+    def __init__(self, world, path):
+        super().__init__(world, None, WORKER_CNT)
+        self.m_Path = path
+
+    def create_db_manager(self, index):
+        return SqliteDbManager(self.m_Path)
+
+    def pump(self, done):
+        """World 스레드 : done() 이 참이 될 때까지 World Pipe 메시지 처리"""
+        while not done():
+            if not self.m_DoneSensor.receive_message(5):
+                return False
+        return True
+
+def check_done(pool):
+    results = []
+    pool.submit("DH01", lambda db: db.update_status("DH01", 1),
+                callback=lambda result, error: results.append((result, error)))
+    pumped = pool.pump(lambda: results)
+    row = sqlite3.connect(pool.m_Path).execute("SELECT STATUS FROM DC_CNF_DATAHANDLER WHERE ID = 'DH01'").fetchone()
+    ok = pumped and results == [(True, "")] and row == (1,)
+    print(f"[1] Job done -> DB_JOB_DONE over the World Pipe (pickled), closure callback(result, error) : {ok}")
+    return ok
+
+def check_error(pool, world):
+    results = []
+    # 실패 작업 : 해당 작업 세션의 오류가 callback 으로 전달
+    pool.submit("DH02", lambda db: db.execute("UPDATE NO_TABLE SET A = 1"),
+                callback=lambda result, error: results.append((result, error)))
+    # 예외 작업
+    pool.submit("DH03", lambda db: 1 / 0,
+                callback=lambda result, error: results.append((result, error)))
+    pool.pump(lambda: len(results) == 2)
+
+    # callback 없는 작업 : 성공은 통지 없음, 실패만 World 에 보고
+    pool.submit("DH04", lambda db: db.update_status("DH04", 1))
+    pool.submit("DH04", lambda db: db.execute("SELECT FROM"))
+    pool.pump(lambda: world.m_ErrorList)
+    silent = not pool.m_DoneSensor.receive_message(0.1)
+
+    ok = sorted(results, key=repr) == sorted([(False, "no such table: NO_TABLE"),
+                                              (False, "ZeroDivisionError: division by zero")], key=repr)
+    ok = ok and silent and len(world.m_ErrorList) == 1 and "DB Query Error" in world.m_ErrorList[0]
+    print(f"[2] Failed job reports its own error (callback / no callback) : {ok}")
+    return ok
+
+def check_order(pool):
+    done = {}
+    for idx in range(JOB_CNT):
+        key = f"DH{idx % KEY_CNT:02d}"
+        pool.submit(key, lambda db, key=key, idx=idx: db.update_status(key, idx),
+                    callback=lambda result, error, key=key, idx=idx: done.setdefault(key, []).append(idx))
+    send_cnt = pool.m_DoneSensor.m_SendCnt
+    pumped = pool.pump(lambda: sum(map(len, done.values())) == JOB_CNT)
+    wakeups = pool.m_DoneSensor.m_SendCnt - send_cnt
+
+    conn = sqlite3.connect(pool.m_Path)
+    ok = pumped and all(seq == sorted(seq) for seq in done.values()) and wakeups <= JOB_CNT
+    for key, seq in done.items():
+        ok = ok and conn.execute("SELECT STATUS FROM DC_CNF_DATAHANDLER WHERE ID = ?", (key,)).fetchone() == (seq[-1],)
+    stat = pool.get_stat()
+    ok = ok and stat["QueueDepth"] == 0 and not pool.m_DoneList
+    print(f"[3] {JOB_CNT} jobs / {KEY_CNT} keys / {WORKER_CNT} workers, per-key order kept, "
+          f"{wakeups} pipe wakeups : {ok}")
+    return ok
+
+def main():
+    print(">> DbWorkerPool Test Start\n")
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE DC_CNF_DATAHANDLER (ID TEXT, STATUS INTEGER)")
+    conn.executemany("INSERT INTO DC_CNF_DATAHANDLER VALUES (?, 0)", ((f"DH{i:02d}",) for i in range(KEY_CNT)))
+    conn.commit()
+    conn.close()
+
+    world = World()
+    pool = TestPool(world, path)
+    pool.start()
+    try:
+        ok = check_done(pool)
+        ok = check_error(pool, world) and ok
+        ok = check_order(pool) and ok
+    finally:
+        pool.stop()
+        pool.m_DoneSensor.close()
+        os.remove(path)
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
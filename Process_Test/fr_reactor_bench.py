@@ -0,0 +1,111 @@
+import sys
+import os
+import resource
+import socket
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Event.fr_world import FrWorld, FR_MODE, FR_REACTOR
+
+SOCK_CNTS = (100, 1000, 5000)
+LOOP_CNT = 2000
+
+class BenchFdSensor:
+    """
+    FrRdFdSensor 의 select / selector 프로토콜 재현
+    (fr_sensor.py 가 단독 import 되지 않아 FrRdFdSensor 를 직접 생성할 수 없음)
+    """
+    def __init__(self, world, sock):
+        self.m_WorldPtr = world
+        self.m_Sock = sock
+        self.m_FD = sock.fileno()
+        self.m_RegisteredFd = -1
+        self.m_RecvCnt = 0
+        world.m_InputEventSrc.register_sensor(self)
+        if world.register_fd(self.m_FD, self):
+            self.m_RegisteredFd = self.m_FD
+
+    def is_enabled(self):
+        return True
+
+    def make_select_request(self, rd_list, wr_list, ex_list, world_ptr):
+        if self.m_RegisteredFd == -1:
+            rd_list.append(self.m_FD)
+        return 1
+
+    def get_events(self, rd_list, wr_list, ex_list, world_ptr):
+        if self.m_FD in rd_list:
+            self.m_WorldPtr.m_InputEventSrc.insert_notify_sensor(self)
+        return 1
+
+    def subject_changed(self):
+        self.m_Sock.recv(64)
+        self.m_RecvCnt += 1
+
+def run(reactor, sock_cnt):
+    world = FrWorld(FR_MODE.FR_SUB, reactor=reactor)
+    pairs = [socket.socketpair() for _ in range(sock_cnt)]
+    sensors = [BenchFdSensor(world, a) for a, b in pairs]
+
+    # 마지막 소켓만 활성 (나머지는 idle)
+    active_peer = pairs[-1][1]
+    try:
+        active_peer.send(b"x")
+        if world.read_event() < 0:
+            return None, False
+        world.dispatch_src()
+
+        start = time.perf_counter()
+        for _ in range(LOOP_CNT):
+            active_peer.send(b"x")
+            world.read_event()
+            world.dispatch_src()
+        elapsed = time.perf_counter() - start
+
+        ok = (sensors[-1].m_RecvCnt == LOOP_CNT + 1
+              and all(sensor.m_RecvCnt == 0 for sensor in sensors[:-1]))
+        return elapsed * 1e6 / LOOP_CNT, ok
+    finally:
+        for a, b in pairs:
+            a.close()
+            b.close()
+        if world.m_Selector:
+            world.m_Selector.close()
+            world.m_Selector = None
+
+def main():
+    print(">> FrWorld Reactor Benchmark Start\n")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    need = max(SOCK_CNTS) * 2 + 64
+    if soft < need:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(need, hard), hard))
+
+    print(f"[1] 1 active + N-1 idle socketpairs, {LOOP_CNT} loops (read_event + dispatch_src)\n")
+    print(f"   {'Sockets':>7} | {'select (us/loop)':>18} | {'selector (us/loop)':>18}")
+
+    result = {}
+    all_ok = True
+    for cnt in SOCK_CNTS:
+        sel_us, sel_ok = run(FR_REACTOR.SELECT, cnt)
+        epl_us, epl_ok = run(FR_REACTOR.SELECTOR, cnt)
+        result[cnt] = (sel_us, epl_us)
+        all_ok = all_ok and epl_ok and (sel_us is None or sel_ok)
+        sel_text = f"{sel_us:18.1f}" if sel_us is not None else f"{'FD_SETSIZE 초과':>16}"
+        print(f"   {cnt:>7} | {sel_text} | {epl_us:18.1f}")
+
+    small, large = result[SOCK_CNTS[0]], result[SOCK_CNTS[-1]]
+    flat = large[1] < small[1] * 3
+    faster = small[1] < small[0]
+    print(f"\n[2] Dispatch correct : {all_ok}, selector {SOCK_CNTS[-1]}/{SOCK_CNTS[0]} "
+          f"= {large[1] / small[1]:.2f}x, select/selector at {SOCK_CNTS[0]} = {small[0] / small[1]:.1f}x")
+
+    ok = all_ok and flat and faster
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
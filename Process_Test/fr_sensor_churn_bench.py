@@ -0,0 +1,157 @@
+import sys
+import os
+import socket
+import time
+from collections import deque
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Event.fr_event_src import FrEventSrc
+from Class.Event.fr_sensor_registry import FrSensorRegistry
+
+CONN_CNT = 10000
+LIVE_MAX = 5000         # 동시 연결 수 (이후 가장 오래된 연결부터 끊음)
+DISPATCH_EVERY = 64     # 이 수의 연결마다 dispatch_sensor
+
+class ListEventSrc:
+    """
+    기존 FrEventSrc : list 등록, unregister 시 list.remove + 알림 deque 탐색
+    """
+    def __init__(self):
+        self.m_SensorList = []
+        self.m_NotifySensorList = deque()
+
+    def register_sensor(self, sensor):
+        if sensor not in self.m_SensorList:
+            self.m_SensorList.append(sensor)
+        return 1
+
+    def unregister_sensor(self, sensor):
+        if sensor in self.m_SensorList:
+            self.m_SensorList.remove(sensor)
+        if sensor in self.m_NotifySensorList:
+            self.m_NotifySensorList.remove(sensor)
+        return 1
+
+    def insert_notify_sensor(self, sensor):
+        self.m_NotifySensorList.append(sensor)
+
+    def dispatch_sensor(self):
+        while self.m_NotifySensorList:
+            sensor = self.m_NotifySensorList.popleft()
+            if sensor.is_enabled():
+                sensor.subject_changed()
+        return 1
+
+class ListRegistry:
+    """
+    기존 전역 센서 리스트 : FrWorldPipe._dispatch 는 메시지마다 전체 순회
+    """
+    def __init__(self):
+        self.m_List = []
+
+    def register(self, sensor):
+        self.m_List.append(sensor)
+        return sensor
+
+    def unregister(self, sensor):
+        self.m_List.remove(sensor)
+
+    def find(self, target):
+        for sensor in self.m_List:
+            if sensor is target:
+                return sensor
+        return None
+
+class IdRegistry:
+    def register(self, sensor):
+        return FrSensorRegistry.register(sensor)
+
+    def unregister(self, sensor):
+        FrSensorRegistry.unregister(sensor)
+
+    def find(self, sensor_id):
+        return FrSensorRegistry.find(sensor_id)
+
+class BenchSensor:
+    def __init__(self, sock):
+        self.m_Sock = sock
+        self.m_Dispatched = 0
+
+    def is_enabled(self):
+        return True
+
+    def subject_changed(self):
+        self.m_Dispatched += 1
+
+def churn(listener, src, registry):
+    addr = listener.getsockname()
+    live = deque()
+    sensors = []
+    reg_time = 0.0
+    perf = time.perf_counter
+
+    def disconnect():
+        nonlocal reg_time
+        sensor, peer = live.popleft()
+        start = perf()
+        src.unregister_sensor(sensor)
+        registry.unregister(sensor)
+        reg_time += perf() - start
+        sensor.m_Sock.close()
+        peer.close()
+
+    for idx in range(CONN_CNT):
+        peer = socket.create_connection(addr)
+        conn, _ = listener.accept()
+        sensor = BenchSensor(conn)
+        sensors.append(sensor)
+
+        start = perf()
+        src.register_sensor(sensor)
+        key = registry.register(sensor)
+        src.insert_notify_sensor(sensor)
+        registry.find(key)                  # FrWorldPipe 메시지 1건 수신
+        if idx % DISPATCH_EVERY == DISPATCH_EVERY - 1:
+            src.dispatch_sensor()
+        reg_time += perf() - start
+
+        live.append((sensor, peer))
+        # 끊는 연결은 아직 dispatch 전일 수 있음 (알림 대기열 정리 경로)
+        if len(live) > LIVE_MAX:
+            disconnect()
+
+    while live:
+        disconnect()
+    src.dispatch_sensor()
+    return reg_time, [sensor.m_Dispatched for sensor in sensors]
+
+def main():
+    print(">> Sensor Registry Churn Benchmark Start\n")
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1024)
+
+    print(f"[1] {CONN_CNT} connect/disconnect, up to {LIVE_MAX} live "
+          f"(register + notify + pipe lookup + unregister)\n")
+    list_time, list_cnt = churn(listener, ListEventSrc(), ListRegistry())
+    dict_time, dict_cnt = churn(listener, FrEventSrc(), IdRegistry())
+    listener.close()
+
+    print(f"   list : {list_time * 1000:9.1f} ms ({list_time * 1e6 / CONN_CNT:7.1f} us/conn)")
+    print(f"   dict : {dict_time * 1000:9.1f} ms ({dict_time * 1e6 / CONN_CNT:7.1f} us/conn)")
+
+    same = list_cnt == dict_cnt
+    print(f"\n[2] Same dispatch result : {same} ({sum(dict_cnt)} dispatched), "
+          f"registry left : {FrSensorRegistry.count()}, speedup {list_time / dict_time:.0f}x")
+
+    ok = same and FrSensorRegistry.count() == 0 and dict_time * 5 < list_time
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
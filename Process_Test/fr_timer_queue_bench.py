@@ -0,0 +1,148 @@
+import sys
+import os
+import random
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Event.fr_timer_queue import FrTimerQueue
+
+SENSOR_CNTS = (1000, 5000)
+LOOP_CNT = 20000
+ALIVE_SEC = 30.0
+WRITE_CHECK_SEC = 0.35
+
+class TimeOut:
+    # fr_timer_sensor._TimeOut 과 동일 필드 (fr_sensor.py 가 단독 import 되지 않음)
+    __slots__ = ("deadline", "reason", "key", "cancelled", "queued")
+
+    def __init__(self, deadline, reason, key):
+        self.deadline = deadline
+        self.reason = reason
+        self.key = key
+        self.cancelled = False
+        self.queued = False
+
+class ListTimerSensor:
+    """
+    기존 FrTimerSensor : 센서별 정렬 리스트 + 더미 타이머, 취소는 키 탐색
+    """
+    def __init__(self):
+        self.timer_list = []
+        self.key_seq = 0
+        self.min_deadline = 0.0
+        self.set_timeout(31536000, 10000)
+
+    def set_timeout(self, sec, reason):
+        deadline = time.time() + sec
+        self.key_seq += 1
+        entry = TimeOut(deadline, reason, self.key_seq)
+        for i, t in enumerate(self.timer_list):
+            if t.deadline > deadline:
+                self.timer_list.insert(i, entry)
+                break
+        else:
+            self.timer_list.append(entry)
+        self.min_deadline = self.timer_list[0].deadline
+        return self.key_seq
+
+    def cancel_timer(self, key):
+        for i, t in enumerate(self.timer_list):
+            if t.key == key:
+                self.timer_list.pop(i)
+                self.min_deadline = self.timer_list[0].deadline
+                return True
+        return False
+
+class HeapTimerSensor:
+    """
+    변경 FrTimerSensor : key -> TimeOut, 정렬은 월드 힙 (FrTimerQueue)
+    """
+    def __init__(self, queue):
+        self.queue = queue
+        self.timers = {}
+        self.key_seq = 0
+
+    def set_timeout(self, sec, reason):
+        self.key_seq += 1
+        entry = TimeOut(time.monotonic() + sec, reason, self.key_seq)
+        self.timers[entry.key] = entry
+        self.queue.push(entry, self)
+        return self.key_seq
+
+    def cancel_timer(self, key):
+        entry = self.timers.pop(key, None)
+        if entry is None:
+            return False
+        self.queue.cancel(entry)
+        return True
+
+def run_list(sensor_cnt):
+    sensors = [ListTimerSensor() for _ in range(sensor_cnt)]
+    keys = [[s.set_timeout(ALIVE_SEC, 1), s.set_timeout(WRITE_CHECK_SEC, 2)] for s in sensors]
+
+    start = time.perf_counter()
+    for loop in range(LOOP_CNT):
+        # 수신 소켓 1개 : AliveCheck 타이머 재설정
+        idx = loop % sensor_cnt
+        sensors[idx].cancel_timer(keys[idx][0])
+        keys[idx][0] = sensors[idx].set_timeout(ALIVE_SEC, 1)
+        # FrTimerEventSrc.make_select_request : 전 센서 최소 deadline 탐색
+        earliest = -1.0
+        for s in sensors:
+            if earliest < 0 or s.min_deadline < earliest:
+                earliest = s.min_deadline
+    return (time.perf_counter() - start) * 1e6 / LOOP_CNT
+
+def run_heap(sensor_cnt):
+    queue = FrTimerQueue()
+    sensors = [HeapTimerSensor(queue) for _ in range(sensor_cnt)]
+    keys = [[s.set_timeout(ALIVE_SEC, 1), s.set_timeout(WRITE_CHECK_SEC, 2)] for s in sensors]
+
+    start = time.perf_counter()
+    for loop in range(LOOP_CNT):
+        idx = loop % sensor_cnt
+        sensors[idx].cancel_timer(keys[idx][0])
+        keys[idx][0] = sensors[idx].set_timeout(ALIVE_SEC, 1)
+        queue.next_deadline()
+    return (time.perf_counter() - start) * 1e6 / LOOP_CNT, len(queue)
+
+def check_order():
+    # 임의 등록/취소 후 만료 순서가 정렬 기준과 같은지, 취소 항목이 빠지는지
+    rnd = random.Random(7)
+    queue = FrTimerQueue()
+    entries = [TimeOut(rnd.random() * 100, 0, key) for key in range(20000)]
+    for entry in entries:
+        queue.push(entry, None)
+    for entry in rnd.sample(entries, 15000):
+        queue.cancel(entry)
+    live = sorted((e for e in entries if not e.cancelled), key=lambda e: (e.deadline, e.key))
+
+    first = queue.next_deadline()
+    popped = [entry for _, entry in queue.pop_expired(50.0)] + [entry for _, entry in queue.pop_expired(100.0)]
+    return first == live[0].deadline and popped == live and len(queue) == 0
+
+def main():
+    print(">> Timer Queue Benchmark Start\n")
+    print(f"[1] N sensors x 2 timers, {LOOP_CNT} loops (AliveCheck reset + next deadline)\n")
+    print(f"   {'Sensors':>7} | {'list (us/loop)':>15} | {'heap (us/loop)':>15} | speedup")
+
+    ok = True
+    for cnt in SENSOR_CNTS:
+        list_us = run_list(cnt)
+        heap_us, live = run_heap(cnt)
+        ok = ok and live == cnt * 2 and heap_us * 10 < list_us
+        print(f"   {cnt:>7} | {list_us:15.1f} | {heap_us:15.2f} | {list_us / heap_us:6.0f}x")
+
+    order_ok = check_order()
+    print(f"\n[2] Expire order / lazy cancel correct : {order_ok}")
+
+    ok = ok and order_ok
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import sys
+import os
+import itertools
+import select
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+MSG_CNT = 20000
+MSG_SIZE = 200
+SOCK_BUF = 32768            # fr_socket_sensor _DEFAULT_SOCK_BUF_SIZE
+READER_PAUSE = 0.1          # 느린 GUI : 수신 측 일시 정지
+RETRY_MSEC = 350            # 기존 data_send_time 타이머 주기
+SENDMSG_MAX_BUFS = 64
+
+# FrSocketSensor 송신 경로 재현 (fr_sensor.py 가 단독 import 되지 않아 센서를 직접 생성할 수 없음)
+
+class SelectWriter:
+    """
+    기존 : write 마다 is_writerable() select, 불가 시 큐 적재 -> 350 ms 타이머에서 재시도
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self.queue = deque()
+        self.syscalls = 0
+
+    def is_writerable(self):
+        self.syscalls += 1
+        _, w, _ = select.select([], [self.sock], [], 100 / 1_000_000)
+        return bool(w)
+
+    def send(self, data):
+        self.syscalls += 1
+        return self.sock.send(data)
+
+    def write(self, packet):
+        while True:
+            if self.is_writerable():
+                if self.queue:
+                    self.send(self.queue.popleft())
+                else:
+                    return self.send(packet)
+            else:
+                self.queue.append(packet)
+                return len(packet)
+
+    def data_send_time(self):
+        while self.queue and self.is_writerable():
+            self.send(self.queue.popleft())
+
+    def drain(self):
+        while self.queue:
+            time.sleep(RETRY_MSEC / 1000)
+            self.data_send_time()
+
+class ReactorWriter:
+    """
+    변경 : MSG_DONTWAIT send, 남은 데이터는 큐 -> 쓰기 가능 이벤트에서 sendmsg 묶음 전송
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self.queue = deque()      # [memoryview, ...]
+        self.syscalls = 0
+        self.flush_sends = []   # flush() 1회당 sendmsg 횟수
+        self.high_water = 0
+        self.queue_bytes = 0
+        self.selector = selectors.DefaultSelector()
+        self.write_wait = False
+
+    def set_write_wait(self, flag):
+        if flag != self.write_wait:
+            self.write_wait = flag
+            if flag:
+                self.selector.register(self.sock, selectors.EVENT_WRITE)
+            else:
+                self.selector.unregister(self.sock)
+
+    def put(self, view):
+        self.queue.append(view)
+        self.queue_bytes += len(view)
+        self.high_water = max(self.high_water, self.queue_bytes)
+        self.set_write_wait(True)
+
+    def write(self, packet):
+        if self.queue:
+            self.put(memoryview(packet))
+            return len(packet)
+        self.syscalls += 1
+        try:
+            sent = self.sock.send(packet, socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            sent = 0
+        if sent < len(packet):
+            self.put(memoryview(packet)[sent:])
+        return len(packet)
+
+    def flush(self):
+        queue = self.queue
+        total = 0
+        sends = 0
+        while queue:
+            bufs = list(itertools.islice(queue, SENDMSG_MAX_BUFS))
+            want = sum(len(buf) for buf in bufs)
+            self.syscalls += 1
+            sends += 1
+            try:
+                sent = self.sock.sendmsg(bufs, [], socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                break
+            total += sent
+            self.queue_bytes -= sent
+            left = sent
+            while left:
+                if left < len(queue[0]):
+                    queue[0] = queue[0][left:]
+                    break
+                left -= len(queue.popleft())
+            if sent < want:
+                break
+        self.flush_sends.append(sends)
+        self.set_write_wait(bool(queue))
+
+    def drain(self):
+        while self.queue:
+            self.syscalls += 1
+            for _ in self.selector.select(1.0):
+                self.flush()
+
+def reader(sock, total, result):
+    time.sleep(READER_PAUSE)
+    resume = time.perf_counter()
+    received = bytearray()
+    while len(received) < total:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        received += chunk
+    result["drain_ms"] = (time.perf_counter() - resume) * 1000
+    result["data"] = bytes(received)
+
+def measure(writer_cls):
+    wsock, rsock = socket.socketpair()
+    for sock in (wsock, rsock):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCK_BUF)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCK_BUF)
+
+    packets = [(b"%08d" % idx).ljust(MSG_SIZE, b".") for idx in range(MSG_CNT)]
+    result = {}
+    thread = threading.Thread(target=reader, args=(rsock, MSG_CNT * MSG_SIZE, result))
+    thread.start()
+
+    writer = writer_cls(wsock)
+    start = time.perf_counter()
+    for packet in packets:
+        writer.write(packet)
+    writer.burst_ms = (time.perf_counter() - start) * 1000
+    writer.drain()
+    thread.join()
+    wsock.close()
+    rsock.close()
+    return writer, result["drain_ms"], result["data"] == b"".join(packets)
+
+def check_flush_all():
+    # 소켓 버퍼 여유가 충분하면 flush() 1회로 SENDMSG_MAX_BUFS 초과 큐를 모두 비워야 함
+    wsock, rsock = socket.socketpair()
+    writer = ReactorWriter(wsock)
+    for idx in range(SENDMSG_MAX_BUFS * 3):
+        writer.put(memoryview(b"%08d" % idx))
+    writer.flush()
+    ok = not writer.queue and writer.flush_sends == [3] and not writer.write_wait
+    writer.selector.close()
+    wsock.close()
+    rsock.close()
+    return ok
+
+def main():
+    print(">> Socket Write Queue Benchmark Start\n")
+    print(f"[1] {MSG_CNT} x {MSG_SIZE} B burst, socket buf {SOCK_BUF} B, "
+          f"reader paused {READER_PAUSE * 1000:.0f} ms\n")
+
+    old, old_ms, old_ok = measure(SelectWriter)
+    new, new_ms, new_ok = measure(ReactorWriter)
+    for title, writer, drain_ms, data_ok in (("select+timer", old, old_ms, old_ok),
+                                             ("reactor", new, new_ms, new_ok)):
+        print(f"   {title:<12} : write() loop {writer.burst_ms:7.1f} ms, drain {drain_ms:7.1f} ms after resume, "
+              f"syscalls {writer.syscalls:6d}, data ok {data_ok}")
+    print(f"   queue high water (reactor) : {new.high_water} B")
+
+    print(f"\n[2] write() loop {old.burst_ms / new.burst_ms:.0f}x shorter, drain latency {old_ms / new_ms:.0f}x lower, "
+          f"syscalls {old.syscalls / new.syscalls:.0f}x fewer")
+
+    flush_ok = check_flush_all()
+    print(f"\n[3] flush() drains {SENDMSG_MAX_BUFS * 3} queued buffers in one readiness event : {flush_ok}")
+
+    ok = (old_ok and new_ok and flush_ok and new_ms < old_ms and new.syscalls < old.syscalls
+          and new.queue_bytes == 0)
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import sys
+import os
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.ProcParser.ParsingIdentMgr import ParsingIdentMgr
+from Class.ProcParser.RuleType import IdentRule, ParsingRule, LINE_STR
+
+LOOP_CNT = 2000
+
+def make_ident_mgr(sibling_cnt, use_matcher, empty_id_idx=-1):
+    """
+    Root 아래 LINE_STR 형제 룰 sibling_cnt 개 (1~3 라인 검사), empty_id_idx 번째 형제는 빈 IdString
+    """
+    mgr = ParsingIdentMgr()
+    mgr.LINE_STR_MATCHER_MIN_PATTERN = 1 if use_matcher else sibling_cnt + 1
+
+    p_rule = ParsingRule()
+    p_rule.m_ParsingRuleId = 1
+    p_rule.m_ParsingType = LINE_STR
+    p_rule.m_StartLine = 1
+    p_rule.m_EndLine = 3
+
+    for i in range(sibling_cnt):
+        rule = IdentRule()
+        rule.m_IdentName = f"IDENT_{i}"
+        rule.m_IdString = "" if i == empty_id_idx else f"M{i:04d} RESULT"
+        rule.m_OutPutFlag = True
+        rule.m_ParsingRulePtr = p_rule
+        mgr.m_TotalIdentRuleMap[rule.m_IdentName] = rule
+        mgr.m_IdentRule.m_ChildRuleMap[rule.m_IdentName] = rule
+
+    mgr.compile_ident_tree()
+    return mgr
+
+def make_msg(sibling_cnt):
+    # 마지막 형제가 매칭되는 최악의 경우
+    lines = [
+        "   SNMS_DC  2026-10-18 10:00:00",
+        "*** MMC OUTPUT NE=BSC01 SEQ=12345",
+        f"    M{sibling_cnt - 1:04d} RESULT = OK",
+    ]
+    lines += [f"  ITEM{i:03d}    VALUE={i * 7}    STATUS=NORMAL" for i in range(20)]
+    return "\n".join(lines)
+
+def legacy_identify(mgr, msg):
+    """
+    기존 방식 : 형제마다 check_identify (라인 범위만큼 'in' 검사)
+    """
+    mgr.m_MsgBuf = msg
+    mgr.line_scanning()
+    for child_rule in mgr.m_IdentRule.m_ChildRuleMap.values():
+        if mgr.check_identify(child_rule):
+            return child_rule
+    return None
+
+def bench(title, func, mgr, msg):
+    start = time.perf_counter()
+    for _ in range(LOOP_CNT):
+        func(mgr, msg)
+    elapsed = time.perf_counter() - start
+    us = elapsed / LOOP_CNT * 1000000
+    print(f"   {title:<22}: {us:10.2f} us/msg")
+    return us
+
+def check_empty_id_string(sibling_cnt):
+    """
+    빈 IdString 은 'in' 검사상 비어 있지 않은 모든 라인에 매칭 : AhoCorasick 노드에서도 같은 형제 선택
+    """
+    msg = make_msg(sibling_cnt)
+    empty_id_idx = sibling_cnt // 2
+    loop_mgr = make_ident_mgr(sibling_cnt, False, empty_id_idx)
+    ac_mgr = make_ident_mgr(sibling_cnt, True, empty_id_idx)
+
+    expect = legacy_identify(loop_mgr, msg).m_IdentName
+    ok = expect == f"IDENT_{empty_id_idx}"
+    ok = ok and loop_mgr.identify(msg).m_FinalIdentName == expect and ac_mgr.identify(msg).m_FinalIdentName == expect
+    print(f"[Empty IdString : sibling {empty_id_idx} of {sibling_cnt}] -> {expect} : {ok}\n")
+    return ok
+
+def main():
+    print(">> LINE_STR Identification Benchmark Start\n")
+
+    for sibling_cnt in (10, 100, 1000):
+        msg = make_msg(sibling_cnt)
+        loop_mgr = make_ident_mgr(sibling_cnt, False)
+        ac_mgr = make_ident_mgr(sibling_cnt, True)
+
+        expect = legacy_identify(loop_mgr, msg).m_IdentName
+        if loop_mgr.identify(msg).m_FinalIdentName != expect or ac_mgr.identify(msg).m_FinalIdentName != expect:
+            print(">> Test Result: FAIL (Ident result mismatch)")
+            return
+
+        print(f"[Siblings : {sibling_cnt}]")
+        legacy_us = bench("Legacy Loop", legacy_identify, loop_mgr, msg)
+        bench("Compiled (in Loop)", lambda m, b: m.identify(b), loop_mgr, msg)
+        ac_us = bench("Compiled (AhoCorasick)", lambda m, b: m.identify(b), ac_mgr, msg)
+        print(f"   Speed Up (Legacy/AC)  : {legacy_us / ac_us:10.2f} x\n")
+
+    if not check_empty_id_string(100):
+        print(">> Test Result: FAIL (Empty IdString ident mismatch)")
+        return
+
+    print(f">> Default LINE_STR_MATCHER_MIN_PATTERN : {ParsingIdentMgr.LINE_STR_MATCHER_MIN_PATTERN}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import sys
+import os
+import random
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.ProcParser.MsgTokenizer import MsgTokenizer
+
+CASE_CNT = 20000
+
+# -------------------------------------------------------
+# 기존 DataExtractor 문자 단위 구현 (비교 기준)
+# -------------------------------------------------------
+def legacy_string_list(line, delimiter=" "):
+    str_list = []
+    if not delimiter:
+        delimiter = " "
+    if delimiter != " " and delimiter not in line:
+        return str_list
+    str_list.append("")
+    tokens = line.split() if delimiter == " " else line.split(delimiter)
+    for token in tokens:
+        str_list.append(token.strip())
+    return str_list
+
+def legacy_string_index(line, token_pos, delimiter=" "):
+    if not delimiter:
+        delimiter = " "
+    if delimiter != " " and delimiter not in line:
+        return None
+    tokens = line.split() if delimiter == " " else line.split(delimiter)
+    target_idx = token_pos - 1
+    if 0 <= target_idx < len(tokens):
+        return tokens[target_idx].strip()
+    return None
+
+def legacy_char_list(line, delimiter):
+    str_list = []
+    if not delimiter:
+        delimiter = " "
+    if not any(d in line for d in delimiter):
+        return str_list
+    str_list.append("")
+    tmp = ""
+    for char in line:
+        if char in delimiter:
+            if not tmp:
+                if char != ' ':
+                    str_list.append("")
+            else:
+                str_list.append(tmp.strip())
+                tmp = ""
+        else:
+            tmp += char
+    if tmp:
+        str_list.append(tmp.strip())
+    return str_list
+
+def legacy_char_index(line, token_pos, delimiter):
+    if not delimiter:
+        delimiter = " "
+    if not any(d in line for d in delimiter):
+        return None
+    token_cnt = 0
+    tmp = ""
+    for char in line:
+        if char in delimiter:
+            if not tmp:
+                if char != ' ':
+                    token_cnt += 1
+                    if token_cnt == token_pos:
+                        return ""
+            else:
+                token_cnt += 1
+                if token_cnt == token_pos:
+                    return tmp.strip()
+                tmp = ""
+        else:
+            tmp += char
+    if tmp:
+        token_cnt += 1
+        if token_cnt == token_pos:
+            return tmp.strip()
+    return None
+
+def backward_token(str_list, token_pos):
+    # 음수 인덱스 : 뒤에서부터 (-1 = 마지막 토큰)
+    tokens = str_list[1:]
+    return tokens[token_pos] if 0 < -token_pos <= len(tokens) else None
+
+# -------------------------------------------------------
+ALPHABET = ["A", "b", "1", " ", "  ", "\t", ",", ";", "=", ":", "-", "]", "^", "\\", "|", "ITEM", "NE=BSC01"]
+DELIMITERS = [None, "", " ", ",", ";", "=", ", ", " =", ",;", "]-^\\", "\t", "ITEM", "|:"]
+
+def random_line(rnd):
+    return "".join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 20)))
+
+def main():
+    print(">> MsgTokenizer Differential Test Start\n")
+
+    rnd = random.Random(1234)
+    tok = MsgTokenizer()
+    fail_cnt = 0
+
+    for case in range(CASE_CNT):
+        line = random_line(rnd)
+        delimiter = rnd.choice(DELIMITERS)
+        string_delim = delimiter if delimiter is not None else " "
+
+        # 1. List 변형
+        tokens = tok.tokenize_string(line, string_delim)
+        if legacy_string_list(line, string_delim) != ([""] + tokens if tokens is not None else []):
+            fail_cnt += 1
+            print(f"   [String List] line={line!r} delim={string_delim!r}")
+
+        tokens = tok.tokenize_char(line, string_delim)
+        if legacy_char_list(line, string_delim) != ([""] + tokens if tokens is not None else []):
+            fail_cnt += 1
+            print(f"   [Char List] line={line!r} delim={string_delim!r}")
+
+        # 2. Index 변형 (양수 = 기존과 동일, 음수 = 뒤에서부터)
+        for token_pos in range(-6, 8):
+            if token_pos >= 0:
+                expect_string = legacy_string_index(line, token_pos, string_delim)
+                expect_char = legacy_char_index(line, token_pos, string_delim)
+            else:
+                expect_string = backward_token(legacy_string_list(line, string_delim), token_pos)
+                expect_char = backward_token(legacy_char_list(line, string_delim), token_pos)
+
+            if tok.get_string_token(line, token_pos, string_delim) != expect_string:
+                fail_cnt += 1
+                print(f"   [String Index] line={line!r} pos={token_pos} delim={string_delim!r}")
+            if tok.get_char_token(line, token_pos, string_delim) != expect_char:
+                fail_cnt += 1
+                print(f"   [Char Index] line={line!r} pos={token_pos} delim={string_delim!r}")
+
+        if case % 500 == 0:
+            tok.clear()
+
+        if fail_cnt > 10:
+            break
+
+    print(f"\n   Cases : {CASE_CNT}")
+    print(f">> Test Result: {'PASS' if fail_cnt == 0 else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import sys
+import os
+import socket
+import struct
+import threading
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.Common.ParsedDataBatch import ParsedDataBatch
+from Class.Common.AsciiMmcType import MAX_MSG
+
+RECORD_CNT = 5000
+HDR_FMT = "!II" # PACKET_T : MsgId + Length
+AS_PARSED_DATA = 5001
+AS_PARSED_DATA_BATCH = 5002
+
+def make_bodies(record_cnt):
+    # AS_PARSED_DATA body 대용 (가변 길이 레코드)
+    return [(f"NE{i % 7:02d}\0EVT\0" + "VAL\0" * (10 + i % 20)).encode() for i in range(record_cnt)]
+
+def dispatch_packet(msg_id, payload, bodies):
+    """
+    AsSocket._dispatch_packet / _dispatch_parsed_data_batch : AS_PARSED_DATA_BATCH 는
+    AS_PARSED_DATA 로 풀어 순서대로 receive_packet 에 전달
+    """
+    if msg_id == AS_PARSED_DATA_BATCH:
+        records = ParsedDataBatch.unpack(payload)
+        if records is None:
+            raise ValueError("invalid AS_PARSED_DATA_BATCH")
+        for body in records:
+            dispatch_packet(AS_PARSED_DATA, bytes(body), bodies)
+    else:
+        bodies.append(payload)
+
+def recv_all(sock, expect_cnt, result):
+    """
+    수신 측 (DataRouter) : PACKET_T 를 읽어 AS_PARSED_DATA 레코드로 복원
+    """
+    buf = b""
+    bodies = []
+    while len(bodies) < expect_cnt:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buf += chunk
+        while len(buf) >= 8:
+            msg_id, length = struct.unpack(HDR_FMT, buf[:8])
+            if len(buf) < 8 + length:
+                break
+            payload, buf = buf[8:8 + length], buf[8 + length:]
+            dispatch_packet(msg_id, payload, bodies)
+    result.extend(bodies)
+
+def send_single(sock, bodies):
+    write_cnt = 0
+    for body in bodies:
+        sock.sendall(struct.pack(HDR_FMT, AS_PARSED_DATA, len(body)) + body)
+        write_cnt += 1
+    return write_cnt
+
+def send_batched(sock, bodies):
+    """
+    DataRouterConnection.send_parsed_data (batch on) : 배치에 못 담는 레코드는
+    대기 중인 배치를 먼저 보낸 뒤 AS_PARSED_DATA 단건으로 전송, 마지막은 EOR flush
+    """
+    write_cnt = 0
+    batch = ParsedDataBatch()
+
+    def flush():
+        if batch.is_empty():
+            return 0
+        payload = batch.get_payload()
+        sock.sendall(struct.pack(HDR_FMT, AS_PARSED_DATA_BATCH, len(payload)) + payload)
+        batch.clear()
+        return 1
+
+    for body in bodies:
+        if not batch.can_hold(len(body)):
+            write_cnt += flush()
+            sock.sendall(struct.pack(HDR_FMT, AS_PARSED_DATA, len(body)) + body)
+            write_cnt += 1
+            continue
+        if not batch.append(body):
+            write_cnt += flush()
+            batch.append(body)
+    write_cnt += flush() # EOR
+    return write_cnt
+
+def run(title, send_func, bodies):
+    tx, rx = socket.socketpair()
+    result = []
+    th = threading.Thread(target=recv_all, args=(rx, len(bodies), result))
+    th.start()
+
+    start = time.perf_counter()
+    write_cnt = send_func(tx, bodies)
+    th.join()
+    elapsed = time.perf_counter() - start
+    tx.close()
+    rx.close()
+
+    ok = result == bodies
+    print(f"   {title:<10}: {write_cnt:6d} writes, {elapsed * 1000:8.2f} ms, records ok={ok}")
+    return ok
+
+def main():
+    print(">> AS_PARSED_DATA_BATCH Test Start\n")
+
+    # 1. Pack / Unpack
+    batch = ParsedDataBatch(64)
+    print(f"[1] append: {batch.append(b'abc')}, {batch.append(b'')}, over size: {batch.append(b'x' * 64)}")
+    print(f"    unpack : {[bytes(b) for b in ParsedDataBatch.unpack(bytes(batch.get_payload()))]}")
+    print(f"    broken : {ParsedDataBatch.unpack(bytes(batch.get_payload())[:-1])}")
+
+    # 2. Socket write count (list response)
+    bodies = make_bodies(RECORD_CNT)
+    print(f"\n[2] {RECORD_CNT} records over socketpair")
+    ok = run("Single", send_single, bodies)
+    ok = run("Batched", send_batched, bodies) and ok
+
+    # 3. 배치에 못 담는 큰 레코드가 섞여도 수신 순서 유지
+    mixed = make_bodies(300)
+    for pos in (0, 17, 150, 299):
+        mixed.insert(pos, (b"BIG%03d\0" % pos).ljust(MAX_MSG - 4, b"V"))
+    print(f"\n[3] {len(mixed)} records with oversize records in between")
+    ok = run("Mixed", send_batched, mixed) and ok
+
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
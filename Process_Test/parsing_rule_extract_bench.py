@@ -0,0 +1,130 @@
+import sys
+import os
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.ProcParser.DataExtractor import DataExtractor
+from Class.ProcParser.ParsingRuleCompiler import ParsingRuleCompiler
+from Class.ProcParser.RuleType import *
+
+LOOP_CNT = 20
+
+# (ParsingType, StartString, EndString, StartColumn, EndColumn, ExtractSize, TokenIndex, TokenDelimiter, TokenSize, DelimiterType)
+RULE_SPEC_LIST = [
+    (STRSTR_TOKEN,                  "NE=",     "",  0,  0, 0, 1, " ",  0, 0),
+    (STRSTR_TOKEN,                  "VALUE=",  "",  0,  0, 0, 1, " ",  0, 0),
+    (STRSTR_TOKEN,                  "ITEM",    "",  0,  0, 0, 3, "=",  0, 0),
+    (STRSTR_TOKEN,                  "STATUS",  "",  0,  0, 0, 1, "=,", 4, 1),
+    (STRCOL_STRSTR_TOKEN,           "ITEM",    "",  3,  0, 0, 2, " ",  0, 0),
+    (STRCOL_STRSTR_ENDCOL,          "ITEM",    "",  1, 12, 0, 0, "",   0, 0),
+    (STRCOL_ENDSTR,                 "",        "=", 3,  0, 0, 0, "",   0, 0),
+    (STRSTR_EXTSIZE,                "SEQ=",    "",  0,  0, 5, 0, "",   0, 0),
+    (STRSTR_ENDSTR,                 "VALUE=",  " ", 0,  0, 0, 0, "",   0, 0),
+    (STRSTR_ENDCOL,                 "ITEM",    "",  0, 10, 0, 0, "",   0, 0),
+    (EXTSIZE_ENDSTR,                "",        "=", 0,  0, 4, 0, "",   0, 0),
+    (STRCOL_STRSTR_REMAINSTR,       "STATUS=", "",  1,  0, 0, 0, "",   0, 0),
+    (STRCOL_STRSTR_TOKEN_REMAINSTR, "ITEM",    "",  1,  0, 0, 2, " ",  0, 0),
+]
+
+def make_rule_list():
+    rule_list = []
+    for rule_id, spec in enumerate(RULE_SPEC_LIST, 1):
+        rule = ParsingRule()
+        rule.m_ParsingRuleId = rule_id
+        (rule.m_ParsingType, rule.m_StartString, rule.m_EndString,
+         rule.m_StartColumn, rule.m_EndColumn, rule.m_ExtractSize,
+         rule.m_TokenIndex, rule.m_TokenDelimiter, rule.m_TokenSize, rule.m_DelimiterType) = spec
+        rule.m_ExtractFunc = ParsingRuleCompiler.compile(rule)
+        rule_list.append(rule)
+    return rule_list
+
+def load_corpus(corpus_dir):
+    """
+    corpus_dir 의 파일 하나 = 수집된 MMC 출력 하나
+    """
+    corpus = []
+    for file_name in sorted(os.listdir(corpus_dir)):
+        path = os.path.join(corpus_dir, file_name)
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                corpus.append(f.read())
+    return corpus
+
+def make_corpus(record_cnt=200):
+    """
+    수집 코퍼스가 없을 때 사용하는 MMC 형태의 출력
+    """
+    corpus = []
+    for seq in range(record_cnt):
+        lines = [
+            "   SNMS_DC  2026-10-18 10:00:00",
+            f"*** MMC OUTPUT NE=BSC{seq % 32:02d} SEQ={10000 + seq}",
+            "",
+        ]
+        lines += [f"  ITEM{i:03d}    VALUE={i * seq % 997}    STATUS=NORMAL,ACT" for i in range(20 + seq % 30)]
+        lines.append("  COMPLETED")
+        corpus.append("\n".join(lines))
+    return corpus
+
+def run_record(extractor, msg, rule_list, use_compiled):
+    """
+    레코드 하나의 모든 라인에 모든 룰 적용
+    """
+    extractor.m_MsgBuf = msg
+    extractor.line_scanning()
+
+    result_list = []
+    for line_number in range(1, extractor.m_EndLineNumber + 1):
+        line_buf = extractor.get_line(line_number)
+        if not line_buf:
+            continue
+        for rule in rule_list:
+            if use_compiled:
+                result_list.append(rule.m_ExtractFunc(extractor, line_buf, line_number))
+            else:
+                result_list.append(extractor.extract_data_from_parsing_rule_generic(rule, line_buf, line_number))
+    return result_list
+
+def bench(title, extractor, corpus, rule_list, use_compiled):
+    start = time.perf_counter()
+    for _ in range(LOOP_CNT):
+        for msg in corpus:
+            run_record(extractor, msg, rule_list, use_compiled)
+    elapsed = time.perf_counter() - start
+    us = elapsed / (LOOP_CNT * len(corpus)) * 1000000
+    print(f"   {title:<20}: {us:10.2f} us/record")
+    return us
+
+def main():
+    print(">> Parsing Rule Extraction Benchmark Start\n")
+
+    if len(sys.argv) > 1:
+        corpus = load_corpus(sys.argv[1])
+        print(f"[Corpus : {sys.argv[1]}, {len(corpus)} records]")
+    else:
+        corpus = make_corpus()
+        print(f"[Corpus : synthetic, {len(corpus)} records]")
+
+    if not corpus:
+        print(">> Test Result: FAIL (Empty corpus)")
+        return
+
+    extractor = DataExtractor(None)
+    rule_list = make_rule_list()
+
+    for msg in corpus:
+        if run_record(extractor, msg, rule_list, False) != run_record(extractor, msg, rule_list, True):
+            print(">> Test Result: FAIL (Extract result mismatch)")
+            return
+
+    generic_us = bench("Generic (if/elif)", extractor, corpus, rule_list, False)
+    compiled_us = bench("Compiled (closure)", extractor, corpus, rule_list, True)
+    print(f"   Speed Up            : {generic_us / compiled_us:10.2f} x")
+
+if __name__ == "__main__":
+    main()
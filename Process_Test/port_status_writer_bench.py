@@ -0,0 +1,228 @@
+import sys
+import os
+import sqlite3
+import time
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.SqlType.fr_db_base_type import DbType, QueryBindData
+from Class.Sql.fr_db_statement import DbStatementRegistry
+from Class.ProcNaServer.PortStatusWriter import PortStatusWriter
+
+PORT_CNT = 3000
+RECONNECT_CNT = 3
+FLUSH_SIZE = 500
+DC_STATUS_CMD_PORT = "DC_STATUS_CMD_PORT"
+PORT_ELIMINATION = 4
+
+# DbManager.DB_MANAGER_STATEMENTS 중 포트 상태 문장
+STATEMENTS = {
+    "DELETE_CMD_PORT_BY_SEQUENCE": f"DELETE FROM {DC_STATUS_CMD_PORT} WHERE SEQUENCE = :SEQUENCE",
+    "INSERT_CMD_PORT":
+        f"INSERT INTO {DC_STATUS_CMD_PORT} (SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS) "
+        f"VALUES (:SEQUENCE, :MANAGERID, :CONNECTORID, :EQUIPID, :STATUS)",
+}
+
+def bind_to_params(bind):
+    # OraSession2._build_name_params 와 동일한 변환
+    return {bd.bind_name: bd.int_data if bd.bind_type == QueryBindData.BIND_INT else bd.str_data
+            for bd in bind}
+
+class SqliteDbManager:
+    """
+    DbManager 의 execute_statement / execute_statement_array / commit / rollback 대용 (SQLite).
+    DB 호출(execute / executemany / commit) 1회를 왕복 1회로 계산.
+    """
+    def __init__(self):
+        self.m_Conn = sqlite3.connect(":memory:")
+        self.m_Conn.execute(f"CREATE TABLE {DC_STATUS_CMD_PORT} "
+                            f"(SEQUENCE INTEGER, MANAGERID TEXT, CONNECTORID TEXT, EQUIPID TEXT, STATUS INTEGER)")
+        self.m_Conn.execute(f"CREATE INDEX IDX_SEQ ON {DC_STATUS_CMD_PORT} (SEQUENCE)")
+        self.m_Registry = DbStatementRegistry()
+        self.m_Registry.register_all(STATEMENTS)
+        self.m_RoundTrip = 0
+        self.m_FailCnt = 0 # 이 횟수만큼 execute_statement_array 실패 (DB 연결 끊김 등)
+        self.m_ErrorMsg = ""
+
+    def get_error_msg(self):
+        return self.m_ErrorMsg
+
+    def execute_statement(self, name, values, auto_commit=True):
+        query, bind = self.m_Registry.get(name).make_bind_param(DbType.ORACLE_OCI2, values)
+        self.m_Conn.execute(query, bind_to_params(bind))
+        self.m_RoundTrip += 1
+        if auto_commit:
+            self.commit()
+        return True
+
+    def execute_statement_array(self, name, values_list, auto_commit=True):
+        if self.m_FailCnt > 0:
+            self.m_FailCnt -= 1
+            self.m_ErrorMsg = "ORA-03113: end-of-file on communication channel"
+            return False
+        query, bind_list = self.m_Registry.get(name).make_bind_param_list(DbType.ORACLE_OCI2, values_list)
+        self.m_Conn.executemany(query, [bind_to_params(bind) for bind in bind_list])
+        self.m_RoundTrip += 1
+        if auto_commit:
+            self.commit()
+        return True
+
+    def commit(self):
+        self.m_Conn.commit()
+        self.m_RoundTrip += 1
+
+    def rollback(self):
+        self.m_Conn.rollback()
+        self.m_RoundTrip += 1
+
+    def dump(self):
+        return self.m_Conn.execute(f"SELECT SEQUENCE, MANAGERID, CONNECTORID, EQUIPID, STATUS "
+                                   f"FROM {DC_STATUS_CMD_PORT} ORDER BY SEQUENCE").fetchall()
+
+def make_updates():
+    """
+    매니저 재접속 RECONNECT_CNT 회 : 포트 PORT_CNT 개 상태 보고 (일부 ELIMINATION)
+    """
+    updates = []
+    for r in range(RECONNECT_CNT):
+        for seq in range(PORT_CNT):
+            status = PORT_ELIMINATION if (seq + r) % 10 == 0 else 1 + (seq + r) % 3
+            values = None
+            if status != PORT_ELIMINATION:
+                values = {"SEQUENCE": seq, "MANAGERID": f"MGR{seq % 4:02d}",
+                          "CONNECTORID": f"CON{seq % 40:03d}", "EQUIPID": f"CON{seq % 40:03d}",
+                          "STATUS": status}
+            updates.append((seq, values))
+    return updates
+
+def run_per_port(db_mgr, updates):
+    """
+    기존 update_connection_status : 포트마다 DELETE + INSERT, 각각 commit
+    """
+    for seq, values in updates:
+        db_mgr.execute_statement("DELETE_CMD_PORT_BY_SEQUENCE", {"SEQUENCE": seq})
+        if values:
+            db_mgr.execute_statement("INSERT_CMD_PORT", values)
+
+def run_writer(db_mgr, updates):
+    writer = PortStatusWriter(db_mgr, FLUSH_SIZE)
+    for seq, values in updates:
+        writer.add(seq, values)
+    writer.flush() # 타이머 만료 대용
+    return writer
+
+def check_requeue():
+    """
+    flush 실패 시 묶음을 되돌려 다음 flush 에서 반영, 연속 실패가 한도를 넘으면 폐기
+    """
+    db_mgr = SqliteDbManager()
+    writer = PortStatusWriter(db_mgr, FLUSH_SIZE)
+    values = lambda seq, status: {"SEQUENCE": seq, "MANAGERID": "MGR00", "CONNECTORID": "CON000",
+                                  "EQUIPID": "CON000", "STATUS": status}
+
+    db_mgr.m_FailCnt = 2
+    for seq in range(100):
+        writer.add(seq, values(seq, 1))
+    writer.flush()
+    writer.add(5, values(5, 3))     # 재시도 대기 중 들어온 새 상태가 우선
+    writer.flush()
+    requeued = writer.get_pending_cnt() == 100
+    writer.flush()
+    rows = db_mgr.dump()
+    ok = requeued and len(rows) == 100 and rows[5][4] == 3 and all(row[4] == 1 for row in rows if row[0] != 5)
+
+    db_mgr.m_FailCnt = PortStatusWriter.MAX_FLUSH_RETRY + 1
+    writer.add(200, values(200, 2))
+    for _ in range(PortStatusWriter.MAX_FLUSH_RETRY + 1):
+        writer.flush()
+    stat = writer.get_stat()
+    ok = ok and stat["DropCnt"] == 1 and stat["PendingCnt"] == 0 and len(db_mgr.dump()) == 100
+    return ok
+
+class DeferredPool:
+    """
+    DbWorkerPool 대용 : 제출된 작업을 보관 -> run_job 으로 작업 스레드 수행, deliver 로 World 스레드 callback
+    """
+    def __init__(self, db_mgr):
+        self.m_DbMgr = db_mgr
+        self.m_JobList = []
+        self.m_DoneList = []
+
+    def submit(self, key, func, *args, callback=None):
+        self.m_JobList.append((func, args, callback))
+        return True
+
+    def run_job(self):
+        func, args, callback = self.m_JobList.pop(0)
+        self.m_DoneList.append((callback, func(self.m_DbMgr, *args)))
+
+    def deliver(self):
+        callback, result = self.m_DoneList.pop(0)
+        callback(result, "")
+
+def check_fail_after_newer_commit():
+    """
+    flush A (seq 1 = UP) 실패 통지가 flush B (seq 1 = DOWN) 제출/commit 이후 도착 : A 를 되돌리지 않음
+    """
+    db_mgr = SqliteDbManager()
+    pool = DeferredPool(db_mgr)
+    writer = PortStatusWriter(db_mgr, FLUSH_SIZE)
+    writer.set_worker_pool(pool)
+    values = lambda seq, status: {"SEQUENCE": seq, "MANAGERID": "MGR00", "CONNECTORID": "CON000",
+                                  "EQUIPID": "CON000", "STATUS": status}
+
+    writer.add(1, values(1, 1))     # UP
+    writer.add(2, values(2, 1))     # B 에 없는 Sequence : 재시도 대상
+    writer.flush()
+    writer.add(1, values(1, 2))     # DOWN
+    writer.flush()
+
+    db_mgr.m_FailCnt = 1
+    pool.run_job()                  # A 실패
+    pool.run_job()                  # B commit
+    pool.deliver()
+    pool.deliver()
+    requeued = sorted(writer.m_PendingMap) == [2]
+    writer.flush()
+    pool.run_job()
+    pool.deliver()
+    rows = db_mgr.dump()
+    return requeued and [(row[0], row[4]) for row in rows] == [(1, 2), (2, 1)] and not writer.m_SeqGenMap
+
+def main():
+    print(">> PortStatusWriter Benchmark Start\n")
+    updates = make_updates()
+    print(f"[1] {len(updates)} port status updates ({RECONNECT_CNT} reconnects x {PORT_CNT} ports), SQLite\n")
+
+    legacy = SqliteDbManager()
+    start = time.perf_counter()
+    run_per_port(legacy, updates)
+    legacy_elapsed = time.perf_counter() - start
+
+    bulk = SqliteDbManager()
+    start = time.perf_counter()
+    writer = run_writer(bulk, updates)
+    bulk_elapsed = time.perf_counter() - start
+    stat = writer.get_stat()
+
+    print(f"\n   {'Per port':<16}: {legacy_elapsed * 1000:8.2f} ms, round trips={legacy.m_RoundTrip}")
+    print(f"   {'PortStatusWriter':<16}: {bulk_elapsed * 1000:8.2f} ms, round trips={bulk.m_RoundTrip}, "
+          f"flushes={stat['FlushCnt']}, rows={stat['TotalRowCnt']}")
+
+    print("\n[2] Failed flush : batch requeued for the next flush, dropped after "
+          f"{PortStatusWriter.MAX_FLUSH_RETRY} retries\n")
+    requeue_ok = check_requeue()
+    print(f"\n   Requeue / bounded retry : {requeue_ok}")
+
+    newer_ok = check_fail_after_newer_commit()
+    print(f"\n[3] Flush fails after a newer flush of the same port committed, newer status kept : {newer_ok}")
+
+    ok = legacy.dump() == bulk.dump() and stat["FlushFailCnt"] == 0 and requeue_ok and newer_ok
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import sys
+import os
+import time
+import tracemalloc
+import zlib
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from Class.ProcParser.ResultBuilder import ResultBuilder
+
+RECORD_CNT = 10000
+MAX_PARSED_DATA_SIZE = 40960
+SEG_BLK_SIZE = 3000
+LIMIT_SIZE = 4000
+REPEAT_CNT = 5
+TIME_TOLERANCE = 1.1     # 측정 잡음 허용 (ResultBuilder 가 기존 대비 10 % 이상 느리면 실패)
+
+def make_list_output(record_cnt, column_cnt, width):
+    """
+    리스트 응답의 레코드별 추출 아이템 목록
+    """
+    return [[f"R{r:05d}C{c:02d}".ljust(width, "x") for c in range(column_cnt)] for r in range(record_cnt)]
+
+def send(result):
+    # 소켓 write 대신 데이터만 훑는 소비자 (bytes-like 그대로 사용)
+    return zlib.crc32(result)
+
+def legacy_record(long_result, item_list):
+    """
+    기존 방식 : item.encode() + b'\\0' 복사 후 레코드/블록을 다시 슬라이스 복사
+    """
+    result_offset = 0
+    for item_buf in item_list:
+        encoded_data = item_buf.encode('utf-8') + b'\0'
+        data_len = len(encoded_data)
+        long_result[result_offset : result_offset + data_len] = encoded_data
+        result_offset += data_len
+
+    total_len = result_offset
+    if total_len > LIMIT_SIZE:
+        for k in range((total_len // SEG_BLK_SIZE) + 1):
+            start_idx = k * SEG_BLK_SIZE
+            send(long_result[start_idx : min(start_idx + SEG_BLK_SIZE, total_len)])
+    else:
+        send(long_result[:total_len])
+
+def builder_record(builder, item_list):
+    """
+    ResultBuilder : 아이템마다 버퍼에 직접 기록, 레코드/블록은 memoryview
+    """
+    builder.reset()
+    builder.append_items(item_list)
+
+    total_len = builder.get_len()
+    if total_len > LIMIT_SIZE:
+        for k in range((total_len // SEG_BLK_SIZE) + 1):
+            send(builder.get_segment_view(k, SEG_BLK_SIZE))
+    else:
+        send(builder.get_view())
+
+def timed_run(func, target, records):
+    start = time.perf_counter()
+    for item_list in records:
+        func(target, item_list)
+    return time.perf_counter() - start
+
+def measure_alloc(func, target, records):
+    """
+    레코드당 일시 할당 피크 (tracemalloc) 합계
+    """
+    tracemalloc.start()
+    total = 0
+    for item_list in records:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func(target, item_list)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - base
+    tracemalloc.stop()
+    return total
+
+def bench(title, records):
+    print(f"[{title}] records={len(records)}, items/record={len(records[0])}")
+
+    legacy_buf = bytearray(MAX_PARSED_DATA_SIZE)
+    builder = ResultBuilder(MAX_PARSED_DATA_SIZE)
+
+    # 결과 동일성
+    same = True
+    for item_list in records[:100]:
+        legacy_record(legacy_buf, item_list)
+        builder_record(builder, item_list)
+        same = same and bytes(builder.get_view()) == bytes(legacy_buf[:builder.get_len()])
+    print(f"   Same result bytes : {same}")
+
+    runs = (("Legacy (bytes copy)", legacy_record, legacy_buf),
+            ("ResultBuilder (view)", builder_record, builder))
+    # REPEAT_CNT 회 번갈아 측정 후 최소값 (측정 잡음 / 부하 변동 제거)
+    elapsed_list = [float("inf")] * len(runs)
+    for _ in range(REPEAT_CNT):
+        for idx, (name, func, target) in enumerate(runs):
+            elapsed_list[idx] = min(elapsed_list[idx], timed_run(func, target, records))
+
+    alloc_list = []
+    for (name, func, target), elapsed in zip(runs, elapsed_list):
+        alloc = measure_alloc(func, target, records)
+        alloc_list.append(alloc / len(records))
+        print(f"   {name:<22}: {elapsed / len(records) * 1000000:8.2f} us/record, "
+              f"{alloc / len(records):10.1f} B/record peak alloc")
+
+    legacy_time, builder_time = elapsed_list
+    legacy_alloc, builder_alloc = alloc_list
+    # 레코드 크기의 임시 객체가 없어야 함 : 일시 할당은 아이템 1개 + view 수준
+    item_bytes = max(len(item.encode('utf-8')) for item in records[0])
+    alloc_ok = builder_alloc < legacy_alloc and builder_alloc < item_bytes + 512
+    print(f"   Speedup : {legacy_time / builder_time:.1f}x, alloc {legacy_alloc / builder_alloc:.1f}x lower : "
+          f"{alloc_ok}\n")
+    return same and alloc_ok and builder_time < legacy_time * TIME_TOLERANCE
+
+def main():
+    print(">> Result Buffer Allocation Benchmark Start\n")
+    ok = bench("List Output", make_list_output(RECORD_CNT, 12, 12))
+    ok = bench("Wide Record (Segmented)", make_list_output(RECORD_CNT // 10, 200, 40)) and ok
+    print(f">> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()
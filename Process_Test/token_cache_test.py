@@ -0,0 +1,118 @@
+import sys
+import os
+
+# 라이브러리 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+for path in (project_root, os.path.join(project_root, 'Class')):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from Class.ProcParser.DataExtractor import DataExtractor
+from Class.ProcParser.MsgTokenizer import MsgTokenizer
+from Class.ProcParser.ParsingRuleCompiler import ParsingRuleCompiler
+from Class.ProcParser.RuleType import *
+
+MSG_1 = "*** MMC OUTPUT NE=BSC01\n  ITEM001    VALUE=10    STATUS=NORMAL,ACT\n  COMPLETED"
+MSG_2 = "*** MMC OUTPUT NE=BSC02\n  ITEM002    VALUE=77    STATUS=FAULTY,ACT\n  COMPLETED"
+ROW = 2
+
+def make_rule(parsing_type, start_string, token_index, token_delimiter=" ", delimiter_type=0, start_column=0):
+    rule = ParsingRule()
+    rule.m_ParsingType = parsing_type
+    rule.m_StartString = start_string
+    rule.m_StartColumn = start_column
+    rule.m_TokenIndex = token_index
+    rule.m_TokenDelimiter = token_delimiter
+    rule.m_DelimiterType = delimiter_type
+    rule.m_ExtractFunc = ParsingRuleCompiler.compile(rule)
+    return rule
+
+def expected(line_buf, rule):
+    # 캐시 없이 직접 토큰화 (비교 기준)
+    tok = MsgTokenizer()
+    sub_line = line_buf[line_buf.find(rule.m_StartString, max(rule.m_StartColumn - 1, 0)) + len(rule.m_StartString):]
+    if rule.m_DelimiterType == 1:
+        return tok.get_char_token(sub_line, rule.m_TokenIndex, rule.m_TokenDelimiter) or ""
+    return tok.get_string_token(sub_line, rule.m_TokenIndex, rule.m_TokenDelimiter) or ""
+
+def scan(extractor, msg):
+    extractor.m_MsgBuf = msg
+    extractor.line_scanning()
+    extractor.m_Tokenizer.reset_cache_stat()
+
+def cache_stat(extractor):
+    # (hit, miss) of MsgTokenizer, the only token list cache
+    return extractor.m_Tokenizer.get_cache_stat()
+
+def cache_cnt(extractor):
+    tokenizer = extractor.m_Tokenizer
+    return len(tokenizer.m_StringTokenCache) + len(tokenizer.m_CharTokenCache)
+
+def extract(extractor, rule_list, use_compiled=True):
+    line_buf = extractor.get_line(ROW)
+    values = []
+    for rule in rule_list:
+        if use_compiled:
+            values.append(rule.m_ExtractFunc(extractor, line_buf, ROW))
+        else:
+            values.append(extractor.extract_data_from_parsing_rule_generic(rule, line_buf, ROW))
+    return values, [(True, expected(line_buf, rule)) for rule in rule_list]
+
+def check_hit(extractor):
+    # 같은 시작 문자열 / 구분자를 읽는 룰 : 첫 룰만 토큰화, 나머지는 MsgTokenizer 캐시 사용
+    rule_list = [make_rule(STRSTR_TOKEN, "ITEM", idx) for idx in (1, 2, 3, -1)]
+    rule_list.append(make_rule(STRCOL_STRSTR_TOKEN, "ITEM", 2, start_column=2))
+    scan(extractor, MSG_1)
+    values, expect = extract(extractor, rule_list)
+    generic, _ = extract(extractor, rule_list, use_compiled=False)
+    stat = cache_stat(extractor)
+    ok = values == expect == generic and values[1] == (True, "VALUE=10") and stat == (len(rule_list) * 2 - 1, 1)
+    ok = ok and cache_cnt(extractor) == 1
+    print(f"[1] {len(rule_list)} rules on one row (compiled + generic), same remainder -> hit/miss {stat} : {ok}")
+    return ok
+
+def check_miss(extractor):
+    # 시작 위치 / 구분자 종류 / 구분자가 다르면 별도 토큰 목록
+    rule_list = [make_rule(STRSTR_TOKEN, "ITEM", 1),
+                 make_rule(STRSTR_TOKEN, "VALUE=", 1),
+                 make_rule(STRSTR_TOKEN, "ITEM", 2, "=", 0),
+                 make_rule(STRSTR_TOKEN, "ITEM", 2, "=", 1),
+                 make_rule(STRSTR_TOKEN, "STATUS", 2, "=,", 1)]
+    scan(extractor, MSG_1)
+    values, expect = extract(extractor, rule_list)
+    stat = cache_stat(extractor)
+    ok = values == expect and values[4] == (True, "NORMAL") and stat == (0, len(rule_list))
+    ok = ok and cache_cnt(extractor) == len(rule_list)
+    print(f"[2] Different offset / delimiter type / delimiter -> hit/miss {stat} : {ok}")
+    return ok
+
+def check_changed(extractor):
+    rule_list = [make_rule(STRSTR_TOKEN, "ITEM", idx) for idx in (1, 2)]
+    scan(extractor, MSG_1)
+    first, _ = extract(extractor, rule_list)
+
+    # 같은 줄 번호 / 같은 offset 의 다른 메시지 : 이전 토큰 목록을 재사용하지 않음
+    scan(extractor, MSG_2)
+    second, expect = extract(extractor, rule_list)
+    stat = cache_stat(extractor)
+    ok = len(MSG_1) == len(MSG_2) and first != second and second == expect
+    ok = ok and second[1] == (True, "VALUE=77") and stat == (1, 1)
+
+    # 새 메시지마다 캐시를 비움 : 같은 내용의 메시지도 다시 토큰화, 이전 메시지 항목은 남지 않음
+    scan(extractor, MSG_1)
+    third, _ = extract(extractor, rule_list)
+    ok = ok and third == first and cache_stat(extractor) == (1, 1) and cache_cnt(extractor) == 1
+    print(f"[3] Next message (same length, same row / offset) -> re-tokenized, hit/miss {stat} : {ok}")
+    return ok
+
+def main():
+    print(">> DataExtractor Token Cache Test Start\n")
+    extractor = DataExtractor(None)
+    ok = check_hit(extractor)
+    ok = check_miss(extractor) and ok
+    ok = check_changed(extractor) and ok
+    print(f"\n>> Test Result: {'PASS' if ok else 'FAIL'}")
+
+if __name__ == "__main__":
+    main()